@@ -16,11 +16,11 @@ __all__: list[str] = [
 ]
 
 __author__ = "4-proxy"
-__version__ = "0.3.0"
+__version__ = "0.5.0"
 
 from abc import ABC, abstractmethod
 
-from typing import Any, Iterable
+from typing import Any, Dict, Iterable
 
 
 # ______________________________________________________________________________________________________________________
@@ -91,3 +91,26 @@ class SQLAPIInterface(ABC):
             Iterable[Any]: An iterable collection of result rows, or `None` if no results are found.
         """
         pass
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @abstractmethod
+    def execute_query_returns_columns(self, sql_query: str, *query_data) -> Dict[str, Any]:
+        """execute_query_returns_columns executes a SQL query and returns the result as columns.
+
+        This abstract method must be implemented by subclasses to execute SQL queries
+        that return multiple rows of data (e.g., SELECT statements) and collect the values
+        of every column into a single array instead of building a Python object per row.
+
+        *Numeric columns should be returned as typed arrays (e.g. `numpy.ndarray` or `array.array`),
+        other columns as arrays of objects.
+        *If no results are found, this method should return the columns without values.
+        *Duplicate column names must not overwrite each other, e.g. they are returned as `column_<index>`.
+
+        Args:
+            sql_query (str): The SQL command to be executed.
+            query_data (tuple): Optional parameters to be used in the SQL command.
+
+        Returns:
+            Dict[str, Any]: The arrays of the columns by the column names.
+        """
+        pass
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides an abstract interface `TransactionInterface` for controlling transactions of SQL databases.
+
+*Relationship with other modules:
+    `sql_api_interface`: The queries of the API are executed within the transactions of this interface.
+    `sql_database`: Database implementations can provide transaction control through this interface.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TransactionInterface',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+from abc import ABC, abstractmethod
+
+from typing import Any, ContextManager
+
+
+# ______________________________________________________________________________________________________________________
+class TransactionInterface(ABC):
+    """TransactionInterface abstract interface representing transaction control of SQL databases.
+
+    This interface is used to be implemented by the classes, which also implement `SQLAPIInterface`,
+    so the queries of the API can be grouped into transactions.
+
+    Args:
+        ABC: Class from the `abc` module, which allows the creation
+             of abstract classes in Python.
+    """
+
+    @abstractmethod
+    def transaction(self) -> ContextManager[Any]:
+        """transaction returns a context manager of a transaction.
+
+        This abstract method must be implemented to start a transaction when entering the context,
+        commit it when leaving the context and roll it back if an exception is raised.
+
+        *A nested call must create a savepoint instead of a new transaction.
+        Leaving the nested context releases the savepoint, an exception rolls back only
+        to the savepoint and is re-raised.
+
+        Returns:
+            ContextManager[Any]: The context manager of the transaction.
+        """
+        pass
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @abstractmethod
+    def group_commit(self, max_statements: int, max_delay_ms: int) -> ContextManager[Any]:
+        """group_commit returns a context manager, which groups the commits of separate statements.
+
+        This abstract method must be implemented to disable per-statement commits within the context
+        and commit the accumulated statements once `max_statements` are executed
+        or `max_delay_ms` milliseconds are passed since the first uncommitted statement.
+
+        *The statements left uncommitted are committed when leaving the context.
+
+        Args:
+            max_statements (int): Max number of statements in one commit.
+            max_delay_ms (int): Max delay of the commit of a statement in milliseconds.
+
+        Returns:
+            ContextManager[Any]: The context manager of the group commit.
+        """
+        pass
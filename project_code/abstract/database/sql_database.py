@@ -17,7 +17,7 @@ __all__: list[str] = [
 ]
 
 __author__ = "4-proxy"
-__version__ = "0.5.0"
+__version__ = "0.6.0"
 
 from abc import ABC, abstractmethod
 
@@ -65,13 +65,41 @@ class SQLDataBase(ABC):
 
         This setter allows updating the database configuration parameters.
 
-        *It is important to make sure that the active connection method will be disconnected
-        to allow `dbconfig` to be changed.
+        *The change is live: the implementation applies it in `_on_dbconfig_changed`
+        (e.g. switches the new work to the connections with the new parameters).
+        If applying fails, the previous parameters are restored and the error is raised.
 
         Args:
             new_dbconfig (Dict[str, Any]): A dictionary containing new database configuration parameters.
         """
-        self.__dbconfig: Dict[str, Any] = new_dbconfig
+        try:
+            old_dbconfig: Dict[str, Any] = self.__dbconfig
+
+        except AttributeError:
+            # The first configuration of the instance, there are no connections yet
+            self.__dbconfig: Dict[str, Any] = new_dbconfig
+            return
+
+        self.__dbconfig = new_dbconfig
+
+        try:
+            self._on_dbconfig_changed(old_dbconfig=old_dbconfig)
+
+        except BaseException:
+            self.__dbconfig = old_dbconfig
+            raise
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _on_dbconfig_changed(self, old_dbconfig: Dict[str, Any]) -> None:
+        """_on_dbconfig_changed applies the new `dbconfig` to the connections.
+
+        *The default implementation does nothing, the connections use the new parameters
+        when they are created next time.
+
+        Args:
+            old_dbconfig (Dict[str, Any]): The previous database configuration parameters.
+        """
+        pass
 
     # ------------------------------------------------------------------------------------------------------------------
     @abstractmethod
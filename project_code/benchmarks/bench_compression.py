@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module compares the CPU cost of the protocol compression with the bytes it saves, per kind of query.
+
+The result of a query is built as the packets of the text protocol (a point query, a page, an export).
+The server side is simulated by compressing the packets in the chunks of `net_buffer_length`
+(16 KiB by default). The client side is the driver itself: its plain and compressed network brokers
+receive the same result from a socket, which replays the bytes from memory.
+
+The compression pays off, when the link is slower than the break-even rate:
+the saved bytes divided by the CPU seconds of the compression and the decompression.
+The last table shows the decision of the `adaptive` mode for each kind of traffic.
+
+Run from the `project_code` directory:
+    python -m benchmarks.bench_compression --export-rows 20000 --repeats 5
+
+*Relationship with other modules:
+    `adaptive_compression`: Decides the compression of a connection from its bytes per query.
+    `mysql_compression`: The `compression` option of `dbconfig`.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import argparse
+import random
+import struct
+import time
+import zlib
+
+from mysql.connector.network import NetworkBroker, NetworkBrokerCompressed, NetworkBrokerPlain
+
+from mysql_support.mysql_compression import DEFAULT_ADAPTIVE_COMPRESSION_POLICY
+from tools.adaptive_compression import TransferMeter
+
+from typing import Callable, List, Optional, Sequence, Tuple
+
+
+# The packets shorter than this are sent uncompressed by the server (`MIN_COMPRESS_LENGTH`)
+MIN_COMPRESS_LENGTH: int = 50
+
+EOF_PAYLOAD: bytes = b'\xfe\x00\x00\x02\x00'
+
+STATUSES: Tuple[str, ...] = ('new', 'paid', 'shipped', 'delivered', 'returned')
+
+
+# ______________________________________________________________________________________________________________________
+class ReplayingSocket:
+    """ReplayingSocket socket, which returns the recorded bytes to `recv_into`."""
+
+    def __init__(self, data: bytes) -> None:
+        self.__view = memoryview(data)
+        self.__offset: int = 0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def recv_into(self, buffer: memoryview, size: int) -> int:
+        read: int = min(size, len(self.__view) - self.__offset)
+        buffer[:read] = self.__view[self.__offset:self.__offset + read]
+        self.__offset += read
+
+        return read
+
+
+# ______________________________________________________________________________________________________________________
+def _encode_lenenc_string(value: bytes) -> bytes:
+    # The values of the benchmark are shorter than 251 bytes, so the length takes a single byte
+    return bytes((len(value),)) + value
+
+
+# ______________________________________________________________________________________________________________________
+def build_result_packets(rows_count: int, seed: int = 7) -> List[bytes]:
+    """build_result_packets builds the rows of the `orders` table as the packets of the text protocol.
+
+    Args:
+        rows_count (int): The number of the rows.
+        seed (int, optional): The seed of the generated values. Defaults to 7.
+
+    Returns:
+        List[bytes]: The packets of the rows and the final EOF packet (with their headers).
+    """
+    generator = random.Random(seed)
+    payloads: List[bytes] = []
+
+    for row_id in range(1, rows_count + 1):
+        values: Tuple[str, ...] = (
+            str(row_id),
+            f"customer{generator.randrange(100_000)}@example.com",
+            generator.choice(STATUSES),
+            f"2024-{generator.randrange(1, 13):02d}-{generator.randrange(1, 29):02d} "
+            f"{generator.randrange(24):02d}:{generator.randrange(60):02d}:{generator.randrange(60):02d}",
+            f"{generator.randrange(100, 100_000) / 100:.2f}",
+            f"Order of {generator.randrange(1, 10)} items, delivery {generator.choice(('standard', 'express'))}",
+        )
+        payloads.append(b''.join(_encode_lenenc_string(value.encode()) for value in values))
+
+    payloads.append(EOF_PAYLOAD)
+
+    return [struct.pack('<I', len(payload))[:3] + bytes((number % 256,)) + payload
+            for number, payload in enumerate(payloads, start=1)]
+
+
+# ______________________________________________________________________________________________________________________
+def compress_like_server(packets: Sequence[bytes], chunk_size: int, level: int) -> bytes:
+    """compress_like_server frames the packets of the result as the compressed packets of the protocol.
+
+    *The chunks end at the boundaries of the packets, the driver doesn't join a header split between two chunks.
+
+    Args:
+        packets (Sequence[bytes]): The packets of the result.
+        chunk_size (int): The min bytes of the packets in a compressed packet (`net_buffer_length`).
+        level (int): The zlib level (`protocol_compression_level`).
+
+    Returns:
+        bytes: The compressed packets.
+    """
+    chunks: List[bytes] = []
+    pending: List[bytes] = []
+    pending_size: int = 0
+
+    for packet in packets:
+        pending.append(packet)
+        pending_size += len(packet)
+
+        if pending_size >= chunk_size:
+            chunks.append(b''.join(pending))
+            pending, pending_size = [], 0
+
+    if pending:
+        chunks.append(b''.join(pending))
+
+    frames: List[bytes] = []
+
+    for number, chunk in enumerate(chunks):
+        if len(chunk) < MIN_COMPRESS_LENGTH:
+            body, uncompressed_length = chunk, 0
+
+        else:
+            body, uncompressed_length = zlib.compress(chunk, level), len(chunk)
+
+        frames.append(struct.pack('<I', len(body))[:3] + bytes((number % 256,))
+                      + struct.pack('<I', uncompressed_length)[:3] + body)
+
+    return b''.join(frames)
+
+
+# ______________________________________________________________________________________________________________________
+def receive_all(broker_class: Callable[[], NetworkBroker], data: bytes, packets_count: int) -> int:
+    """receive_all receives the packets of a result by the network broker of the driver.
+
+    Returns:
+        int: The bytes of the received packets.
+    """
+    broker: NetworkBroker = broker_class()
+    sock = ReplayingSocket(data=data)
+
+    return sum(len(broker.recv(sock, 'replay')) for _ in range(packets_count))
+
+
+# ______________________________________________________________________________________________________________________
+def best_seconds(function: Callable[[], object], repeats: int) -> float:
+    """best_seconds returns the fastest of the repeated calls."""
+    timings: List[float] = []
+
+    for _ in range(repeats):
+        started_at: float = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started_at)
+
+    return min(timings)
+
+
+# ______________________________________________________________________________________________________________________
+def main(arguments: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark of the CPU cost of the compression against saved bytes.")
+    parser.add_argument('--page-rows', type=int, default=50)
+    parser.add_argument('--export-rows', type=int, default=20_000)
+    parser.add_argument('--chunk-size', type=int, default=16 * 1024, help="The `net_buffer_length` of the server.")
+    parser.add_argument('--level', type=int, default=6, help="The zlib level of the server.")
+    parser.add_argument('--repeats', type=int, default=5, help="The best of the repeated runs is reported.")
+    args = parser.parse_args(arguments)
+
+    workloads: Tuple[Tuple[str, int], ...] = (('point', 1), ('page', args.page_rows), ('export', args.export_rows))
+
+    print(f"{'query':>8} {'rows':>7} {'bytes':>10} {'compressed':>11} {'saved':>6} "
+          f"{'server us':>10} {'client plain us':>16} {'client zlib us':>15} {'break-even':>13}")
+
+    for name, rows_count in workloads:
+        packets: List[bytes] = build_result_packets(rows_count=rows_count)
+        stream: bytes = b''.join(packets)
+        compressed: bytes = compress_like_server(packets=packets, chunk_size=args.chunk_size, level=args.level)
+
+        server_seconds: float = best_seconds(
+            lambda: compress_like_server(packets=packets, chunk_size=args.chunk_size, level=args.level), args.repeats
+        )
+        plain_seconds: float = best_seconds(
+            lambda: receive_all(broker_class=NetworkBrokerPlain, data=stream, packets_count=len(packets)),
+            args.repeats
+        )
+        compressed_seconds: float = best_seconds(
+            lambda: receive_all(broker_class=NetworkBrokerCompressed, data=compressed, packets_count=len(packets)),
+            args.repeats
+        )
+
+        saved_bytes: int = len(stream) - len(compressed)
+        cpu_seconds: float = server_seconds + max(compressed_seconds - plain_seconds, 0.0)
+
+        # The link, over which the saved transfer time equals the spent CPU time
+        break_even: str = f"{saved_bytes / cpu_seconds / 1e6:>8.1f} MB/s" if saved_bytes > 0 else f"{'never':>13}"
+
+        print(f"{name:>8} {rows_count:>7} {len(stream):>10} {len(compressed):>11} "
+              f"{saved_bytes / len(stream):>6.0%} {server_seconds * 1e6:>10.1f} {plain_seconds * 1e6:>16.1f} "
+              f"{compressed_seconds * 1e6:>15.1f} {break_even}")
+
+    print()
+    print(f"adaptive mode ({DEFAULT_ADAPTIVE_COMPRESSION_POLICY!r}):")
+
+    for name, rows_count in workloads:
+        received_bytes: int = sum(map(len, build_result_packets(rows_count=rows_count)))
+        meter: TransferMeter = DEFAULT_ADAPTIVE_COMPRESSION_POLICY.create_meter()
+        decisions: List[bool] = [meter.observe_query(received_bytes=received_bytes) for _ in range(100)]
+
+        switched_after: str = str(decisions.index(True) + 1) if True in decisions else '-'
+        print(f"{name:>8}: {received_bytes:>10} bytes per query, compressed: {decisions[-1]!s:>5}, "
+              f"switched after {switched_after} queries")
+
+
+if __name__ == '__main__':
+    main()
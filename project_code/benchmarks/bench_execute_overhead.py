@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module measures the Python-side overhead of a point query, without the network and the server.
+
+The connection answers every statement at once (an OK packet or a single row), so the measured time
+is the work of the driver and of `MySQLDataBaseSingle`: the cursors, the substitution of the parameters,
+the conversion of the rows. For a sub-millisecond query this work is comparable to the round trip.
+
+Run from the `project_code` directory:
+    python -m benchmarks.bench_execute_overhead --calls 50000
+
+*Relationship with other modules:
+    `mysql_compiled_cursor`: The cursor substituting the parameters into the compiled statements.
+    `mysql_database_single`: Reuses the cursors of its connection.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import argparse
+import time
+
+from mysql.connector.connection import MySQLConnection
+from mysql.connector.constants import FieldFlag, FieldType
+from mysql.connector.conversion import MySQLConverter
+from mysql.connector.cursor import MySQLCursor
+
+from mysql_support import mysql_database_single
+from mysql_support.mysql_compiled_cursor import MySQLCompiledCursor
+from mysql_support.mysql_database_single import MySQLDataBaseSingle
+from tools.row_factory import RowFormat
+
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+
+UPDATE_QUERY: str = "UPDATE users SET name = %s, visits = visits + %s WHERE id = %s"
+SELECT_QUERY: str = "SELECT id, name FROM users WHERE id = %s AND status = %s"
+
+ROW: Tuple[bytes, bytes] = (b'42', b'banana')
+COLUMNS = [('id', FieldType.LONG, None, None, None, None, 0, FieldFlag.NOT_NULL, 63),
+           ('name', FieldType.VAR_STRING, None, None, None, None, 1, 0, 45)]
+
+
+# ______________________________________________________________________________________________________________________
+class AnsweringConnection(MySQLConnection):
+    """AnsweringConnection connection, which answers the statements without a server."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._socket = object()
+        self._sql_mode = ''
+        self.converter = MySQLConverter(self.python_charset, True)
+
+        self.ping_count: int = 0
+        self.__pending_rows: int = 0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def connect(self, **kwargs: Any) -> None:
+        pass
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def cmd_ping(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        # The driver pings the server for every new cursor, the round trip isn't counted here
+        self.ping_count += 1
+        return {}
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def cmd_query(self, query: Any, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        if query.lstrip()[:6].upper() == b'SELECT':
+            self.__pending_rows = 1
+            return {'columns': COLUMNS}
+
+        return {'affected_rows': 1, 'insert_id': 0, 'warning_count': 0, 'server_status': 0}
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def get_row(self, *args: Any, **kwargs: Any) -> Tuple[Optional[Tuple[bytes, ...]], Optional[Dict[str, int]]]:
+        if self.__pending_rows:
+            self.__pending_rows = 0
+            return ROW, None
+
+        return None, {'status_flag': 0, 'warning_count': 0}
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def get_rows(self, *args: Any, **kwargs: Any) -> Tuple[list, Dict[str, int]]:
+        rows: list = [ROW] if self.__pending_rows else []
+        self.__pending_rows = 0
+
+        return rows, {'status_flag': 0, 'warning_count': 0}
+
+
+# ______________________________________________________________________________________________________________________
+def measure_microseconds_per_call(call: Callable[[], Any], calls_count: int, repeats: int) -> float:
+    """measure_microseconds_per_call returns the best time of a call of the repeated runs."""
+    best_seconds: float = float('inf')
+
+    for _ in range(repeats):
+        started_at: float = time.perf_counter()
+
+        for _ in range(calls_count):
+            call()
+
+        best_seconds = min(best_seconds, time.perf_counter() - started_at)
+
+    return best_seconds / calls_count * 1_000_000
+
+
+# ______________________________________________________________________________________________________________________
+def main(arguments: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark of the Python-side overhead of a point query.")
+    parser.add_argument('--calls', type=int, default=50_000)
+    parser.add_argument('--repeats', type=int, default=5, help="The best of the repeated runs is reported.")
+    args = parser.parse_args(arguments)
+
+    connection = AnsweringConnection()
+    update_params: Tuple[Any, ...] = ("banana", 1, 42)
+
+    def execute_with_new_cursor() -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(UPDATE_QUERY, update_params)
+
+    reused_cursor: MySQLCursor = connection.cursor()
+    compiled_cursor: MySQLCursor = connection.cursor(cursor_class=MySQLCompiledCursor)
+
+    # The instance uses the answering connection instead of opening one
+    mysql_database_single.MySQLConnection = lambda: connection
+    database = MySQLDataBaseSingle(user='bench', database='bench')
+    database.default_row_format = RowFormat.TUPLE
+
+    calls: Dict[str, Callable[[], Any]] = {
+        "driver, new cursor per call": execute_with_new_cursor,
+        "driver, reused cursor": lambda: reused_cursor.execute(UPDATE_QUERY, update_params),
+        "reused compiled cursor": lambda: compiled_cursor.execute(UPDATE_QUERY, update_params),
+        "execute_query_no_returns": lambda: database.execute_query_no_returns(UPDATE_QUERY, "banana", 1, 42),
+        "execute_query_returns_one": lambda: database.execute_query_returns_one(SELECT_QUERY, 42, 'active'),
+    }
+
+    print(f"{'call':<32} {'us/call':>8} {'pings/call':>11}")
+
+    for name, call in calls.items():
+        connection.ping_count = 0
+        microseconds: float = measure_microseconds_per_call(call, args.calls, args.repeats)
+
+        print(f"{name:<32} {microseconds:>8.2f} {connection.ping_count / (args.calls * args.repeats):>11.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module benchmarks the checkout of the pooled connections by many threads:
+the free list behind a single lock of the pool against `ConnectionBag` with the per-thread caches.
+
+Run from the `project_code` directory:
+    python -m benchmarks.bench_pool_checkout --threads 64 128 --size 16 --iterations 2000
+
+*Relationship with other modules:
+    `connection_bag`: The benchmarked store of the idle connections.
+    `mysql_database_pool`: Uses the same fast path and the same waiting as `BagCheckout`.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import argparse
+import threading
+import time
+
+from tools.connection_bag import ConnectionBag
+
+from typing import List, Optional, Sequence
+
+
+# ______________________________________________________________________________________________________________________
+class GlobalLockCheckout:
+    """GlobalLockCheckout the LIFO free list, every checkout and return takes the lock of the pool."""
+
+    def __init__(self, size: int) -> None:
+        self.__condition = threading.Condition()
+        self.__items: List[object] = [object() for _ in range(size)]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def get(self) -> object:
+        with self.__condition:
+            while not self.__items:
+                self.__condition.wait()
+
+            return self.__items.pop()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def put(self, item: object) -> None:
+        with self.__condition:
+            self.__items.append(item)
+            self.__condition.notify()
+
+
+# ______________________________________________________________________________________________________________________
+class BagCheckout:
+    """BagCheckout the checkout of `MySQLDataBasePool`, the lock is taken only to wait for a free item."""
+
+    def __init__(self, size: int) -> None:
+        self.__condition = threading.Condition()
+        self.__bag: ConnectionBag[object] = ConnectionBag()
+        self.__waiting_count: int = 0
+
+        for _ in range(size):
+            self.__bag.put(object())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def get(self) -> object:
+        item: Optional[object] = self.__bag.poll()
+
+        if item is not None:
+            return item
+
+        with self.__condition:
+            self.__waiting_count += 1
+
+            try:
+                while True:
+                    item = self.__bag.poll()
+
+                    if item is not None:
+                        return item
+
+                    self.__condition.wait()
+
+            finally:
+                self.__waiting_count -= 1
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def put(self, item: object) -> None:
+        self.__bag.put(item)
+
+        if self.__waiting_count:
+            with self.__condition:
+                self.__condition.notify()
+
+
+# ______________________________________________________________________________________________________________________
+def measure_checkouts_per_second(checkout: object, threads_count: int, iterations: int,
+                                 hold_seconds: float) -> float:
+    """measure_checkouts_per_second runs the checkouts and the returns of the threads together.
+
+    Args:
+        checkout (object): `GlobalLockCheckout` or `BagCheckout`.
+        threads_count (int): The number of the threads.
+        iterations (int): The number of the checkouts of each thread.
+        hold_seconds (float): The seconds an item is held (0 measures the checkout alone).
+
+    Returns:
+        float: The number of the checkouts per second.
+    """
+    barrier = threading.Barrier(parties=threads_count + 1)
+
+    def work() -> None:
+        barrier.wait()
+
+        for _ in range(iterations):
+            item: object = checkout.get()
+
+            if hold_seconds:
+                time.sleep(hold_seconds)
+
+            checkout.put(item)
+
+    threads: List[threading.Thread] = [threading.Thread(target=work) for _ in range(threads_count)]
+
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    started_at: float = time.perf_counter()
+
+    for thread in threads:
+        thread.join()
+
+    return threads_count * iterations / (time.perf_counter() - started_at)
+
+
+# ______________________________________________________________________________________________________________________
+def main(arguments: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark of the checkout of the pooled connections.")
+    parser.add_argument('--threads', type=int, nargs='+', default=[16, 64, 128])
+    parser.add_argument('--size', type=int, nargs='+', default=[16, 128],
+                        help="The sizes of the pool (the threads wait, when it is smaller).")
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--hold', type=float, default=0.0, help="The seconds a connection is held.")
+    parser.add_argument('--repeats', type=int, default=3, help="The best of the repeated runs is reported.")
+    args = parser.parse_args(arguments)
+
+    print(f"{'threads':>8} {'size':>6} {'global lock':>14} {'bag':>14} {'speedup':>8}")
+
+    for size in args.size:
+        for threads_count in args.threads:
+            results: List[float] = [
+                max(measure_checkouts_per_second(checkout=checkout_class(size=size), threads_count=threads_count,
+                                                 iterations=args.iterations, hold_seconds=args.hold)
+                    for _ in range(args.repeats))
+                for checkout_class in (GlobalLockCheckout, BagCheckout)
+            ]
+
+            print(f"{threads_count:>8} {size:>6} {results[0]:>12.0f}/s {results[1]:>12.0f}/s "
+                  f"{results[1] / results[0]:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `MySQLCompiledCursor` class - a cursor of the driver, which substitutes
+the parameters into the cached (compiled) statements.
+
+The driver encodes the statement and searches it for the `%s` placeholders by a regular expression
+on every call, then it converts the parameters in three passes. The cursor splits a statement
+into its fragments once (`compile_statement`) and converts the parameters in a single pass,
+so a repeated point query spends less time in Python before it is sent.
+
+*The parameters are converted by the converter of the connection, so the statement sent
+to the server is the same as the one built by the driver.
+
+*Relationship with other modules:
+    `mysql_database_single`: Reuses the compiled cursors for the statements of a connection.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'MySQLCompiledCursor',
+    'compile_statement',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+from decimal import Decimal
+from functools import lru_cache
+
+from mysql.connector.conversion import MySQLConverter
+from mysql.connector.cursor import MySQLCursor
+
+from mysql_support.mysql_statement_builder import MAX_CACHED_STATEMENT_LENGTH
+
+from typing import Any, List, Optional, Sequence, Tuple, Type
+
+
+# ______________________________________________________________________________________________________________________
+@lru_cache(maxsize=1024)
+def compile_statement(sql_query: str, charset: str) -> Tuple[bytes, ...]:
+    """compile_statement splits the encoded statement by its `%s` placeholders.
+
+    Args:
+        sql_query (str): The statement with the `%s` placeholders.
+        charset (str): The Python charset of the connection.
+
+    Returns:
+        Tuple[bytes, ...]: The fragments of the statement around the placeholders
+                           (the number of the placeholders + 1).
+    """
+    return tuple(sql_query.encode(charset).split(b'%s'))
+
+
+# ______________________________________________________________________________________________________________________
+@lru_cache(maxsize=32)
+def _has_default_parameter_conversion(converter_class: Type[Any]) -> bool:
+    # The integers and None of a converter, which doesn't override the conversion of the parameters, are literals
+    return (issubclass(converter_class, MySQLConverter)
+            and converter_class.to_mysql is MySQLConverter.to_mysql
+            and converter_class.escape is MySQLConverter.escape
+            and converter_class.quote is MySQLConverter.quote)
+
+
+# ______________________________________________________________________________________________________________________
+class MySQLCompiledCursor(MySQLCursor):
+    """MySQLCompiledCursor cursor, which substitutes the sequence of the parameters into the compiled statement.
+
+    *The other calls (the mapping of the parameters, `map_results`, a mismatched number of the parameters,
+    a value the converter can't process) are executed by the driver itself, so its errors are kept.
+    """
+
+    def execute(self, operation: Any, params: Optional[Any] = None, map_results: bool = False) -> None:
+        if params and isinstance(operation, str) and isinstance(params, (tuple, list)) and not map_results \
+                and len(operation) <= MAX_CACHED_STATEMENT_LENGTH:
+            statement: Optional[bytes] = self.__render_statement(operation=operation, params=params)
+
+            if statement is not None:
+                return super().execute(statement)
+
+        return super().execute(operation, params, map_results)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __render_statement(self, operation: str, params: Sequence[Any]) -> Optional[bytes]:
+        connection: Any = self._connection
+
+        try:
+            fragments: Tuple[bytes, ...] = compile_statement(sql_query=operation, charset=connection.python_charset)
+
+            if len(fragments) != len(params) + 1:
+                return None
+
+            converter: Any = connection.converter
+            to_mysql = converter.to_mysql
+            escape = converter.escape
+            quote = converter.quote
+            sql_mode: Any = connection.sql_mode
+            has_default_conversion: bool = _has_default_parameter_conversion(converter_class=type(converter))
+
+            parts: List[Any] = [fragments[0]]
+
+            for index, value in enumerate(params, start=1):
+                value_type: type = type(value)
+
+                if has_default_conversion and value_type is int:
+                    parts.append(b'%d' % value)
+
+                elif has_default_conversion and value is None:
+                    parts.append(b'NULL')
+
+                else:
+                    converted: Any = escape(to_mysql(value), sql_mode)
+                    parts.append(converted if isinstance(value, Decimal) else quote(converted))
+
+                parts.append(fragments[index])
+
+            return b''.join(parts)
+
+        except Exception:
+            return None
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the compression of the MySQL protocol configured by the `compression` option of `dbconfig`.
+
+    `off`: No compression (the default).
+    `zlib`: Every connection is compressed.
+    `adaptive` (or an `AdaptiveCompressionPolicy`): A connection is compressed only while its queries
+                                                    transfer large results, see `adaptive_compression`.
+
+The option is removed from the parameters passed to the driver, which get the `compress` flag instead.
+The driver's own `compress` parameter is still accepted, when the option is not used.
+
+*`zstd` is rejected: the driver negotiates only the zlib compression (`CLIENT_COMPRESS`).
+
+*Relationship with other modules:
+    `adaptive_compression`: The recommendation of the `adaptive` mode.
+    `mysql_database_single`: Opens its connections with the compression of `dbconfig`.
+    `mysql_database_pool`: Validates the option, its sessions apply it.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'COMPRESSION_OPTION',
+    'DEFAULT_ADAPTIVE_COMPRESSION_POLICY',
+    'MySQLCompression',
+    'MySQLMeteredConnection',
+    'build_connection_config',
+    'parse_compression_option',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+from enum import Enum
+
+from mysql.connector.connection import MySQLConnection
+from mysql.connector.network import MySQLSocket
+
+from tools.adaptive_compression import AdaptiveCompressionPolicy
+
+from typing import Any, Dict, Optional, Tuple
+
+
+COMPRESSION_OPTION: str = 'compression'
+
+DEFAULT_ADAPTIVE_COMPRESSION_POLICY = AdaptiveCompressionPolicy()
+
+
+# ______________________________________________________________________________________________________________________
+class MySQLCompression(Enum):
+    """MySQLCompression modes of the compression of the connections.
+
+    Attributes:
+        OFF: No compression.
+        ZLIB: Every connection is compressed.
+        ADAPTIVE: A connection is compressed only while its queries transfer large results.
+    """
+    OFF = 'off'
+    ZLIB = 'zlib'
+    ADAPTIVE = 'adaptive'
+
+
+# ______________________________________________________________________________________________________________________
+def parse_compression_option(dbconfig: Dict[str, Any]) -> Tuple[MySQLCompression, Optional[AdaptiveCompressionPolicy]]:
+    """parse_compression_option validates the `compression` option of `dbconfig`.
+
+    Args:
+        dbconfig (Dict[str, Any]): The parameters of the connection.
+
+    Raises:
+        ValueError: If the option is unknown or unsupported (`zstd`), or it is combined with `compress`.
+
+    Returns:
+        Tuple[MySQLCompression, Optional[AdaptiveCompressionPolicy]]: The mode and the policy of the `adaptive` mode.
+    """
+    option: Any = dbconfig.get(COMPRESSION_OPTION)
+
+    if option is None:
+        return (MySQLCompression.ZLIB if dbconfig.get('compress') else MySQLCompression.OFF), None
+
+    if 'compress' in dbconfig:
+        raise ValueError("The *compression* option cannot be combined with the *compress* parameter!")
+
+    if isinstance(option, AdaptiveCompressionPolicy):
+        return MySQLCompression.ADAPTIVE, option
+
+    if isinstance(option, str) and option.lower() == 'zstd':
+        raise ValueError("The *zstd* compression is not supported by the driver, use *zlib* or *adaptive*!")
+
+    try:
+        compression = MySQLCompression(option.lower() if isinstance(option, str) else option)
+
+    except ValueError:
+        raise ValueError(f"Unknown *compression* option: {option!r}! "
+                         f"Expected one of: {', '.join(mode.value for mode in MySQLCompression)}.") from None
+
+    if compression is MySQLCompression.ADAPTIVE:
+        return compression, DEFAULT_ADAPTIVE_COMPRESSION_POLICY
+
+    return compression, None
+
+
+# ______________________________________________________________________________________________________________________
+def build_connection_config(dbconfig: Dict[str, Any], compress: bool) -> Dict[str, Any]:
+    """build_connection_config builds the parameters of the driver from `dbconfig`.
+
+    Args:
+        dbconfig (Dict[str, Any]): The parameters of the connection.
+        compress (bool): Whether the connection is compressed.
+
+    Returns:
+        Dict[str, Any]: The parameters without the `compression` option. `dbconfig` itself,
+                        if it doesn't use the option.
+    """
+    if COMPRESSION_OPTION not in dbconfig:
+        return dbconfig
+
+    connection_config: Dict[str, Any] = {
+        param: value for param, value in dbconfig.items() if param != COMPRESSION_OPTION
+    }
+    connection_config['compress'] = compress
+
+    return connection_config
+
+
+# ______________________________________________________________________________________________________________________
+class MySQLMeteredConnection(MySQLConnection):
+    """MySQLMeteredConnection connection, which counts the bytes of the packets received from the server.
+
+    *The packets are counted after the decompression, so the count doesn't depend on the compression.
+    """
+
+    received_bytes: int = 0
+
+    def take_received_bytes(self) -> int:
+        """take_received_bytes returns the bytes received since the previous call."""
+        received_bytes: int = self.received_bytes
+        self.received_bytes = 0
+
+        return received_bytes
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _get_connection(self) -> MySQLSocket:
+        mysql_socket: MySQLSocket = super()._get_connection()
+        recv = mysql_socket.recv
+
+        def counting_recv(*args: Any, **kwargs: Any) -> bytearray:
+            packet: bytearray = recv(*args, **kwargs)
+            self.received_bytes += len(packet)
+
+            return packet
+
+        mysql_socket.recv = counting_recv  # type: ignore[method-assign]
+
+        return mysql_socket
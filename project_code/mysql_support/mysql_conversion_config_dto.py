@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module defines a `MySQLConversionConfigDTO` class representing a data transfer object (DTO)
+for configuring the conversion of MySQL values into Python types.
+
+*Relationship with other modules:
+    `mysql_fast_converter`: Builds the converter class of the driver from the configuration.
+    `mysql_database_single`: Uses the configuration per query or per instance.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'MySQLConversionConfigDTO'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+from dataclasses import dataclass, field
+
+from mysql.connector.constants import FieldType
+
+from typing import Any, Callable, Dict
+
+
+# ______________________________________________________________________________________________________________________
+@dataclass(frozen=True)
+class MySQLConversionConfigDTO:
+    """MySQLConversionConfigDTO represents a frozen data transfer object (DTO) for the conversion of values.
+
+    The conversion of `DECIMAL` and temporal columns into `Decimal` and `datetime` objects is expensive
+    and useless for results, which are only forwarded (e.g. as JSON). This configuration allows
+    to skip it or to replace it with faster converters.
+
+    *Instances are hashable, so the converters built from them are cached.
+
+    Attributes:
+        raw (bool): Whether to return the values as they are received (`bytearray`), without any conversion.
+        decimal_as_str (bool): Whether to return `DECIMAL` values as `str` instead of `Decimal`.
+        temporal_as_str (bool): Whether to return `DATE`, `TIME`, `DATETIME`, `TIMESTAMP` values
+                                as `str` instead of `datetime` objects.
+        converters (Dict[int, Callable[[bytes], Any]]): The fast converters of the values
+                                                        by the column type (`FieldType`).
+                                                        They take the text value as `bytes`
+                                                        and have the highest priority.
+    """
+    raw: bool = False
+    decimal_as_str: bool = False
+    temporal_as_str: bool = False
+    converters: Dict[int, Callable[[bytes], Any]] = field(default_factory=dict, hash=False)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __post_init__(self) -> None:
+        """__post_init__ post-initialization to validate this class.
+
+        *The converters are copied, so changing the passed mapping doesn't change the configuration.
+        """
+        for flag_name in ('raw', 'decimal_as_str', 'temporal_as_str'):
+            if not isinstance(getattr(self, flag_name), bool):
+                raise TypeError(f"The *{flag_name}* field of conversion config must be a bool!")
+
+        known_field_types = {info[0] for info in FieldType.desc.values()}
+
+        for field_type, converter in self.converters.items():
+            if field_type not in known_field_types:
+                raise ValueError(f"The column type: *{field_type}* - is not a MySQL *FieldType*!")
+
+            if not callable(converter):
+                raise TypeError(f"The converter of the column type: *{field_type}* - must be callable!")
+
+        object.__setattr__(self, 'converters', dict(self.converters))
@@ -0,0 +1,630 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `MySQLDataBasePool` class - a pool of MySQL connections,
+which waits for a free connection instead of failing when all of them are in use.
+
+Every pooled connection is a `MySQLDataBaseSingle` session, so a leased connection has the whole API
+(row formats, conversions, timeouts, transactions). The sessions connect lazily on their first query
+and are reused in LIFO order, so the most recently used (warm) connection is taken first.
+
+The idle connections are kept in a `ConnectionBag`, so a thread leases and returns a connection
+without the lock of the pool, while there is a free connection. The lock is taken only to open
+a new connection, to wait for a free one or to change the pool (resize, close, new `dbconfig`).
+
+*Relationship with other modules:
+    `mysql_pool_config_dto`: The configuration of the pool.
+    `mysql_database_single`: The sessions of the pooled connections.
+    `deadline`: Limits the waiting for a connection and the execution of the query together.
+    `admission_controller`: Admits the work of the priority lanes before it takes a connection.
+    `adaptive_pool_sizer`: Resizes the pool at runtime from the observed leases.
+    `connection_bag`: The idle connections with the per-thread caches.
+    `mysql_compression`: The compression of the connections set by the `compression` option of `dbconfig`.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'MySQLDataBasePool'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.11.0"
+
+import threading
+import time
+import weakref
+
+from contextlib import contextmanager, nullcontext
+
+from abstract.api.sql_api_interface import SQLAPIInterface
+from abstract.api.transaction_interface import TransactionInterface
+from abstract.database.connection_interface import PoolConnectionInterface
+from abstract.database.sql_database import SQLDataBase
+
+from mysql_support.mysql_compression import parse_compression_option
+from mysql_support.mysql_database_single import MySQLDataBaseSingle
+from mysql_support.mysql_pool_config_dto import MySQLPoolConfigDTO
+from tools.adaptive_pool_sizer import AdaptivePoolSizer
+from tools.admission_controller import AdmissionController
+from tools.connection_bag import ConnectionBag
+from tools.deadline import Deadline
+from tools.fork_guard import register_after_fork_in_child
+from tools.priority_lane_dto import PriorityLaneDTO
+
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+# ______________________________________________________________________________________________________________________
+class MySQLDataBasePool(SQLDataBase, PoolConnectionInterface[MySQLDataBaseSingle], SQLAPIInterface,
+                        TransactionInterface):
+    """MySQLDataBasePool pool of MySQL connections with waiting for a free connection.
+
+    The queries of the API lease a connection for a single call. `deadline` of a call
+    covers both the waiting for a connection and the execution of the query,
+    a call with a passed deadline is skipped without any work.
+
+    With `priority_lanes`, the work is admitted by `AdmissionController` before it takes a connection,
+    so e.g. the batch jobs can't take the connections reserved for the interactive requests.
+
+    The size of the pool starts at `pool_config.size`, it can be changed at runtime by `resize`
+    or automatically by `pool_sizer` from the waiting and holding times of the leases.
+
+    A new `dbconfig` (e.g. rotated credentials or a failover host) is applied live: the idle connections
+    are replaced by the warm ones opened with the new parameters, the leased ones are closed when they are returned.
+
+    Example:
+        >>> database = MySQLDataBasePool(pool_config=MySQLPoolConfigDTO(name='main', size=8, reset_session=True),
+        ...                              priority_lanes=(PriorityLaneDTO(name='interactive', reserved_connections=3),
+        ...                                              PriorityLaneDTO(name='batch', max_queue_length=50)),
+        ...                              host='localhost', user='app', database='shop')
+        >>> rows = database.execute_query_returns_all("SELECT ...", deadline=Deadline.after(seconds=0.3))
+        >>> database.execute_query_no_returns("DELETE ...", lane_name='batch')
+        >>> with database.leased_connection() as session:
+        ...     session.execute_query_no_returns("UPDATE ...")
+    """
+
+    def __init__(self, pool_config: MySQLPoolConfigDTO,
+                 priority_lanes: Optional[Sequence[PriorityLaneDTO]] = None,
+                 pool_sizer: Optional[AdaptivePoolSizer] = None, **dbconfig) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            pool_config (MySQLPoolConfigDTO): The configuration of the pool.
+            priority_lanes (Optional[Sequence[PriorityLaneDTO]], optional): The lanes from the most important one.
+                                                                             Defaults to None (no admission control).
+            pool_sizer (Optional[AdaptivePoolSizer], optional): The policy resizing the pool.
+                                                                Defaults to None (the fixed size).
+            dbconfig (dict): The parameters of the connections. With the `adaptive` compression
+                             (see `mysql_compression`), each pooled connection decides on its own.
+
+        Raises:
+            ValueError: If the reserved connections of the lanes exceed the min size of the pool
+                        or the `compression` option is invalid.
+        """
+        SQLDataBase.__init__(self=self, **dbconfig)
+
+        # The sessions are created lazily, so an invalid option fails here rather than on the first query
+        parse_compression_option(dbconfig=dbconfig)
+
+        self.__pool_config: MySQLPoolConfigDTO = pool_config
+        self.__pool_sizer: Optional[AdaptivePoolSizer] = pool_sizer
+
+        self.__size: int = pool_config.size if pool_sizer is None else pool_sizer.clamp(size=pool_config.size)
+
+        self.__admission_controller: Optional[AdmissionController] = None
+
+        if priority_lanes:
+            self.__admission_controller = AdmissionController(capacity=self.__size, lanes=priority_lanes)
+
+            if pool_sizer is not None and pool_sizer.min_size < self.__admission_controller.reserved_connections_count:
+                raise ValueError("The reserved connections of the priority lanes cannot be > min size of the pool!")
+
+        self.__condition = threading.Condition()
+        self.__idle_sessions: ConnectionBag[MySQLDataBaseSingle] = ConnectionBag()
+        self.__sessions_count: int = 0
+        self.__generation_sessions: weakref.WeakSet[MySQLDataBaseSingle] = weakref.WeakSet()
+        self.__waiting_count: int = 0
+        self.__is_closed: bool = True
+
+        # The connections leased by the threads of the parent are never returned in a forked child
+        register_after_fork_in_child(owner=self, callback=MySQLDataBasePool.__forget_parent_leases)
+
+        self.create_new_connection_pool()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def pool_config(self) -> MySQLPoolConfigDTO:
+        return self.__pool_config
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @pool_config.setter
+    def pool_config(self, new_pool_config: MySQLPoolConfigDTO) -> None:
+        """pool_config setter of the field.
+
+        The pool is resized to the new size (limited by `pool_sizer`) without closing the leased connections,
+        the new `reset_session` applies to the next returned connection.
+
+        Args:
+            new_pool_config (MySQLPoolConfigDTO): The new configuration of the pool.
+        """
+        if not isinstance(new_pool_config, MySQLPoolConfigDTO):
+            raise TypeError("The pool config must be a *MySQLPoolConfigDTO*!")
+
+        size: int = new_pool_config.size
+
+        if self.__pool_sizer is not None:
+            size = self.__pool_sizer.clamp(size=size)
+
+        self.resize(size=size)
+        self.__pool_config = new_pool_config
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def admission_controller(self) -> Optional[AdmissionController]:
+        return self.__admission_controller
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def pool_sizer(self) -> Optional[AdaptivePoolSizer]:
+        return self.__pool_sizer
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def idle_connections_count(self) -> int:
+        return self.__idle_sessions.idle_count
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def connections_count(self) -> int:
+        return self.__sessions_count
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def create_new_connection_pool(self) -> None:
+        self.close_active_pool()
+
+        with self.__condition:
+            # The connections leased from the previous pool keep their room until they are returned and closed
+            self.__idle_sessions = ConnectionBag()
+            self.__generation_sessions = weakref.WeakSet()
+            self.__is_closed = False
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def get_connection_from_pool(self, deadline: Optional[Deadline] = None) -> MySQLDataBaseSingle:
+        """get_connection_from_pool leases a connection, it waits while all connections are in use.
+
+        *The connection must be returned by `release_connection_to_pool`,
+        `leased_connection` does it automatically.
+
+        Args:
+            deadline (Optional[Deadline], optional): The deadline of the waiting. Defaults to None (no limit).
+
+        Raises:
+            RuntimeError: If the pool is closed.
+            TimeoutError: If the deadline passes before a connection is free.
+
+        Returns:
+            MySQLDataBaseSingle: The session of the leased connection.
+        """
+        if self.__is_closed:
+            raise RuntimeError("The connection pool is closed!")
+
+        # The fast path without the lock of the pool
+        session: Optional[MySQLDataBaseSingle] = self.__idle_sessions.poll()
+
+        if session is not None:
+            return session
+
+        with self.__condition:
+            # The returning threads notify the pool only while a thread is registered here
+            self.__waiting_count += 1
+
+            try:
+                while True:
+                    if self.__is_closed:
+                        raise RuntimeError("The connection pool is closed!")
+
+                    session = self.__idle_sessions.poll()
+
+                    if session is not None:
+                        return session
+
+                    if self.__sessions_count < self.__size:
+                        self.__sessions_count += 1
+                        generation_sessions: weakref.WeakSet[MySQLDataBaseSingle] = self.__generation_sessions
+                        break
+
+                    if deadline is None:
+                        self.__condition.wait()
+
+                    else:
+                        self.__condition.wait(timeout=deadline.check(operation="Waiting for a pooled connection"))
+
+            finally:
+                self.__waiting_count -= 1
+
+        try:
+            session = MySQLDataBaseSingle(**self.dbconfig)
+
+        except BaseException:
+            self.__discard_session()
+            raise
+
+        generation_sessions.add(session)
+
+        return session
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def release_connection_to_pool(self, session: MySQLDataBaseSingle) -> None:
+        """release_connection_to_pool returns the leased connection to the pool.
+
+        *With `reset_session` of the configuration, the changed session of the connection is reset,
+        so the next user doesn't see its variables or an unfinished transaction (a clean session
+        is returned without the round trip of the reset).
+        A connection, which can't be reset or has been closed (e.g. it failed the health check),
+        is discarded and replaced later.
+
+        Args:
+            session (MySQLDataBaseSingle): The session of the leased connection.
+        """
+        if session.is_connection_closed:
+            self.__discard_session(session=session)
+            return
+
+        if self.__pool_config.reset_session:
+            try:
+                session.reset_connection_session()
+
+            except Exception:
+                self.__discard_session(session=session)
+                return
+
+        # The connections over a reduced size or of an old `dbconfig` are closed, when they are returned
+        if not self.__is_surplus(session=session):
+            self.__idle_sessions.put(session)
+
+            if self.__is_surplus(session=session):
+                # The pool has been changed meanwhile, the change may have missed the returned connection
+                self.__close_surplus_sessions()
+
+            elif self.__waiting_count:
+                with self.__condition:
+                    self.__condition.notify()
+
+            return
+
+        self.__discard_session(session=session)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @contextmanager
+    def leased_connection(self, deadline: Optional[Deadline] = None,
+                          lane_name: Optional[str] = None) -> Iterator[MySQLDataBaseSingle]:
+        """leased_connection leases a connection for the context.
+
+        Args:
+            deadline (Optional[Deadline], optional): The deadline of the waiting. Defaults to None (no limit).
+            lane_name (Optional[str], optional): The priority lane of the work. Defaults to None (the first lane),
+                                                 it is ignored without `priority_lanes`.
+
+        Raises:
+            TimeoutError: If the deadline has passed before or during the waiting,
+                          or the request is shed by the latency target of its lane.
+            RuntimeError: If the request is shed by the full queue of its lane.
+
+        Yields:
+            Iterator[MySQLDataBaseSingle]: The session of the leased connection.
+        """
+        if deadline is not None:
+            deadline.check(operation="Leasing a pooled connection")
+
+        started_at: float = time.monotonic()
+
+        admission: ContextManager[None] = nullcontext()
+
+        if self.__admission_controller is not None:
+            admission = self.__admission_controller.admit(lane_name=lane_name, deadline=deadline)
+
+        with admission, self.__leased_session(deadline=deadline, started_at=started_at) as session:
+            yield session
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def resize(self, size: int) -> None:
+        """resize changes the max number of the connections of the pool.
+
+        *A larger size is available to the waiting threads at once. With a smaller size,
+        the idle connections over it are closed now and the leased ones when they are returned.
+
+        Args:
+            size (int): The new size of the pool.
+
+        Raises:
+            ValueError: If the size is not an int > 0 or it is less than the reserved connections of the lanes.
+        """
+        if not isinstance(size, int) or size <= 0:
+            raise ValueError("The size of the pool must be an int > 0!")
+
+        if self.__admission_controller is not None:
+            self.__admission_controller.capacity = size
+
+        with self.__condition:
+            self.__size = size
+
+        self.__close_surplus_sessions()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def check_health(self, deadline: Optional[Deadline] = None) -> None:
+        """check_health checks the server by a ping of a pooled connection.
+
+        Args:
+            deadline (Optional[Deadline], optional): The deadline of the waiting. Defaults to None (no limit).
+
+        Raises:
+            mysql.connector.Error: If the server can't be reached or doesn't answer.
+        """
+        with self.leased_connection(deadline=deadline) as session:
+            session.check_health()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def close_active_pool(self) -> None:
+        """close_active_pool closes the idle connections, the leased ones are closed when they are returned."""
+        with self.__condition:
+            self.__is_closed = True
+
+        # The waiting threads must see the pool is closed
+        self.__close_surplus_sessions()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_query_no_returns(self, sql_query: str, *query_data,
+                                 deadline: Optional[Deadline] = None, lane_name: Optional[str] = None,
+                                 **options: Any) -> None:
+        self.__run_in_session(lambda session: session.execute_query_no_returns(sql_query, *query_data,
+                                                                               deadline=deadline, **options),
+                              deadline=deadline, lane_name=lane_name)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_query_returns_one(self, sql_query: str, *query_data,
+                                  deadline: Optional[Deadline] = None, lane_name: Optional[str] = None,
+                                  **options: Any) -> Any:
+        return self.__run_in_session(lambda session: session.execute_query_returns_one(sql_query, *query_data,
+                                                                                       deadline=deadline, **options),
+                                     deadline=deadline, lane_name=lane_name)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_query_returns_all(self, sql_query: str, *query_data,
+                                  deadline: Optional[Deadline] = None, lane_name: Optional[str] = None,
+                                  **options: Any) -> Iterable[Any]:
+        return self.__run_in_session(lambda session: session.execute_query_returns_all(sql_query, *query_data,
+                                                                                       deadline=deadline, **options),
+                                     deadline=deadline, lane_name=lane_name)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_query_returns_columns(self, sql_query: str, *query_data,
+                                      deadline: Optional[Deadline] = None, lane_name: Optional[str] = None,
+                                      **options: Any) -> Dict[str, Any]:
+        return self.__run_in_session(lambda session: session.execute_query_returns_columns(sql_query, *query_data,
+                                                                                           deadline=deadline,
+                                                                                           **options),
+                                     deadline=deadline, lane_name=lane_name)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _read_metadata_rows(self, sql_query: str, *query_data) -> List[Tuple[Any, ...]]:
+        return self.__run_in_session(lambda session: session._read_metadata_rows(sql_query, *query_data),
+                                     deadline=None, lane_name=None)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_multi_statement(self, sql_queries: Any, *query_data,
+                                deadline: Optional[Deadline] = None, lane_name: Optional[str] = None,
+                                **options: Any) -> List[Optional[List[Any]]]:
+        return self.__run_in_session(lambda session: session.execute_multi_statement(sql_queries, *query_data,
+                                                                                     deadline=deadline, **options),
+                                     deadline=deadline, lane_name=lane_name)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @contextmanager
+    def transaction(self, deadline: Optional[Deadline] = None,
+                    lane_name: Optional[str] = None) -> Iterator[MySQLDataBaseSingle]:
+        """transaction leases a connection and runs a transaction on it for the context.
+
+        Yields:
+            Iterator[MySQLDataBaseSingle]: The session of the leased connection, the statements
+                                           of the transaction must be executed by it.
+        """
+        with self.leased_connection(deadline=deadline, lane_name=lane_name) as session, session.transaction():
+            yield session
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @contextmanager
+    def group_commit(self, max_statements: int = 100, max_delay_ms: int = 50,
+                     deadline: Optional[Deadline] = None,
+                     lane_name: Optional[str] = None) -> Iterator[MySQLDataBaseSingle]:
+        """group_commit leases a connection and groups the commits of its statements for the context.
+
+        *`deadline` and `lane_name` are used for the leasing, as in `transaction`.
+
+        Yields:
+            Iterator[MySQLDataBaseSingle]: The session of the leased connection.
+        """
+        with self.leased_connection(deadline=deadline, lane_name=lane_name) as session, \
+                session.group_commit(max_statements=max_statements, max_delay_ms=max_delay_ms):
+            yield session
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __str__(self) -> str:
+        connection_params: List[str] = [
+            f"{param}={self.dbconfig[param]!r}"
+            for param in ('host', 'port', 'user', 'database')
+            if param in self.dbconfig
+        ]
+        connection_params.append(f"pool={self.__pool_config.name!r}")
+        connection_params.append(f"size={self.__size}")
+
+        return f"{self.__class__.__name__}({', '.join(connection_params)})"
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _get_info_about_server(self) -> str:
+        with self.leased_connection() as session:
+            return session._get_info_about_server()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _on_dbconfig_changed(self, old_dbconfig: Dict[str, Any]) -> None:
+        """_on_dbconfig_changed switches the pool to the new `dbconfig` without interrupting its work.
+
+        The replacements of the idle connections are opened with the new parameters first, so the new
+        parameters are verified and the pool stays warm. Then the idle connections are switched at once,
+        the leased connections finish their work and are closed when they are returned.
+
+        Args:
+            old_dbconfig (Dict[str, Any]): The previous parameters of the connections.
+
+        Raises:
+            ValueError: If the `compression` option is invalid (the previous `dbconfig` is kept).
+            mysql.connector.Error: If a connection with the new parameters can't be opened
+                                   (the previous `dbconfig` is kept).
+        """
+        parse_compression_option(dbconfig=self.dbconfig)
+
+        stale_count: int = self.__idle_sessions.count_idle(predicate=lambda session: not self.__is_current(session))
+
+        new_sessions: List[MySQLDataBaseSingle] = []
+
+        try:
+            for _ in range(stale_count):
+                new_sessions.append(MySQLDataBaseSingle(**self.dbconfig))
+                new_sessions[-1].get_connection_with_database()
+
+        except BaseException:
+            for session in new_sessions:
+                self.__close_session(session=session)
+
+            raise
+
+        with self.__condition:
+            stale_sessions: List[MySQLDataBaseSingle] = self.__idle_sessions.drain(
+                predicate=lambda session: not self.__is_current(session=session)
+            )
+            self.__sessions_count -= len(stale_sessions)
+
+            # The connections leased meanwhile may have taken the room of the replacements
+            room_count: int = max(self.__size - self.__sessions_count, 0)
+
+            for session in new_sessions[:room_count]:
+                self.__generation_sessions.add(session)
+                self.__idle_sessions.put(session)
+
+            self.__sessions_count += len(new_sessions[:room_count])
+            stale_sessions.extend(new_sessions[room_count:])
+
+            self.__condition.notify_all()
+
+        for session in stale_sessions:
+            self.__close_session(session=session)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __is_current(self, session: MySQLDataBaseSingle) -> bool:
+        # The connections of a pool created before by `create_new_connection_pool` are never reused
+        return session in self.__generation_sessions and session.dbconfig == self.dbconfig
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __is_surplus(self, session: MySQLDataBaseSingle) -> bool:
+        return self.__is_closed or self.__sessions_count > self.__size or not self.__is_current(session=session)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __close_surplus_sessions(self) -> None:
+        with self.__condition:
+            if self.__is_closed:
+                sessions: List[MySQLDataBaseSingle] = self.__idle_sessions.drain()
+
+            else:
+                sessions = self.__idle_sessions.drain(predicate=lambda session: not self.__is_current(session=session))
+
+                # The least recently used connections are closed first
+                sessions.extend(self.__idle_sessions.drain(
+                    limit=max(self.__sessions_count - len(sessions) - self.__size, 0)
+                ))
+
+            self.__sessions_count -= len(sessions)
+            self.__condition.notify_all()
+
+        for session in sessions:
+            self.__close_session(session=session)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __run_in_session(self, call: Callable[[MySQLDataBaseSingle], Any],
+                         deadline: Optional[Deadline], lane_name: Optional[str]) -> Any:
+        with self.leased_connection(deadline=deadline, lane_name=lane_name) as session:
+            return call(session)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @contextmanager
+    def __leased_session(self, deadline: Optional[Deadline], started_at: float) -> Iterator[MySQLDataBaseSingle]:
+        session: MySQLDataBaseSingle = self.get_connection_from_pool(deadline=deadline)
+
+        acquired_at: float = time.monotonic()
+        in_use_count: int = 0
+
+        if self.__pool_sizer is not None:
+            in_use_count = self.__sessions_count - self.__idle_sessions.idle_count
+
+        try:
+            yield session
+
+        finally:
+            self.release_connection_to_pool(session=session)
+
+            if self.__pool_sizer is not None:
+                self.__adapt_size(wait_seconds=acquired_at - started_at,
+                                  hold_seconds=time.monotonic() - acquired_at, in_use_count=in_use_count)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __adapt_size(self, wait_seconds: float, hold_seconds: float, in_use_count: int) -> None:
+        size: int = self.__size
+        recommended_size: int = self.__pool_sizer.observe_lease(wait_seconds=wait_seconds, hold_seconds=hold_seconds,
+                                                                in_use_count=in_use_count, size=size)
+
+        if recommended_size != size:
+            self.resize(size=recommended_size)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __discard_session(self, session: Optional[MySQLDataBaseSingle] = None) -> None:
+        if session is not None:
+            self.__close_session(session=session)
+            self.__idle_sessions.remove(item=session)
+
+        with self.__condition:
+            self.__sessions_count -= 1
+
+            # A waiting thread can create a new connection instead
+            self.__condition.notify()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __close_session(session: MySQLDataBaseSingle) -> None:
+        try:
+            session.close_active_connection_with_database()
+        except Exception:
+            pass
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __forget_parent_leases(self) -> None:
+        # The lock may be held by a thread, which doesn't exist in the child.
+        # The idle sessions have already dropped their inherited sockets, so they are reused.
+        self.__condition = threading.Condition()
+
+        idle_sessions: List[MySQLDataBaseSingle] = self.__idle_sessions.drain()
+        self.__idle_sessions = ConnectionBag()
+
+        for session in idle_sessions:
+            self.__idle_sessions.put(session)
+
+        self.__sessions_count = len(idle_sessions)
+        self.__waiting_count = 0
+
+        if self.__admission_controller is not None:
+            self.__admission_controller = AdmissionController(capacity=self.__size,
+                                                              lanes=self.__admission_controller.lanes)
@@ -12,60 +12,1637 @@ __all__: list[str] = [
 ]
 
 __author__ = "4-proxy"
-__version__ = "0.4.0"
+__version__ = "0.33.0"
+
+import os
+import re
+import threading
+import time
+import weakref
+
+from contextlib import contextmanager
+from functools import partial
 
 from mysql.connector.connection import MySQLConnection
+from mysql.connector.constants import ClientFlag, FieldFlag, FieldType
+from mysql.connector.conversion import MySQLConverter
+from mysql.connector.cursor import MySQLCursor
+from mysql.connector.errorcode import (CR_SERVER_GONE_ERROR, CR_SERVER_LOST, CR_SERVER_LOST_EXTENDED,
+                                       ER_CLIENT_INTERACTION_TIMEOUT, ER_QUERY_INTERRUPTED, ER_QUERY_TIMEOUT)
+from mysql.connector.errors import Error as MySQLError
 
 from abstract.database.sql_database import SQLDataBase
 from abstract.api.sql_api_interface import SQLAPIInterface
+from abstract.api.transaction_interface import TransactionInterface
 from abstract.database.connection_interface import SingleConnectionInterface
 
-from typing import Any, Iterable
+from mysql_support.mysql_compiled_cursor import MySQLCompiledCursor
+from mysql_support.mysql_compression import (MySQLCompression, MySQLMeteredConnection, build_connection_config,
+                                             parse_compression_option)
+from mysql_support.mysql_conversion_config_dto import MySQLConversionConfigDTO
+from mysql_support.mysql_fast_converter import get_converter_class
+from mysql_support.mysql_statement_builder import (add_max_execution_time_hint, build_column_chunk_statements,
+                                                   build_upsert_statement, changes_session_state,
+                                                   split_rows_by_packet_size)
+from mysql_support.mysql_upsert_result_dto import MySQLUpsertResultDTO
+from tools.adaptive_compression import AdaptiveCompressionPolicy, TransferMeter
+from tools.chunked_stream import ChunkedStreamReader, ChunkSink, is_readable_stream
+from tools.columnar_result import ColumnarResultBuilder, FLOAT_TYPECODE, INT_TYPECODE, UINT_TYPECODE
+from tools.deadline import Deadline
+from tools.fork_guard import drop_inherited_socket, register_after_fork_in_child
+from tools.memory_budget_dto import MemoryBudgetDTO
+from tools.row_factory import RowFactory, RowFormat, RowFormatType, get_row_factory
+from tools.schema_metadata_cache import SchemaMetadataCache
+from tools.spilled_rows import SpillableRowBuffer
+from tools.sql_statement_builder import validate_identifier
+from tools.statement_watchdog import StatementWatchdog, WatchedStatement
+
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+INTEGER_FIELD_TYPES: FrozenSet[int] = frozenset((
+    FieldType.TINY, FieldType.SHORT, FieldType.INT24, FieldType.LONG, FieldType.LONGLONG, FieldType.YEAR,
+))
+
+FLOAT_FIELD_TYPES: FrozenSet[int] = frozenset((FieldType.FLOAT, FieldType.DOUBLE))
+
+SESSION_VARIABLE_NAME_PATTERN: re.Pattern = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# The errors, after which the connection is lost and can't be used again
+LOST_CONNECTION_ERRNOS: FrozenSet[int] = frozenset((
+    CR_SERVER_GONE_ERROR, CR_SERVER_LOST, CR_SERVER_LOST_EXTENDED, ER_CLIENT_INTERACTION_TIMEOUT,
+))
+
+# Within `group_commit` a failed upsert is rolled back to it, so the grouped statements are kept
+UPSERT_SAVEPOINT_NAME: str = 'blueberry_upsert'
+
+# The driver sends the long data of a prepared statement in the chunks of 128 KiB
+LONG_DATA_CHUNK_SIZE: int = 128 * 1024
+
+# A character of `utf8mb4` takes up to 4 bytes, so a chunk of TEXT may be 4 times longer in bytes
+MAX_CHARACTER_BYTES: int = 4
+
+# Cancels the statements, which timeouts can't be applied by the `MAX_EXECUTION_TIME` hint
+_statement_watchdog = StatementWatchdog()
+
+
+# ______________________________________________________________________________________________________________________
+class _InfoMessageCursor(MySQLCursor):
+    """_InfoMessageCursor cursor, which keeps the info message of the OK packet (e.g. `Records: 3  Duplicates: 1`)."""
+
+    info_message: Optional[str] = None
+
+    def _handle_noresultset(self, res: Any) -> None:
+        super()._handle_noresultset(res)
+
+        self.info_message = res.get('info_msg')
+
+
+# ______________________________________________________________________________________________________________________
+class _GroupCommitState:
+    """_GroupCommitState counters of the statements waiting for the group commit."""
+
+    def __init__(self, max_statements: int, max_delay_ms: int) -> None:
+        if max_statements <= 0 or max_delay_ms < 0:
+            raise ValueError("The *max_statements* value cannot be <= 0 and *max_delay_ms* cannot be < 0!")
+
+        self.max_statements: int = max_statements
+        self.max_delay: float = max_delay_ms / 1000
+
+        self.pending_statements: int = 0
+        self.first_pending_time: float = 0.0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def register_statement(self) -> bool:
+        """register_statement counts the executed statement and reports whether the commit is due."""
+        if not self.pending_statements:
+            self.first_pending_time = time.monotonic()
+
+        self.pending_statements += 1
+
+        return (
+            self.pending_statements >= self.max_statements
+            or time.monotonic() - self.first_pending_time >= self.max_delay
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def reset(self) -> None:
+        self.pending_statements = 0
+
+
+# ______________________________________________________________________________________________________________________
+class _ConnectionState:
+    """_ConnectionState connection and the state of its session.
+
+    *The state is shared by all threads or owned by a single thread (`thread_affinity` mode).
+    """
+
+    __slots__ = ('connection', 'max_allowed_packet', 'transaction_depth', 'group_commit_state',
+                 'dbconfig_generation', 'pending_connection', 'is_session_changed', 'session_variables',
+                 'cursors', 'cursors_connection', 'transfer_meter', '__weakref__')
+
+    def __init__(self) -> None:
+        self.connection: Optional[MySQLConnection] = None
+        self.max_allowed_packet: Optional[int] = None
+        self.transaction_depth: int = 0
+        self.group_commit_state: Optional[_GroupCommitState] = None
+
+        # The generation of `dbconfig` the connection was opened with and the connection prepared for the new one
+        self.dbconfig_generation: int = 0
+        self.pending_connection: Optional[MySQLConnection] = None
+
+        # Whether the session has to be reset before another user, and the known values of its variables
+        self.is_session_changed: bool = False
+        self.session_variables: Dict[str, Any] = {}
+
+        # The cursors reused by the statements of the connection, by the kind of the cursor
+        self.cursors: Dict[bool, MySQLCursor] = {}
+        self.cursors_connection: Optional[MySQLConnection] = None
+
+        # The bytes per query of the connection in the `adaptive` compression mode
+        self.transfer_meter: Optional[TransferMeter] = None
+
+
+# ______________________________________________________________________________________________________________________
+class _ThreadConnectionState(_ConnectionState):
+    """_ThreadConnectionState state of a thread, its connection is closed when the thread exits.
+
+    *The state is kept in `threading.local`, which releases it when its thread exits.
+    """
+
+    __slots__ = ('owner_pid', 'release_slot')
+
+    def __init__(self, release_slot: Optional[Callable[[], None]]) -> None:
+        super().__init__()
+
+        self.owner_pid: int = os.getpid()
+        self.release_slot: Optional[Callable[[], None]] = release_slot
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __del__(self) -> None:
+        connection: Optional[MySQLConnection] = self.connection
+
+        # A state inherited by a forked child has already dropped its socket
+        if connection is not None and self.owner_pid == os.getpid():
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+        if self.release_slot is not None:
+            self.release_slot()
+
+
+# ______________________________________________________________________________________________________________________
+class _ConnectionStateField:
+    """_ConnectionStateField field of the instance, which is stored in the connection state of the calling thread."""
+
+    def __init__(self, state_attribute: str) -> None:
+        self.state_attribute: str = state_attribute
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+
+        return getattr(instance._connection_state, self.state_attribute)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __set__(self, instance: Any, value: Any) -> None:
+        setattr(instance._connection_state, self.state_attribute, value)
 
 
 # ______________________________________________________________________________________________________________________
-class MySQLDataBaseSingle(SQLDataBase, SingleConnectionInterface[MySQLConnection], SQLAPIInterface):
-    def __init__(self, **dbconfig) -> None:
+class MySQLDataBaseSingle(SQLDataBase, SingleConnectionInterface[MySQLConnection], SQLAPIInterface,
+                          TransactionInterface):
+    # The connection and its session state belong to the calling thread in `thread_affinity` mode
+    __connection_with_database = _ConnectionStateField(state_attribute='connection')
+    __max_allowed_packet = _ConnectionStateField(state_attribute='max_allowed_packet')
+    __transaction_depth = _ConnectionStateField(state_attribute='transaction_depth')
+    __group_commit_state = _ConnectionStateField(state_attribute='group_commit_state')
+    __connection_dbconfig_generation = _ConnectionStateField(state_attribute='dbconfig_generation')
+    __pending_connection = _ConnectionStateField(state_attribute='pending_connection')
+    __is_session_changed = _ConnectionStateField(state_attribute='is_session_changed')
+    __session_variables = _ConnectionStateField(state_attribute='session_variables')
+    __cursors = _ConnectionStateField(state_attribute='cursors')
+    __cursors_connection = _ConnectionStateField(state_attribute='cursors_connection')
+    __transfer_meter = _ConnectionStateField(state_attribute='transfer_meter')
+
+    def __init__(self,
+                 *,
+                 thread_affinity: bool = False,
+                 max_connections: Optional[int] = None,
+                 connection_wait_timeout: float = 10.0,
+                 **dbconfig) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            thread_affinity (bool, optional): Whether each thread lazily gets and reuses its own connection
+                                              built from the same `dbconfig`. The connection of a thread
+                                              is closed when the thread exits. Defaults to False.
+            max_connections (Optional[int], optional): The cap on the connections of all threads
+                                                       in `thread_affinity` mode. Defaults to None (no cap).
+            connection_wait_timeout (float, optional): The max seconds a new thread waits for a free connection
+                                                       when the cap is reached. Defaults to 10.0.
+            dbconfig (dict): The parameters of the connection. The `compression` option (`off`, `zlib`
+                             or `adaptive`) sets the compression of the protocol, see `mysql_compression`.
+
+        Raises:
+            ValueError: If `max_connections` is not positive or the `compression` option is invalid.
+        """
         SQLDataBase.__init__(self=self, **dbconfig)
 
-        self.__connection_with_database: MySQLConnection = None
+        self.__compression: MySQLCompression
+        self.__compression_policy: Optional[AdaptiveCompressionPolicy]
+        self.__compression, self.__compression_policy = parse_compression_option(dbconfig=dbconfig)
+
+        if max_connections is not None and max_connections <= 0:
+            raise ValueError("The *max_connections* value cannot be <= 0!")
+
+        self.__thread_affinity: bool = thread_affinity
+        self.__max_connections: Optional[int] = max_connections
+        self.__connection_wait_timeout: float = connection_wait_timeout
+
+        self.__shared_connection_state = _ConnectionState()
+        self.__thread_connection_states: threading.local = threading.local()
+        self.__connection_slots: Optional[threading.BoundedSemaphore] = self.__create_connection_slots()
+
+        # All states of the instance, so a forked child can drop the sockets of every thread
+        self.__connection_states: 'weakref.WeakSet[_ConnectionState]' = weakref.WeakSet()
+        self.__connection_states.add(self.__shared_connection_state)
+
+        self.__default_row_format: RowFormatType = RowFormat.DICT
+
+        self.__default_conversion: Optional[MySQLConversionConfigDTO] = None
+        self.__converters: Dict[Tuple[MySQLConversionConfigDTO, str, bool], MySQLConverter] = {}
+
+        self.__default_memory_budget: Optional[MemoryBudgetDTO] = None
+        self.__default_timeout: Optional[float] = None
+
+        self.__schema_metadata: Optional[SchemaMetadataCache] = None
+
+        # It is increased by every change of `dbconfig`, the connections of the older generations are replaced
+        self.__dbconfig_generation: int = 0
+
+        # A child of `os.fork()` must not use or close the connection inherited from the parent
+        register_after_fork_in_child(owner=self, callback=MySQLDataBaseSingle.__drop_inherited_connection)
+
+        # The threads create their connections on their first query
+        if not thread_affinity:
+            self.create_new_connection_with_database()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def thread_affinity(self) -> bool:
+        return self.__thread_affinity
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def schema_metadata(self) -> SchemaMetadataCache:
+        """schema_metadata the cache of the metadata of the tables, it is created on the first use.
+
+        *Invalidate the cache after changing a table, e.g. `schema_metadata.invalidate('users')`.
+        """
+        if self.__schema_metadata is None:
+            self.__schema_metadata = SchemaMetadataCache(database=self)
+
+        return self.__schema_metadata
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def in_transaction(self) -> bool:
+        """in_transaction whether the statements run within `transaction` or `group_commit` of the calling thread.
+
+        *The server rolls back the whole transaction after a deadlock, so such a statement must not be retried alone.
+        """
+        # A thread without its connection state hasn't started a transaction
+        if self.__thread_affinity and getattr(self.__thread_connection_states, 'state', None) is None:
+            return False
+
+        return bool(self.__transaction_depth) or self.__group_commit_state is not None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def is_connection_closed(self) -> bool:
+        """is_connection_closed whether the instance has no usable connection (e.g. it was lost or failed the ping).
+
+        *The next query opens a new connection, unless the connection was lost within a transaction.
+        """
+        # A thread without its connection state hasn't opened its connection yet
+        if self.__thread_affinity and getattr(self.__thread_connection_states, 'state', None) is None:
+            return True
+
+        return self.__connection_with_database is None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def _connection_state(self) -> _ConnectionState:
+        if not self.__thread_affinity:
+            return self.__shared_connection_state
+
+        state: Optional[_ConnectionState] = getattr(self.__thread_connection_states, 'state', None)
+
+        if state is None:
+            state = self.__create_thread_connection_state()
+
+        return state
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def default_row_format(self) -> RowFormatType:
+        return self.__default_row_format
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @default_row_format.setter
+    def default_row_format(self, new_row_format: RowFormatType) -> None:
+        """default_row_format setter of the field.
+
+        The format is used by the queries, which don't pass their own `row_format`.
+
+        Args:
+            new_row_format (RowFormatType): The predefined format or the class of the rows (e.g. dataclass).
+        """
+        if not isinstance(new_row_format, (RowFormat, type)):
+            raise TypeError("The row format must be a *RowFormat* or a class of the rows!")
+
+        self.__default_row_format = new_row_format
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def default_conversion(self) -> Optional[MySQLConversionConfigDTO]:
+        return self.__default_conversion
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @default_conversion.setter
+    def default_conversion(self, new_conversion: Optional[MySQLConversionConfigDTO]) -> None:
+        """default_conversion setter of the field.
+
+        The conversion is used by the queries, which don't pass their own `conversion`.
+        `None` means the standard conversion of the driver.
+
+        Args:
+            new_conversion (Optional[MySQLConversionConfigDTO]): The configuration of the conversion of values.
+        """
+        if new_conversion is not None and not isinstance(new_conversion, MySQLConversionConfigDTO):
+            raise TypeError("The conversion must be a *MySQLConversionConfigDTO* or None!")
+
+        self.__default_conversion = new_conversion
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def default_timeout(self) -> Optional[float]:
+        return self.__default_timeout
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @default_timeout.setter
+    def default_timeout(self, new_timeout: Optional[float]) -> None:
+        """default_timeout setter of the field.
+
+        The timeout in seconds is used by the queries, which don't pass their own `timeout`.
+        `None` means the statements are not limited.
+
+        Args:
+            new_timeout (Optional[float]): The max execution time of a statement in seconds.
+        """
+        if new_timeout is not None and new_timeout <= 0:
+            raise ValueError("The timeout cannot be <= 0!")
+
+        self.__default_timeout = new_timeout
 
-        self.create_new_connection_with_database()
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def default_memory_budget(self) -> Optional[MemoryBudgetDTO]:
+        return self.__default_memory_budget
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @default_memory_budget.setter
+    def default_memory_budget(self, new_memory_budget: Optional[MemoryBudgetDTO]) -> None:
+        """default_memory_budget setter of the field.
+
+        The budget is used by `execute_query_returns_all`, which doesn't pass its own `memory_budget`.
+        `None` means all rows are kept in memory.
+
+        Args:
+            new_memory_budget (Optional[MemoryBudgetDTO]): The limits of the rows kept in memory.
+        """
+        if new_memory_budget is not None and not isinstance(new_memory_budget, MemoryBudgetDTO):
+            raise TypeError("The memory budget must be a *MemoryBudgetDTO* or None!")
+
+        self.__default_memory_budget = new_memory_budget
 
     # ------------------------------------------------------------------------------------------------------------------
     def create_new_connection_with_database(self) -> None:
-        connection = MySQLConnection()
+        self.close_active_connection_with_database()
+
+        connection: MySQLConnection = self.__new_connection()
 
         self.__connection_with_database = connection
+        self.__max_allowed_packet = None
 
     # ------------------------------------------------------------------------------------------------------------------
     def get_connection_with_database(self) -> MySQLConnection:
-        pass
+        if self.__connection_with_database is None:
+            # Connecting again within a transaction would run its next statements outside of it
+            if self.__transaction_depth:
+                raise ConnectionError("The connection has been lost within the transaction!")
+
+            self.create_new_connection_with_database()
+
+        connection: MySQLConnection = self.__connection_with_database
+
+        # The connection of an old `dbconfig` or compression is replaced between the transactions, never within one
+        if (self.__connection_dbconfig_generation != self.__dbconfig_generation
+                or self.__is_compression_switch_due(connection=connection)) \
+                and self.__is_connection_opened(connection=connection) \
+                and self.__transaction_depth == 0 and self.__group_commit_state is None \
+                and not connection.in_transaction:
+            connection = self.__switch_to_new_dbconfig(old_connection=connection)
+
+        # The connection is opened lazily, so creating an instance doesn't require the server
+        if not self.__is_connection_opened(connection=connection):
+            try:
+                connection.connect(**self.__get_connection_config())
+
+            except BaseException:
+                # The driver keeps the socket of the failed attempt, so the connection is not reused
+                self.__discard_connection(connection=connection)
+                raise
+
+            self.__max_allowed_packet = None
+            self.__connection_dbconfig_generation = self.__dbconfig_generation
+            self.__forget_session_state()
+
+        return connection
 
     # ------------------------------------------------------------------------------------------------------------------
     def close_active_connection_with_database(self) -> None:
-        pass
+        # A thread without its connection state has nothing to close
+        if self.__thread_affinity and getattr(self.__thread_connection_states, 'state', None) is None:
+            return
+
+        connection: Optional[MySQLConnection] = self.__connection_with_database
+
+        if connection is not None:
+            # The driver keeps the socket of a closed connection, so the closed one is recognized by being dropped
+            self.__connection_with_database = None
+            self.__max_allowed_packet = None
+
+            if self.__is_connection_opened(connection=connection):
+                connection.close()
+
+        pending_connection: Optional[MySQLConnection] = self.__pending_connection
+
+        if pending_connection is not None:
+            self.__pending_connection = None
+            self.__close_quietly(connection=pending_connection)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def reset_connection_session(self, force: bool = False) -> bool:
+        """reset_connection_session resets the session of the opened connection (`COM_RESET_CONNECTION`).
+
+        The session variables, user variables, temporary tables and an open transaction are discarded,
+        so the connection can be reused by another user, e.g. when it is returned to a pool.
+        A connection, which isn't opened, has nothing to reset.
+
+        *The reset costs a round trip, so it is skipped for a clean session: no open transaction
+        and no executed statement, which may change the session (see `changes_session_state`).
+
+        Args:
+            force (bool, optional): Whether to reset a clean session too. Defaults to False.
+
+        Returns:
+            bool: Whether the session was reset.
+        """
+        connection: Optional[MySQLConnection] = self.__connection_with_database
+
+        if connection is None or not self.__is_connection_opened(connection=connection):
+            return False
+
+        if not force and not self.__is_session_changed and not connection.in_transaction:
+            return False
+
+        connection.cmd_reset_connection()
+
+        # The session value may differ from the one of the previous user
+        self.__max_allowed_packet = None
+        self.__forget_session_state()
+
+        return True
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def check_health(self) -> None:
+        """check_health checks the server by a ping (`COM_PING`), the cheapest round trip.
+
+        *A connection, which fails the ping, is closed, so the next query connects again.
+        Set `connection_timeout` in `dbconfig` to limit the check of an unreachable server.
+
+        Raises:
+            mysql.connector.Error: If the server can't be reached or doesn't answer.
+        """
+        connection: MySQLConnection = self.get_connection_with_database()
+
+        try:
+            connection.cmd_ping()
+
+        except Exception:
+            self.__discard_connection(connection=connection)
+            raise
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def set_session_variable(self, variable_name: str, value: Any) -> bool:
+        """set_session_variable sets the session variable, unless it is known to have the value already.
+
+        *The known values are forgotten, when the session is reset or reconnected,
+        or a statement, which may change the session, is executed.
+
+        Example:
+            >>> database.set_session_variable('sql_mode', 'STRICT_ALL_TABLES')
+            True
+            >>> database.set_session_variable('sql_mode', 'STRICT_ALL_TABLES')  # no round trip
+            False
+
+        Args:
+            variable_name (str): The name of the system variable (e.g. `time_zone`).
+            value (Any): The value of the variable, it is passed as a parameter of the statement.
+
+        Raises:
+            ValueError: If the name of the variable is not a plain identifier.
+
+        Returns:
+            bool: Whether the `SET` statement was executed.
+        """
+        if not SESSION_VARIABLE_NAME_PATTERN.match(variable_name):
+            raise ValueError(f"Invalid name of the session variable: {variable_name!r}!")
+
+        variable_name = variable_name.lower()
+        connection: MySQLConnection = self.get_connection_with_database()
+        session_variables: Dict[str, Any] = self.__session_variables
+
+        if variable_name in session_variables and session_variables[variable_name] == value:
+            return False
+
+        with self.__reused_cursor(connection=connection) as cursor:
+            cursor.execute(f"SET SESSION {variable_name} = %s", (value,))
+
+        self.__is_session_changed = True
+        session_variables[variable_name] = value
+
+        return True
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _on_dbconfig_changed(self, old_dbconfig: Dict[str, Any]) -> None:
+        """_on_dbconfig_changed switches the instance to the new `dbconfig` without interrupting its work.
+
+        The opened shared connection is replaced by a connection opened with the new parameters in advance,
+        so the switch doesn't delay a query and the new parameters (e.g. rotated credentials) are verified
+        before they are used. The old connection finishes its transaction and is closed before the next statement
+        outside of it. In `thread_affinity` mode, each thread opens its new connection the same way lazily.
+
+        Args:
+            old_dbconfig (Dict[str, Any]): The previous parameters of the connection.
+
+        Raises:
+            ValueError: If the `compression` option is invalid (the previous `dbconfig` is kept).
+            mysql.connector.Error: If the connection with the new parameters can't be opened
+                                   (the previous `dbconfig` is kept).
+        """
+        old_compression: Tuple[MySQLCompression, Optional[AdaptiveCompressionPolicy]] = (
+            self.__compression, self.__compression_policy
+        )
+        self.__compression, self.__compression_policy = parse_compression_option(dbconfig=self.dbconfig)
+
+        if not self.__thread_affinity:
+            connection: Optional[MySQLConnection] = self.__connection_with_database
+
+            if connection is not None and self.__is_connection_opened(connection=connection):
+                new_connection: MySQLConnection = self.__new_connection()
+
+                try:
+                    new_connection.connect(**self.__get_connection_config())
+
+                except BaseException:
+                    self.__compression, self.__compression_policy = old_compression
+                    raise
+
+                # A connection prepared for a previous change is never used
+                if self.__pending_connection is not None:
+                    self.__close_quietly(connection=self.__pending_connection)
+
+                self.__pending_connection = new_connection
+
+        self.__dbconfig_generation += 1
 
     # ------------------------------------------------------------------------------------------------------------------
-    def execute_query_no_returns(self, sql_query: str, *query_data) -> None:
-        pass
+    def execute_query_no_returns(self, sql_query: str, *query_data,
+                                 timeout: Optional[float] = None,
+                                 deadline: Optional[Deadline] = None) -> None:
+        self.__check_deadline(deadline=deadline)
+
+        connection: MySQLConnection = self.get_connection_with_database()
+        self.__track_session_change(sql_query=sql_query)
+
+        with self.__reused_cursor(connection=connection) as cursor, \
+                self.__statement_timeout(connection=connection, sql_query=sql_query,
+                                         timeout=timeout, deadline=deadline) as timed_query:
+            cursor.execute(timed_query, query_data)
+
+        self.__commit_if_needed(connection=connection)
 
     # ------------------------------------------------------------------------------------------------------------------
-    def execute_query_returns_one(self, sql_query: str, *query_data) -> Any:
-        pass
+    def execute_query_returns_one(self, sql_query: str, *query_data,
+                                  row_format: Optional[RowFormatType] = None,
+                                  conversion: Optional[MySQLConversionConfigDTO] = None,
+                                  timeout: Optional[float] = None,
+                                  deadline: Optional[Deadline] = None) -> Any:
+        self.__check_deadline(deadline=deadline)
+
+        connection: MySQLConnection = self.get_connection_with_database()
+        self.__track_session_change(sql_query=sql_query)
+
+        with self.__open_cursor(connection=connection, conversion=conversion) as cursor:
+            with self.__statement_timeout(connection=connection, sql_query=sql_query,
+                                          timeout=timeout, deadline=deadline) as timed_query:
+                cursor.execute(timed_query, query_data)
+
+                row: Any = cursor.fetchone()
+
+                # The rest of the result set must be read before the next query
+                if connection.unread_result:
+                    connection.consume_results()
+
+            row_factory: Optional[RowFactory] = self.__get_row_factory(cursor=cursor, row_format=row_format)
+
+        if row is None or row_factory is None:
+            return row
+
+        return row_factory(row)
 
     # ------------------------------------------------------------------------------------------------------------------
-    def execute_query_returns_all(self, sql_query: str, *query_data) -> Iterable[Any]:
-        pass
+    def execute_query_returns_all(self, sql_query: str, *query_data,
+                                  row_format: Optional[RowFormatType] = None,
+                                  conversion: Optional[MySQLConversionConfigDTO] = None,
+                                  memory_budget: Optional[MemoryBudgetDTO] = None,
+                                  timeout: Optional[float] = None,
+                                  deadline: Optional[Deadline] = None) -> Iterable[Any]:
+        """execute_query_returns_all executes the query and returns all rows of the result.
+
+        *With a memory budget, a result over the budget is returned as `SpilledRowSequence`,
+        which should be closed when it is not needed (or used as a context manager).
+
+        Args:
+            sql_query (str): The SQL query.
+            query_data: The parameters of the query.
+            row_format (Optional[RowFormatType], optional): The format of the rows. Defaults to None
+                                                            (`default_row_format`).
+            conversion (Optional[MySQLConversionConfigDTO], optional): The conversion of values. Defaults to None
+                                                                       (`default_conversion`).
+            memory_budget (Optional[MemoryBudgetDTO], optional): The limits of the rows kept in memory.
+                                                                 Defaults to None (`default_memory_budget`).
+            timeout (Optional[float], optional): The max execution time in seconds. Defaults to None
+                                                 (`default_timeout`).
+            deadline (Optional[Deadline], optional): The deadline of the request, it shrinks the timeout.
+                                                     Defaults to None.
+
+        Raises:
+            TimeoutError: If the statement is interrupted by the timeout or the deadline has passed.
+
+        Returns:
+            Iterable[Any]: The rows (`list` or `SpilledRowSequence`) or None, if there are no rows.
+        """
+        self.__check_deadline(deadline=deadline)
+
+        connection: MySQLConnection = self.get_connection_with_database()
+        self.__track_session_change(sql_query=sql_query)
+
+        if memory_budget is None:
+            memory_budget = self.__default_memory_budget
+
+        with self.__open_cursor(connection=connection, conversion=conversion) as cursor, \
+                self.__statement_timeout(connection=connection, sql_query=sql_query,
+                                         timeout=timeout, deadline=deadline) as timed_query:
+            cursor.execute(timed_query, query_data)
+
+            if memory_budget is None:
+                rows: Iterable[Any] = self.__fetch_all_rows(cursor=cursor, row_format=row_format)
+
+            else:
+                rows = self.__fetch_rows_within_budget(cursor=cursor, row_format=row_format,
+                                                       memory_budget=memory_budget)
+
+        return rows or None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_query_returns_columns(self, sql_query: str, *query_data,
+                                      chunk_size: int = 10_000,
+                                      conversion: Optional[MySQLConversionConfigDTO] = None,
+                                      timeout: Optional[float] = None,
+                                      deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        self.__check_deadline(deadline=deadline)
+
+        connection: MySQLConnection = self.get_connection_with_database()
+        self.__track_session_change(sql_query=sql_query)
+
+        with self.__open_cursor(connection=connection, conversion=conversion) as cursor, \
+                self.__statement_timeout(connection=connection, sql_query=sql_query,
+                                         timeout=timeout, deadline=deadline) as timed_query:
+            cursor.execute(timed_query, query_data)
+
+            # The raw values are not converted (`bytes`), so they are kept in the object columns
+            is_raw: bool = self.__is_raw_result(connection=connection, conversion=conversion)
+
+            builder = ColumnarResultBuilder(column_names=cursor.column_names,
+                                            typecodes=[None if is_raw
+                                                       else self.__get_column_typecode(column_description=description)
+                                                       for description in cursor.description or ()])
+
+            while rows := cursor.fetchmany(size=chunk_size):
+                builder.append_rows(rows=rows)
+
+        return builder.build()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _read_metadata_rows(self, sql_query: str, *query_data) -> List[Tuple[Any, ...]]:
+        """_read_metadata_rows executes the query of `INFORMATION_SCHEMA` and returns the rows as tuples.
+
+        *The query is executed with the default conversion and without a memory budget, so the options
+        of the caller (`default_row_format`, `default_conversion`, ...) don't change the metadata.
+        A raw cursor configured by `dbconfig` still returns `bytearray` values, they are decoded by the reader.
+        """
+        connection: MySQLConnection = self.get_connection_with_database()
+
+        with self.__reused_cursor(connection=connection) as cursor:
+            cursor.execute(sql_query, query_data)
+            rows: List[Tuple[Any, ...]] = [tuple(row) for row in cursor.fetchall()]
+
+        return rows
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_multi_statement(self,
+                                sql_queries: Union[str, Sequence[str]],
+                                *query_data,
+                                row_format: Optional[RowFormatType] = None,
+                                conversion: Optional[MySQLConversionConfigDTO] = None,
+                                timeout: Optional[float] = None,
+                                deadline: Optional[Deadline] = None) -> List[Optional[List[Any]]]:
+        """execute_multi_statement sends several statements in a single round trip and returns all their results.
+
+        The statements are sent as one multi-statement query, and the server returns
+        the results one after another (MySQL multi-results protocol),
+        so the independent statements don't wait for the round trip of each other.
+        A stored procedure `CALL` is executed the same way and returns all its result sets.
+
+        *`query_data` are the parameters of all statements in the order of their placeholders.
+        *The server stops at the first failed statement, the exception is raised,
+        and the statements executed before it are not rolled back.
+
+        Args:
+            sql_queries (Union[str, Sequence[str]]): The statements, either a sequence or a string separated by `;`.
+            query_data (tuple): Optional parameters to be used in the statements.
+            row_format (Optional[RowFormatType], optional): The format of the rows. Defaults to None
+                                                            (`default_row_format`).
+            conversion (Optional[MySQLConversionConfigDTO], optional): The conversion of values. Defaults to None
+                                                                       (`default_conversion`).
+            timeout (Optional[float], optional): The max execution time of all statements in seconds.
+                                                 Defaults to None (`default_timeout`).
+            deadline (Optional[Deadline], optional): The deadline of the request, it shrinks the timeout.
+                                                     Defaults to None.
+
+        Raises:
+            TimeoutError: If the statements are interrupted by the timeout or the deadline has passed.
+
+        Returns:
+            List[Optional[List[Any]]]: The results in the order of the server: the rows of each result set
+                                       or `None` for a result without rows (e.g. `INSERT`
+                                       or the final status of `CALL`).
+        """
+        self.__check_deadline(deadline=deadline)
+
+        if not isinstance(sql_queries, str):
+            sql_queries = '; '.join(sql_query.strip().rstrip(';') for sql_query in sql_queries)
+
+        connection: MySQLConnection = self.get_connection_with_database()
+        self.__track_session_change(sql_query=sql_queries)
+
+        results: List[Optional[List[Any]]] = []
+
+        # The hint would limit only the first statement, so the whole batch is watched
+        with self.__open_cursor(connection=connection, conversion=conversion) as cursor, \
+                self.__statement_timeout(connection=connection, sql_query=sql_queries,
+                                         timeout=timeout, deadline=deadline, use_hint=False) as timed_queries:
+            cursor.execute(timed_queries, query_data)
+
+            while True:
+                rows: Optional[List[Any]] = self.__fetch_all_rows(cursor=cursor, row_format=row_format) \
+                    if cursor.with_rows else None
+                results.append(rows)
+
+                if not cursor.nextset():
+                    break
+
+        self.__commit_if_needed(connection=connection)
+
+        return results
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_bulk_upsert(self,
+                            table_name: str,
+                            column_names: Sequence[str],
+                            rows: Iterable[Sequence[Any]],
+                            key_column_names: Optional[Sequence[str]] = None,
+                            update_column_names: Optional[Sequence[str]] = None) -> MySQLUpsertResultDTO:
+        """execute_bulk_upsert inserts new rows and updates existing rows with multi-row statements.
+
+        The rows are sent as `INSERT ... ON DUPLICATE KEY UPDATE` statements,
+        each of them as large as `max_allowed_packet` of the server allows.
+        This replaces a `SELECT` followed by an `INSERT` or `UPDATE` for each row.
+
+        *The duplicates are detected by MySQL itself, so `key_column_names` must be
+        the columns of the primary key or of a unique index of the table.
+        *All statements are committed together, if any of them fails, all of them are rolled back.
+        With `autocommit`, the statements of several batches are run in an explicit transaction.
+
+        Args:
+            table_name (str): The name of the target table.
+            column_names (Sequence[str]): The names of the columns of every row.
+            rows (Iterable[Sequence[Any]]): The rows in the order of `column_names`.
+            key_column_names (Optional[Sequence[str]], optional): The names of the key columns, they are never
+                                                                  updated. Defaults to None (the primary or
+                                                                  a unique key of the table within `column_names`,
+                                                                  found by `schema_metadata`).
+            update_column_names (Optional[Sequence[str]], optional): The names of the columns updated for
+                                                                     the existing rows. Defaults to None
+                                                                     (all columns except the keys).
+
+        Raises:
+            ValueError: If the key or update columns are not a part of `column_names` or intersect,
+                        or the table has no key within `column_names`.
+
+        Returns:
+            MySQLUpsertResultDTO: The number of inserted, updated and unchanged rows
+                                  (see `MySQLUpsertResultDTO.from_statement_result` about `FOUND_ROWS`).
+        """
+        column_names = [validate_identifier(identifier=name) for name in column_names]
+
+        if key_column_names is None:
+            key_column_names = self.schema_metadata.get_table_metadata(table_name=table_name).find_key_within(
+                column_names=column_names
+            )
+
+        if not key_column_names or not set(key_column_names) <= set(column_names):
+            raise ValueError("The key columns must be a non-empty part of the *column_names*!")
+
+        if update_column_names is None:
+            update_column_names = [name for name in column_names if name not in key_column_names]
+
+        if not set(update_column_names) <= set(column_names):
+            raise ValueError("The update columns must be a part of the *column_names*!")
+
+        if set(update_column_names) & set(key_column_names):
+            raise ValueError("The key columns cannot be updated!")
+
+        connection: MySQLConnection = self.get_connection_with_database()
+
+        found_rows: bool = ClientFlag.FOUND_ROWS in self.dbconfig.get('client_flags', ())
+        statement_overhead: int = len(build_upsert_statement(table_name=table_name,
+                                                             column_names=column_names,
+                                                             update_column_names=update_column_names,
+                                                             rows_count=1))
+
+        result = MySQLUpsertResultDTO()
+
+        # A savepoint of the same name is replaced by the next upsert and released by the commit of the group
+        is_grouped: bool = not self.__transaction_depth and self.__group_commit_state is not None
+
+        if is_grouped:
+            connection.cmd_query(f"SAVEPOINT {UPSERT_SAVEPOINT_NAME}")
+
+        # With `autocommit` every statement would be committed at once, so the batches are run in a transaction
+        is_autocommit: bool = not self.__transaction_depth and not is_grouped \
+            and bool(self.dbconfig.get('autocommit', False))
+
+        try:
+            batches: Iterator[List[Tuple[Any, ...]]] = split_rows_by_packet_size(
+                rows=rows, max_packet_size=self.__get_max_allowed_packet(), statement_overhead=statement_overhead
+            )
+            batch: Optional[List[Tuple[Any, ...]]] = next(batches, None)
+
+            with connection.cursor(cursor_class=_InfoMessageCursor) as cursor:
+                while batch is not None:
+                    # The next batch is taken in advance, so a single statement doesn't need the transaction
+                    next_batch: Optional[List[Tuple[Any, ...]]] = next(batches, None)
+
+                    if is_autocommit and next_batch is not None and not connection.in_transaction:
+                        connection.start_transaction()
+
+                    sql_query: str = build_upsert_statement(table_name=table_name,
+                                                            column_names=column_names,
+                                                            update_column_names=update_column_names,
+                                                            rows_count=len(batch))
+
+                    cursor.execute(sql_query, [value for row in batch for value in row])
+
+                    result += MySQLUpsertResultDTO.from_statement_result(rows_count=len(batch),
+                                                                         affected_rows=cursor.rowcount,
+                                                                         info_message=cursor.info_message,
+                                                                         found_rows=found_rows)
+                    batch = next_batch
+
+        except Exception as error:
+            self.__discard_lost_connection(connection=connection, error=error)
+
+            # Within `transaction` the rollback is done by the context manager
+            if not self.__transaction_depth and self.__connection_with_database is connection:
+                if is_grouped:
+                    connection.cmd_query(f"ROLLBACK TO SAVEPOINT {UPSERT_SAVEPOINT_NAME}")
+                else:
+                    connection.rollback()
+
+            raise
+
+        self.__commit_if_needed(connection=connection)
+
+        return result
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_query_with_streams(self, sql_query: str, *query_data,
+                                   timeout: Optional[float] = None,
+                                   deadline: Optional[Deadline] = None) -> None:
+        """execute_query_with_streams executes the statement, which parameters may be binary file objects.
+
+        The file objects are sent in chunks before the statement is executed (`COM_STMT_SEND_LONG_DATA`
+        of a server-side prepared statement), so a large value (e.g. an artifact of 200 MB) is never held
+        in memory as a whole. Each chunk is read into a single reused buffer and sent from its `memoryview`.
+
+        *The statement is prepared and closed for every call, use `execute_query_no_returns` for small values.
+        A value must fit into `max_allowed_packet` of the server, though it is sent in chunks.
+
+        Example:
+            >>> with open('model.bin', 'rb') as stream:
+            ...     database.execute_query_with_streams("INSERT INTO artifacts (name, data) VALUES (%s, %s)",
+            ...                                         'model', stream)
+
+        Args:
+            sql_query (str): The SQL statement.
+            query_data: The parameters of the statement, the binary file objects are read from their position.
+            timeout (Optional[float], optional): The max execution time in seconds. Defaults to None
+                                                 (`default_timeout`).
+            deadline (Optional[Deadline], optional): The deadline of the request, it shrinks the timeout.
+                                                     Defaults to None.
+
+        Raises:
+            TypeError: If a file object is not binary.
+            TimeoutError: If the statement is interrupted by the timeout or the deadline has passed.
+        """
+        self.__check_deadline(deadline=deadline)
+
+        params: Tuple[Any, ...] = tuple(
+            ChunkedStreamReader(stream=value, chunk_size=LONG_DATA_CHUNK_SIZE) if is_readable_stream(value=value)
+            else value
+            for value in query_data
+        )
+
+        connection: MySQLConnection = self.get_connection_with_database()
+        self.__track_session_change(sql_query=sql_query)
+
+        try:
+            with connection.cursor(prepared=True) as cursor, \
+                    self.__statement_timeout(connection=connection, sql_query=sql_query,
+                                             timeout=timeout, deadline=deadline) as timed_query:
+                cursor.execute(timed_query, params)
+
+        except BaseException as error:
+            self.__discard_lost_connection(connection=connection, error=error)
+            raise
+
+        self.__commit_if_needed(connection=connection)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def read_column_into(self,
+                         table_name: str,
+                         column_name: str,
+                         key: Dict[str, Any],
+                         target: Any,
+                         chunk_size: Optional[int] = None) -> Optional[int]:
+        """read_column_into reads a large BLOB or TEXT value of a row into the buffer or the file object in chunks.
+
+        Every chunk is a separate query (`SUBSTRING`), so neither the client nor a single packet holds
+        the whole value. The chunks are written to the target through `memoryview` slices,
+        without joining them. The queries run in a single transaction, so they read the same version of the row.
+
+        *Each chunk query makes the server read the whole value again before it is cut, so the work
+        of the server grows with the size of the value times the number of the chunks. The default chunk
+        is as large as `max_allowed_packet` allows (16 MiB of the default 64 MiB, e.g. 13 queries
+        for 200 MB), smaller chunks save the memory of the client at this cost.
+        *`chunk_size` is counted in characters for a TEXT column, the value is returned in the charset
+        of the connection. The buffer must have the size of the value in this charset
+        (e.g. a `latin1` value of 10 bytes takes up to 20 bytes in `utf8mb4`).
+
+        Example:
+            >>> with open('model.bin', 'wb') as stream:
+            ...     database.read_column_into('artifacts', 'data', key={'id': 42}, target=stream)
+            209715200
+
+        Args:
+            table_name (str): The name of the table.
+            column_name (str): The name of the BLOB or TEXT column.
+            key (Dict[str, Any]): The values of the columns, which identify the row (e.g. the primary key).
+            target (Any): A binary file object or a writable buffer (`bytearray`, `mmap`, ...) of a sufficient size,
+                          it is written from its position (start).
+            chunk_size (Optional[int], optional): The max length of a chunk. Defaults to None
+                                                  (a quarter of `max_allowed_packet` of the session).
+
+        Raises:
+            TypeError: If the target is neither a file object nor a writable buffer.
+            ValueError: If the chunk size is invalid, the key doesn't identify a single row
+                        or the value doesn't fit into the target buffer.
+
+        Returns:
+            Optional[int]: The number of the written bytes, None if there is no such row or the value is NULL.
+        """
+        if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size <= 0):
+            raise ValueError("The *chunk_size* must be an int > 0!")
+
+        key_values: Tuple[Any, ...] = tuple(key.values())
+        sink = ChunkSink(target=target)
+
+        with self.transaction():
+            connection: MySQLConnection = self.get_connection_with_database()
+
+            # The size of the buffer is counted in the charset, in which the server returns the chunks
+            length_query, chunk_query = build_column_chunk_statements(table_name=table_name,
+                                                                      column_name=column_name,
+                                                                      key_column_names=list(key),
+                                                                      charset_name=connection.charset)
+
+            # The raw cursor returns the chunks as they are received, without a conversion
+            with self.__reused_cursor(connection=connection, is_raw=True) as cursor:
+                cursor.execute(length_query, key_values)
+                rows: List[Any] = cursor.fetchall()
+
+                if len(rows) > 1:
+                    raise ValueError(f"The key must identify a single row, *{len(rows)}* rows are found!")
+
+                if not rows or rows[0][0] is None:
+                    return None
+
+                bytes_length, chars_length = int(rows[0][0]), int(rows[0][1])
+                sink.reserve(size=bytes_length)
+
+                if chunk_size is None:
+                    # A chunk of any charset must fit into a packet of the result
+                    chunk_size = max(self.__get_max_allowed_packet() // MAX_CHARACTER_BYTES, 1)
+
+                for position in range(1, chars_length + 1, chunk_size):
+                    cursor.execute(chunk_query, (position, chunk_size) + key_values)
+                    (chunk,) = cursor.fetchone()
+
+                    # The rest of the result set must be read before the next chunk
+                    if connection.unread_result:
+                        connection.consume_results()
+
+                    sink.write(chunk=chunk)
+
+        return sink.written_bytes
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @contextmanager
+    def transaction(self) -> Iterator['MySQLDataBaseSingle']:
+        connection: MySQLConnection = self.get_connection_with_database()
+
+        if self.__transaction_depth:
+            yield from self.__run_savepoint(connection=connection)
+            return
+
+        # The statements of the group commit are not a part of the explicit transaction
+        self.__commit_group(connection=connection)
+
+        # The reads without `autocommit` leave an implicit transaction open, the driver refuses to start another one.
+        # It is committed, as `START TRANSACTION` of the server does.
+        if connection.in_transaction:
+            connection.commit()
+
+        connection.start_transaction()
+        self.__transaction_depth = 1
+
+        try:
+            yield self
+
+        except BaseException:
+            # The server rolls back the transaction of a lost connection itself
+            if self.__connection_with_database is connection:
+                connection.rollback()
+
+            raise
+
+        else:
+            connection.commit()
+
+        finally:
+            self.__transaction_depth = 0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @contextmanager
+    def group_commit(self, max_statements: int = 100, max_delay_ms: int = 50) -> Iterator['MySQLDataBaseSingle']:
+        """group_commit returns a context manager, which groups the commits of separate statements.
+
+        *`max_delay_ms` is checked when a statement is executed, so an idle connection
+        keeps the statements uncommitted until the next statement or leaving the context.
+        *The statements executed before an exception are still committed when leaving the context,
+        as they would be without the group commit.
+        """
+        if self.__group_commit_state is not None:
+            raise RuntimeError("The group commit is already active!")
+
+        connection: MySQLConnection = self.get_connection_with_database()
+
+        self.__group_commit_state = _GroupCommitState(max_statements=max_statements, max_delay_ms=max_delay_ms)
+
+        is_autocommit: bool = bool(self.dbconfig.get('autocommit', False))
+
+        if is_autocommit:
+            connection.autocommit = False
+
+        try:
+            yield self
+
+        finally:
+            try:
+                self.__commit_group(connection=connection)
+
+            finally:
+                self.__group_commit_state = None
+
+                if is_autocommit:
+                    connection.autocommit = True
 
     # ------------------------------------------------------------------------------------------------------------------
     def __str__(self) -> str:
-        return ""
+        connection_params: List[str] = [
+            f"{param}={self.dbconfig[param]!r}"
+            for param in ('host', 'port', 'user', 'database')
+            if param in self.dbconfig
+        ]
+
+        return f"{self.__class__.__name__}({', '.join(connection_params)})"
 
     # ------------------------------------------------------------------------------------------------------------------
     def _get_info_about_server(self) -> str:
-        pass
+        connection: MySQLConnection = self.get_connection_with_database()
+
+        return f"MySQL server {connection.server_info} on {connection.server_host}:{connection.server_port}"
 
     # ------------------------------------------------------------------------------------------------------------------
     def _get_info_about_connection(self) -> str:
-        pass
+        connection: MySQLConnection = self.get_connection_with_database()
+
+        return (
+            f"Connection id={connection.connection_id}, user={connection.user!r}, "
+            f"database={connection.database!r}, charset={connection.charset!r}"
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @contextmanager
+    def __open_cursor(self,
+                      connection: MySQLConnection,
+                      conversion: Optional[MySQLConversionConfigDTO]) -> Iterator[MySQLCursor]:
+        if conversion is None:
+            conversion = self.__default_conversion
+
+        if conversion is None:
+            with self.__reused_cursor(connection=connection) as cursor:
+                yield cursor
+
+            return
+
+        if conversion.raw:
+            with self.__reused_cursor(connection=connection, is_raw=True) as cursor:
+                yield cursor
+
+            return
+
+        # The converter of the connection is replaced only for the time of the query
+        original_converter: MySQLConverter = connection.converter
+        connection.converter = self.__get_converter(connection=connection, conversion=conversion)
+
+        try:
+            with self.__reused_cursor(connection=connection) as cursor:
+                yield cursor
+
+        finally:
+            connection.converter = original_converter
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @contextmanager
+    def __reused_cursor(self, connection: MySQLConnection, is_raw: bool = False) -> Iterator[MySQLCursor]:
+        """__reused_cursor lends the cursor of the connection, which is created once for the statements of its kind.
+
+        *The cursor is taken out of the cache for the time of the statement, so a nested statement gets its own one.
+        A cursor, which has failed, is closed and not reused.
+        """
+        # The cursors of a replaced connection are dropped with it
+        if self.__cursors_connection is not connection:
+            self.__cursors_connection = connection
+            self.__cursors = {}
+
+        cursors: Dict[bool, MySQLCursor] = self.__cursors
+        cursor: Optional[MySQLCursor] = cursors.pop(is_raw, None)
+
+        if cursor is None:
+            cursor = self.__create_cursor(connection=connection, is_raw=is_raw).__enter__()
+
+        try:
+            yield cursor
+
+        except BaseException as error:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+
+            self.__discard_lost_connection(connection=connection, error=error)
+            raise
+
+        # The unread rows are handled as by closing the cursor
+        connection.handle_unread_result()
+        cursors[is_raw] = cursor
+
+        transfer_meter: Optional[TransferMeter] = self.__transfer_meter
+
+        if transfer_meter is not None and isinstance(connection, MySQLMeteredConnection):
+            transfer_meter.observe_query(received_bytes=connection.take_received_bytes())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __create_cursor(connection: MySQLConnection, is_raw: bool) -> MySQLCursor:
+        if is_raw:
+            return connection.cursor(raw=True)
+
+        # The buffered or raw cursors configured by `dbconfig` are kept
+        if getattr(connection, '_buffered', False) or getattr(connection, '_raw', False):
+            return connection.cursor()
+
+        return connection.cursor(cursor_class=MySQLCompiledCursor)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @contextmanager
+    def __statement_timeout(self,
+                            connection: MySQLConnection,
+                            sql_query: str,
+                            timeout: Optional[float],
+                            deadline: Optional[Deadline] = None,
+                            use_hint: bool = True) -> Iterator[str]:
+        """__statement_timeout limits the execution time of the statement executed within the context.
+
+        A `SELECT` is limited by the server with the `MAX_EXECUTION_TIME` hint, other statements
+        are cancelled by `KILL QUERY` from a side connection. Either way the statement is interrupted,
+        the connection is cleaned for the next query and `TimeoutError` is raised.
+        The timeout is shrunk to the time remaining until `deadline`.
+
+        Raises:
+            TimeoutError: If the deadline has passed, the statement is not executed.
+
+        Yields:
+            Iterator[str]: The statement to execute (with the hint, if it is applied).
+        """
+        if timeout is None:
+            timeout = self.__default_timeout
+
+        if deadline is not None:
+            timeout = deadline.limit_timeout(timeout=timeout)
+
+        if timeout is None:
+            yield sql_query
+            return
+
+        hinted_query: Optional[str] = None
+
+        if use_hint:
+            hinted_query = add_max_execution_time_hint(sql_query=sql_query, timeout_ms=int(timeout * 1000))
+
+        watched: Optional[WatchedStatement] = None
+
+        if hinted_query is None:
+            watched = _statement_watchdog.watch(timeout=timeout,
+                                                on_timeout=partial(self.__kill_query,
+                                                                   connection_id=connection.connection_id))
+
+        try:
+            yield sql_query if hinted_query is None else hinted_query
+
+        except MySQLError as error:
+            is_timed_out: bool = watched is not None and watched.finish()
+
+            if error.errno == ER_QUERY_TIMEOUT or (is_timed_out and error.errno == ER_QUERY_INTERRUPTED):
+                self.__clean_connection_after_timeout(connection=connection)
+
+                raise TimeoutError(f"The statement exceeded the timeout: *{timeout}* seconds!") from error
+
+            raise
+
+        finally:
+            if watched is not None:
+                watched.finish()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __check_deadline(deadline: Optional[Deadline]) -> None:
+        # An expired request doesn't open the connection or reset the session before it fails
+        if deadline is not None:
+            deadline.check(operation="The statement")
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __kill_query(self, connection_id: int) -> None:
+        side_connection = MySQLConnection()
+
+        # The side connection transfers nothing, so it is never compressed
+        side_connection.connect(**build_connection_config(dbconfig=self.dbconfig, compress=False))
+
+        try:
+            side_connection.cmd_query(f"KILL QUERY {int(connection_id)}")
+        finally:
+            side_connection.close()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __clean_connection_after_timeout(self, connection: MySQLConnection) -> None:
+        try:
+            if connection.unread_result:
+                connection.consume_results()
+
+            # The interrupted statement is rolled back by the server, but its implicit transaction keeps the locks.
+            # Within `transaction` and `group_commit` the other statements must be kept.
+            if not self.__transaction_depth and self.__group_commit_state is None and connection.in_transaction:
+                connection.rollback()
+
+        except Exception:
+            # A connection in an unknown state is not reused, the next query connects again
+            self.__discard_connection(connection=connection)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __get_converter(self, connection: MySQLConnection, conversion: MySQLConversionConfigDTO) -> MySQLConverter:
+        converter_key: Tuple[MySQLConversionConfigDTO, str, bool] = (conversion, connection.charset,
+                                                                     connection.use_unicode)
+
+        converter: Optional[MySQLConverter] = self.__converters.get(converter_key)
+
+        if converter is None:
+            converter = get_converter_class(conversion_config=conversion)(connection.charset, connection.use_unicode)
+            self.__converters[converter_key] = converter
+
+        return converter
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __get_row_factory(self, cursor: MySQLCursor, row_format: Optional[RowFormatType]) -> Optional[RowFactory]:
+        return get_row_factory(row_format=self.__default_row_format if row_format is None else row_format,
+                               column_names=cursor.column_names)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __fetch_all_rows(self, cursor: MySQLCursor, row_format: Optional[RowFormatType]) -> List[Any]:
+        rows: List[Any] = cursor.fetchall()
+        row_factory: Optional[RowFactory] = self.__get_row_factory(cursor=cursor, row_format=row_format)
+
+        if row_factory is None:
+            return rows
+
+        return list(map(row_factory, rows))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __fetch_rows_within_budget(self,
+                                   cursor: MySQLCursor,
+                                   row_format: Optional[RowFormatType],
+                                   memory_budget: MemoryBudgetDTO) -> Iterable[Any]:
+        buffer = SpillableRowBuffer(memory_budget=memory_budget,
+                                    row_factory=self.__get_row_factory(cursor=cursor, row_format=row_format))
+
+        while rows := cursor.fetchmany(size=memory_budget.chunk_size):
+            buffer.append_rows(rows=rows)
+
+        return buffer.build()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __get_max_allowed_packet(self) -> int:
+        if self.__max_allowed_packet is None:
+            connection: MySQLConnection = self.get_connection_with_database()
+
+            row: Tuple[Any, ...] = connection.info_query("SELECT @@session.max_allowed_packet")
+
+            self.__max_allowed_packet = int(row[0])
+
+        return self.__max_allowed_packet
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __run_savepoint(self, connection: MySQLConnection) -> Iterator['MySQLDataBaseSingle']:
+        # The depth is unique among the active savepoints, so it is used as the name
+        savepoint_name: str = f"blueberry_savepoint_{self.__transaction_depth}"
+
+        connection.cmd_query(f"SAVEPOINT {savepoint_name}")
+        self.__transaction_depth += 1
+
+        try:
+            yield self
+
+        except BaseException:
+            connection.cmd_query(f"ROLLBACK TO SAVEPOINT {savepoint_name}")
+            raise
+
+        else:
+            connection.cmd_query(f"RELEASE SAVEPOINT {savepoint_name}")
+
+        finally:
+            self.__transaction_depth -= 1
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __commit_if_needed(self, connection: MySQLConnection) -> None:
+        if self.__transaction_depth:
+            return
+
+        if self.__group_commit_state is not None:
+            if self.__group_commit_state.register_statement():
+                self.__commit_group(connection=connection)
+
+            return
+
+        # Checking the status flag doesn't need a round trip, unlike `autocommit` property
+        if connection.in_transaction:
+            connection.commit()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __commit_group(self, connection: MySQLConnection) -> None:
+        if self.__group_commit_state is None or not self.__group_commit_state.pending_statements:
+            return
+
+        connection.commit()
+        self.__group_commit_state.reset()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __get_column_typecode(column_description: Tuple[Any, ...]) -> Optional[str]:
+        field_type: int = column_description[1]
+
+        if field_type in FLOAT_FIELD_TYPES:
+            return FLOAT_TYPECODE
+
+        if field_type in INTEGER_FIELD_TYPES:
+            # Only BIGINT UNSIGNED doesn't fit into the signed 64-bit integer
+            is_unsigned: bool = len(column_description) > 7 and bool(column_description[7] & FieldFlag.UNSIGNED)
+
+            return UINT_TYPECODE if is_unsigned and field_type == FieldType.LONGLONG else INT_TYPECODE
+
+        return None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __create_connection_slots(self) -> Optional[threading.BoundedSemaphore]:
+        if not self.__thread_affinity or self.__max_connections is None:
+            return None
+
+        return threading.BoundedSemaphore(value=self.__max_connections)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __is_raw_result(self, connection: MySQLConnection, conversion: Optional[MySQLConversionConfigDTO]) -> bool:
+        if conversion is None:
+            conversion = self.__default_conversion
+
+        # The raw cursors configured by `dbconfig` are kept, see `__create_cursor`
+        return (conversion is not None and conversion.raw) or bool(getattr(connection, '_raw', False))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __create_thread_connection_state(self) -> _ThreadConnectionState:
+        connection_slots: Optional[threading.BoundedSemaphore] = self.__connection_slots
+
+        if connection_slots is not None and not connection_slots.acquire(timeout=self.__connection_wait_timeout):
+            raise TimeoutError(f"All *{self.__max_connections}* connections are used by other threads!")
+
+        state = _ThreadConnectionState(release_slot=None if connection_slots is None else connection_slots.release)
+
+        self.__thread_connection_states.state = state
+        self.__connection_states.add(state)
+
+        return state
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __drop_inherited_connection(self) -> None:
+        for state in list(self.__connection_states):
+            for connection in (state.connection, state.pending_connection):
+                mysql_socket: Any = getattr(connection, '_socket', None)
+
+                if mysql_socket is not None:
+                    drop_inherited_socket(sock=mysql_socket.sock)
+
+                    # `MySQLSocket.__del__` shuts the socket down, which would break the connection of the parent
+                    mysql_socket.sock = None
+
+            # The next query connects again lazily
+            state.connection = None
+            state.pending_connection = None
+            state.max_allowed_packet = None
+
+            state.transaction_depth = 0
+            state.group_commit_state = None
+
+            state.is_session_changed = False
+            state.session_variables = {}
+
+        # The threads of the parent don't exist in the child, so their connections don't take the slots
+        for state in list(self.__connection_states):
+            if isinstance(state, _ThreadConnectionState):
+                state.release_slot = None
+
+        self.__thread_connection_states = threading.local()
+        self.__connection_slots = self.__create_connection_slots()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __track_session_change(self, sql_query: str) -> None:
+        if changes_session_state(sql_query=sql_query):
+            self.__is_session_changed = True
+
+            # The statement may have changed the known variables
+            self.__session_variables.clear()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __forget_session_state(self) -> None:
+        self.__is_session_changed = False
+        self.__session_variables = {}
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __new_connection(self) -> MySQLConnection:
+        # Only the connections of the `adaptive` mode count the received bytes
+        if self.__compression is MySQLCompression.ADAPTIVE:
+            return MySQLMeteredConnection()
+
+        return MySQLConnection()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __get_connection_config(self) -> Dict[str, Any]:
+        if self.__compression is not MySQLCompression.ADAPTIVE:
+            return build_connection_config(dbconfig=self.dbconfig,
+                                           compress=self.__compression is MySQLCompression.ZLIB)
+
+        transfer_meter: Optional[TransferMeter] = self.__transfer_meter
+
+        # The meter of the connection starts again with a new policy
+        if transfer_meter is None or transfer_meter.policy is not self.__compression_policy:
+            transfer_meter = self.__compression_policy.create_meter()
+            self.__transfer_meter = transfer_meter
+
+        return build_connection_config(dbconfig=self.dbconfig, compress=transfer_meter.is_compression_recommended)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __is_compression_switch_due(self, connection: MySQLConnection) -> bool:
+        # Reconnecting would lose the changed session (e.g. the variables or the temporary tables)
+        if self.__compression is not MySQLCompression.ADAPTIVE or self.__is_session_changed:
+            return False
+
+        transfer_meter: Optional[TransferMeter] = self.__transfer_meter
+
+        return transfer_meter is not None \
+            and transfer_meter.is_compression_recommended != bool(getattr(connection, '_compress', False))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __switch_to_new_dbconfig(self, old_connection: MySQLConnection) -> MySQLConnection:
+        new_connection: Optional[MySQLConnection] = self.__pending_connection
+        self.__pending_connection = None
+
+        if new_connection is None:
+            # It is opened with the new `dbconfig` by the caller
+            new_connection = self.__new_connection()
+
+        else:
+            self.__connection_dbconfig_generation = self.__dbconfig_generation
+
+        self.__connection_with_database = new_connection
+        self.__max_allowed_packet = None
+        self.__forget_session_state()
+
+        self.__close_quietly(connection=old_connection)
+
+        return new_connection
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __discard_connection(self, connection: MySQLConnection) -> None:
+        """__discard_connection closes the connection, which can't be used again, the next query connects again.
+
+        *The driver keeps the socket of a closed connection, so the connection is dropped to be recognized as closed.
+        """
+        self.__close_quietly(connection=connection)
+
+        if self.__connection_with_database is connection:
+            self.__connection_with_database = None
+            self.__max_allowed_packet = None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __discard_lost_connection(self, connection: MySQLConnection, error: BaseException) -> None:
+        if isinstance(error, MySQLError) and error.errno in LOST_CONNECTION_ERRNOS:
+            self.__discard_connection(connection=connection)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __close_quietly(connection: MySQLConnection) -> None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __is_connection_opened(connection: MySQLConnection) -> bool:
+        # It tells a connected connection from a created one only, the closed connections are dropped
+        return getattr(connection, '_socket', None) is not None
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the converter classes of the driver built from `MySQLConversionConfigDTO`
+and ready-made fast converters of the values.
+
+*Relationship with other modules:
+    `mysql_conversion_config_dto`: The configuration of the conversion.
+    `mysql_database_single`: Uses the converters for the queries.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'MySQLFastConverter',
+    'get_converter_class',
+    'bytes_to_str',
+    'datetime_to_epoch_seconds',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import calendar
+
+from functools import lru_cache
+
+from mysql.connector.constants import FieldType
+from mysql.connector.conversion import MySQLConverter
+
+from mysql_support.mysql_conversion_config_dto import MySQLConversionConfigDTO
+
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+
+DECIMAL_FIELD_TYPES: Tuple[int, ...] = (FieldType.DECIMAL, FieldType.NEWDECIMAL)
+
+TEMPORAL_FIELD_TYPES: Tuple[int, ...] = (
+    FieldType.DATE, FieldType.NEWDATE, FieldType.TIME, FieldType.DATETIME, FieldType.TIMESTAMP,
+)
+
+
+# ______________________________________________________________________________________________________________________
+def bytes_to_str(value: bytes) -> str:
+    """bytes_to_str returns the text value of the column as it is sent by the server."""
+    return value.decode('ascii')
+
+
+# ______________________________________________________________________________________________________________________
+def datetime_to_epoch_seconds(value: bytes) -> int:
+    """datetime_to_epoch_seconds converts a `DATETIME`/`TIMESTAMP` value into UNIX epoch seconds.
+
+    The value is parsed by slices, without building `datetime` objects.
+
+    *The value is treated as UTC, so the session `time_zone` should be '+00:00'.
+    *The fractional part of seconds is dropped.
+
+    Args:
+        value (bytes): The text value, e.g. b'2024-01-31 23:59:59.123456'.
+
+    Returns:
+        int: The number of seconds since 1970-01-01 00:00:00 UTC.
+    """
+    return calendar.timegm((
+        int(value[0:4]), int(value[5:7]), int(value[8:10]),
+        int(value[11:13] or 0), int(value[14:16] or 0), int(value[17:19] or 0),
+    ))
+
+
+# ______________________________________________________________________________________________________________________
+class MySQLFastConverter(MySQLConverter):
+    """MySQLFastConverter converter of the driver, which skips or replaces the expensive conversions.
+
+    The subclasses with a specific configuration are built by `get_converter_class`,
+    because the driver creates the converter by its class.
+    """
+
+    conversion_config: MySQLConversionConfigDTO = MySQLConversionConfigDTO()
+
+    def __init__(self, charset: Optional[str] = None, use_unicode: bool = True, str_fallback: bool = False) -> None:
+        super().__init__(charset, use_unicode, str_fallback)
+
+        self._cache_field_types = self.__build_field_type_converters()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __build_field_type_converters(self) -> Dict[int, Callable[[bytes, Any], Any]]:
+        # The same mapping as the driver builds lazily, with the configured replacements
+        field_type_converters: Dict[int, Callable[[bytes, Any], Any]] = {}
+
+        for name, info in FieldType.desc.items():
+            converter: Optional[Callable[[bytes, Any], Any]] = getattr(self, f"_{name.lower()}_to_python", None)
+
+            if converter is not None:
+                field_type_converters[info[0]] = converter
+
+        conversion_config: MySQLConversionConfigDTO = self.conversion_config
+
+        if conversion_config.decimal_as_str:
+            for field_type in DECIMAL_FIELD_TYPES:
+                field_type_converters[field_type] = self.__convert_to_str
+
+        if conversion_config.temporal_as_str:
+            for field_type in TEMPORAL_FIELD_TYPES:
+                field_type_converters[field_type] = self.__convert_to_str
+
+        for field_type, value_converter in conversion_config.converters.items():
+            field_type_converters[field_type] = self.__wrap_value_converter(value_converter=value_converter)
+
+        return field_type_converters
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __convert_to_str(value: bytes, description: Any = None) -> str:
+        return value.decode('utf-8')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __wrap_value_converter(value_converter: Callable[[bytes], Any]) -> Callable[[bytes, Any], Any]:
+        return lambda value, description=None: value_converter(value)
+
+
+# ______________________________________________________________________________________________________________________
+@lru_cache(maxsize=128)
+def get_converter_class(conversion_config: MySQLConversionConfigDTO) -> Type[MySQLFastConverter]:
+    """get_converter_class returns the converter class of the driver for the configuration.
+
+    *The class can be passed to the driver as `converter_class` in `dbconfig`.
+
+    Args:
+        conversion_config (MySQLConversionConfigDTO): The configuration of the conversion.
+
+    Returns:
+        Type[MySQLFastConverter]: The converter class, built once per configuration.
+    """
+    return type('ConfiguredMySQLFastConverter', (MySQLFastConverter,), {'conversion_config': conversion_config})
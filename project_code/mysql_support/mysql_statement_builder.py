@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides MySQL specific helper functions for building multi-row statements.
+
+*Relationship with other modules:
+    `sql_statement_builder`: Builds the common part of multi-row `INSERT` statements.
+    `mysql_database_single`: Uses the functions to execute bulk operations.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'add_max_execution_time_hint',
+    'build_column_chunk_statements',
+    'build_upsert_statement',
+    'changes_session_state',
+    'estimate_row_packet_size',
+    'split_rows_by_packet_size',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.6.0"
+
+import re
+
+from functools import lru_cache
+
+from tools.sql_statement_builder import build_multi_row_insert, quote_identifier, validate_identifier
+
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+# The estimate of one non-string literal (numbers, dates, etc.) in the statement
+NON_STRING_LITERAL_SIZE: int = 32
+
+# The leading `SELECT` keyword and an optimizer hint comment following it
+SELECT_KEYWORD_PATTERN: re.Pattern = re.compile(r'^\s*SELECT\b(\s*/\*\+)?', re.IGNORECASE)
+
+# The statements, which leave a state in the session: variables, temporary tables, locks, prepared statements
+SESSION_CHANGE_PATTERN: re.Pattern = re.compile(
+    r'(?:^|;)\s*(?:/\*.*?\*/\s*)*'
+    r'(?:SET|USE|PREPARE|LOCK|XA|HANDLER|CREATE\s+TEMPORARY|DROP\s+TEMPORARY|START\s+TRANSACTION|BEGIN)\b'
+    r'|@\w+\s*:='
+    r'|\bINTO\s+@'
+    r'|\bGET_LOCK\s*\('
+    r'|\bLAST_INSERT_ID\s*\(\s*[^\s)]',
+    re.IGNORECASE | re.DOTALL
+)
+
+# The longer statements (e.g. with inline data) are checked every time instead of being kept in the cache
+MAX_CACHED_STATEMENT_LENGTH: int = 4096
+
+
+# ______________________________________________________________________________________________________________________
+def build_upsert_statement(table_name: str,
+                           column_names: Sequence[str],
+                           update_column_names: Sequence[str],
+                           rows_count: int) -> str:
+    """build_upsert_statement builds a multi-row `INSERT ... ON DUPLICATE KEY UPDATE` statement.
+
+    *When there are no columns to update, the first column is assigned to itself,
+    so the existing rows stay unchanged.
+
+    Args:
+        table_name (str): The name of the target table.
+        column_names (Sequence[str]): The names of the inserted columns.
+        update_column_names (Sequence[str]): The names of the columns updated for the existing rows.
+        rows_count (int): The number of rows in the statement.
+
+    Returns:
+        str: The text of the statement.
+    """
+    insert_statement: str = build_multi_row_insert(table_name=table_name,
+                                                   column_names=column_names,
+                                                   rows_count=rows_count)
+
+    if update_column_names:
+        assignments: List[str] = [
+            f"{quoted} = VALUES({quoted})"
+            for quoted in (quote_identifier(identifier=name) for name in update_column_names)
+        ]
+
+    else:
+        quoted: str = quote_identifier(identifier=column_names[0])
+        assignments = [f"{quoted} = {quoted}"]
+
+    return insert_statement + " ON DUPLICATE KEY UPDATE " + ', '.join(assignments)
+
+
+# ______________________________________________________________________________________________________________________
+def build_column_chunk_statements(table_name: str,
+                                  column_name: str,
+                                  key_column_names: Sequence[str],
+                                  charset_name: Optional[str] = None) -> Tuple[str, str]:
+    """build_column_chunk_statements builds the statements reading a large column of a row in chunks.
+
+    *The chunks are cut by `SUBSTRING`, which counts the characters of a TEXT column and the bytes of a BLOB,
+    so a chunk of TEXT may have more bytes than characters.
+    *The server returns a TEXT value in the charset of the connection, e.g. a `latin1` value takes more bytes
+    in `utf8mb4`. With `charset_name` the bytes of a TEXT value are counted in this charset,
+    a BLOB (`binary`) is never converted.
+
+    Args:
+        table_name (str): The name of the table.
+        column_name (str): The name of the BLOB or TEXT column.
+        key_column_names (Sequence[str]): The names of the columns, which identify the row.
+        charset_name (Optional[str], optional): The charset of the connection. Defaults to None
+                                                (the bytes are counted in the charset of the column).
+
+    Raises:
+        ValueError: If there are no key columns.
+
+    Returns:
+        Tuple[str, str]: The statement of the lengths of the value (in bytes and in characters) and the statement
+                         of a chunk, its parameters are the position (from 1), the length and the values of the keys.
+    """
+    if not key_column_names:
+        raise ValueError("The row must be identified by at least one key column!")
+
+    quoted_table: str = quote_identifier(identifier=table_name)
+    quoted_column: str = quote_identifier(identifier=column_name)
+    condition: str = ' AND '.join(f"{quote_identifier(identifier=name)} = %s" for name in key_column_names)
+
+    measured_value: str = quoted_column
+
+    if charset_name is not None:
+        validate_identifier(identifier=charset_name)
+
+        measured_value = (f"IF(CHARSET({quoted_column}) = 'binary', {quoted_column}, "
+                          f"CONVERT({quoted_column} USING {charset_name}))")
+
+    return (
+        f"SELECT LENGTH({measured_value}), CHAR_LENGTH({quoted_column}) FROM {quoted_table} WHERE {condition}",
+        f"SELECT SUBSTRING({quoted_column}, %s, %s) FROM {quoted_table} WHERE {condition}",
+    )
+
+
+# ______________________________________________________________________________________________________________________
+def estimate_row_packet_size(row: Sequence[Any]) -> int:
+    """estimate_row_packet_size estimates the size of the row values rendered into the statement.
+
+    *The estimate is pessimistic: escaping can double the length of strings and bytes,
+    and every value is wrapped in quotes and separated by a comma.
+
+    Args:
+        row (Sequence[Any]): The values of the row.
+
+    Returns:
+        int: The estimated size in bytes.
+    """
+    size: int = 2  # parentheses of the row
+
+    for value in row:
+        if isinstance(value, str):
+            # Up to 4 bytes per character in utf8mb4
+            size += 8 * len(value) + 3
+
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            size += 2 * len(value) + 3
+
+        else:
+            size += NON_STRING_LITERAL_SIZE
+
+    return size
+
+
+# ______________________________________________________________________________________________________________________
+def split_rows_by_packet_size(rows: Iterable[Sequence[Any]],
+                              max_packet_size: int,
+                              statement_overhead: int) -> Iterator[List[Tuple[Any, ...]]]:
+    """split_rows_by_packet_size groups rows, so every statement fits into the packet of the server.
+
+    Args:
+        rows (Iterable[Sequence[Any]]): The rows to be grouped.
+        max_packet_size (int): The value of `max_allowed_packet` of the server.
+        statement_overhead (int): The size of the statement text without the rows values.
+
+    Raises:
+        ValueError: If a single row doesn't fit into the packet.
+
+    Yields:
+        Iterator[List[Tuple[Any, ...]]]: The groups of rows, one group per statement.
+    """
+    budget: int = max_packet_size - statement_overhead
+
+    batch: List[Tuple[Any, ...]] = []
+    batch_size: int = 0
+
+    for row in rows:
+        row = tuple(row)
+        row_size: int = estimate_row_packet_size(row=row)
+
+        if row_size > budget:
+            raise ValueError(f"The row doesn't fit into the *max_allowed_packet* = {max_packet_size} of the server!")
+
+        if batch and batch_size + row_size > budget:
+            yield batch
+
+            batch = []
+            batch_size = 0
+
+        batch.append(row)
+        batch_size += row_size
+
+    if batch:
+        yield batch
+
+
+# ______________________________________________________________________________________________________________________
+def add_max_execution_time_hint(sql_query: str, timeout_ms: int) -> Optional[str]:
+    """add_max_execution_time_hint adds the `MAX_EXECUTION_TIME` optimizer hint to a `SELECT` statement.
+
+    *MySQL applies the hint only to the top-level read-only `SELECT` statements,
+    so other statements are not changed and need another way of the timeout.
+
+    Args:
+        sql_query (str): The text of the statement.
+        timeout_ms (int): The max execution time in milliseconds.
+
+    Returns:
+        Optional[str]: The statement with the hint or `None`, if the hint isn't applicable
+                       (not a `SELECT` or the statement has its own `MAX_EXECUTION_TIME`).
+    """
+    match: Optional[re.Match] = SELECT_KEYWORD_PATTERN.match(sql_query)
+
+    if match is None or 'MAX_EXECUTION_TIME' in sql_query.upper():
+        return None
+
+    hint: str = f"MAX_EXECUTION_TIME({max(int(timeout_ms), 1)})"
+
+    # Only the first hint comment after the keyword is recognized, so the hint joins the existing one
+    if match.group(1):
+        return f"{sql_query[:match.end()]} {hint}{sql_query[match.end():]}"
+
+    return f"{sql_query[:match.end()]} /*+ {hint} */{sql_query[match.end():]}"
+
+
+# ______________________________________________________________________________________________________________________
+def changes_session_state(sql_query: str) -> bool:
+    """changes_session_state checks whether the statements may leave a state in the session of the connection.
+
+    *The check is conservative: a match in a string literal is a false positive,
+    which only costs an unnecessary reset of the session.
+
+    Args:
+        sql_query (str): The text of the statements.
+
+    Returns:
+        bool: Whether the statements set variables, create temporary tables, take locks, etc.
+    """
+    if len(sql_query) > MAX_CACHED_STATEMENT_LENGTH:
+        return SESSION_CHANGE_PATTERN.search(sql_query) is not None
+
+    return _changes_session_state_cached(sql_query)
+
+
+# ______________________________________________________________________________________________________________________
+@lru_cache(maxsize=1024)
+def _changes_session_state_cached(sql_query: str) -> bool:
+    # The same statements are repeated by the application, so their check is done once
+    return SESSION_CHANGE_PATTERN.search(sql_query) is not None
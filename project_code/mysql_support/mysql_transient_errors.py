@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module classifies the MySQL errors, after which a statement or a transaction may be executed again,
+and the errors, which mean the server (endpoint) itself is failing.
+
+*Relationship with other modules:
+    `retry_policy`: Uses `is_transient_mysql_error` as the classifier of the errors.
+    `circuit_breaker`: Uses `is_mysql_endpoint_failure` as the classifier of the failures.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'is_mysql_endpoint_failure',
+    'is_transient_mysql_error',
+    'ROLLED_BACK_ERRNOS',
+    'NOT_EXECUTED_ERRNOS',
+    'CONNECTION_LOST_ERRNOS',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+from mysql.connector import errorcode
+from mysql.connector.errors import Error as MySQLError
+
+from typing import FrozenSet
+
+
+# The server has rolled back the work of the failed statement, so it may be repeated
+ROLLED_BACK_ERRNOS: FrozenSet[int] = frozenset((
+    errorcode.ER_LOCK_DEADLOCK,
+    errorcode.ER_LOCK_WAIT_TIMEOUT,
+))
+
+# The statement hasn't been executed (e.g. a read-only server after a failover, no free connections)
+NOT_EXECUTED_ERRNOS: FrozenSet[int] = frozenset((
+    errorcode.ER_OPTION_PREVENTS_STATEMENT,
+    errorcode.ER_READ_ONLY_MODE,
+    errorcode.ER_CANT_EXECUTE_IN_READ_ONLY_TRANSACTION,
+    errorcode.ER_CON_COUNT_ERROR,
+    errorcode.ER_SERVER_SHUTDOWN,
+    errorcode.CR_CONNECTION_ERROR,
+    errorcode.CR_CONN_HOST_ERROR,
+))
+
+# The effect of the statement is unknown, so only an idempotent statement may be repeated
+CONNECTION_LOST_ERRNOS: FrozenSet[int] = frozenset((
+    errorcode.CR_SERVER_GONE_ERROR,
+    errorcode.CR_SERVER_LOST,
+    errorcode.CR_SERVER_LOST_EXTENDED,
+    errorcode.ER_CLIENT_INTERACTION_TIMEOUT,
+))
+
+
+# ______________________________________________________________________________________________________________________
+def is_transient_mysql_error(error: BaseException, is_idempotent: bool) -> bool:
+    """is_transient_mysql_error checks whether the failed call may be repeated.
+
+    Args:
+        error (BaseException): The error of the call.
+        is_idempotent (bool): Whether the call may be repeated, when its effect is unknown.
+
+    Returns:
+        bool: Whether the error is transient and repeating the call is safe.
+    """
+    if not isinstance(error, MySQLError):
+        return False
+
+    if error.errno in ROLLED_BACK_ERRNOS or error.errno in NOT_EXECUTED_ERRNOS:
+        return True
+
+    return is_idempotent and error.errno in CONNECTION_LOST_ERRNOS
+
+
+# ______________________________________________________________________________________________________________________
+def is_mysql_endpoint_failure(error: BaseException) -> bool:
+    """is_mysql_endpoint_failure checks whether the error means the server is unavailable or overloaded.
+
+    *The errors of the statements themselves (e.g. a syntax error, a duplicate key or a deadlock)
+    don't say anything about the health of the server.
+
+    Args:
+        error (BaseException): The error of the call.
+
+    Returns:
+        bool: Whether the error is a failure of the endpoint (lost or refused connection, timeout, read-only mode).
+    """
+    if isinstance(error, MySQLError):
+        return error.errno in NOT_EXECUTED_ERRNOS or error.errno in CONNECTION_LOST_ERRNOS
+
+    return isinstance(error, (TimeoutError, OSError))
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module defines a `MySQLUpsertResultDTO` class representing a data transfer object (DTO)
+with the result of a bulk upsert.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'MySQLUpsertResultDTO'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import re
+
+from dataclasses import dataclass
+
+from typing import Match, Optional, Pattern
+
+
+DUPLICATES_PATTERN: Pattern[str] = re.compile(r'Duplicates:\s*(\d+)')
+
+
+# ______________________________________________________________________________________________________________________
+@dataclass(frozen=True)
+class MySQLUpsertResultDTO:
+    """MySQLUpsertResultDTO represents a frozen data transfer object (DTO) with the result of a bulk upsert.
+
+    Attributes:
+        inserted (int): The number of new rows.
+        updated (int): The number of existing rows, which values have been changed.
+        unchanged (int): The number of existing rows, which already had the same values.
+        statements (int): The number of statements (round trips) used for the upsert.
+    """
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    statements: int = 0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __add__(self, other: 'MySQLUpsertResultDTO') -> 'MySQLUpsertResultDTO':
+        return MySQLUpsertResultDTO(inserted=self.inserted + other.inserted,
+                                    updated=self.updated + other.updated,
+                                    unchanged=self.unchanged + other.unchanged,
+                                    statements=self.statements + other.statements)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @classmethod
+    def from_statement_result(cls,
+                              rows_count: int,
+                              affected_rows: int,
+                              info_message: Optional[str],
+                              found_rows: bool = False) -> 'MySQLUpsertResultDTO':
+        """from_statement_result builds the result of one `INSERT ... ON DUPLICATE KEY UPDATE` statement.
+
+        MySQL counts 1 affected row per inserted row, 2 per updated row and 0 per unchanged row
+        (1 if the `FOUND_ROWS` client flag is set).
+        The info message of the server (`Records: 3  Duplicates: 1  Warnings: 0`) gives
+        the number of duplicates, so all three numbers can be restored.
+
+        *The server doesn't send the info message for a single-row statement,
+        in this case the number of duplicates is restored from `affected_rows`.
+        With `FOUND_ROWS`, an inserted and an unchanged row both count 1 affected row,
+        so an unchanged single row can't be told apart and it is counted as inserted.
+
+        Args:
+            rows_count (int): The number of rows in the statement.
+            affected_rows (int): The number of affected rows reported by the server.
+            info_message (Optional[str]): The info message of the OK packet.
+            found_rows (bool, optional): Whether the `FOUND_ROWS` client flag is set. Defaults to False.
+
+        Returns:
+            MySQLUpsertResultDTO: The result of the statement.
+        """
+        match: Optional[Match[str]] = DUPLICATES_PATTERN.search(info_message or '')
+
+        if match is not None:
+            duplicates: int = int(match.group(1))
+
+        elif rows_count == 1:
+            duplicates = int(affected_rows != 1)
+
+        else:
+            # No info about duplicates, so unchanged rows can't be distinguished
+            duplicates = max(affected_rows - rows_count, 0)
+
+        inserted: int = rows_count - duplicates
+
+        if found_rows:
+            updated: int = affected_rows - inserted - duplicates
+        else:
+            updated = (affected_rows - inserted) // 2
+
+        return cls(inserted=inserted, updated=updated, unchanged=duplicates - updated, statements=1)
@@ -8,7 +8,7 @@ Apache license, version 2.0 (Apache-2.0 license)
 """
 
 __author__ = "4-proxy"
-__version__ = "0.3.1"
+__version__ = "0.4.0"
 
 import unittest
 
@@ -31,6 +31,7 @@ class TestSQLAPIInterface(unittest.TestCase):
             'execute_query_no_returns',
             'execute_query_returns_one',
             'execute_query_returns_all',
+            'execute_query_returns_columns',
         ]
 
     # ------------------------------------------------------------------------------------------------------------------
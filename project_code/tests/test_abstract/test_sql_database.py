@@ -8,7 +8,7 @@ Apache license, version 2.0 (Apache-2.0 license)
 """
 
 __author__ = "4-proxy"
-__version__ = "0.5.1"
+__version__ = "0.6.0"
 
 import unittest
 
@@ -77,3 +77,19 @@ class TestSQLDataBase(unittest.TestCase):
         actual_dbconfig: Dict[str, Any] = instance.dbconfig
 
         self.assertDictEqual(d1=expected_dbconfig, d2=actual_dbconfig)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_failed_change_of_dbconfig_restores_previous_dbconfig(self) -> None:
+        # Build
+        class FailingTestClass(ConcreteTestClass):
+            def _on_dbconfig_changed(self, old_dbconfig: Dict[str, Any]) -> None:
+                raise ValueError("Access denied")
+
+        instance = FailingTestClass(host="localhost", password="old")
+
+        # Operate
+        with self.assertRaises(expected_exception=ValueError):
+            instance.dbconfig = {"host": "localhost", "password": "new"}
+
+        # Check
+        self.assertDictEqual(d1={"host": "localhost", "password": "old"}, d2=instance.dbconfig)
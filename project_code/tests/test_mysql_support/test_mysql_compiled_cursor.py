@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `MySQLCompiledCursor` and `compile_statement` from the `mysql_compiled_cursor.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import unittest
+from unittest import mock as UnitMock
+
+from datetime import datetime
+from decimal import Decimal
+
+from mysql.connector.connection import MySQLConnection
+from mysql.connector.conversion import MySQLConverter
+from mysql.connector.cursor import MySQLCursor
+from mysql.connector.errors import ProgrammingError
+
+from tests.test_helper import *
+
+from mysql_support import mysql_compiled_cursor as tested_module
+from mysql_support.mysql_compiled_cursor import MySQLCompiledCursor as tested_class
+
+from typing import Any, Sequence
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLCompiledCursor(unittest.TestCase):
+    def _create_connection(self, sql_mode: str = '') -> UnitMock.MagicMock:
+        connection = UnitMock.MagicMock(spec=MySQLConnection, python_charset='utf8', sql_mode=sql_mode)
+        connection.converter = MySQLConverter(charset='utf8mb4', use_unicode=True)
+        connection.cmd_query.return_value = {'affected_rows': 1, 'insert_id': 0, 'warning_count': 0}
+
+        return connection
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _get_sent_statements(self, sql_query: str, params: Sequence[Any], sql_mode: str = '') -> Sequence[bytes]:
+        statements = []
+
+        for cursor_class in (MySQLCursor, tested_class):
+            connection: UnitMock.MagicMock = self._create_connection(sql_mode=sql_mode)
+            cursor_class(connection).execute(sql_query, params)
+            statements.append(connection.cmd_query.call_args.args[0])
+
+        return statements
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_is_subclass_of_MySQLCursor(self) -> None:
+        TestHelper.check_inspected_class_is_subclass_of_expected_base_class(
+            _cls=tested_class, expected_base_class=MySQLCursor
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_statement_is_the_same_as_built_by_driver(self) -> None:
+        # Build
+        params: Sequence[Any] = (7, -3, None, True, 1.5, Decimal('2.50'), "O'Neil\n", b'\x00\\', datetime(2024, 1, 31))
+        sql_query: str = "INSERT INTO t VALUES (" + ", ".join(["%s"] * len(params)) + ")"
+
+        for sql_mode in ('', 'NO_BACKSLASH_ESCAPES'):
+            with self.subTest(sql_mode=sql_mode):
+                # Operate
+                driver_statement, compiled_statement = self._get_sent_statements(sql_query=sql_query, params=params,
+                                                                                 sql_mode=sql_mode)
+
+                # Check
+                self.assertEqual(first=compiled_statement, second=driver_statement)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_statement_is_compiled_once(self) -> None:
+        # Build
+        tested_module.compile_statement.cache_clear()
+        cursor = tested_class(self._create_connection())
+
+        # Operate
+        for user_id in range(3):
+            cursor.execute("SELECT name FROM users WHERE id = %s", (user_id,))
+
+        # Check
+        self.assertEqual(first=tested_module.compile_statement.cache_info().misses, second=1)
+        self.assertEqual(first=tested_module.compile_statement.cache_info().hits, second=2)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_mismatched_parameters_are_reported_by_driver(self) -> None:
+        # Build
+        cursor = tested_class(self._create_connection())
+
+        # Check
+        for params in ((1,), (1, 2, 3)):
+            with self.subTest(params=params), self.assertRaises(expected_exception=ProgrammingError):
+                cursor.execute("UPDATE users SET name = %s WHERE id = %s", params)
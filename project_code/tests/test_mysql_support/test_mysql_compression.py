@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for the compression of the connections from the `mysql_compression.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import unittest
+from unittest import mock as UnitMock
+
+from mysql.connector.connection import MySQLConnection
+
+from mysql_support import mysql_compression as tested_module
+from mysql_support.mysql_compression import MySQLCompression, MySQLMeteredConnection
+from tools.adaptive_compression import AdaptiveCompressionPolicy
+
+
+# ______________________________________________________________________________________________________________________
+class TestParseCompressionOption(unittest.TestCase):
+    def test_missing_option_follows_compress_parameter(self) -> None:
+        # Check
+        self.assertEqual(first=tested_module.parse_compression_option(dbconfig={'user': '4proxy'}),
+                         second=(MySQLCompression.OFF, None))
+        self.assertEqual(first=tested_module.parse_compression_option(dbconfig={'compress': True}),
+                         second=(MySQLCompression.ZLIB, None))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_modes_are_parsed(self) -> None:
+        # Build
+        policy = AdaptiveCompressionPolicy()
+
+        # Check
+        for option, expected in (('off', (MySQLCompression.OFF, None)),
+                                 ('ZLIB', (MySQLCompression.ZLIB, None)),
+                                 (MySQLCompression.ZLIB, (MySQLCompression.ZLIB, None)),
+                                 ('adaptive', (MySQLCompression.ADAPTIVE,
+                                               tested_module.DEFAULT_ADAPTIVE_COMPRESSION_POLICY)),
+                                 (policy, (MySQLCompression.ADAPTIVE, policy))):
+            with self.subTest(option=option):
+                self.assertEqual(first=tested_module.parse_compression_option(dbconfig={'compression': option}),
+                                 second=expected)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_invalid_options_raise_ValueError(self) -> None:
+        # Check
+        for dbconfig in ({'compression': 'zstd'},
+                         {'compression': 'lz4'},
+                         {'compression': True},
+                         {'compression': 'zlib', 'compress': True}):
+            with self.subTest(dbconfig=dbconfig), self.assertRaises(expected_exception=ValueError):
+                tested_module.parse_compression_option(dbconfig=dbconfig)
+
+
+# ______________________________________________________________________________________________________________________
+class TestBuildConnectionConfig(unittest.TestCase):
+    def test_dbconfig_without_option_is_passed_as_is(self) -> None:
+        # Build
+        dbconfig = {'user': '4proxy', 'compress': True}
+
+        # Check
+        self.assertIs(expr1=tested_module.build_connection_config(dbconfig=dbconfig, compress=False), expr2=dbconfig)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_option_is_replaced_by_compress_flag(self) -> None:
+        # Build
+        dbconfig = {'user': '4proxy', 'compression': 'adaptive'}
+
+        # Operate
+        connection_config = tested_module.build_connection_config(dbconfig=dbconfig, compress=True)
+
+        # Check
+        self.assertEqual(first=connection_config, second={'user': '4proxy', 'compress': True})
+        self.assertEqual(first=dbconfig, second={'user': '4proxy', 'compression': 'adaptive'})
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLMeteredConnection(unittest.TestCase):
+    def test_received_packets_are_counted(self) -> None:
+        # Build
+        mysql_socket = UnitMock.MagicMock()
+        mysql_socket.recv.side_effect = [bytearray(b'x' * 10), bytearray(b'y' * 5)]
+
+        with UnitMock.patch.object(target=MySQLConnection, attribute='_get_connection', return_value=mysql_socket):
+            instance = MySQLMeteredConnection()
+            sock = instance._get_connection()
+
+        # Operate
+        packets = [sock.recv(), sock.recv(read_timeout=3)]
+
+        # Check
+        self.assertEqual(first=packets, second=[bytearray(b'x' * 10), bytearray(b'y' * 5)])
+        self.assertEqual(first=instance.take_received_bytes(), second=15)
+        self.assertEqual(first=instance.take_received_bytes(), second=0)
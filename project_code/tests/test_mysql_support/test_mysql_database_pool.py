@@ -0,0 +1,524 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `MySQLDataBasePool` from the `mysql_database_pool.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.10.0"
+
+import threading
+import unittest
+from unittest import mock as UnitMock
+
+from mysql.connector import errorcode
+from mysql.connector.connection import MySQLConnection
+from mysql.connector.errors import OperationalError
+from mysql.connector.protocol import MySQLProtocol
+
+from tests.test_helper import *
+
+from mysql_support import mysql_database_pool as tested_module
+from mysql_support import mysql_database_single
+from mysql_support.mysql_database_pool import MySQLDataBasePool as tested_class
+from mysql_support.mysql_pool_config_dto import MySQLPoolConfigDTO
+
+from abstract.database.sql_database import SQLDataBase
+from abstract.database.connection_interface import PoolConnectionInterface
+from abstract.api.sql_api_interface import SQLAPIInterface
+from abstract.api.transaction_interface import TransactionInterface
+
+from tools.adaptive_pool_sizer import AdaptivePoolSizer
+from tools.deadline import Deadline
+from tools.priority_lane_dto import PriorityLaneDTO
+
+from typing import Any, Dict, List, Optional
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLDataBasePool(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module, attribute='MySQLDataBaseSingle', autospec=True)
+        MockMySQLDataBaseSingle: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._sessions: List[UnitMock.MagicMock] = []
+        MockMySQLDataBaseSingle.side_effect = self._create_session
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_session(self, **dbconfig: Any) -> UnitMock.MagicMock:
+        session = UnitMock.MagicMock(name=f"session-{len(self._sessions)}")
+        session.dbconfig = dbconfig
+        session.is_connection_closed = False
+        self._sessions.append(session)
+
+        return session
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_instance_of_tested_class(self, size: int = 2, reset_session: bool = False) -> tested_class:
+        pool_config = MySQLPoolConfigDTO(name='test_pool', size=size, reset_session=reset_session)
+
+        return tested_class(pool_config=pool_config, user='4proxy', database='banana_db')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_is_subclass_of_SQLDataBase(self) -> None:
+        TestHelper.check_inspected_class_is_subclass_of_expected_base_class(
+            _cls=tested_class, expected_base_class=SQLDataBase
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_implements_interfaces(self) -> None:
+        for interface in (PoolConnectionInterface, SQLAPIInterface, TransactionInterface):
+            with self.subTest(interface=interface):
+                AbstractTestHelper.check_inspected_class_implements_expected_interface(
+                    _cls=tested_class, expected_interface=interface
+                )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_released_connection_is_reused(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+
+        # Operate
+        with instance.leased_connection() as first_session:
+            pass
+
+        with instance.leased_connection() as second_session:
+            pass
+
+        # Check
+        self.assertIs(expr1=second_session, expr2=first_session)
+        self.assertEqual(first=len(self._sessions), second=1)
+        self.assertEqual(first=instance.idle_connections_count, second=1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_thread_waits_for_released_connection(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(size=1)
+        session = instance.get_connection_from_pool()
+        result: Dict[str, Any] = {}
+
+        def lease() -> None:
+            result['session'] = instance.get_connection_from_pool(deadline=Deadline.after(seconds=5.0))
+
+        thread = threading.Thread(target=lease)
+
+        # Operate
+        thread.start()
+        instance.release_connection_to_pool(session=session)
+        thread.join()
+
+        # Check
+        self.assertIs(expr1=result['session'], expr2=session)
+        self.assertEqual(first=instance.connections_count, second=1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_waiting_is_limited_by_deadline(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(size=1)
+        instance.get_connection_from_pool()
+
+        # Check
+        with self.assertRaises(expected_exception=TimeoutError):
+            instance.get_connection_from_pool(deadline=Deadline.after(seconds=0.01))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_query_with_passed_deadline_is_skipped(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+
+        # Check
+        with self.assertRaises(expected_exception=TimeoutError):
+            instance.execute_query_returns_all("SELECT 1", deadline=Deadline.after(seconds=-1.0))
+
+        self.assertEqual(first=self._sessions, second=[])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_query_is_executed_by_leased_session_with_deadline(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+        deadline: Deadline = Deadline.after(seconds=5.0)
+
+        # Operate
+        rows = instance.execute_query_returns_all("SELECT id FROM users WHERE id = %s", 1,
+                                                  deadline=deadline, timeout=2.0)
+
+        # Check
+        session: UnitMock.MagicMock = self._sessions[0]
+        session.execute_query_returns_all.assert_called_once_with("SELECT id FROM users WHERE id = %s", 1,
+                                                                  deadline=deadline, timeout=2.0)
+        self.assertIs(expr1=rows, expr2=session.execute_query_returns_all.return_value)
+        self.assertEqual(first=instance.idle_connections_count, second=1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_release_resets_session(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(reset_session=True)
+
+        # Operate
+        with instance.leased_connection():
+            pass
+
+        # Check
+        self._sessions[0].reset_connection_session.assert_called_once()
+        self.assertEqual(first=instance.idle_connections_count, second=1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_connection_failed_to_reset_is_discarded(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(reset_session=True)
+
+        # Operate
+        with instance.leased_connection() as session:
+            session.reset_connection_session.side_effect = RuntimeError("Lost connection")
+
+        # Check
+        session.close_active_connection_with_database.assert_called_once()
+        self.assertEqual(first=instance.connections_count, second=0)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_closed_pool_closes_connections_and_rejects_leases(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+
+        with instance.leased_connection():
+            pass
+
+        leased_session = instance.get_connection_from_pool()
+        other_session = instance.get_connection_from_pool()
+
+        # Operate
+        instance.release_connection_to_pool(session=other_session)
+        instance.close_active_pool()
+        instance.release_connection_to_pool(session=leased_session)
+
+        # Check
+        other_session.close_active_connection_with_database.assert_called_once()
+        leased_session.close_active_connection_with_database.assert_called_once()
+        self.assertEqual(first=instance.connections_count, second=0)
+
+        with self.assertRaises(expected_exception=RuntimeError):
+            instance.get_connection_from_pool()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_new_pool_counts_connections_leased_from_previous_pool(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(size=2)
+        leased_sessions: List[UnitMock.MagicMock] = [instance.get_connection_from_pool() for _ in range(2)]
+
+        # Operate
+        instance.create_new_connection_pool()
+
+        with self.assertRaises(expected_exception=TimeoutError):
+            instance.get_connection_from_pool(deadline=Deadline.after(seconds=0.01))
+
+        for session in leased_sessions:
+            instance.release_connection_to_pool(session=session)
+
+        new_sessions: List[UnitMock.MagicMock] = [instance.get_connection_from_pool() for _ in range(2)]
+
+        # Check
+        for session in leased_sessions:
+            session.close_active_connection_with_database.assert_called_once()
+
+        self.assertTrue(expr=all(session not in leased_sessions for session in new_sessions))
+        self.assertEqual(first=instance.connections_count, second=2)
+
+        with self.assertRaises(expected_exception=TimeoutError):
+            instance.get_connection_from_pool(deadline=Deadline.after(seconds=0.01))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_transaction_runs_on_leased_session(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+
+        # Operate
+        with instance.transaction() as session:
+            session.execute_query_no_returns("UPDATE t SET a = 1")
+
+        # Check
+        session.transaction.assert_called_once()
+        self.assertEqual(first=instance.idle_connections_count, second=1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_group_commit_leases_by_deadline_and_lane(self) -> None:
+        # Build
+        pool_config = MySQLPoolConfigDTO(name='test_pool', size=2, reset_session=False)
+        instance = tested_class(pool_config=pool_config,
+                                priority_lanes=(PriorityLaneDTO(name='interactive', reserved_connections=1),
+                                                PriorityLaneDTO(name='batch')),
+                                user='4proxy', database='banana_db')
+
+        # Operate
+        with instance.leased_connection(lane_name='batch'):
+            with self.assertRaises(expected_exception=TimeoutError):
+                with instance.group_commit(lane_name='batch', deadline=Deadline.after(seconds=0.01)):
+                    pass
+
+            with instance.group_commit(lane_name='interactive') as session:
+                session.execute_query_no_returns("INSERT INTO logs VALUES (1)")
+
+        # Check
+        self.assertEqual(first=len(self._sessions), second=2)
+        self._sessions[1].group_commit.assert_called_once_with(max_statements=100, max_delay_ms=50)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_batch_lane_cannot_take_interactive_reservation(self) -> None:
+        # Build
+        pool_config = MySQLPoolConfigDTO(name='test_pool', size=2, reset_session=False)
+        instance = tested_class(pool_config=pool_config,
+                                priority_lanes=(PriorityLaneDTO(name='interactive', reserved_connections=1),
+                                                PriorityLaneDTO(name='batch')),
+                                user='4proxy', database='banana_db')
+
+        # Operate
+        with instance.leased_connection(lane_name='batch'):
+            with self.assertRaises(expected_exception=TimeoutError):
+                instance.execute_query_no_returns("DELETE FROM logs", lane_name='batch',
+                                                  deadline=Deadline.after(seconds=0.01))
+
+            instance.execute_query_no_returns("UPDATE users SET name = %s", "a", lane_name='interactive')
+
+        # Check
+        self.assertEqual(first=len(self._sessions), second=2)
+        self._sessions[1].execute_query_no_returns.assert_called_once_with("UPDATE users SET name = %s", "a",
+                                                                           deadline=None)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_smaller_size_closes_connections_over_it(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(size=3)
+        sessions = [instance.get_connection_from_pool() for _ in range(3)]
+
+        instance.release_connection_to_pool(session=sessions[0])
+
+        # Operate
+        instance.resize(size=1)
+        instance.release_connection_to_pool(session=sessions[1])
+        instance.release_connection_to_pool(session=sessions[2])
+
+        # Check
+        sessions[0].close_active_connection_with_database.assert_called_once()
+        sessions[1].close_active_connection_with_database.assert_called_once()
+        sessions[2].close_active_connection_with_database.assert_not_called()
+
+        self.assertEqual(first=instance.size, second=1)
+        self.assertEqual(first=instance.connections_count, second=1)
+        self.assertEqual(first=instance.idle_connections_count, second=1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_larger_size_wakes_waiting_thread(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(size=1)
+        instance.get_connection_from_pool()
+        result: Dict[str, Any] = {}
+
+        def lease() -> None:
+            result['session'] = instance.get_connection_from_pool(deadline=Deadline.after(seconds=5.0))
+
+        thread = threading.Thread(target=lease)
+
+        # Operate
+        thread.start()
+        instance.resize(size=2)
+        thread.join()
+
+        # Check
+        self.assertIs(expr1=result['session'], expr2=self._sessions[1])
+        self.assertEqual(first=instance.connections_count, second=2)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_pool_is_resized_by_pool_sizer(self) -> None:
+        # Build
+        pool_sizer = UnitMock.create_autospec(spec=AdaptivePoolSizer, instance=True)
+        pool_sizer.clamp.side_effect = lambda size: size
+        pool_sizer.observe_lease.return_value = 5
+
+        pool_config = MySQLPoolConfigDTO(name='test_pool', size=2, reset_session=False)
+        instance = tested_class(pool_config=pool_config, pool_sizer=pool_sizer, user='4proxy', database='banana_db')
+
+        # Operate
+        instance.execute_query_no_returns("UPDATE users SET name = %s", "a")
+
+        # Check
+        pool_sizer.observe_lease.assert_called_once_with(wait_seconds=UnitMock.ANY, hold_seconds=UnitMock.ANY,
+                                                         in_use_count=1, size=2)
+        self.assertEqual(first=instance.size, second=5)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_new_dbconfig_replaces_idle_connections_by_warm_ones(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+        idle_session = instance.get_connection_from_pool()
+        leased_session = instance.get_connection_from_pool()
+        instance.release_connection_to_pool(session=idle_session)
+
+        # Operate
+        instance.dbconfig = {'user': '4proxy', 'password': 'rotated', 'database': 'banana_db'}
+
+        # Check
+        new_session: UnitMock.MagicMock = self._sessions[2]
+        new_session.get_connection_with_database.assert_called_once()
+        idle_session.close_active_connection_with_database.assert_called_once()
+
+        self.assertEqual(first=new_session.dbconfig['password'], second='rotated')
+        self.assertEqual(first=instance.connections_count, second=2)
+
+        with instance.leased_connection() as session:
+            self.assertIs(expr1=session, expr2=new_session)
+
+        # The leased connection of the old dbconfig finishes its work and is closed
+        leased_session.close_active_connection_with_database.assert_not_called()
+        instance.release_connection_to_pool(session=leased_session)
+        leased_session.close_active_connection_with_database.assert_called_once()
+        self.assertEqual(first=instance.connections_count, second=1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_dbconfig_failed_to_connect_is_not_applied(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+
+        with instance.leased_connection() as idle_session:
+            pass
+
+        old_dbconfig: Dict[str, Any] = instance.dbconfig
+
+        def create_failing_session(**dbconfig: Any) -> UnitMock.MagicMock:
+            session: UnitMock.MagicMock = self._create_session(**dbconfig)
+            session.get_connection_with_database.side_effect = RuntimeError("Access denied")
+            return session
+
+        tested_module.MySQLDataBaseSingle.side_effect = create_failing_session
+
+        # Operate
+        with self.assertRaises(expected_exception=RuntimeError):
+            instance.dbconfig = {'user': '4proxy', 'password': 'wrong', 'database': 'banana_db'}
+
+        # Check
+        self.assertEqual(first=instance.dbconfig, second=old_dbconfig)
+        idle_session.close_active_connection_with_database.assert_not_called()
+        self._sessions[1].close_active_connection_with_database.assert_called_once()
+        self.assertEqual(first=instance.idle_connections_count, second=1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_invalid_compression_is_rejected(self) -> None:
+        # Build
+        pool_config = MySQLPoolConfigDTO(name='test_pool', size=2, reset_session=False)
+        instance: tested_class = self._create_instance_of_tested_class()
+
+        # Check
+        with self.assertRaises(expected_exception=ValueError):
+            tested_class(pool_config=pool_config, user='4proxy', compression='zstd')
+
+        with self.assertRaises(expected_exception=ValueError):
+            instance.dbconfig = {'user': '4proxy', 'database': 'banana_db', 'compression': 'zstd'}
+
+        self.assertEqual(first=instance.dbconfig, second={'user': '4proxy', 'database': 'banana_db'})
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_new_pool_config_resizes_pool(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(size=2)
+
+        # Operate
+        instance.pool_config = MySQLPoolConfigDTO(name='test_pool', size=6, reset_session=True)
+
+        # Check
+        self.assertEqual(first=instance.size, second=6)
+        self.assertTrue(expr=instance.pool_config.reset_session)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_health_check_pings_pooled_connection(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+
+        # Operate
+        instance.check_health()
+
+        # Check
+        self._sessions[0].check_health.assert_called_once_with()
+        self.assertEqual(first=instance.idle_connections_count, second=1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_many_threads_share_limited_connections(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(size=4)
+        leased_sessions: List[Any] = []
+        shared_sessions: List[Any] = []
+        lock = threading.Lock()
+
+        def work() -> None:
+            for _ in range(20):
+                with instance.leased_connection(deadline=Deadline.after(seconds=10.0)) as session:
+                    with lock:
+                        if any(leased_session is session for leased_session in leased_sessions):
+                            shared_sessions.append(session)
+
+                        leased_sessions.append(session)
+
+                    with lock:
+                        leased_sessions.remove(session)
+
+        threads: List[threading.Thread] = [threading.Thread(target=work) for _ in range(64)]
+
+        # Operate
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        # Check
+        self.assertEqual(first=shared_sessions, second=[])
+        self.assertLessEqual(a=len(self._sessions), b=4)
+        self.assertEqual(first=instance.idle_connections_count, second=instance.connections_count)
+
+
+# ______________________________________________________________________________________________________________________
+class _DriverConnectionStub(MySQLConnection):
+    """_DriverConnectionStub connection of the driver, which connects to a mocked socket instead of a server."""
+
+    ping_error: Optional[Exception] = None
+
+    def connect(self, **dbconfig: Any) -> None:
+        self._protocol = MySQLProtocol()
+        self._socket = UnitMock.MagicMock()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def cmd_ping(self) -> None:
+        if self.ping_error is not None:
+            raise self.ping_error
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLDataBasePoolConnectionLoss(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=mysql_database_single, attribute='MySQLConnection',
+                                        new=_DriverConnectionStub)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        pool_config = MySQLPoolConfigDTO(name='test_pool', size=1, reset_session=False)
+        self._instance = tested_class(pool_config=pool_config, user='4proxy', database='banana_db')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_connection_failed_health_check_is_not_returned_to_pool(self) -> None:
+        # Build
+        with UnitMock.patch.object(target=_DriverConnectionStub, attribute='ping_error',
+                                   new=OperationalError(errno=errorcode.CR_SERVER_GONE_ERROR)):
+            with self.assertRaises(expected_exception=OperationalError):
+                self._instance.check_health()
+
+        # Operate
+        idle_connections_count: int = self._instance.idle_connections_count
+        self._instance.check_health()
+
+        # Check
+        self.assertEqual(first=idle_connections_count, second=0)
+        self.assertEqual(first=self._instance.idle_connections_count, second=1)
+
+        with self._instance.leased_connection() as session:
+            self.assertFalse(expr=session.is_connection_closed)
@@ -8,21 +8,45 @@ Apache license, version 2.0 (Apache-2.0 license)
 """
 
 __author__ = "4-proxy"
-__version__ = "0.4.0"
+__version__ = "0.34.0"
 
+import gc
+import io
+import threading
 import unittest
 from unittest import mock as UnitMock
 
+from mysql.connector import errorcode
+from mysql.connector.connection import MySQLConnection
+from mysql.connector.errors import Error as MySQLError, InterfaceError, OperationalError, ProgrammingError
+from mysql.connector.protocol import MySQLProtocol
+
 from tests.test_helper import *
 
 from mysql_support import mysql_database_single as tested_module
+from mysql_support.mysql_compiled_cursor import MySQLCompiledCursor
+from mysql_support.mysql_compression import MySQLMeteredConnection
+from mysql_support.mysql_conversion_config_dto import MySQLConversionConfigDTO
 from mysql_support.mysql_database_single import MySQLDataBaseSingle as tested_class
 
 from abstract.database.sql_database import SQLDataBase
 from abstract.database.connection_interface import SingleConnectionInterface
 from abstract.api.sql_api_interface import SQLAPIInterface
+from abstract.api.transaction_interface import TransactionInterface
+
+from dataclasses import dataclass
 
-from typing import Dict, Any, Tuple
+from tools import fork_guard
+from tools.adaptive_compression import AdaptiveCompressionPolicy
+from tools.chunked_stream import ChunkedStreamReader
+from tools.row_factory import RowFormat
+from tools.deadline import Deadline
+from tools.memory_budget_dto import MemoryBudgetDTO
+from tools.schema_metadata_cache import SchemaMetadataCache
+from tools.spilled_rows import SpilledRowSequence
+from tools.table_metadata_dto import ColumnMetadataDTO, TableMetadataDTO
+
+from typing import Dict, Any, List, Tuple
 
 
 # ______________________________________________________________________________________________________________________
@@ -76,6 +100,12 @@ class TestMySQLDataBaseSingle(unittest.TestCase):
             _cls=self._tested_class, expected_interface=SQLAPIInterface
         )
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_implements_TransactionInterface(self) -> None:
+        AbstractTestHelper.check_inspected_class_implements_expected_interface(
+            _cls=self._tested_class, expected_interface=TransactionInterface
+        )
+
     # ------------------------------------------------------------------------------------------------------------------
     @UnitMock.patch.object(target=SQLDataBase, attribute='__init__',
                            autospec=True)
@@ -138,3 +168,1436 @@ class TestMySQLDataBaseSingle(unittest.TestCase):
                 f"So the value of the field: *{expected_field}* - is not an instance of expected class!"
             )
         )
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLDataBaseSingleBulkUpsert(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module, attribute='MySQLConnection', autospec=True)
+        MockMySQLConnection: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._connection: UnitMock.MagicMock = MockMySQLConnection.return_value
+        self._connection.info_query.return_value = (4_194_304,)
+        self._connection.in_transaction = True
+
+        self._cursor: UnitMock.MagicMock = self._connection.cursor.return_value.__enter__.return_value
+        self._cursor.rowcount = 3
+        self._cursor.info_message = "Records: 2  Duplicates: 1  Warnings: 0"
+
+        self._instance = tested_class(user='4proxy', database='banana_db')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_upsert_sends_one_statement_and_commits(self) -> None:
+        # Operate
+        result = self._instance.execute_bulk_upsert(table_name="users",
+                                                    column_names=("id", "name"),
+                                                    rows=[(1, "a"), (2, "b")],
+                                                    key_column_names=("id",))
+
+        # Check
+        self._cursor.execute.assert_called_once_with(
+            "INSERT INTO `users` (`id`, `name`) VALUES (%s, %s), (%s, %s) "
+            "ON DUPLICATE KEY UPDATE `name` = VALUES(`name`)",
+            [1, "a", 2, "b"]
+        )
+        self._connection.commit.assert_called_once()
+
+        self.assertEqual(first=(result.inserted, result.updated, result.unchanged, result.statements),
+                         second=(1, 1, 0, 1))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_upsert_rolls_back_on_error(self) -> None:
+        # Build
+        self._cursor.execute.side_effect = RuntimeError("Deadlock")
+
+        # Check
+        with self.assertRaises(expected_exception=RuntimeError):
+            self._instance.execute_bulk_upsert(table_name="users",
+                                               column_names=("id", "name"),
+                                               rows=[(1, "a")],
+                                               key_column_names=("id",))
+
+        self._connection.rollback.assert_called_once()
+        self._connection.commit.assert_not_called()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_failed_later_batch_with_autocommit_rolls_back_all_batches(self) -> None:
+        # Build
+        instance = tested_class(user='4proxy', database='banana_db', autocommit=True)
+
+        self._connection.in_transaction = False
+        self._connection.start_transaction.side_effect = lambda: setattr(self._connection, 'in_transaction', True)
+        self._cursor.execute.side_effect = [None, RuntimeError("Deadlock")]
+
+        # Operate
+        with UnitMock.patch.object(target=tested_module, attribute='split_rows_by_packet_size',
+                                   return_value=iter([[(1, "a")], [(2, "b")]])):
+            with self.assertRaises(expected_exception=RuntimeError):
+                instance.execute_bulk_upsert(table_name="users",
+                                             column_names=("id", "name"),
+                                             rows=[(1, "a"), (2, "b")],
+                                             key_column_names=("id",))
+
+        # Check
+        self._connection.start_transaction.assert_called_once()
+        self.assertEqual(first=self._cursor.execute.call_count, second=2)
+        self._connection.rollback.assert_called_once()
+        self._connection.commit.assert_not_called()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_single_batch_with_autocommit_is_not_wrapped_in_transaction(self) -> None:
+        # Build
+        instance = tested_class(user='4proxy', database='banana_db', autocommit=True)
+        self._connection.in_transaction = False
+
+        # Operate
+        instance.execute_bulk_upsert(table_name="users", column_names=("id", "name"), rows=[(1, "a")],
+                                     key_column_names=("id",))
+
+        # Check
+        self._connection.start_transaction.assert_not_called()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_failed_upsert_within_group_commit_keeps_grouped_statements(self) -> None:
+        # Build
+        def execute_failing_upsert(*query: Any) -> None:
+            raise RuntimeError("Deadlock")
+
+        # Operate
+        with self._instance.group_commit(max_statements=10):
+            self._instance.execute_query_no_returns("DELETE FROM logs")
+
+            self._cursor.execute.side_effect = execute_failing_upsert
+
+            with self.assertRaises(expected_exception=RuntimeError):
+                self._instance.execute_bulk_upsert(table_name="users",
+                                                   column_names=("id", "name"),
+                                                   rows=[(1, "a")],
+                                                   key_column_names=("id",))
+
+            self._connection.commit.assert_not_called()
+
+        # Check
+        self._connection.rollback.assert_not_called()
+        self.assertEqual(first=self._connection.cmd_query.call_args_list, second=[
+            UnitMock.call("SAVEPOINT blueberry_upsert"),
+            UnitMock.call("ROLLBACK TO SAVEPOINT blueberry_upsert"),
+        ])
+        # The grouped statement is committed when leaving the context
+        self._connection.commit.assert_called_once()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_upsert_without_key_columns_uses_key_from_schema_metadata(self) -> None:
+        # Build
+        metadata = TableMetadataDTO(schema_name="banana_db", table_name="users",
+                                    columns=(ColumnMetadataDTO(name="id", data_type="int", is_nullable=False),),
+                                    primary_key=("id",))
+
+        # Operate
+        with UnitMock.patch.object(target=SchemaMetadataCache, attribute='get_table_metadata',
+                                   return_value=metadata) as mock_get_table_metadata:
+            self._instance.execute_bulk_upsert(table_name="users", column_names=("id", "name"), rows=[(1, "a")])
+
+        # Check
+        mock_get_table_metadata.assert_called_once_with(table_name="users")
+        self.assertIn(member="`name` = VALUES(`name`)", container=self._cursor.execute.call_args.args[0])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_upsert_with_invalid_columns_raise_ValueError(self) -> None:
+        # Build
+        invalid_params: Tuple[Dict[str, Any], ...] = (
+            {'key_column_names': ()},
+            {'key_column_names': ("uid",)},
+            {'key_column_names': ("id",), 'update_column_names': ("id", "name")},
+            {'key_column_names': ("id",), 'update_column_names': ("email",)},
+        )
+
+        # Check
+        for params in invalid_params:
+            with self.subTest(pattern=params):
+                with self.assertRaises(expected_exception=ValueError):
+                    self._instance.execute_bulk_upsert(table_name="users",
+                                                       column_names=("id", "name"),
+                                                       rows=[(1, "a")],
+                                                       **params)
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLDataBaseSingleTransaction(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module, attribute='MySQLConnection', autospec=True)
+        MockMySQLConnection: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._connection: UnitMock.MagicMock = MockMySQLConnection.return_value
+        self._connection.in_transaction = False
+        self._connection.unread_result = False
+
+        # As the driver, a transaction can't be started within another one
+        def start_transaction(*args: Any, **kwargs: Any) -> None:
+            if self._connection.in_transaction:
+                raise ProgrammingError("Transaction already in progress")
+
+            self._connection.in_transaction = True
+
+        self._connection.start_transaction.side_effect = start_transaction
+        self._connection.commit.side_effect = lambda: setattr(self._connection, 'in_transaction', False)
+        self._connection.rollback.side_effect = lambda: setattr(self._connection, 'in_transaction', False)
+
+        self._instance = tested_class(user='4proxy', database='banana_db')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_transaction_after_read_ends_implicit_transaction(self) -> None:
+        # Build
+        # Without `autocommit`, the server starts an implicit transaction by the read
+        cursor: UnitMock.MagicMock = self._connection.cursor.return_value.__enter__.return_value
+        cursor.execute.side_effect = lambda *query: setattr(self._connection, 'in_transaction', True)
+        cursor.fetchone.return_value = None
+
+        self._instance.execute_query_returns_one("SELECT name FROM users WHERE id = %s", 1)
+
+        # Operate
+        with self._instance.transaction():
+            self._instance.execute_query_no_returns("UPDATE users SET name = %s WHERE id = %s", "a", 1)
+
+        # Check
+        self._connection.start_transaction.assert_called_once()
+        self.assertEqual(first=self._connection.commit.call_count, second=2)
+        self.assertFalse(expr=self._connection.in_transaction)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_transaction_commits_once_for_all_statements(self) -> None:
+        # Operate
+        with self._instance.transaction():
+            self._instance.execute_query_no_returns("UPDATE t SET a = %s", 1)
+            self._instance.execute_query_no_returns("UPDATE t SET b = %s", 2)
+
+        # Check
+        self._connection.start_transaction.assert_called_once()
+        self._connection.commit.assert_called_once()
+        self._connection.rollback.assert_not_called()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_transaction_rolls_back_on_exception(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=KeyError):
+            with self._instance.transaction():
+                raise KeyError
+
+        self._connection.rollback.assert_called_once()
+        self._connection.commit.assert_not_called()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_nested_transaction_uses_savepoint(self) -> None:
+        # Operate
+        with self._instance.transaction():
+            with self.assertRaises(expected_exception=KeyError):
+                with self._instance.transaction():
+                    raise KeyError
+
+            with self._instance.transaction():
+                pass
+
+        # Check
+        self.assertEqual(
+            first=[call.args[0] for call in self._connection.cmd_query.call_args_list],
+            second=[
+                "SAVEPOINT blueberry_savepoint_1",
+                "ROLLBACK TO SAVEPOINT blueberry_savepoint_1",
+                "SAVEPOINT blueberry_savepoint_1",
+                "RELEASE SAVEPOINT blueberry_savepoint_1",
+            ]
+        )
+        self._connection.commit.assert_called_once()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_in_transaction_within_transaction_and_group_commit(self) -> None:
+        # Operate
+        with self._instance.transaction():
+            within_transaction: bool = self._instance.in_transaction
+
+        with self._instance.group_commit(max_statements=3, max_delay_ms=60_000):
+            within_group_commit: bool = self._instance.in_transaction
+
+        # Check
+        self.assertTrue(expr=within_transaction)
+        self.assertTrue(expr=within_group_commit)
+        self.assertFalse(expr=self._instance.in_transaction)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_group_commit_commits_every_max_statements(self) -> None:
+        # Operate
+        with self._instance.group_commit(max_statements=3, max_delay_ms=60_000):
+            for i in range(7):
+                self._instance.execute_query_no_returns("INSERT INTO t VALUES (%s)", i)
+
+            commits_within_context: int = self._connection.commit.call_count
+
+        # Check
+        self.assertEqual(first=commits_within_context, second=2)
+        self.assertEqual(first=self._connection.commit.call_count, second=3)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_group_commit_commits_after_max_delay(self) -> None:
+        # Operate
+        with self._instance.group_commit(max_statements=1000, max_delay_ms=0):
+            self._instance.execute_query_no_returns("INSERT INTO t VALUES (%s)", 1)
+
+            commits_within_context: int = self._connection.commit.call_count
+
+        # Check
+        self.assertEqual(first=commits_within_context, second=1)
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLDataBaseSingleMultiStatement(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module, attribute='MySQLConnection', autospec=True)
+        MockMySQLConnection: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._connection: UnitMock.MagicMock = MockMySQLConnection.return_value
+        self._connection.in_transaction = False
+
+        self._cursor: UnitMock.MagicMock = self._connection.cursor.return_value.__enter__.return_value
+
+        self._instance = tested_class(user='4proxy', database='banana_db')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_statements_are_sent_in_one_query_and_results_returned_in_order(self) -> None:
+        # Build
+        results_of_server = [([(1,)], True, ('a',)), (None, False, ()), ([(2,), (3,)], True, ('b',))]
+        current_result: Dict[str, int] = {'index': 0}
+
+        def nextset() -> bool:
+            current_result['index'] += 1
+            return current_result['index'] < len(results_of_server)
+
+        type(self._cursor).with_rows = UnitMock.PropertyMock(
+            side_effect=lambda: results_of_server[current_result['index']][1]
+        )
+        type(self._cursor).column_names = UnitMock.PropertyMock(
+            side_effect=lambda: results_of_server[current_result['index']][2]
+        )
+        self._cursor.fetchall.side_effect = lambda: results_of_server[current_result['index']][0]
+        self._cursor.nextset.side_effect = nextset
+
+        # Operate
+        results = self._instance.execute_multi_statement(
+            ["SELECT a FROM t WHERE id = %s;", "UPDATE t SET a = %s", "SELECT b FROM t"], 1, 2
+        )
+
+        # Check
+        self._cursor.execute.assert_called_once_with(
+            "SELECT a FROM t WHERE id = %s; UPDATE t SET a = %s; SELECT b FROM t", (1, 2)
+        )
+        self.assertEqual(first=results, second=[[{'a': 1}], None, [{'b': 2}, {'b': 3}]])
+
+
+# ______________________________________________________________________________________________________________________
+@dataclass
+class UserRow:
+    id: int
+    name: str
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLDataBaseSingleRowFormat(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module, attribute='MySQLConnection', autospec=True)
+        MockMySQLConnection: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._connection: UnitMock.MagicMock = MockMySQLConnection.return_value
+        self._connection.unread_result = False
+
+        self._cursor: UnitMock.MagicMock = self._connection.cursor.return_value.__enter__.return_value
+        self._cursor.column_names = ('id', 'name')
+        self._cursor.fetchall.return_value = [(1, "a"), (2, "b")]
+        self._cursor.fetchone.return_value = (1, "a")
+
+        self._instance = tested_class(user='4proxy', database='banana_db')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_default_row_format_is_dict(self) -> None:
+        self.assertEqual(first=self._instance.execute_query_returns_all("SELECT id, name FROM users"),
+                         second=[{'id': 1, 'name': "a"}, {'id': 2, 'name': "b"}])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_tuple_rows_are_returned_without_conversion(self) -> None:
+        # Operate
+        rows = self._instance.execute_query_returns_all("SELECT id, name FROM users", row_format=RowFormat.TUPLE)
+
+        # Check
+        self.assertIs(expr1=rows, expr2=self._cursor.fetchall.return_value)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_rows_over_memory_budget_are_spilled(self) -> None:
+        # Build
+        self._cursor.fetchmany.side_effect = [[(1, "a"), (2, "b")], [(3, "c")], []]
+        self._instance.default_memory_budget = MemoryBudgetDTO(max_rows=2, chunk_size=2)
+
+        # Operate
+        rows = self._instance.execute_query_returns_all("SELECT id, name FROM users")
+        self.addCleanup(rows.close)
+
+        # Check
+        self.assertIsInstance(obj=rows, cls=SpilledRowSequence)
+        self.assertEqual(first=list(rows), second=[{'id': 1, 'name': "a"}, {'id': 2, 'name': "b"},
+                                                   {'id': 3, 'name': "c"}])
+        self._cursor.fetchall.assert_not_called()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_row_is_mapped_to_dataclass(self) -> None:
+        row = self._instance.execute_query_returns_one("SELECT id, name FROM users", row_format=UserRow)
+
+        self.assertEqual(first=row, second=UserRow(id=1, name="a"))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_default_row_format_is_used_by_queries(self) -> None:
+        # Build
+        self._instance.default_row_format = RowFormat.NAMED
+
+        # Operate
+        row = self._instance.execute_query_returns_one("SELECT id, name FROM users")
+
+        # Check
+        self.assertEqual(first=(row.id, row.name), second=(1, "a"))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_invalid_default_row_format_raise_TypeError(self) -> None:
+        with self.assertRaises(expected_exception=TypeError):
+            self._instance.default_row_format = 'dict'
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_columns_are_collected_by_fetchmany_chunks(self) -> None:
+        from array import array
+        from mysql.connector.constants import FieldFlag, FieldType
+
+        # Build
+        self._cursor.description = [('id', FieldType.LONGLONG, None, None, None, None, 0, FieldFlag.UNSIGNED),
+                                    ('name', FieldType.VAR_STRING, None, None, None, None, 1, 0)]
+        self._cursor.fetchmany.side_effect = [[(1, "a"), (2, "b")], [(3, "c")], []]
+
+        # Operate
+        with UnitMock.patch('tools.columnar_result.numpy', new=None):
+            columns = self._instance.execute_query_returns_columns("SELECT id, name FROM users", chunk_size=2)
+
+        # Check
+        self.assertEqual(first=columns, second={'id': array('Q', [1, 2, 3]), 'name': ["a", "b", "c"]})
+        self._cursor.fetchmany.assert_called_with(size=2)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_raw_numeric_columns_are_collected_as_objects(self) -> None:
+        from mysql.connector.constants import FieldFlag, FieldType
+
+        # Build
+        self._cursor.column_names = ('id', 'score')
+        self._cursor.description = [('id', FieldType.LONGLONG, None, None, None, None, 0, FieldFlag.UNSIGNED),
+                                    ('score', FieldType.DOUBLE, None, None, None, None, 1, 0)]
+        self._cursor.fetchmany.side_effect = [[(bytearray(b'1'), bytearray(b'0.5'))], []]
+
+        # Operate
+        with UnitMock.patch('tools.columnar_result.numpy', new=None):
+            columns = self._instance.execute_query_returns_columns("SELECT id, score FROM users",
+                                                                   conversion=MySQLConversionConfigDTO(raw=True))
+
+        # Check
+        self.assertEqual(first=columns, second={'id': [bytearray(b'1')], 'score': [bytearray(b'0.5')]})
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_columns_with_duplicate_names_are_all_returned(self) -> None:
+        from mysql.connector.constants import FieldType
+
+        # Build
+        self._cursor.column_names = ('id', 'id')
+        self._cursor.description = [('id', FieldType.LONGLONG, None, None, None, None, 0, 0),
+                                    ('id', FieldType.LONGLONG, None, None, None, None, 0, 0)]
+        self._cursor.fetchmany.side_effect = [[(1, 10), (2, 20)], []]
+
+        # Operate
+        with UnitMock.patch('tools.columnar_result.numpy', new=None):
+            columns = self._instance.execute_query_returns_columns("SELECT u.id, o.id FROM users u JOIN orders o")
+
+        # Check
+        self.assertEqual(first=list(columns), second=['id', 'column_1'])
+        self.assertEqual(first=list(columns['column_1']), second=[10, 20])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_raw_conversion_uses_raw_cursor(self) -> None:
+        from mysql_support.mysql_conversion_config_dto import MySQLConversionConfigDTO
+
+        # Operate
+        self._instance.execute_query_returns_all("SELECT id, name FROM users",
+                                                 conversion=MySQLConversionConfigDTO(raw=True))
+
+        # Check
+        self._connection.cursor.assert_called_once_with(raw=True)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_conversion_replaces_converter_only_for_query(self) -> None:
+        from mysql_support.mysql_conversion_config_dto import MySQLConversionConfigDTO
+        from mysql_support.mysql_fast_converter import MySQLFastConverter
+
+        # Build
+        self._connection.charset = 'utf8mb4'
+        self._connection.use_unicode = True
+        self._connection.converter = original_converter = UnitMock.sentinel.converter
+
+        converters_of_queries = []
+        self._cursor.fetchall.side_effect = lambda: converters_of_queries.append(self._connection.converter) or []
+
+        # Operate
+        self._instance.default_conversion = MySQLConversionConfigDTO(decimal_as_str=True)
+        self._instance.execute_query_returns_all("SELECT price FROM goods")
+
+        # Check
+        self.assertIsInstance(obj=converters_of_queries[0], cls=MySQLFastConverter)
+        self.assertIs(expr1=self._connection.converter, expr2=original_converter)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_schema_metadata_is_read_regardless_of_default_options(self) -> None:
+        # Build
+        self._instance.default_row_format = UserRow
+        self._instance.default_conversion = MySQLConversionConfigDTO(raw=True)
+        self._instance.default_memory_budget = MemoryBudgetDTO(max_rows=1, chunk_size=1)
+
+        self._cursor.fetchall.side_effect = [
+            [(bytearray(b'id'), bytearray(b'int'), bytearray(b'NO'), None),
+             (bytearray(b'name'), bytearray(b'varchar'), bytearray(b'YES'), bytearray(b'64'))],
+            [(bytearray(b'PRIMARY'), bytearray(b'PRIMARY KEY'), bytearray(b'id'))],
+        ]
+
+        # Operate
+        metadata: TableMetadataDTO = self._instance.schema_metadata.get_table_metadata(table_name="users")
+
+        # Check
+        self.assertEqual(first=metadata.columns, second=(
+            ColumnMetadataDTO(name='id', data_type='int', is_nullable=False),
+            ColumnMetadataDTO(name='name', data_type='varchar', is_nullable=True, max_length=64),
+        ))
+        self.assertEqual(first=metadata.primary_key, second=('id',))
+
+        self._connection.cursor.assert_called_once_with(cursor_class=MySQLCompiledCursor)
+        self._cursor.fetchmany.assert_not_called()
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLDataBaseSingleForkSafety(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module, attribute='MySQLConnection', autospec=True)
+        self._MockMySQLConnection: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._instance = tested_class(user='4proxy', database='banana_db')
+
+        self._inherited_connection: UnitMock.MagicMock = self._MockMySQLConnection.return_value
+        self._inherited_connection._socket = UnitMock.MagicMock()
+        self._inherited_socket: UnitMock.MagicMock = self._inherited_connection._socket.sock
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_child_drops_inherited_socket_without_closing_connection(self) -> None:
+        # Operate
+        fork_guard._run_after_fork_in_child()
+
+        # Check
+        self._inherited_socket.close.assert_called_once()
+        self._inherited_socket.shutdown.assert_not_called()
+        self._inherited_connection.close.assert_not_called()
+        self.assertIsNone(obj=self._inherited_connection._socket.sock)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_child_connects_again_lazily(self) -> None:
+        # Build
+        fork_guard._run_after_fork_in_child()
+        new_connection = UnitMock.MagicMock()
+        new_connection._socket = None
+        self._MockMySQLConnection.return_value = new_connection
+
+        # Operate
+        connection = self._instance.get_connection_with_database()
+
+        # Check
+        self.assertIs(expr1=connection, expr2=new_connection)
+        new_connection.connect.assert_called_once_with(user='4proxy', database='banana_db')
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLDataBaseSingleThreadAffinity(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module, attribute='MySQLConnection', autospec=True)
+        MockMySQLConnection: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._connections: List[UnitMock.MagicMock] = []
+        MockMySQLConnection.side_effect = self._create_connection
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_connection(self) -> UnitMock.MagicMock:
+        connection = UnitMock.MagicMock(_socket=None)
+        connection.connect.side_effect = lambda **dbconfig: setattr(connection, '_socket', UnitMock.MagicMock())
+
+        self._connections.append(connection)
+
+        return connection
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _get_connection_in_thread(self, instance: tested_class) -> Any:
+        result: Dict[str, Any] = {}
+
+        def get_connection() -> None:
+            try:
+                result['connection'] = instance.get_connection_with_database()
+            except Exception as error:
+                result['error'] = error
+
+        thread = threading.Thread(target=get_connection)
+        thread.start()
+        thread.join()
+
+        return result
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_each_thread_reuses_its_own_connection(self) -> None:
+        # Build
+        instance = tested_class(thread_affinity=True, user='4proxy')
+
+        # Operate
+        first_connection = instance.get_connection_with_database()
+        second_connection = instance.get_connection_with_database()
+        thread_result: Dict[str, Any] = self._get_connection_in_thread(instance=instance)
+
+        # Check
+        self.assertIs(expr1=first_connection, expr2=second_connection)
+        self.assertIsNot(expr1=thread_result['connection'], expr2=first_connection)
+        first_connection.connect.assert_called_once_with(user='4proxy')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_connection_of_thread_is_closed_when_thread_exits(self) -> None:
+        # Build
+        instance = tested_class(thread_affinity=True, max_connections=1, connection_wait_timeout=0.01)
+
+        # Operate
+        thread_result: Dict[str, Any] = self._get_connection_in_thread(instance=instance)
+        thread_connection = thread_result.pop('connection')
+        gc.collect()
+
+        # Check
+        thread_connection.close.assert_called_once()
+        # The slot of the exited thread is free again
+        self.assertIsNotNone(obj=instance.get_connection_with_database())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_thread_waits_for_free_connection_when_cap_is_reached(self) -> None:
+        # Build
+        instance = tested_class(thread_affinity=True, max_connections=1, connection_wait_timeout=0.01)
+        instance.get_connection_with_database()
+
+        # Operate
+        thread_result: Dict[str, Any] = self._get_connection_in_thread(instance=instance)
+
+        # Check
+        self.assertIsInstance(obj=thread_result['error'], cls=TimeoutError)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_transactions_are_tracked_per_thread(self) -> None:
+        # Build
+        instance = tested_class(thread_affinity=True)
+
+        # Operate
+        with instance.transaction():
+            self._get_connection_in_thread(instance=instance)
+            thread_connection = self._connections[-1]
+
+        # Check
+        self._connections[0].start_transaction.assert_called_once()
+        thread_connection.start_transaction.assert_not_called()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_constructor_raises_for_non_positive_max_connections(self) -> None:
+        with self.assertRaises(expected_exception=ValueError):
+            tested_class(thread_affinity=True, max_connections=0)
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLDataBaseSingleTimeout(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module, attribute='MySQLConnection', autospec=True)
+        self._MockMySQLConnection: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        watchdog_patcher = UnitMock.patch.object(target=tested_module, attribute='_statement_watchdog')
+        self._watchdog: UnitMock.MagicMock = watchdog_patcher.start()
+        self.addCleanup(watchdog_patcher.stop)
+
+        self._connection: UnitMock.MagicMock = self._MockMySQLConnection.return_value
+        self._connection.unread_result = False
+        self._connection.in_transaction = True
+        self._connection.connection_id = 42
+
+        self._cursor: UnitMock.MagicMock = self._connection.cursor.return_value.__enter__.return_value
+        self._cursor.column_names = ('id',)
+        self._cursor.fetchall.return_value = [(1,)]
+
+        self._instance = tested_class(user='4proxy', database='banana_db')
+        self._instance.default_timeout = 1.5
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_select_is_limited_by_max_execution_time_hint(self) -> None:
+        # Operate
+        self._instance.execute_query_returns_all("SELECT id FROM users")
+
+        # Check
+        self._cursor.execute.assert_called_once_with("SELECT /*+ MAX_EXECUTION_TIME(1500) */ id FROM users", ())
+        self._watchdog.watch.assert_not_called()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_select_over_timeout_raises_TimeoutError_and_cleans_connection(self) -> None:
+        # Build
+        self._cursor.execute.side_effect = tested_module.MySQLError(errno=tested_module.ER_QUERY_TIMEOUT)
+
+        # Check
+        with self.assertRaises(expected_exception=TimeoutError):
+            self._instance.execute_query_returns_all("SELECT id FROM users", timeout=0.5)
+
+        self._connection.rollback.assert_called_once()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_other_statement_is_killed_by_watchdog(self) -> None:
+        # Build
+        self._watchdog.watch.return_value.finish.return_value = True
+        self._cursor.execute.side_effect = tested_module.MySQLError(errno=tested_module.ER_QUERY_INTERRUPTED)
+
+        # Operate
+        with self.assertRaises(expected_exception=TimeoutError):
+            self._instance.execute_query_no_returns("UPDATE users SET name = %s", "a")
+
+        on_timeout = self._watchdog.watch.call_args.kwargs['on_timeout']
+        on_timeout()
+
+        # Check
+        self._watchdog.watch.assert_called_once_with(timeout=1.5, on_timeout=UnitMock.ANY)
+        self._cursor.execute.assert_called_once_with("UPDATE users SET name = %s", ("a",))
+        self._connection.cmd_query.assert_called_once_with("KILL QUERY 42")
+        self._connection.rollback.assert_called_once()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_interruption_without_timeout_is_not_converted(self) -> None:
+        # Build
+        self._watchdog.watch.return_value.finish.return_value = False
+        self._cursor.execute.side_effect = tested_module.MySQLError(errno=tested_module.ER_QUERY_INTERRUPTED)
+
+        # Check
+        with self.assertRaises(expected_exception=tested_module.MySQLError):
+            self._instance.execute_query_no_returns("UPDATE users SET name = %s", "a")
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_timeout_within_transaction_keeps_transaction(self) -> None:
+        # Build
+        self._cursor.execute.side_effect = tested_module.MySQLError(errno=tested_module.ER_QUERY_TIMEOUT)
+
+        # Operate
+        with self.assertRaises(expected_exception=TimeoutError):
+            with self._instance.transaction():
+                self._instance.execute_query_returns_one("SELECT id FROM users")
+
+        # Check
+        # The only rollback is the one of the failed transaction itself
+        self._connection.rollback.assert_called_once()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_deadline_shrinks_timeout_of_statement(self) -> None:
+        # Operate
+        self._instance.execute_query_returns_all("SELECT id FROM users", deadline=Deadline.after(seconds=0.5))
+
+        # Check
+        sql_query: str = self._cursor.execute.call_args.args[0]
+        hint_ms = int(sql_query.split('MAX_EXECUTION_TIME(')[1].split(')')[0])
+
+        self.assertGreater(a=hint_ms, b=0)
+        self.assertLessEqual(a=hint_ms, b=500)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_passed_deadline_skips_statement(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=TimeoutError):
+            self._instance.execute_query_no_returns("UPDATE users SET name = %s", "a",
+                                                    deadline=Deadline.after(seconds=-1.0))
+
+        self._cursor.execute.assert_not_called()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_passed_deadline_fails_before_connecting(self) -> None:
+        # Build
+        calls: Dict[str, Any] = {
+            'execute_query_no_returns': lambda deadline: self._instance.execute_query_no_returns(
+                "UPDATE users SET name = 'a'", deadline=deadline),
+            'execute_query_returns_one': lambda deadline: self._instance.execute_query_returns_one(
+                "SELECT id FROM users", deadline=deadline),
+            'execute_query_returns_all': lambda deadline: self._instance.execute_query_returns_all(
+                "SELECT id FROM users", deadline=deadline),
+            'execute_query_returns_columns': lambda deadline: self._instance.execute_query_returns_columns(
+                "SELECT id FROM users", deadline=deadline),
+            'execute_multi_statement': lambda deadline: self._instance.execute_multi_statement(
+                ["SELECT id FROM users", "SELECT 1"], deadline=deadline),
+            'execute_query_with_streams': lambda deadline: self._instance.execute_query_with_streams(
+                "UPDATE users SET avatar = %s", io.BytesIO(b'avatar'), deadline=deadline),
+        }
+
+        # Check
+        for method_name, call in calls.items():
+            with self.subTest(pattern=method_name):
+                with self.assertRaises(expected_exception=TimeoutError):
+                    call(Deadline.after(seconds=-1.0))
+
+                self._connection.connect.assert_not_called()
+                self._connection.cursor.assert_not_called()
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLDataBaseSingleReconfiguration(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module, attribute='MySQLConnection', autospec=True)
+        MockMySQLConnection: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._connections: List[UnitMock.MagicMock] = []
+        MockMySQLConnection.side_effect = self._create_connection
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_connection(self) -> UnitMock.MagicMock:
+        connection = UnitMock.MagicMock(_socket=None, in_transaction=False, unread_result=False)
+        # As the driver, `close` keeps the socket of the connection
+        connection.connect.side_effect = lambda **dbconfig: setattr(connection, '_socket', UnitMock.MagicMock())
+
+        self._connections.append(connection)
+
+        return connection
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_new_dbconfig_switches_to_connection_opened_in_advance(self) -> None:
+        # Build
+        instance = tested_class(user='4proxy', password='old')
+        old_connection: Any = instance.get_connection_with_database()
+
+        # Operate
+        instance.dbconfig = {'user': '4proxy', 'password': 'rotated'}
+        new_connection: Any = self._connections[1]
+
+        # Check
+        new_connection.connect.assert_called_once_with(user='4proxy', password='rotated')
+        old_connection.close.assert_not_called()
+
+        self.assertIs(expr1=instance.get_connection_with_database(), expr2=new_connection)
+        old_connection.close.assert_called_once()
+        self.assertEqual(first=len(self._connections), second=2)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_open_transaction_keeps_old_connection_until_it_ends(self) -> None:
+        # Build
+        instance = tested_class(user='4proxy', password='old')
+        old_connection: Any = instance.get_connection_with_database()
+
+        # Operate
+        with instance.transaction():
+            instance.dbconfig = {'user': '4proxy', 'password': 'rotated'}
+            connection_within_transaction: Any = instance.get_connection_with_database()
+
+        connection_after_transaction: Any = instance.get_connection_with_database()
+
+        # Check
+        self.assertIs(expr1=connection_within_transaction, expr2=old_connection)
+        self.assertIs(expr1=connection_after_transaction, expr2=self._connections[1])
+        old_connection.commit.assert_called_once()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_dbconfig_failed_to_connect_keeps_old_connection(self) -> None:
+        # Build
+        instance = tested_class(user='4proxy', password='old')
+        old_connection: Any = instance.get_connection_with_database()
+
+        def create_failing_connection() -> UnitMock.MagicMock:
+            connection: UnitMock.MagicMock = self._create_connection()
+            connection.connect.side_effect = tested_module.MySQLError(msg="Access denied")
+            return connection
+
+        tested_module.MySQLConnection.side_effect = create_failing_connection
+
+        # Operate
+        with self.assertRaises(expected_exception=tested_module.MySQLError):
+            instance.dbconfig = {'user': '4proxy', 'password': 'wrong'}
+
+        # Check
+        self.assertEqual(first=instance.dbconfig, second={'user': '4proxy', 'password': 'old'})
+        self.assertIs(expr1=instance.get_connection_with_database(), expr2=old_connection)
+
+
+# ______________________________________________________________________________________________________________________
+class _DriverConnectionStub(MySQLConnection):
+    """_DriverConnectionStub connection of the driver, which connects to a mocked socket instead of a server."""
+
+    def connect(self, **dbconfig: Any) -> None:
+        if getattr(self, 'connect_error', None) is not None:
+            # As the driver, a failed attempt keeps the closed socket
+            self._socket = UnitMock.MagicMock()
+            raise self.connect_error
+
+        self._protocol = MySQLProtocol()
+        self._socket = UnitMock.MagicMock()
+        self.statement_cursor = UnitMock.MagicMock()
+
+        # The commands of the transactions and the pings are not sent to the mocked socket
+        self.cmd_ping = UnitMock.MagicMock()
+        self.start_transaction = UnitMock.MagicMock()
+        self.commit = UnitMock.MagicMock()
+        self.rollback = UnitMock.MagicMock()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def cursor(self, *args: Any, **kwargs: Any) -> UnitMock.MagicMock:
+        cursor = UnitMock.MagicMock()
+        cursor.__enter__.return_value = self.statement_cursor
+
+        return cursor
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLDataBaseSingleConnectionLoss(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module, attribute='MySQLConnection', new=_DriverConnectionStub)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._instance = tested_class(user='4proxy', database='banana_db')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_closed_connection_is_opened_again(self) -> None:
+        # Build
+        old_connection: Any = self._instance.get_connection_with_database()
+
+        # Operate
+        self._instance.close_active_connection_with_database()
+        new_connection: Any = self._instance.get_connection_with_database()
+
+        # Check
+        # The driver keeps the socket of the closed connection
+        self.assertIsNotNone(obj=old_connection._socket)
+        old_connection._socket.close_connection.assert_called_once()
+        self.assertIsNot(expr1=new_connection, expr2=old_connection)
+        self.assertIsNotNone(obj=new_connection._socket)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_lost_connection_is_replaced_by_next_query(self) -> None:
+        # Check
+        for error in (OperationalError(errno=errorcode.CR_SERVER_GONE_ERROR),
+                      InterfaceError(errno=errorcode.CR_SERVER_LOST)):
+            with self.subTest(error=error):
+                lost_connection: Any = self._instance.get_connection_with_database()
+                lost_connection.statement_cursor.execute.side_effect = error
+
+                with self.assertRaises(expected_exception=MySQLError):
+                    self._instance.execute_query_no_returns("DELETE FROM logs")
+
+                self._instance.execute_query_no_returns("DELETE FROM logs")
+
+                new_connection: Any = self._instance.get_connection_with_database()
+                self.assertIsNot(expr1=new_connection, expr2=lost_connection)
+                new_connection.statement_cursor.execute.assert_called_once_with("DELETE FROM logs", ())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_failed_statement_keeps_connection(self) -> None:
+        # Build
+        connection: Any = self._instance.get_connection_with_database()
+        connection.statement_cursor.execute.side_effect = MySQLError(errno=errorcode.ER_DUP_ENTRY)
+
+        # Operate
+        with self.assertRaises(expected_exception=MySQLError):
+            self._instance.execute_query_no_returns("INSERT INTO users VALUES (%s)", 1)
+
+        # Check
+        self.assertIs(expr1=self._instance.get_connection_with_database(), expr2=connection)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_connection_lost_within_transaction_is_not_opened_again(self) -> None:
+        # Build
+        connection: Any = self._instance.get_connection_with_database()
+        connection.statement_cursor.execute.side_effect = OperationalError(errno=errorcode.CR_SERVER_LOST_EXTENDED)
+
+        # Operate
+        with self.assertRaises(expected_exception=ConnectionError), self._instance.transaction():
+            try:
+                self._instance.execute_query_no_returns("UPDATE users SET name = %s", "a")
+            except MySQLError:
+                pass
+
+            self._instance.execute_query_no_returns("UPDATE users SET name = %s", "b")
+
+        # Check
+        self.assertIsNot(expr1=self._instance.get_connection_with_database(), expr2=connection)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_connection_failed_ping_is_opened_again(self) -> None:
+        # Build
+        connection: Any = self._instance.get_connection_with_database()
+        connection.cmd_ping.side_effect = OperationalError(errno=errorcode.CR_SERVER_GONE_ERROR)
+
+        # Operate
+        with self.assertRaises(expected_exception=OperationalError):
+            self._instance.check_health()
+
+        is_closed: bool = self._instance.is_connection_closed
+        self._instance.check_health()
+
+        # Check
+        self.assertTrue(expr=is_closed)
+        self.assertFalse(expr=self._instance.is_connection_closed)
+        new_connection: Any = self._instance.get_connection_with_database()
+        self.assertIsNot(expr1=new_connection, expr2=connection)
+        new_connection.cmd_ping.assert_called_once_with()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_failed_connect_is_attempted_again(self) -> None:
+        # Build
+        self._instance.close_active_connection_with_database()
+
+        with UnitMock.patch.object(target=_DriverConnectionStub, attribute='connect_error',
+                                   new=OperationalError(errno=errorcode.CR_CONN_HOST_ERROR), create=True):
+            with self.assertRaises(expected_exception=OperationalError):
+                self._instance.get_connection_with_database()
+
+        # Operate
+        connection: Any = self._instance.get_connection_with_database()
+
+        # Check
+        self.assertTrue(expr=hasattr(connection, 'statement_cursor'))
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLDataBaseSingleSessionState(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module, attribute='MySQLConnection', autospec=True)
+        MockMySQLConnection: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._connection = UnitMock.MagicMock(_socket=UnitMock.MagicMock(), in_transaction=False, unread_result=False)
+        self._cursor: UnitMock.MagicMock = self._connection.cursor.return_value.__enter__.return_value
+        MockMySQLConnection.return_value = self._connection
+
+        self._instance = tested_class(user='4proxy', database='banana_db')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_clean_session_is_not_reset(self) -> None:
+        # Operate
+        self._instance.execute_query_no_returns("UPDATE users SET name = %s", "a")
+        is_reset: bool = self._instance.reset_connection_session()
+
+        # Check
+        self.assertFalse(expr=is_reset)
+        self._connection.cmd_reset_connection.assert_not_called()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_changed_session_is_reset_once(self) -> None:
+        # Operate
+        self._instance.execute_query_no_returns("CREATE TEMPORARY TABLE ids (id INT)")
+
+        is_reset: bool = self._instance.reset_connection_session()
+        is_reset_again: bool = self._instance.reset_connection_session()
+
+        # Check
+        self.assertTrue(expr=is_reset)
+        self.assertFalse(expr=is_reset_again)
+        self._connection.cmd_reset_connection.assert_called_once()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_open_transaction_is_reset(self) -> None:
+        # Build
+        self._connection.in_transaction = True
+
+        # Check
+        self.assertTrue(expr=self._instance.reset_connection_session())
+        self._connection.cmd_reset_connection.assert_called_once()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_known_session_variable_is_not_set_again(self) -> None:
+        # Operate
+        results: List[bool] = [
+            self._instance.set_session_variable('time_zone', '+00:00'),
+            self._instance.set_session_variable('TIME_ZONE', '+00:00'),
+            self._instance.set_session_variable('time_zone', '+02:00'),
+        ]
+
+        # Check
+        self.assertEqual(first=results, second=[True, False, True])
+        self.assertEqual(first=self._cursor.execute.call_args_list, second=[
+            UnitMock.call("SET SESSION time_zone = %s", ('+00:00',)),
+            UnitMock.call("SET SESSION time_zone = %s", ('+02:00',)),
+        ])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_known_session_variables_are_forgotten_after_reset_and_raw_set(self) -> None:
+        # Build
+        self._instance.set_session_variable('time_zone', '+00:00')
+
+        # Operate
+        self._instance.reset_connection_session()
+        is_set_after_reset: bool = self._instance.set_session_variable('time_zone', '+00:00')
+
+        self._instance.execute_query_no_returns("SET time_zone = 'SYSTEM'")
+        is_set_after_raw_set: bool = self._instance.set_session_variable('time_zone', '+00:00')
+
+        # Check
+        self.assertTrue(expr=is_set_after_reset)
+        self.assertTrue(expr=is_set_after_raw_set)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_invalid_name_of_session_variable_raises_ValueError(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=ValueError):
+            self._instance.set_session_variable('time_zone = 1; DROP TABLE users; --', 'x')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_connection_failing_health_check_is_closed(self) -> None:
+        # Build
+        self._connection.cmd_ping.side_effect = MySQLError(errno=errorcode.CR_SERVER_LOST)
+
+        # Check
+        with self.assertRaises(expected_exception=MySQLError):
+            self._instance.check_health()
+
+        self._connection.close.assert_called_once()
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLDataBaseSingleCursorReuse(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module, attribute='MySQLConnection', autospec=True)
+        MockMySQLConnection: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._connection = UnitMock.MagicMock(_socket=UnitMock.MagicMock(), _buffered=False, _raw=False,
+                                              in_transaction=False, unread_result=False)
+        self._cursor: UnitMock.MagicMock = self._connection.cursor.return_value.__enter__.return_value
+        MockMySQLConnection.return_value = self._connection
+
+        self._instance = tested_class(user='4proxy', database='banana_db')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_cursor_is_created_once_for_statements(self) -> None:
+        # Operate
+        self._instance.execute_query_no_returns("UPDATE users SET name = %s WHERE id = %s", "a", 1)
+        self._instance.execute_query_returns_one("SELECT name FROM users WHERE id = %s", 1)
+
+        # Check
+        self._connection.cursor.assert_called_once_with(cursor_class=MySQLCompiledCursor)
+        self.assertEqual(first=self._cursor.execute.call_args_list, second=[
+            UnitMock.call("UPDATE users SET name = %s WHERE id = %s", ("a", 1)),
+            UnitMock.call("SELECT name FROM users WHERE id = %s", (1,)),
+        ])
+        self._cursor.close.assert_not_called()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_raw_statements_have_own_cursor(self) -> None:
+        # Operate
+        for _ in range(2):
+            self._instance.execute_query_returns_all("SELECT id FROM users",
+                                                     conversion=MySQLConversionConfigDTO(raw=True))
+            self._instance.execute_query_returns_all("SELECT id FROM users")
+
+        # Check
+        self.assertEqual(first=self._connection.cursor.call_args_list, second=[
+            UnitMock.call(raw=True), UnitMock.call(cursor_class=MySQLCompiledCursor),
+        ])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_failed_cursor_is_closed_and_replaced(self) -> None:
+        # Build
+        self._cursor.execute.side_effect = [MySQLError(errno=errorcode.ER_DUP_ENTRY), None]
+
+        # Operate
+        with self.assertRaises(expected_exception=MySQLError):
+            self._instance.execute_query_no_returns("INSERT INTO users VALUES (%s)", 1)
+
+        self._instance.execute_query_no_returns("INSERT INTO users VALUES (%s)", 2)
+
+        # Check
+        self._cursor.close.assert_called_once()
+        self.assertEqual(first=self._connection.cursor.call_count, second=2)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_buffered_connection_keeps_its_cursor(self) -> None:
+        # Build
+        self._connection._buffered = True
+
+        # Operate
+        self._instance.execute_query_no_returns("DELETE FROM logs")
+
+        # Check
+        self._connection.cursor.assert_called_once_with()
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLDataBaseSingleChunkedStreams(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module, attribute='MySQLConnection', autospec=True)
+        MockMySQLConnection: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._connection = UnitMock.MagicMock(_socket=UnitMock.MagicMock(), _buffered=False, _raw=False,
+                                              in_transaction=False, unread_result=False, charset='utf8mb4')
+        self._cursor: UnitMock.MagicMock = self._connection.cursor.return_value.__enter__.return_value
+        MockMySQLConnection.return_value = self._connection
+
+        self._instance = tested_class(user='4proxy', database='banana_db')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_value_is_read_into_buffer_in_chunks(self) -> None:
+        # Build
+        self._cursor.fetchall.return_value = [(b'10', b'10')]
+        self._cursor.fetchone.side_effect = [(b'abcd',), (b'efgh',), (b'ij',)]
+        target = bytearray(12)
+
+        # Operate
+        written_bytes = self._instance.read_column_into('artifacts', 'data', key={'id': 42}, target=target,
+                                                        chunk_size=4)
+
+        # Check
+        self.assertEqual(first=written_bytes, second=10)
+        self.assertEqual(first=bytes(target[:10]), second=b'abcdefghij')
+        self._connection.cursor.assert_called_once_with(raw=True)
+        self.assertEqual(first=self._cursor.execute.call_args_list[1:], second=[
+            UnitMock.call("SELECT SUBSTRING(`data`, %s, %s) FROM `artifacts` WHERE `id` = %s", (position, 4, 42))
+            for position in (1, 5, 9)
+        ])
+        self._connection.start_transaction.assert_called_once()
+        self._connection.commit.assert_called_once()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_value_length_is_measured_in_connection_charset(self) -> None:
+        # Build
+        self._cursor.fetchall.return_value = [(b'4', b'2')]
+        self._cursor.fetchone.side_effect = [("\u00e9\u00e8".encode(),)]
+        target = bytearray(4)
+
+        # Operate
+        written_bytes = self._instance.read_column_into('artifacts', 'notes', key={'id': 42}, target=target,
+                                                        chunk_size=2)
+
+        # Check
+        # 2 `latin1` characters of the column are 4 bytes in `utf8mb4` of the connection
+        self.assertEqual(first=written_bytes, second=4)
+        self.assertEqual(first=self._cursor.execute.call_args_list[0], second=UnitMock.call(
+            "SELECT LENGTH(IF(CHARSET(`notes`) = 'binary', `notes`, CONVERT(`notes` USING utf8mb4))), "
+            "CHAR_LENGTH(`notes`) FROM `artifacts` WHERE `id` = %s", (42,)
+        ))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_default_chunk_fits_max_allowed_packet(self) -> None:
+        # Build
+        self._connection.info_query.return_value = (40,)
+        self._cursor.fetchall.return_value = [(b'25', b'25')]
+        self._cursor.fetchone.side_effect = [(b'a' * 10,), (b'b' * 10,), (b'c' * 5,)]
+
+        # Operate
+        written_bytes = self._instance.read_column_into('artifacts', 'data', key={'id': 42}, target=io.BytesIO())
+
+        # Check
+        # A chunk of 4-byte characters must fit into the packet too
+        self.assertEqual(first=written_bytes, second=25)
+        self.assertEqual(first=[call.args[1][:2] for call in self._cursor.execute.call_args_list[1:]],
+                         second=[(1, 10), (11, 10), (21, 10)])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_value_is_written_to_file(self) -> None:
+        # Build
+        self._cursor.fetchall.return_value = [(b'6', b'6')]
+        self._cursor.fetchone.side_effect = [(b'abc',), (b'def',)]
+        target = io.BytesIO()
+
+        # Operate
+        self._instance.read_column_into('artifacts', 'data', key={'id': 42}, target=target, chunk_size=3)
+
+        # Check
+        self.assertEqual(first=target.getvalue(), second=b'abcdef')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_missing_row_and_null_value_return_None(self) -> None:
+        # Check
+        for rows in ([], [(None, None)]):
+            with self.subTest(rows=rows):
+                self._cursor.fetchall.return_value = rows
+
+                written_bytes = self._instance.read_column_into('artifacts', 'data', key={'id': 42},
+                                                                target=bytearray(1))
+
+                self.assertIsNone(obj=written_bytes)
+                self._cursor.fetchone.assert_not_called()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_small_buffer_raises_ValueError_before_chunks(self) -> None:
+        # Build
+        self._cursor.fetchall.return_value = [(b'10', b'10')]
+
+        # Check
+        with self.assertRaises(expected_exception=ValueError):
+            self._instance.read_column_into('artifacts', 'data', key={'id': 42}, target=bytearray(4))
+
+        self._cursor.fetchone.assert_not_called()
+        self._connection.rollback.assert_called_once()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_invalid_arguments_raise_ValueError(self) -> None:
+        # Build
+        self._cursor.fetchall.return_value = [(b'1', b'1'), (b'1', b'1')]
+
+        # Check
+        for arguments in ({'key': {'id': 42}, 'chunk_size': 0},
+                          {'key': {}},
+                          {'key': {'group_id': 7}}):
+            with self.subTest(arguments=arguments), self.assertRaises(expected_exception=ValueError):
+                self._instance.read_column_into('artifacts', 'data', target=bytearray(8), **arguments)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_streams_are_sent_by_prepared_statement(self) -> None:
+        # Build
+        prepared_cursor: UnitMock.MagicMock = self._cursor
+        stream = io.BytesIO(b'model')
+
+        # Operate
+        self._instance.execute_query_with_streams("INSERT INTO artifacts (name, data) VALUES (%s, %s)",
+                                                  'model', stream)
+
+        # Check
+        self._connection.cursor.assert_called_once_with(prepared=True)
+        sql_query, params = prepared_cursor.execute.call_args.args
+        self.assertEqual(first=sql_query, second="INSERT INTO artifacts (name, data) VALUES (%s, %s)")
+        self.assertEqual(first=params[0], second='model')
+        self.assertIsInstance(obj=params[1], cls=ChunkedStreamReader)
+        self.assertEqual(first=bytes(params[1].read()), second=b'model')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_bytes_parameters_are_not_wrapped(self) -> None:
+        # Operate
+        self._instance.execute_query_with_streams("INSERT INTO artifacts (data) VALUES (%s)", b'model')
+
+        # Check
+        self._cursor.execute.assert_called_once_with("INSERT INTO artifacts (data) VALUES (%s)", (b'model',))
+
+
+# ______________________________________________________________________________________________________________________
+class _MeteredConnectionStub(MySQLMeteredConnection):
+    """_MeteredConnectionStub metered connection without a server, each query receives `result_bytes` bytes."""
+
+    result_bytes: int = 0
+
+    def connect(self, **dbconfig: Any) -> None:
+        self.connect_kwargs: Dict[str, Any] = dbconfig
+        self._compress = dbconfig.get('compress', False)
+        self._socket = UnitMock.MagicMock()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def close(self) -> None:
+        # As the driver, `close` keeps the socket of the connection
+        self.is_closed: bool = True
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def cursor(self, *args: Any, **kwargs: Any) -> UnitMock.MagicMock:
+        cursor = UnitMock.MagicMock()
+        cursor.__enter__.return_value.execute.side_effect = \
+            lambda *query: setattr(self, 'received_bytes', self.received_bytes + self.result_bytes)
+
+        return cursor
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLDataBaseSingleCompression(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module, attribute='MySQLConnection', autospec=True)
+        self._MockMySQLConnection: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        metered_patcher = UnitMock.patch.object(target=tested_module, attribute='MySQLMeteredConnection',
+                                                new=_MeteredConnectionStub)
+        metered_patcher.start()
+        self.addCleanup(metered_patcher.stop)
+
+        self._policy = AdaptiveCompressionPolicy(enable_bytes_per_query=10_000, disable_bytes_per_query=1_000,
+                                                 min_queries_count=2)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_zlib_option_is_passed_as_compress_flag(self) -> None:
+        # Build
+        connection = UnitMock.MagicMock(_socket=None)
+        self._MockMySQLConnection.return_value = connection
+        instance = tested_class(user='4proxy', compression='zlib')
+
+        # Operate
+        instance.get_connection_with_database()
+
+        # Check
+        connection.connect.assert_called_once_with(user='4proxy', compress=True)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_invalid_option_raises_ValueError(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=ValueError):
+            tested_class(user='4proxy', compression='zstd')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_invalid_option_in_new_dbconfig_keeps_old_one(self) -> None:
+        # Build
+        instance = tested_class(user='4proxy', compression='adaptive')
+
+        # Operate
+        with self.assertRaises(expected_exception=ValueError):
+            instance.dbconfig = {'user': '4proxy', 'compression': 'zstd'}
+
+        # Check
+        self.assertEqual(first=instance.dbconfig, second={'user': '4proxy', 'compression': 'adaptive'})
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_large_transfers_switch_to_compressed_connection(self) -> None:
+        # Build
+        instance = tested_class(user='4proxy', compression=self._policy)
+        old_connection: Any = instance.get_connection_with_database()
+        old_connection.result_bytes = 50_000
+
+        # Operate
+        for _ in range(2):
+            instance.execute_query_returns_all("SELECT * FROM events")
+
+        new_connection: Any = instance.get_connection_with_database()
+
+        # Check
+        self.assertEqual(first=old_connection.connect_kwargs, second={'user': '4proxy', 'compress': False})
+        self.assertIsNot(expr1=new_connection, expr2=old_connection)
+        self.assertEqual(first=new_connection.connect_kwargs, second={'user': '4proxy', 'compress': True})
+        self.assertTrue(expr=old_connection.is_closed)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_small_transfers_keep_uncompressed_connection(self) -> None:
+        # Build
+        instance = tested_class(user='4proxy', compression=self._policy)
+        connection: Any = instance.get_connection_with_database()
+        connection.result_bytes = 200
+
+        # Operate
+        for _ in range(5):
+            instance.execute_query_returns_one("SELECT name FROM users WHERE id = %s", 1)
+
+        # Check
+        self.assertIs(expr1=instance.get_connection_with_database(), expr2=connection)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_changed_session_is_not_reconnected(self) -> None:
+        # Build
+        instance = tested_class(user='4proxy', compression=self._policy)
+        connection: Any = instance.get_connection_with_database()
+        instance.execute_query_no_returns("CREATE TEMPORARY TABLE export_ids (id INT)")
+        connection.result_bytes = 50_000
+
+        # Operate
+        for _ in range(3):
+            instance.execute_query_returns_all("SELECT * FROM events")
+
+        # Check
+        self.assertIs(expr1=instance.get_connection_with_database(), expr2=connection)
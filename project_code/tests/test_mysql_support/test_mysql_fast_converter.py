@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `MySQLFastConverter` and functions from the `mysql_fast_converter.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import unittest
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from mysql.connector.constants import FieldType
+from mysql.connector.conversion import MySQLConverter
+
+from mysql_support import mysql_fast_converter as tested_module
+from mysql_support.mysql_conversion_config_dto import MySQLConversionConfigDTO
+
+from typing import Any, List, Tuple
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLFastConverter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+
+        cls._fields: List[Tuple[Any, ...]] = [
+            ('price', FieldType.NEWDECIMAL, None, None, None, None, 0, 0),
+            ('created', FieldType.DATETIME, None, None, None, None, 0, 0),
+            ('id', FieldType.LONG, None, None, None, None, 0, 0),
+        ]
+        cls._row: Tuple[bytes, ...] = (b'10.50', b'2024-01-31 23:59:59', b'7')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _convert_row(self, conversion_config: MySQLConversionConfigDTO) -> Tuple[Any, ...]:
+        converter_class = tested_module.get_converter_class(conversion_config=conversion_config)
+
+        return converter_class('utf8mb4', True).row_to_python(self._row, self._fields)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_default_config_converts_as_driver(self) -> None:
+        self.assertEqual(first=self._convert_row(conversion_config=MySQLConversionConfigDTO()),
+                         second=MySQLConverter('utf8mb4', True).row_to_python(self._row, self._fields))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_decimal_and_temporal_values_are_kept_as_str(self) -> None:
+        # Operate
+        row = self._convert_row(conversion_config=MySQLConversionConfigDTO(decimal_as_str=True, temporal_as_str=True))
+
+        # Check
+        self.assertEqual(first=row, second=('10.50', '2024-01-31 23:59:59', 7))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_registered_converter_has_priority(self) -> None:
+        # Build
+        conversion_config = MySQLConversionConfigDTO(
+            converters={FieldType.DATETIME: tested_module.datetime_to_epoch_seconds}
+        )
+
+        # Operate
+        row = self._convert_row(conversion_config=conversion_config)
+
+        # Check
+        expected_epoch = int(datetime(2024, 1, 31, 23, 59, 59, tzinfo=timezone.utc).timestamp())
+
+        self.assertEqual(first=row, second=(Decimal('10.50'), expected_epoch, 7))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_converter_class_is_cached_per_config(self) -> None:
+        self.assertIs(
+            expr1=tested_module.get_converter_class(conversion_config=MySQLConversionConfigDTO(decimal_as_str=True)),
+            expr2=tested_module.get_converter_class(conversion_config=MySQLConversionConfigDTO(decimal_as_str=True))
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_datetime_to_epoch_seconds_accepts_date_and_fraction(self) -> None:
+        self.assertEqual(first=tested_module.datetime_to_epoch_seconds(b'1970-01-02'), second=86400)
+        self.assertEqual(first=tested_module.datetime_to_epoch_seconds(b'1970-01-01 00:00:01.999'), second=1)
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLConversionConfigDTO(unittest.TestCase):
+    def test_invalid_fields_raise_exceptions(self) -> None:
+        with self.assertRaises(expected_exception=TypeError):
+            MySQLConversionConfigDTO(raw="yes")
+
+        with self.assertRaises(expected_exception=ValueError):
+            MySQLConversionConfigDTO(converters={100_000: str})
+
+        with self.assertRaises(expected_exception=TypeError):
+            MySQLConversionConfigDTO(converters={FieldType.DATETIME: "epoch"})
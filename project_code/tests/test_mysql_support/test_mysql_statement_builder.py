@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for functions from the `mysql_statement_builder.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.7.0"
+
+import unittest
+
+from mysql_support import mysql_statement_builder as tested_module
+
+from typing import Any, List, Tuple
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLStatementBuilder(unittest.TestCase):
+    def test_build_upsert_statement_updates_given_columns(self) -> None:
+        # Operate
+        sql_query: str = tested_module.build_upsert_statement(table_name="users",
+                                                              column_names=("id", "name", "email"),
+                                                              update_column_names=("name", "email"),
+                                                              rows_count=1)
+
+        # Check
+        self.assertEqual(
+            first=sql_query,
+            second=("INSERT INTO `users` (`id`, `name`, `email`) VALUES (%s, %s, %s) "
+                    "ON DUPLICATE KEY UPDATE `name` = VALUES(`name`), `email` = VALUES(`email`)")
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_build_upsert_statement_without_update_columns_keeps_rows_unchanged(self) -> None:
+        # Operate
+        sql_query: str = tested_module.build_upsert_statement(table_name="users",
+                                                              column_names=("id",),
+                                                              update_column_names=(),
+                                                              rows_count=1)
+
+        # Check
+        self.assertTrue(expr=sql_query.endswith("ON DUPLICATE KEY UPDATE `id` = `id`"))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_build_column_chunk_statements_filters_by_keys(self) -> None:
+        # Operate
+        length_query, chunk_query = tested_module.build_column_chunk_statements(table_name="artifacts",
+                                                                                column_name="data",
+                                                                                key_column_names=("id", "version"))
+
+        # Check
+        self.assertEqual(first=length_query,
+                         second=("SELECT LENGTH(`data`), CHAR_LENGTH(`data`) FROM `artifacts` "
+                                 "WHERE `id` = %s AND `version` = %s"))
+        self.assertEqual(first=chunk_query,
+                         second="SELECT SUBSTRING(`data`, %s, %s) FROM `artifacts` WHERE `id` = %s AND `version` = %s")
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_build_column_chunk_statements_measures_text_in_charset(self) -> None:
+        # Operate
+        length_query, _ = tested_module.build_column_chunk_statements(table_name="artifacts", column_name="notes",
+                                                                      key_column_names=("id",), charset_name="utf8mb4")
+
+        # Check
+        self.assertEqual(first=length_query,
+                         second=("SELECT LENGTH(IF(CHARSET(`notes`) = 'binary', `notes`, "
+                                 "CONVERT(`notes` USING utf8mb4))), CHAR_LENGTH(`notes`) "
+                                 "FROM `artifacts` WHERE `id` = %s"))
+
+        with self.assertRaises(expected_exception=ValueError):
+            tested_module.build_column_chunk_statements(table_name="artifacts", column_name="notes",
+                                                        key_column_names=("id",), charset_name="utf8mb4) --")
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_build_column_chunk_statements_raise_ValueError_without_keys(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=ValueError):
+            tested_module.build_column_chunk_statements(table_name="artifacts", column_name="data",
+                                                        key_column_names=())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_split_rows_by_packet_size_keeps_every_group_within_budget(self) -> None:
+        # Build
+        rows: List[Tuple[Any, ...]] = [(i, "x" * 10) for i in range(100)]
+        row_size: int = tested_module.estimate_row_packet_size(row=rows[0])
+
+        # Operate
+        batches = list(tested_module.split_rows_by_packet_size(rows=rows,
+                                                               max_packet_size=row_size * 10 + 50,
+                                                               statement_overhead=50))
+
+        # Check
+        self.assertEqual(first=[len(batch) for batch in batches], second=[10] * 10)
+        self.assertEqual(first=[row for batch in batches for row in batch], second=rows)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_split_rows_by_packet_size_raise_ValueError_for_too_large_row(self) -> None:
+        with self.assertRaises(expected_exception=ValueError):
+            list(tested_module.split_rows_by_packet_size(rows=[("x" * 1000,)],
+                                                         max_packet_size=1000,
+                                                         statement_overhead=10))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_add_max_execution_time_hint_to_select(self) -> None:
+        # Build
+        patterns: Tuple[Tuple[str, str], ...] = (
+            ("SELECT id FROM users", "SELECT /*+ MAX_EXECUTION_TIME(1500) */ id FROM users"),
+            ("  select id FROM users", "  select /*+ MAX_EXECUTION_TIME(1500) */ id FROM users"),
+            ("SELECT /*+ BKA(users) */ id FROM users",
+             "SELECT /*+ MAX_EXECUTION_TIME(1500) BKA(users) */ id FROM users"),
+        )
+
+        # Check
+        for sql_query, expected_query in patterns:
+            with self.subTest(pattern=sql_query):
+                self.assertEqual(first=tested_module.add_max_execution_time_hint(sql_query=sql_query, timeout_ms=1500),
+                                 second=expected_query)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_add_max_execution_time_hint_skips_other_statements(self) -> None:
+        for sql_query in ("UPDATE users SET name = %s",
+                          "SELECTED_ROWS",
+                          "SELECT /*+ MAX_EXECUTION_TIME(10) */ id FROM users"):
+            with self.subTest(pattern=sql_query):
+                self.assertIsNone(obj=tested_module.add_max_execution_time_hint(sql_query=sql_query, timeout_ms=1500))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_changes_session_state_detects_session_changes(self) -> None:
+        for sql_query in ("SET @user_id = 1",
+                          "  /* audit */ set session time_zone = '+00:00'",
+                          "CREATE TEMPORARY TABLE ids (id INT)",
+                          "SELECT @row := @row + 1 FROM users",
+                          "SELECT id INTO @user_id FROM users LIMIT 1",
+                          "SELECT 1; USE banana_db",
+                          "SELECT GET_LOCK('import', 10)",
+                          "START TRANSACTION"):
+            with self.subTest(pattern=sql_query):
+                self.assertTrue(expr=tested_module.changes_session_state(sql_query=sql_query))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_changes_session_state_skips_plain_statements(self) -> None:
+        for sql_query in ("SELECT id FROM users WHERE id = %s",
+                          "UPDATE users SET name = %s",
+                          "INSERT INTO users (id) VALUES (1) ON DUPLICATE KEY UPDATE id = id",
+                          "SELECT @@session.time_zone, LAST_INSERT_ID()"):
+            with self.subTest(pattern=sql_query):
+                self.assertFalse(expr=tested_module.changes_session_state(sql_query=sql_query))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_changes_session_state_checks_long_statements_without_cache(self) -> None:
+        # Build
+        long_sql_query: str = "SET @ids = '" + "1," * tested_module.MAX_CACHED_STATEMENT_LENGTH + "'"
+        tested_module._changes_session_state_cached.cache_clear()
+
+        # Operate
+        is_changed: bool = tested_module.changes_session_state(sql_query=long_sql_query)
+
+        # Check
+        self.assertTrue(expr=is_changed)
+        self.assertEqual(first=tested_module._changes_session_state_cached.cache_info().currsize, second=0)
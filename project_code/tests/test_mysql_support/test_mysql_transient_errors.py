@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for the classifiers of the errors from the `mysql_transient_errors.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import unittest
+
+from mysql.connector import errorcode
+from mysql.connector.errors import Error as MySQLError
+
+from mysql_support import mysql_transient_errors as tested_module
+
+
+# ______________________________________________________________________________________________________________________
+class TestIsTransientMySQLError(unittest.TestCase):
+    def test_rolled_back_and_not_executed_statements_are_retried(self) -> None:
+        for errno in (errorcode.ER_LOCK_DEADLOCK, errorcode.ER_LOCK_WAIT_TIMEOUT, errorcode.ER_READ_ONLY_MODE):
+            with self.subTest(errno=errno):
+                self.assertTrue(expr=tested_module.is_transient_mysql_error(error=MySQLError(errno=errno),
+                                                                            is_idempotent=False))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_lost_connection_is_retried_only_for_idempotent_call(self) -> None:
+        # Build
+        error = MySQLError(errno=errorcode.CR_SERVER_LOST)
+
+        # Check
+        self.assertTrue(expr=tested_module.is_transient_mysql_error(error=error, is_idempotent=True))
+        self.assertFalse(expr=tested_module.is_transient_mysql_error(error=error, is_idempotent=False))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_other_errors_are_not_retried(self) -> None:
+        for error in (MySQLError(errno=errorcode.ER_DUP_ENTRY), TimeoutError(), ValueError()):
+            with self.subTest(error=error):
+                self.assertFalse(expr=tested_module.is_transient_mysql_error(error=error, is_idempotent=True))
+
+
+# ______________________________________________________________________________________________________________________
+class TestIsMySQLEndpointFailure(unittest.TestCase):
+    def test_unavailable_server_is_failure(self) -> None:
+        for error in (MySQLError(errno=errorcode.CR_SERVER_LOST), MySQLError(errno=errorcode.CR_CONN_HOST_ERROR),
+                      MySQLError(errno=errorcode.ER_READ_ONLY_MODE), TimeoutError(), ConnectionRefusedError()):
+            with self.subTest(error=error):
+                self.assertTrue(expr=tested_module.is_mysql_endpoint_failure(error=error))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_statement_errors_are_not_failures(self) -> None:
+        for error in (MySQLError(errno=errorcode.ER_DUP_ENTRY), MySQLError(errno=errorcode.ER_LOCK_DEADLOCK),
+                      ValueError()):
+            with self.subTest(error=error):
+                self.assertFalse(expr=tested_module.is_mysql_endpoint_failure(error=error))
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `MySQLUpsertResultDTO` from the `mysql_upsert_result_dto.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import unittest
+
+from mysql_support.mysql_upsert_result_dto import MySQLUpsertResultDTO as tested_class
+
+
+# ______________________________________________________________________________________________________________________
+class TestMySQLUpsertResultDTO(unittest.TestCase):
+    def _check_counts(self, result: tested_class, inserted: int, updated: int, unchanged: int) -> None:
+        self.assertEqual(first=(result.inserted, result.updated, result.unchanged),
+                         second=(inserted, updated, unchanged))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_counts_are_restored_from_info_message(self) -> None:
+        # 5 rows: 2 inserted, 2 updated, 1 unchanged -> 2 * 1 + 2 * 2 + 0 affected rows
+        result = tested_class.from_statement_result(rows_count=5,
+                                                    affected_rows=6,
+                                                    info_message="Records: 5  Duplicates: 3  Warnings: 0")
+
+        self._check_counts(result=result, inserted=2, updated=2, unchanged=1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_counts_are_restored_with_found_rows_flag(self) -> None:
+        # 5 rows: 2 inserted, 2 updated, 1 unchanged -> 2 * 1 + 2 * 2 + 1 affected rows
+        result = tested_class.from_statement_result(rows_count=5,
+                                                    affected_rows=7,
+                                                    info_message="Records: 5  Duplicates: 3  Warnings: 0",
+                                                    found_rows=True)
+
+        self._check_counts(result=result, inserted=2, updated=2, unchanged=1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_counts_of_single_row_statement_without_info_message(self) -> None:
+        for affected_rows, expected_counts in ((1, (1, 0, 0)), (2, (0, 1, 0)), (0, (0, 0, 1))):
+            with self.subTest(pattern=affected_rows):
+                result = tested_class.from_statement_result(rows_count=1,
+                                                            affected_rows=affected_rows,
+                                                            info_message=None)
+
+                self._check_counts(result, *expected_counts)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_unchanged_single_row_with_found_rows_flag_is_counted_as_inserted(self) -> None:
+        # An inserted and an unchanged row both count 1 affected row with the flag
+        result = tested_class.from_statement_result(rows_count=1, affected_rows=1, info_message=None, found_rows=True)
+
+        self._check_counts(result=result, inserted=1, updated=0, unchanged=0)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_results_are_summed(self) -> None:
+        # Operate
+        result = tested_class(1, 2, 3, 1) + tested_class(4, 5, 6, 1)
+
+        # Check
+        self.assertEqual(first=result, second=tested_class(5, 7, 9, 2))
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `AdaptiveCompressionPolicy` and `TransferMeter` from the `adaptive_compression.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import unittest
+
+from tools.adaptive_compression import AdaptiveCompressionPolicy as tested_class
+from tools.adaptive_compression import TransferMeter
+
+
+# ______________________________________________________________________________________________________________________
+class TestAdaptiveCompressionPolicy(unittest.TestCase):
+    def test_invalid_parameters_raise(self) -> None:
+        # Check
+        for parameters in ({'enable_bytes_per_query': 1000, 'disable_bytes_per_query': 2000},
+                           {'disable_bytes_per_query': -1},
+                           {'smoothing': 0.0},
+                           {'smoothing': 1.5},
+                           {'min_queries_count': 0}):
+            with self.subTest(parameters=parameters), self.assertRaises(expected_exception=ValueError):
+                tested_class(**parameters)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_meter_starts_without_compression(self) -> None:
+        # Build
+        instance = tested_class()
+
+        # Operate
+        meter: TransferMeter = instance.create_meter()
+
+        # Check
+        self.assertIs(expr1=meter.policy, expr2=instance)
+        self.assertFalse(expr=meter.is_compression_recommended)
+        self.assertEqual(first=meter.queries_count, second=0)
+
+
+# ______________________________________________________________________________________________________________________
+class TestTransferMeter(unittest.TestCase):
+    def setUp(self) -> None:
+        self._policy = tested_class(enable_bytes_per_query=10_000, disable_bytes_per_query=1_000,
+                                    smoothing=0.5, min_queries_count=3)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_no_recommendation_before_min_queries(self) -> None:
+        # Build
+        meter: TransferMeter = self._policy.create_meter()
+
+        # Operate
+        recommendations = [meter.observe_query(received_bytes=1_000_000) for _ in range(2)]
+
+        # Check
+        self.assertEqual(first=recommendations, second=[False, False])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_first_queries_are_averaged_evenly(self) -> None:
+        # Build
+        meter: TransferMeter = tested_class(smoothing=0.2).create_meter()
+
+        # Operate
+        for received_bytes in (100, 200, 300):
+            meter.observe_query(received_bytes=received_bytes)
+
+        # Check
+        self.assertAlmostEqual(first=meter.mean_bytes_per_query, second=200.0)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_large_transfers_recommend_compression(self) -> None:
+        # Build
+        meter: TransferMeter = self._policy.create_meter()
+
+        # Operate
+        recommendations = [meter.observe_query(received_bytes=50_000) for _ in range(3)]
+
+        # Check
+        self.assertEqual(first=recommendations, second=[False, False, True])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_recommendation_is_kept_between_thresholds(self) -> None:
+        # Build
+        meter: TransferMeter = self._policy.create_meter()
+
+        for _ in range(3):
+            meter.observe_query(received_bytes=20_000)
+
+        # Operate
+        # The mean falls from 20000 to 8750, which is between the thresholds
+        meter.observe_query(received_bytes=5_000)
+        is_recommended: bool = meter.observe_query(received_bytes=5_000)
+
+        # Check
+        self.assertTrue(expr=is_recommended)
+        self.assertLess(a=meter.mean_bytes_per_query, b=10_000)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_small_transfers_disable_compression(self) -> None:
+        # Build
+        meter: TransferMeter = self._policy.create_meter()
+
+        for _ in range(3):
+            meter.observe_query(received_bytes=20_000)
+
+        # Operate
+        recommendations = [meter.observe_query(received_bytes=100) for _ in range(5)]
+
+        # Check
+        self.assertTrue(expr=recommendations[0])
+        self.assertFalse(expr=recommendations[-1])
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `AdaptivePoolSizer` from the `adaptive_pool_sizer.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import unittest
+from unittest import mock as UnitMock
+
+from tools import adaptive_pool_sizer as tested_module
+from tools.adaptive_pool_sizer import AdaptivePoolSizer as tested_class
+
+
+# ______________________________________________________________________________________________________________________
+class TestAdaptivePoolSizer(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module.time, attribute='monotonic', return_value=100.0)
+        self._monotonic: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _observe_window(self, instance: tested_class, leases_count: int, wait_seconds: float,
+                        hold_seconds: float, in_use_count: int, size: int) -> int:
+        for _ in range(leases_count - 1):
+            self.assertEqual(first=instance.observe_lease(wait_seconds=wait_seconds, hold_seconds=hold_seconds,
+                                                          in_use_count=in_use_count, size=size),
+                             second=size)
+
+        # The last lease closes the window of the evaluation
+        self._monotonic.return_value += 1.0
+
+        return instance.observe_lease(wait_seconds=wait_seconds, hold_seconds=hold_seconds,
+                                      in_use_count=in_use_count, size=size)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_waiting_grows_size_to_littles_law_estimate(self) -> None:
+        # Build
+        instance = tested_class(min_size=2, max_size=32, target_acquire_wait=0.01)
+
+        # Operate
+        # 20 leases per second held for 0.5s need 10 connections, 12.5 with the headroom
+        size: int = self._observe_window(instance=instance, leases_count=20, wait_seconds=0.1,
+                                         hold_seconds=0.5, in_use_count=4, size=4)
+
+        # Check
+        self.assertEqual(first=size, second=13)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_waiting_grows_size_additively(self) -> None:
+        # Build
+        instance = tested_class(min_size=2, max_size=32, target_acquire_wait=0.01, increase_step=2)
+
+        # Operate
+        size: int = self._observe_window(instance=instance, leases_count=2, wait_seconds=0.1,
+                                         hold_seconds=0.01, in_use_count=8, size=8)
+
+        # Check
+        self.assertEqual(first=size, second=10)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_low_utilization_shrinks_size_multiplicatively(self) -> None:
+        # Build
+        instance = tested_class(min_size=2, max_size=32, decrease_factor=0.5)
+
+        # Operate
+        size: int = self._observe_window(instance=instance, leases_count=5, wait_seconds=0.0,
+                                         hold_seconds=0.01, in_use_count=3, size=16)
+
+        # Check
+        self.assertEqual(first=size, second=8)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_size_is_kept_within_bounds(self) -> None:
+        # Build
+        instance = tested_class(min_size=4, max_size=10)
+
+        # Operate
+        grown_size: int = self._observe_window(instance=instance, leases_count=100, wait_seconds=1.0,
+                                               hold_seconds=1.0, in_use_count=10, size=10)
+        shrunk_size: int = self._observe_window(instance=instance, leases_count=1, wait_seconds=0.0,
+                                                hold_seconds=0.0, in_use_count=1, size=5)
+
+        # Check
+        self.assertEqual(first=grown_size, second=10)
+        self.assertEqual(first=shrunk_size, second=4)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_invalid_bounds_raise_ValueError(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=ValueError):
+            tested_class(min_size=8, max_size=4)
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `AdmissionController` from the `admission_controller.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import threading
+import time
+import unittest
+
+from tools.admission_controller import AdmissionController as tested_class
+from tools.deadline import Deadline
+from tools.priority_lane_dto import PriorityLaneDTO
+
+from typing import List
+
+
+# ______________________________________________________________________________________________________________________
+class TestAdmissionController(unittest.TestCase):
+    def _wait_for_queue_length(self, instance: tested_class, lane_name: str, length: int) -> None:
+        deadline: Deadline = Deadline.after(seconds=5.0)
+
+        while instance.get_queue_length(lane_name=lane_name) != length:
+            deadline.check(operation="Waiting for the queue")
+            time.sleep(0.001)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_reservations_cannot_exceed_capacity(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=ValueError):
+            tested_class(capacity=2, lanes=(PriorityLaneDTO(name='interactive', reserved_connections=2),
+                                            PriorityLaneDTO(name='batch', reserved_connections=1)))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_lane_cannot_take_reserved_connections_of_other_lane(self) -> None:
+        # Build
+        instance = tested_class(capacity=3, lanes=(PriorityLaneDTO(name='interactive', reserved_connections=1),
+                                                   PriorityLaneDTO(name='batch')))
+
+        # Operate
+        with instance.admit(lane_name='batch'), instance.admit(lane_name='batch'):
+            with self.assertRaises(expected_exception=TimeoutError):
+                with instance.admit(lane_name='batch', deadline=Deadline.after(seconds=0.01)):
+                    pass
+
+            with instance.admit(lane_name='interactive', deadline=Deadline.after(seconds=0.01)):
+                interactive_count: int = instance.get_in_use_count(lane_name='interactive')
+
+        # Check
+        self.assertEqual(first=interactive_count, second=1)
+        self.assertEqual(first=instance.get_in_use_count(lane_name='batch'), second=0)
+        self.assertEqual(first=instance.get_queue_length(lane_name='batch'), second=0)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_free_connection_is_given_to_more_important_lane(self) -> None:
+        # Build
+        instance = tested_class(capacity=1, lanes=(PriorityLaneDTO(name='interactive'),
+                                                   PriorityLaneDTO(name='batch')))
+        admitted_lanes: List[str] = []
+
+        def run(lane_name: str) -> None:
+            with instance.admit(lane_name=lane_name, deadline=Deadline.after(seconds=5.0)):
+                admitted_lanes.append(lane_name)
+
+        batch_thread = threading.Thread(target=run, args=('batch',))
+        interactive_thread = threading.Thread(target=run, args=('interactive',))
+
+        # Operate
+        with instance.admit(lane_name='batch'):
+            batch_thread.start()
+            self._wait_for_queue_length(instance=instance, lane_name='batch', length=1)
+
+            interactive_thread.start()
+            self._wait_for_queue_length(instance=instance, lane_name='interactive', length=1)
+
+        batch_thread.join()
+        interactive_thread.join()
+
+        # Check
+        self.assertEqual(first=admitted_lanes, second=['interactive', 'batch'])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_request_is_shed_by_full_queue(self) -> None:
+        # Build
+        instance = tested_class(capacity=1, lanes=(PriorityLaneDTO(name='batch', max_queue_length=0),))
+
+        # Check
+        with instance.admit(lane_name='batch'):
+            with self.assertRaises(expected_exception=RuntimeError):
+                with instance.admit(lane_name='batch'):
+                    pass
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_request_is_shed_by_queue_latency(self) -> None:
+        # Build
+        instance = tested_class(capacity=1, lanes=(PriorityLaneDTO(name='interactive', target_queue_latency=0.01),))
+
+        def wait_until_deadline() -> None:
+            try:
+                with instance.admit(deadline=Deadline.after(seconds=0.2)):
+                    pass
+            except TimeoutError:
+                pass
+
+        waiting_thread = threading.Thread(target=wait_until_deadline)
+
+        # Operate
+        with instance.admit():
+            waiting_thread.start()
+            self._wait_for_queue_length(instance=instance, lane_name='interactive', length=1)
+            time.sleep(0.02)
+
+            # Check
+            started_at: float = time.monotonic()
+
+            with self.assertRaises(expected_exception=TimeoutError):
+                with instance.admit(deadline=Deadline.after(seconds=5.0)):
+                    pass
+
+            self.assertLess(a=time.monotonic() - started_at, b=1.0)
+
+        waiting_thread.join()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_unknown_lane_raises_KeyError(self) -> None:
+        # Build
+        instance = tested_class(capacity=1, lanes=(PriorityLaneDTO(name='interactive'),))
+
+        # Check
+        with self.assertRaises(expected_exception=KeyError):
+            with instance.admit(lane_name='batch'):
+                pass
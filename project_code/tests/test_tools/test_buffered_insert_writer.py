@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `BufferedInsertWriter` from the `buffered_insert_writer.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.3.0"
+
+import gc
+import threading
+import time
+import unittest
+from unittest import mock as UnitMock
+
+from tools.buffered_insert_writer import BufferedInsertWriter as tested_class
+
+from abstract.api.sql_api_interface import SQLAPIInterface
+
+from typing import Any, Dict
+
+
+# ______________________________________________________________________________________________________________________
+class TestBufferedInsertWriter(unittest.TestCase):
+    def setUp(self) -> None:
+        self._database = UnitMock.create_autospec(spec=SQLAPIInterface, instance=True)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_instance_of_tested_class(self, **params: Any) -> tested_class:
+        writer_params: Dict[str, Any] = {
+            'database': self._database,
+            'table_name': "events",
+            'column_names': ("id", "payload"),
+            'flush_interval': 60.0,
+        }
+        writer_params.update(params)
+
+        instance = tested_class(**writer_params)
+        self.addCleanup(instance.close)
+
+        return instance
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_close_flushes_buffered_rows_as_one_multi_row_insert(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+
+        # Operate
+        instance.write(row=(1, "a"))
+        instance.write(row=(2, "b"))
+        instance.close()
+
+        # Check
+        self._database.execute_query_no_returns.assert_called_once_with(
+            "INSERT INTO `events` (`id`, `payload`) VALUES (%s, %s), (%s, %s)", 1, "a", 2, "b"
+        )
+        self.assertEqual(first=instance.written_rows_count, second=2)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_batches_are_split_by_max_batch_rows(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(max_batch_rows=2)
+
+        # Operate
+        instance.write_many(rows=[(i, "x") for i in range(5)])
+        instance.flush()
+
+        # Check
+        rows_per_call = [(len(call.args) - 1) // 2 for call in self._database.execute_query_no_returns.call_args_list]
+
+        self.assertEqual(first=rows_per_call, second=[2, 2, 1])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_batches_are_split_by_max_batch_bytes(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(max_batch_bytes=100)
+
+        # Operate
+        instance.write_many(rows=[(i, "x" * 60) for i in range(3)])
+        instance.flush()
+
+        # Check
+        self.assertEqual(first=self._database.execute_query_no_returns.call_count, second=3)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_rows_are_flushed_by_time_threshold(self) -> None:
+        # Build
+        flushed = threading.Event()
+        self._database.execute_query_no_returns.side_effect = lambda *args: flushed.set()
+
+        instance: tested_class = self._create_instance_of_tested_class(flush_interval=0.05)
+
+        # Operate
+        instance.write(row=(1, "a"))
+
+        # Check
+        self.assertTrue(expr=flushed.wait(timeout=5),
+                        msg="Failure! The row was not flushed by the time threshold!")
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_rows_left_by_partial_flush_keep_their_buffering_time(self) -> None:
+        # Build
+        first_batch_written = threading.Event()
+        last_row_written = threading.Event()
+
+        def write_batch(*args: Any) -> None:
+            if not first_batch_written.is_set():
+                # The next rows wait in the buffer meanwhile
+                time.sleep(0.45)
+                first_batch_written.set()
+
+            elif 5 in args:
+                last_row_written.set()
+
+        self._database.execute_query_no_returns.side_effect = write_batch
+
+        instance: tested_class = self._create_instance_of_tested_class(max_batch_rows=2, flush_interval=0.6)
+
+        # Operate
+        started_at: float = time.monotonic()
+        instance.write_many(rows=[(key, "x") for key in range(1, 6)])
+
+        # Check
+        self.assertTrue(expr=last_row_written.wait(timeout=5))
+        self.assertLess(a=time.monotonic() - started_at, b=0.9,
+                        msg="Failure! The row left by the partial flush waited longer than *flush_interval*!")
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_writer_which_is_not_closed_is_collected_and_flushed(self) -> None:
+        # Build
+        instance = tested_class(database=self._database, table_name="events", column_names=("id", "payload"),
+                                flush_interval=60.0)
+        instance.write(row=(1, "a"))
+
+        # Operate
+        del instance
+        gc.collect()
+
+        # Check
+        self._database.execute_query_no_returns.assert_called_once_with(
+            "INSERT INTO `events` (`id`, `payload`) VALUES (%s, %s)", 1, "a"
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_full_buffer_blocks_writer_until_timeout(self) -> None:
+        # Build
+        release = threading.Event()
+        self._database.execute_query_no_returns.side_effect = lambda *args: release.wait(timeout=5)
+
+        instance: tested_class = self._create_instance_of_tested_class(max_batch_rows=1, max_buffered_rows=1)
+
+        # Operate
+        instance.write(row=(1, "a"))  # taken by the background thread, which is blocked
+        instance.write(row=(2, "b"))  # fills the buffer
+
+        # Check
+        with self.assertRaises(expected_exception=TimeoutError):
+            instance.write(row=(3, "c"), timeout=0.05)
+
+        release.set()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_background_error_is_raised_by_next_call(self) -> None:
+        # Build
+        self._database.execute_query_no_returns.side_effect = RuntimeError("Lost connection")
+
+        instance: tested_class = self._create_instance_of_tested_class()
+
+        # Operate
+        instance.write(row=(1, "a"))
+
+        # Check
+        with self.assertRaises(expected_exception=RuntimeError):
+            instance.flush()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_rows_and_errors_of_all_failed_batches_are_kept(self) -> None:
+        # Build
+        self._database.execute_query_no_returns.side_effect = [RuntimeError("Lost connection"),
+                                                               None,
+                                                               ValueError("Data too long")]
+
+        instance: tested_class = self._create_instance_of_tested_class(max_batch_rows=1)
+
+        # Operate
+        instance.write_many(rows=[(1, "a"), (2, "b"), (3, "c")])
+
+        with self.assertRaises(expected_exception=RuntimeError) as context:
+            instance.close()
+
+        # Check
+        self.assertEqual(first=len(context.exception.__notes__), second=2)
+        self.assertIn(member="Data too long", container=context.exception.__notes__[0])
+        self.assertEqual(first=instance.take_failed_rows(), second=[(1, "a"), (3, "c")])
+        self.assertEqual(first=instance.take_failed_rows(), second=[])
+        self.assertEqual(first=instance.written_rows_count, second=1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_write_after_close_raise_RuntimeError(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+        instance.close()
+
+        # Check
+        with self.assertRaises(expected_exception=RuntimeError):
+            instance.write(row=(1, "a"))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_write_row_of_invalid_length_raise_ValueError(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+
+        # Check
+        with self.assertRaises(expected_exception=ValueError):
+            instance.write(row=(1,))
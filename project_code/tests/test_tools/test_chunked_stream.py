@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `ChunkedStreamReader` and `ChunkSink` from the `chunked_stream.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import io
+import unittest
+
+from mysql.connector.connection import MySQLConnection
+from mysql.connector.protocol import MySQLProtocol
+
+from tools import chunked_stream as tested_module
+from tools.chunked_stream import ChunkedStreamReader, ChunkSink
+
+from typing import Any, List
+
+
+# ______________________________________________________________________________________________________________________
+class _PartialRawWriter(io.RawIOBase):
+    """_PartialRawWriter raw file object, which writes at most 3 bytes per call."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.data = bytearray()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def writable(self) -> bool:
+        return True
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def write(self, chunk: Any) -> int:
+        self.data += bytes(chunk[:3])
+        return min(len(chunk), 3)
+
+
+# ______________________________________________________________________________________________________________________
+class TestChunkedStreamReader(unittest.TestCase):
+    def test_chunks_are_views_of_reused_buffer(self) -> None:
+        # Build
+        instance = ChunkedStreamReader(stream=io.BytesIO(b'abcdefgh'), chunk_size=3)
+
+        # Operate
+        first_chunk: Any = instance.read()
+        first_bytes: bytes = bytes(first_chunk)
+        chunks: List[bytes] = [first_bytes] + [bytes(chunk) for chunk in iter(instance.read, b'')]
+
+        # Check
+        self.assertIsInstance(obj=first_chunk, cls=memoryview)
+        self.assertEqual(first=chunks, second=[b'abc', b'def', b'gh'])
+        self.assertEqual(first=instance.read_bytes, second=8)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_size_limits_chunk(self) -> None:
+        # Build
+        instance = ChunkedStreamReader(stream=io.BytesIO(b'abcdefgh'), chunk_size=4)
+
+        # Check
+        self.assertEqual(first=bytes(instance.read(2)), second=b'ab')
+        self.assertEqual(first=bytes(instance.read(100)), second=b'cdef')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_stream_without_readinto_is_read(self) -> None:
+        # Build
+        class Stream:
+            def __init__(self) -> None:
+                self.__data = io.BytesIO(b'xyz')
+
+            def read(self, size: int) -> bytes:
+                return self.__data.read(size)
+
+        instance = ChunkedStreamReader(stream=Stream(), chunk_size=2)
+
+        # Check
+        self.assertEqual(first=[instance.read(), instance.read(), instance.read()], second=[b'xy', b'z', b''])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_text_stream_raises_TypeError(self) -> None:
+        # Build
+        instance = ChunkedStreamReader(stream=io.StringIO('text'), chunk_size=2)
+
+        # Check
+        with self.assertRaises(expected_exception=TypeError):
+            instance.read()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_invalid_chunk_size_raises_ValueError(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=ValueError):
+            ChunkedStreamReader(stream=io.BytesIO(), chunk_size=0)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_driver_sends_chunks_as_long_data(self) -> None:
+        # Build
+        connection = MySQLConnection()
+        connection._protocol = MySQLProtocol()
+        packets: List[bytes] = []
+        connection._send_cmd = lambda command, packet=None, **options: packets.append(bytes(packet))
+
+        data: bytes = bytes(range(256)) * 1000
+
+        # Operate
+        sent_bytes: int = connection.cmd_stmt_send_long_data(
+            7, 1, ChunkedStreamReader(stream=io.BytesIO(data), chunk_size=100_000)
+        )
+
+        # Check
+        # Each packet starts with the id of the statement (4 bytes) and of the parameter (2 bytes)
+        self.assertEqual(first=sent_bytes, second=len(data))
+        self.assertEqual(first=b''.join(packet[6:] for packet in packets), second=data)
+        self.assertTrue(expr=all(len(packet) <= 6 + 100_000 for packet in packets))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_is_readable_stream(self) -> None:
+        # Check
+        self.assertTrue(expr=tested_module.is_readable_stream(value=io.BytesIO(b'data')))
+
+        for value in (b'data', bytearray(b'data'), memoryview(b'data'), 'data', 1, None):
+            with self.subTest(value=value):
+                self.assertFalse(expr=tested_module.is_readable_stream(value=value))
+
+
+# ______________________________________________________________________________________________________________________
+class TestChunkSink(unittest.TestCase):
+    def test_chunks_are_written_into_buffer(self) -> None:
+        # Build
+        target = bytearray(8)
+        instance = ChunkSink(target=target)
+
+        # Operate
+        instance.reserve(size=6)
+        instance.write(chunk=b'abc')
+        instance.write(chunk=memoryview(b'def'))
+
+        # Check
+        self.assertEqual(first=target, second=bytearray(b'abcdef\x00\x00'))
+        self.assertEqual(first=instance.written_bytes, second=6)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_small_buffer_raises_ValueError(self) -> None:
+        # Build
+        instance = ChunkSink(target=bytearray(4))
+        instance.write(chunk=b'abc')
+
+        # Check
+        with self.assertRaises(expected_exception=ValueError):
+            instance.reserve(size=2)
+
+        with self.assertRaises(expected_exception=ValueError):
+            instance.write(chunk=b'de')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_chunks_are_written_into_file(self) -> None:
+        # Build
+        target = io.BytesIO()
+        instance = ChunkSink(target=target)
+
+        # Operate
+        instance.reserve(size=10 ** 9)
+        instance.write(chunk=b'abc')
+        instance.write(chunk=b'def')
+
+        # Check
+        self.assertEqual(first=target.getvalue(), second=b'abcdef')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_partial_writes_of_raw_file_are_repeated(self) -> None:
+        # Build
+        target = _PartialRawWriter()
+        instance = ChunkSink(target=target)
+
+        # Operate
+        instance.write(chunk=b'abcdefgh')
+
+        # Check
+        self.assertEqual(first=bytes(target.data), second=b'abcdefgh')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_invalid_targets_raise_TypeError(self) -> None:
+        # Check
+        for target in (b'read-only', 'text', 1):
+            with self.subTest(target=target), self.assertRaises(expected_exception=TypeError):
+                ChunkSink(target=target)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `CircuitBreaker` from the `circuit_breaker.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import unittest
+from unittest import mock as UnitMock
+
+from tools import circuit_breaker as tested_module
+from tools.circuit_breaker import CircuitBreaker as tested_class
+from tools.circuit_breaker import CircuitState
+
+
+# ______________________________________________________________________________________________________________________
+class EndpointError(Exception):
+    pass
+
+
+# ______________________________________________________________________________________________________________________
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self) -> None:
+        self._now: float = 1000.0
+
+        patcher = UnitMock.patch.object(target=tested_module.time, attribute='monotonic', side_effect=lambda: self._now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_instance_of_tested_class(self, **params) -> tested_class:
+        params.setdefault('failure_classifier', lambda error: isinstance(error, EndpointError))
+        return tested_class(name='replica-1', window_size=4, min_calls_count=4, open_seconds=5.0, **params)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _fail_calls(self, instance: tested_class, calls_count: int, error: Exception = EndpointError()) -> None:
+        for _ in range(calls_count):
+            with self.assertRaises(expected_exception=type(error)):
+                instance.call(UnitMock.MagicMock(side_effect=error))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_init_with_invalid_parameters(self) -> None:
+        # Check
+        for params in ({'failure_rate_threshold': 0}, {'window_size': 2, 'min_calls_count': 3},
+                       {'open_seconds': -1}, {'half_open_calls_count': 0}):
+            with self.subTest(params=params), self.assertRaises(expected_exception=ValueError):
+                tested_class(name='replica-1', **params)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_circuit_opens_at_failure_rate_and_fails_fast(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+        function = UnitMock.MagicMock(return_value='result')
+
+        instance.call(function)
+        instance.call(function)
+
+        # Operate
+        self._fail_calls(instance=instance, calls_count=2)
+
+        # Check
+        self.assertIs(expr1=instance.state, expr2=CircuitState.OPEN)
+
+        with self.assertRaises(expected_exception=ConnectionError):
+            instance.call(function)
+
+        self.assertEqual(first=function.call_count, second=2)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_errors_not_classified_as_failures_keep_circuit_closed(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+
+        # Operate
+        self._fail_calls(instance=instance, calls_count=4, error=KeyError('duplicate'))
+
+        # Check
+        self.assertIs(expr1=instance.state, expr2=CircuitState.CLOSED)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_slow_calls_open_circuit(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(slow_call_seconds=1.0,
+                                                                       slow_call_rate_threshold=0.75)
+
+        def slow_call() -> None:
+            self._now += 2.0
+
+        # Operate
+        instance.call(lambda: None)
+
+        for _ in range(3):
+            instance.call(slow_call)
+
+        # Check
+        self.assertIs(expr1=instance.state, expr2=CircuitState.OPEN)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_successful_trial_after_open_seconds_closes_circuit(self) -> None:
+        # Build
+        health_probe = UnitMock.MagicMock()
+        instance: tested_class = self._create_instance_of_tested_class(health_probe=health_probe)
+        self._fail_calls(instance=instance, calls_count=4)
+
+        # Operate
+        self._now += 5.0
+        state_after_open_seconds: CircuitState = instance.state
+
+        result: str = instance.call(lambda: 'result')
+
+        # Check
+        self.assertIs(expr1=state_after_open_seconds, expr2=CircuitState.HALF_OPEN)
+        self.assertEqual(first=result, second='result')
+        self.assertIs(expr1=instance.state, expr2=CircuitState.CLOSED)
+        health_probe.assert_called_once_with()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_half_open_circuit_limits_trial_calls(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+        self._fail_calls(instance=instance, calls_count=4)
+        self._now += 5.0
+
+        # Operate
+        with instance.guard():
+            # Check
+            with self.assertRaises(expected_exception=ConnectionError):
+                instance.call(lambda: 'concurrent')
+
+        self.assertIs(expr1=instance.state, expr2=CircuitState.CLOSED)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_failed_health_probe_opens_circuit_again(self) -> None:
+        # Build
+        probe_error = EndpointError('ping')
+        function = UnitMock.MagicMock()
+        instance: tested_class = self._create_instance_of_tested_class(
+            health_probe=UnitMock.MagicMock(side_effect=probe_error)
+        )
+        self._fail_calls(instance=instance, calls_count=4)
+        self._now += 5.0
+
+        # Operate
+        with self.assertRaises(expected_exception=ConnectionError) as context:
+            instance.call(function)
+
+        # Check
+        self.assertIs(expr1=context.exception.__cause__, expr2=probe_error)
+        self.assertIs(expr1=instance.state, expr2=CircuitState.OPEN)
+        function.assert_not_called()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `CircuitBreakingSQLAPI` from the `circuit_breaking_sql_api.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import unittest
+from unittest import mock as UnitMock
+
+from mysql.connector import errorcode
+from mysql.connector.errors import Error as MySQLError
+
+from tests.test_helper import *
+
+from tools.circuit_breaker import CircuitBreaker, CircuitState
+from tools.circuit_breaking_sql_api import CircuitBreakingSQLAPI as tested_class
+from tools.deadline import Deadline
+
+from abstract.api.sql_api_interface import SQLAPIInterface
+from abstract.api.transaction_interface import TransactionInterface
+from mysql_support.mysql_database_pool import MySQLDataBasePool
+from mysql_support.mysql_database_single import MySQLDataBaseSingle
+from mysql_support.mysql_transient_errors import is_mysql_endpoint_failure
+
+
+# ______________________________________________________________________________________________________________________
+class TestCircuitBreakingSQLAPI(unittest.TestCase):
+    def setUp(self) -> None:
+        self._database = UnitMock.create_autospec(spec=MySQLDataBaseSingle, instance=True)
+        self._breaker = CircuitBreaker(name='replica-1', failure_classifier=is_mysql_endpoint_failure,
+                                       window_size=2, min_calls_count=2, open_seconds=60.0)
+        self._instance = tested_class(database=self._database, circuit_breaker=self._breaker)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_implements_SQLAPIInterface(self) -> None:
+        AbstractTestHelper.check_inspected_class_implements_expected_interface(
+            _cls=tested_class, expected_interface=SQLAPIInterface
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_implements_TransactionInterface(self) -> None:
+        AbstractTestHelper.check_inspected_class_implements_expected_interface(
+            _cls=tested_class, expected_interface=TransactionInterface
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_queries_fail_fast_after_endpoint_failures(self) -> None:
+        # Build
+        self._database.execute_query_returns_one.side_effect = MySQLError(errno=errorcode.CR_SERVER_LOST)
+
+        for _ in range(2):
+            with self.assertRaises(expected_exception=MySQLError):
+                self._instance.execute_query_returns_one("SELECT 1", timeout=1.0)
+
+        # Operate
+        with self.assertRaises(expected_exception=ConnectionError):
+            self._instance.execute_query_returns_all("SELECT id FROM users")
+
+        # Check
+        self._database.execute_query_returns_one.assert_called_with("SELECT 1", timeout=1.0)
+        self._database.execute_query_returns_all.assert_not_called()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_statement_errors_keep_circuit_closed(self) -> None:
+        # Build
+        self._database.execute_query_no_returns.side_effect = MySQLError(errno=errorcode.ER_DUP_ENTRY)
+
+        # Operate
+        for _ in range(2):
+            with self.assertRaises(expected_exception=MySQLError):
+                self._instance.execute_query_no_returns("INSERT INTO users VALUES (%s)", 1)
+
+        # Check
+        self.assertIs(expr1=self._breaker.state, expr2=CircuitState.CLOSED)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_failed_transactions_open_circuit(self) -> None:
+        # Build
+        self._database.transaction.return_value.__enter__.side_effect = MySQLError(errno=errorcode.CR_SERVER_LOST)
+
+        # Operate
+        for _ in range(2):
+            with self.assertRaises(expected_exception=MySQLError):
+                with self._instance.transaction():
+                    pass
+
+        # Check
+        self.assertIs(expr1=self._breaker.state, expr2=CircuitState.OPEN)
+        self._database.transaction.assert_called_with()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_group_commit_options_are_passed_to_pool(self) -> None:
+        # Build
+        database = UnitMock.create_autospec(spec=MySQLDataBasePool, instance=True)
+        instance = tested_class(database=database, circuit_breaker=self._breaker)
+        deadline = Deadline.after(seconds=5.0)
+
+        # Operate
+        with instance.group_commit(max_statements=10, deadline=deadline, lane_name='batch'):
+            pass
+
+        # Check
+        database.group_commit.assert_called_once_with(max_statements=10, max_delay_ms=50,
+                                                      deadline=deadline, lane_name='batch')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_transaction_requires_TransactionInterface(self) -> None:
+        # Build
+        instance = tested_class(database=UnitMock.create_autospec(spec=SQLAPIInterface, instance=True),
+                                circuit_breaker=self._breaker)
+
+        # Check
+        with self.assertRaises(expected_exception=TypeError):
+            with instance.transaction():
+                pass
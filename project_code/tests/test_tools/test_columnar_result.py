@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `ColumnarResultBuilder` from the `columnar_result.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.3.0"
+
+import unittest
+
+from array import array
+
+from tools import columnar_result as tested_module
+from tools.columnar_result import ColumnarResultBuilder as tested_class
+
+from typing import Any, Dict, List, Tuple
+
+
+# ______________________________________________________________________________________________________________________
+class TestColumnarResultBuilder(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._tested_class = tested_class
+
+        cls._rows: List[Tuple[Any, ...]] = [(i, i / 2, f"name-{i}") for i in range(3000)]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _build_columns(self, use_numpy: bool, rows: List[Tuple[Any, ...]]) -> Dict[str, Any]:
+        builder = self._tested_class(column_names=('id', 'ratio', 'name'),
+                                     typecodes=(tested_module.INT_TYPECODE, tested_module.FLOAT_TYPECODE, None),
+                                     use_numpy=use_numpy)
+
+        # Rows are appended by chunks, as they are returned by `fetchmany`
+        for start in range(0, len(rows), 1000):
+            builder.append_rows(rows=rows[start:start + 1000])
+
+        return builder.build()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_columns_of_array_module(self) -> None:
+        # Operate
+        columns: Dict[str, Any] = self._build_columns(use_numpy=False, rows=self._rows)
+
+        # Check
+        self.assertIsInstance(obj=columns['id'], cls=array)
+        self.assertEqual(first=columns['id'].typecode, second=tested_module.INT_TYPECODE)
+        self.assertEqual(first=list(columns['ratio']), second=[row[1] for row in self._rows])
+        self.assertEqual(first=columns['name'], second=[row[2] for row in self._rows])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @unittest.skipIf(condition=tested_module.numpy is None, reason="numpy is not installed")
+    def test_columns_of_numpy_arrays_grow_beyond_initial_capacity(self) -> None:
+        # Operate
+        columns: Dict[str, Any] = self._build_columns(use_numpy=True, rows=self._rows)
+
+        # Check
+        self.assertEqual(first=str(columns['id'].dtype), second='int64')
+        self.assertEqual(first=str(columns['name'].dtype), second='object')
+        self.assertEqual(first=columns['id'].tolist(), second=[row[0] for row in self._rows])
+        self.assertEqual(first=len(columns['name']), second=len(self._rows))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_numeric_column_with_null_keeps_none(self) -> None:
+        for use_numpy in (False, True):
+            if use_numpy and tested_module.numpy is None:
+                continue
+
+            with self.subTest(pattern=use_numpy):
+                # Operate
+                columns: Dict[str, Any] = self._build_columns(use_numpy=use_numpy,
+                                                              rows=[(1, 0.5, "a"), (None, None, None)])
+
+                # Check
+                self.assertEqual(first=list(columns['id']), second=[1, None])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_duplicate_column_names_are_not_overwritten(self) -> None:
+        # Build
+        builder = self._tested_class(column_names=('id', 'name', 'id'), typecodes=(None, None, None), use_numpy=False)
+
+        # Operate
+        builder.append_rows(rows=[(1, "a", 10), (2, "b", 20)])
+
+        # Check
+        self.assertEqual(first=builder.build(), second={'id': [1, 2], 'name': ["a", "b"], 'column_2': [10, 20]})
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_renamed_duplicate_does_not_overwrite_column_of_same_name(self) -> None:
+        # Build
+        builder = self._tested_class(column_names=('id', 'column_2', 'id'), typecodes=(None, None, None),
+                                     use_numpy=False)
+
+        # Operate
+        builder.append_rows(rows=[(1, "a", 10), (2, "b", 20)])
+
+        # Check
+        self.assertEqual(first=builder.build(), second={'id': [1, 2], 'column_2': ["a", "b"], 'column_2_1': [10, 20]})
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_invalid_number_of_typecodes_raise_ValueError(self) -> None:
+        with self.assertRaises(expected_exception=ValueError):
+            self._tested_class(column_names=('id',), typecodes=())
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `ConnectionBag` from the `connection_bag.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import threading
+import unittest
+
+from tools.connection_bag import ConnectionBag as tested_class
+
+from typing import Dict, List, Optional
+
+
+# ______________________________________________________________________________________________________________________
+class Item:
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+
+
+# ______________________________________________________________________________________________________________________
+class TestConnectionBag(unittest.TestCase):
+    def setUp(self) -> None:
+        self._instance: tested_class[Item] = tested_class(local_cache_size=2)
+        self._items: List[Item] = [Item(name=f"item-{index}") for index in range(3)]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_init_with_invalid_local_cache_size(self) -> None:
+        with self.assertRaises(expected_exception=ValueError):
+            tested_class(local_cache_size=-1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_most_recently_returned_item_is_taken_first(self) -> None:
+        # Build
+        for item in self._items:
+            self._instance.put(item)
+
+        # Operate
+        taken_items: List[Optional[Item]] = [self._instance.poll() for _ in range(4)]
+
+        # Check
+        self.assertEqual(first=taken_items, second=[*reversed(self._items), None])
+        self.assertEqual(first=self._instance.idle_count, second=0)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_item_cached_by_thread_is_taken_by_other_thread(self) -> None:
+        # Build
+        self._instance.put(self._items[0])
+        result: Dict[str, Optional[Item]] = {}
+
+        def take() -> None:
+            result['item'] = self._instance.poll()
+
+        thread = threading.Thread(target=take)
+
+        # Operate
+        thread.start()
+        thread.join()
+
+        # Check
+        self.assertIs(expr1=result['item'], expr2=self._items[0])
+        self.assertIsNone(obj=self._instance.poll())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_item_is_not_taken_twice(self) -> None:
+        # Build
+        self._instance.put(self._items[0])
+
+        # Operate
+        item: Optional[Item] = self._instance.poll()
+        self._instance.put(item)
+        item_again: Optional[Item] = self._instance.poll()
+
+        # Check
+        self.assertIs(expr1=item_again, expr2=self._items[0])
+        self.assertIsNone(obj=self._instance.poll())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_drain_takes_least_recently_returned_items(self) -> None:
+        # Build
+        for item in self._items:
+            self._instance.put(item)
+
+        # Operate
+        drained_items: List[Item] = self._instance.drain(predicate=lambda item: item.name != 'item-0', limit=1)
+
+        # Check
+        self.assertEqual(first=drained_items, second=[self._items[1]])
+        self.assertEqual(first=self._instance.idle_count, second=2)
+        self.assertEqual(first=[self._instance.poll() for _ in range(3)], second=[self._items[2], self._items[0], None])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_removed_item_is_not_taken(self) -> None:
+        # Build
+        self._instance.put(self._items[0])
+        item: Optional[Item] = self._instance.poll()
+
+        # Operate
+        self._instance.remove(item)
+
+        # Check
+        self.assertEqual(first=self._instance.count_idle(), second=0)
+        self.assertIsNone(obj=self._instance.poll())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_concurrent_threads_never_share_item(self) -> None:
+        # Build
+        for item in self._items:
+            self._instance.put(item)
+
+        holders: Dict[str, int] = {item.name: 0 for item in self._items}
+        errors: List[str] = []
+        lock = threading.Lock()
+
+        def work() -> None:
+            for _ in range(500):
+                item: Optional[Item] = self._instance.poll()
+
+                if item is None:
+                    continue
+
+                with lock:
+                    holders[item.name] += 1
+
+                    if holders[item.name] > 1:
+                        errors.append(item.name)
+
+                with lock:
+                    holders[item.name] -= 1
+
+                self._instance.put(item)
+
+        threads: List[threading.Thread] = [threading.Thread(target=work) for _ in range(8)]
+
+        # Operate
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        # Check
+        self.assertEqual(first=errors, second=[])
+        self.assertEqual(first=self._instance.idle_count, second=3)
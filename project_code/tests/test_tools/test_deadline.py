@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `Deadline` from the `deadline.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import unittest
+
+from tools.deadline import Deadline as tested_class
+
+
+# ______________________________________________________________________________________________________________________
+class TestDeadline(unittest.TestCase):
+    def test_timeout_is_limited_by_remaining_time(self) -> None:
+        # Build
+        instance: tested_class = tested_class.after(seconds=10.0)
+
+        # Operate
+        shorter_timeout: float = instance.limit_timeout(timeout=1.0)
+        remaining_timeout: float = instance.limit_timeout(timeout=60.0)
+        no_timeout: float = instance.limit_timeout(timeout=None)
+
+        # Check
+        self.assertEqual(first=shorter_timeout, second=1.0)
+        self.assertLessEqual(a=remaining_timeout, b=10.0)
+        self.assertGreater(a=remaining_timeout, b=9.0)
+        self.assertLessEqual(a=no_timeout, b=10.0)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_passed_deadline_raises_TimeoutError(self) -> None:
+        # Build
+        instance: tested_class = tested_class.after(seconds=-1.0)
+
+        # Check
+        self.assertTrue(expr=instance.is_expired)
+        self.assertEqual(first=instance.remaining, second=0.0)
+
+        with self.assertRaises(expected_exception=TimeoutError):
+            instance.check(operation="Query")
+
+        with self.assertRaises(expected_exception=TimeoutError):
+            instance.limit_timeout(timeout=1.0)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for the functions from the `fork_guard.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import gc
+import os
+import socket
+import unittest
+
+from tools import fork_guard as tested_module
+
+from typing import List
+
+
+# ______________________________________________________________________________________________________________________
+class Owner:
+    def __init__(self) -> None:
+        self.dropped_in_pids: List[int] = []
+
+    def drop(self) -> None:
+        self.dropped_in_pids.append(os.getpid())
+
+
+# ______________________________________________________________________________________________________________________
+class TestForkGuard(unittest.TestCase):
+    @unittest.skipUnless(hasattr(os, 'fork'), "os.fork() is not available")
+    def test_callback_is_called_only_in_child_process(self) -> None:
+        # Build
+        owner = Owner()
+        tested_module.register_after_fork_in_child(owner=owner, callback=Owner.drop)
+        self.addCleanup(tested_module.unregister_after_fork_in_child, owner)
+
+        # Operate
+        pid: int = os.fork()
+
+        if pid == 0:
+            os._exit(0 if owner.dropped_in_pids == [os.getpid()] else 1)
+
+        _, status = os.waitpid(pid, 0)
+
+        # Check
+        self.assertEqual(first=os.waitstatus_to_exitcode(status), second=0)
+        self.assertEqual(first=owner.dropped_in_pids, second=[])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_registry_does_not_keep_owner_alive(self) -> None:
+        # Build
+        owner = Owner()
+        tested_module.register_after_fork_in_child(owner=owner, callback=Owner.drop)
+
+        # Operate
+        del owner
+        gc.collect()
+
+        # Check
+        self.assertFalse(expr=any(isinstance(item, Owner) for item in tested_module._after_fork_callbacks.keys()))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_drop_inherited_socket_keeps_peer_connection_open(self) -> None:
+        # Build
+        inherited, peer = socket.socketpair()
+        self.addCleanup(peer.close)
+        duplicate: socket.socket = inherited.dup()
+        self.addCleanup(duplicate.close)
+
+        # Operate
+        tested_module.drop_inherited_socket(sock=inherited)
+        tested_module.drop_inherited_socket(sock=None)
+
+        # Check
+        duplicate.sendall(b'ping')
+        self.assertEqual(first=peer.recv(4), second=b'ping')
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `KeysetPaginator` from the `keyset_paginator.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.1"
+
+import unittest
+from unittest import mock as UnitMock
+
+from tools.keyset_paginator import KeysetPaginator as tested_class
+
+from abstract.api.sql_api_interface import SQLAPIInterface
+
+from typing import Any, Dict, List
+
+
+# ______________________________________________________________________________________________________________________
+class TestKeysetPaginator(unittest.TestCase):
+    def setUp(self) -> None:
+        self._database = UnitMock.create_autospec(spec=SQLAPIInterface, instance=True)
+
+        self._table: List[Dict[str, Any]] = [{'id': i, 'name': f"name-{i}"} for i in range(1, 8)]
+        self._database.execute_query_returns_all.side_effect = self._read_page
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _read_page(self, sql_query: str, *query_data: Any) -> Any:
+        # Emulates `WHERE id > %s ORDER BY id LIMIT %s` over the table
+        *keys, limit = query_data
+        last_key: int = keys[0] if 'WHERE' in sql_query else 0
+
+        return [row for row in self._table if row['id'] > last_key][:limit] or None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_instance_of_tested_class(self, **params: Any) -> tested_class:
+        paginator_params: Dict[str, Any] = {
+            'database': self._database,
+            'table_name': "events",
+            'key_column_names': ("id",),
+            'page_size': 3,
+            'min_page_size': 3,
+            'max_page_size': 3,
+        }
+        paginator_params.update(params)
+
+        return tested_class(**paginator_params)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_iteration_yields_all_rows_by_keyset_pages(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+
+        # Operate
+        rows: List[Dict[str, Any]] = list(instance)
+
+        # Check
+        self.assertEqual(first=rows, second=self._table)
+        self.assertEqual(first=self._database.execute_query_returns_all.call_args_list, second=[
+            UnitMock.call("SELECT * FROM `events` ORDER BY `id` LIMIT %s", 3),
+            UnitMock.call("SELECT * FROM `events` WHERE `id` > %s ORDER BY `id` LIMIT %s", 3, 3),
+            UnitMock.call("SELECT * FROM `events` WHERE `id` > %s ORDER BY `id` LIMIT %s", 6, 3),
+        ])
+        self.assertEqual(first=instance.checkpoint, second=(7,))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_iteration_is_lazy(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+
+        # Operate
+        first_row: Dict[str, Any] = next(iter(instance))
+
+        # Check
+        self.assertEqual(first=first_row, second=self._table[0])
+        self._database.execute_query_returns_all.assert_called_once()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_start_after_resumes_from_checkpoint(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(start_after=(5,))
+
+        # Operate
+        rows: List[Dict[str, Any]] = list(instance)
+
+        # Check
+        self.assertEqual(first=[row['id'] for row in rows], second=[6, 7])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_scan_stopped_within_page_resumes_after_last_yielded_row(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+        processed_ids: List[int] = []
+
+        # Operate
+        for row in instance:
+            processed_ids.append(row['id'])
+
+            if row['id'] == 4:
+                break
+
+        resumed_instance: tested_class = self._create_instance_of_tested_class(start_after=instance.checkpoint)
+        processed_ids.extend(row['id'] for row in resumed_instance)
+
+        # Check
+        self.assertEqual(first=processed_ids, second=[1, 2, 3, 4, 5, 6, 7])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_pages_move_checkpoint_to_their_end(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+
+        # Operate
+        first_page: List[Dict[str, Any]] = next(instance.iterate_pages())
+
+        # Check
+        self.assertEqual(first=first_page, second=self._table[:3])
+        self.assertEqual(first=instance.checkpoint, second=(3,))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_composite_key_uses_row_comparison_with_where_clause(self) -> None:
+        # Build
+        self._database.execute_query_returns_all.side_effect = None
+        self._database.execute_query_returns_all.return_value = [('a', 1, 'x')]
+
+        instance: tested_class = self._create_instance_of_tested_class(key_column_names=("kind", "id"),
+                                                                       column_names=("kind", "id", "name"),
+                                                                       where_clause="`name` <> %s",
+                                                                       where_data=("z",),
+                                                                       start_after=("a", 0))
+
+        # Operate
+        pages: List[List[Any]] = list(instance.iterate_pages())
+
+        # Check
+        self._database.execute_query_returns_all.assert_called_once_with(
+            "SELECT `kind`, `id`, `name` FROM `events` WHERE (`kind`, `id`) > (%s, %s) AND (`name` <> %s) "
+            "ORDER BY `kind`, `id` LIMIT %s", "a", 0, "z", 3
+        )
+        self.assertEqual(first=pages, second=[[('a', 1, 'x')]])
+        self.assertEqual(first=instance.checkpoint, second=('a', 1))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_page_size_grows_for_fast_pages_and_shrinks_for_slow_pages(self) -> None:
+        # Build
+        self._table = [{'id': i} for i in range(1, 101)]
+        instance: tested_class = self._create_instance_of_tested_class(page_size=4, min_page_size=2,
+                                                                       max_page_size=16, target_page_seconds=10.0)
+        pages = instance.iterate_pages()
+
+        # Operate
+        next(pages)
+        grown_page_size: int = instance.page_size
+
+        with UnitMock.patch('tools.keyset_paginator.time.monotonic', side_effect=[0.0, 100.0]):
+            next(pages)
+
+        # Check
+        self.assertEqual(first=grown_page_size, second=8)
+        self.assertEqual(first=instance.page_size, second=4)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_init_raises_for_inconsistent_arguments(self) -> None:
+        for params in ({'key_column_names': ()},
+                       {'page_size': 1},
+                       {'start_after': (1, 2)}):
+            with self.subTest(params=params):
+                with self.assertRaises(expected_exception=ValueError):
+                    self._create_instance_of_tested_class(**params)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_init_raises_for_invalid_identifier(self) -> None:
+        with self.assertRaises(expected_exception=ValueError):
+            self._create_instance_of_tested_class(table_name="events; DROP TABLE users")
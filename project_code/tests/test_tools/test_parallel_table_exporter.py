@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `ParallelTableExporter` from the `parallel_table_exporter.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from dataclasses import dataclass
+
+from abstract.api.sql_api_interface import SQLAPIInterface
+from abstract.database.connection_interface import PoolConnectionInterface
+from abstract.database.sql_database import SQLDataBase
+
+from tools.parallel_table_exporter import ExportFormat, ParallelTableExporter as tested_class
+from tools.row_factory import RowFormat
+from tools.table_export_result_dto import TableExportResultDTO
+
+from typing import Any, Dict, List
+
+
+# ______________________________________________________________________________________________________________________
+class InMemoryDataBase(SQLDataBase, SQLAPIInterface):
+    """InMemoryDataBase importable database of `rows_count` rows, so the worker processes can build it."""
+
+    def __init__(self, **dbconfig) -> None:
+        super().__init__(**dbconfig)
+
+        self.rows: List[Dict[str, Any]] = [
+            {'id': key, 'name': f"name-{key}"} for key in range(1, dbconfig['rows_count'] + 1)
+        ]
+
+    def __str__(self) -> str:
+        return "InMemoryDataBase()"
+
+    def _get_info_about_server(self) -> str:
+        return ""
+
+    def execute_query_no_returns(self, sql_query: str, *query_data) -> None:
+        pass
+
+    def execute_query_returns_one(self, sql_query: str, *query_data) -> Any:
+        keys: List[int] = [row['id'] for row in self.rows]
+
+        return {'min_key': min(keys, default=None), 'max_key': max(keys, default=None)}
+
+    def execute_query_returns_all(self, sql_query: str, *query_data) -> Any:
+        # `[last_key,] lower_key, upper_key, limit` of the keyset page of a range
+        *bounds, limit = query_data
+        last_key: int = bounds.pop(0) if len(bounds) == 3 else bounds[0] - 1
+        lower_key, upper_key = bounds
+
+        return [row for row in self.rows if lower_key <= row['id'] < upper_key and row['id'] > last_key][:limit]
+
+    def execute_query_returns_columns(self, sql_query: str, *query_data) -> Dict[str, Any]:
+        return {}
+
+
+# ______________________________________________________________________________________________________________________
+@dataclass
+class EventRow:
+    id: int
+    name: str
+
+
+# ______________________________________________________________________________________________________________________
+class FormattedInMemoryDataBase(InMemoryDataBase):
+    """FormattedInMemoryDataBase database, which returns the rows in its `default_row_format`."""
+
+    def __init__(self, **dbconfig) -> None:
+        super().__init__(**dbconfig)
+
+        self.default_row_format: Any = EventRow
+
+    def execute_query_returns_all(self, sql_query: str, *query_data) -> Any:
+        rows: List[Dict[str, Any]] = super().execute_query_returns_all(sql_query, *query_data)
+
+        if self.default_row_format is RowFormat.DICT:
+            return rows
+
+        if self.default_row_format is RowFormat.TUPLE:
+            return [tuple(row.values()) for row in rows]
+
+        return [self.default_row_format(**row) for row in rows]
+
+
+# ______________________________________________________________________________________________________________________
+def create_formatted_database() -> FormattedInMemoryDataBase:
+    # The settings, which are not a part of `dbconfig`, are applied by the factory
+    database = FormattedInMemoryDataBase(rows_count=6)
+    database.rows = [row for row in database.rows if row['id'] % 2 == 0]
+
+    return database
+
+
+# ______________________________________________________________________________________________________________________
+class InMemoryPool(InMemoryDataBase, PoolConnectionInterface):
+    """InMemoryPool database, which can't be built from its `dbconfig` alone."""
+
+    def create_new_connection_pool(self) -> None:
+        pass
+
+    def get_connection_from_pool(self) -> Any:
+        return self
+
+    def close_active_pool(self) -> None:
+        pass
+
+
+# ______________________________________________________________________________________________________________________
+class TestParallelTableExporter(unittest.TestCase):
+    def setUp(self) -> None:
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        self._output_directory: str = temporary_directory.name
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_instance_of_tested_class(self, rows_count: int, **params: Any) -> tested_class:
+        exporter_params: Dict[str, Any] = {
+            'database': InMemoryDataBase(rows_count=rows_count),
+            'table_name': "events",
+            'key_column_name': "id",
+            'output_directory': self._output_directory,
+            'workers_count': 2,
+            'ranges_count': 3,
+            'page_size': 4,
+        }
+        exporter_params.update(params)
+
+        return tested_class(**exporter_params)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_export_writes_all_rows_by_ranges_in_worker_processes(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(rows_count=20)
+        range_results: List[TableExportResultDTO] = []
+
+        # Operate
+        result: TableExportResultDTO = instance.export(progress_callback=range_results.append)
+
+        # Check
+        exported_keys: List[int] = []
+
+        for file_path in result.file_paths:
+            with open(file_path, encoding='utf-8', newline='') as file:
+                rows: List[List[str]] = list(csv.reader(file))
+
+            self.assertEqual(first=rows[0], second=['id', 'name'])
+            exported_keys.extend(int(row[0]) for row in rows[1:])
+
+        self.assertEqual(first=exported_keys, second=list(range(1, 21)))
+        self.assertEqual(first=len(result.file_paths), second=3)
+        self.assertEqual(first=result.rows_count, second=20)
+        self.assertEqual(first=len(range_results), second=3)
+        self.assertEqual(first=result.bytes_count, second=sum(map(os.path.getsize, result.file_paths)))
+        self.assertGreater(a=result.rows_per_second, b=0)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_export_writes_json_lines(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(rows_count=5, ranges_count=1,
+                                                                       export_format=ExportFormat.JSONL)
+
+        # Operate
+        result: TableExportResultDTO = instance.export()
+
+        # Check
+        with open(result.file_paths[0], encoding='utf-8') as file:
+            rows: List[Dict[str, Any]] = [json.loads(line) for line in file]
+
+        self.assertEqual(first=rows, second=[{'id': key, 'name': f"name-{key}"} for key in range(1, 6)])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_export_of_empty_table_writes_no_files(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(rows_count=0)
+
+        # Operate
+        result: TableExportResultDTO = instance.export()
+
+        # Check
+        self.assertEqual(first=result.rows_count, second=0)
+        self.assertEqual(first=result.file_paths, second=())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_workers_build_databases_by_factory_and_read_tuple_rows(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(rows_count=6, ranges_count=1,
+                                                                       column_names=("id", "name"),
+                                                                       database_factory=create_formatted_database)
+
+        # Operate
+        result: TableExportResultDTO = instance.export()
+
+        # Check
+        with open(result.file_paths[0], encoding='utf-8', newline='') as file:
+            rows: List[List[str]] = list(csv.reader(file))
+
+        self.assertEqual(first=rows, second=[['id', 'name']] + [[str(key), f"name-{key}"] for key in (2, 4, 6)])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_init_raises_for_pool_without_factory(self) -> None:
+        with self.assertRaises(expected_exception=TypeError):
+            tested_class(database=InMemoryPool(rows_count=1), table_name="events", key_column_name="id",
+                         output_directory=self._output_directory)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_init_raises_for_database_without_api(self) -> None:
+        with self.assertRaises(expected_exception=TypeError):
+            tested_class(database=object(), table_name="events", key_column_name="id",
+                         output_directory=self._output_directory)
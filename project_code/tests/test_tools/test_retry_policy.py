@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `RetryPolicy` from the `retry_policy.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import random
+import unittest
+from unittest import mock as UnitMock
+
+from tools import retry_policy as tested_module
+from tools.retry_policy import RetryPolicy as tested_class
+from tools.deadline import Deadline
+
+from typing import List
+
+
+# ______________________________________________________________________________________________________________________
+class TransientError(Exception):
+    errno = 1213
+
+
+# ______________________________________________________________________________________________________________________
+class TestRetryPolicy(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=tested_module.time, attribute='sleep')
+        self._sleep: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_instance_of_tested_class(self, **params) -> tested_class:
+        return tested_class(error_classifier=lambda error, is_idempotent: isinstance(error, TransientError),
+                            rng=random.Random(4), **params)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _create_failing_call(self, failures_count: int) -> UnitMock.MagicMock:
+        return UnitMock.MagicMock(side_effect=[TransientError()] * failures_count + ['result'])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_transient_error_is_retried_with_growing_backoff(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(max_attempts=4, base_delay=0.1, max_delay=10.0)
+        function: UnitMock.MagicMock = self._create_failing_call(failures_count=3)
+
+        # Operate
+        result: str = instance.call(function)
+
+        # Check
+        delays: List[float] = [call.args[0] for call in self._sleep.call_args_list]
+
+        self.assertEqual(first=result, second='result')
+        self.assertEqual(first=function.call_count, second=4)
+
+        for attempt, delay in enumerate(delays, start=1):
+            self.assertLessEqual(a=delay, b=0.1 * 2 ** (attempt - 1))
+
+        self.assertEqual(first=instance.metrics.retries_count, second=3)
+        self.assertEqual(first=instance.metrics.recovered_count, second=1)
+        self.assertEqual(first=instance.metrics.retries_by_error, second={'1213': 3})
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_other_error_is_not_retried(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class()
+        function = UnitMock.MagicMock(side_effect=ValueError("Syntax error"))
+
+        # Check
+        with self.assertRaises(expected_exception=ValueError):
+            instance.call(function)
+
+        self.assertEqual(first=function.call_count, second=1)
+        self.assertEqual(first=instance.metrics.retries_count, second=0)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_last_error_is_raised_after_max_attempts(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(max_attempts=2)
+        function: UnitMock.MagicMock = self._create_failing_call(failures_count=5)
+
+        # Check
+        with self.assertRaises(expected_exception=TransientError):
+            instance.call(function)
+
+        self.assertEqual(first=function.call_count, second=2)
+        self.assertEqual(first=instance.metrics.exhausted_count, second=1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_retries_are_limited_by_budget(self) -> None:
+        # Build
+        instance: tested_class = self._create_instance_of_tested_class(max_attempts=10, max_budget=2.0,
+                                                                       budget_ratio=0.0)
+        function: UnitMock.MagicMock = self._create_failing_call(failures_count=5)
+
+        # Check
+        with self.assertRaises(expected_exception=TransientError):
+            instance.call(function)
+
+        self.assertEqual(first=function.call_count, second=3)
+        self.assertEqual(first=instance.metrics.budget_rejections_count, second=1)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_no_retry_sleeps_past_deadline(self) -> None:
+        # Build
+        rng = UnitMock.create_autospec(spec=random.Random, instance=True)
+        rng.uniform.return_value = 1.0
+
+        instance = tested_class(error_classifier=lambda error, is_idempotent: True,
+                                base_delay=1.0, max_delay=1.0, rng=rng)
+        function: UnitMock.MagicMock = self._create_failing_call(failures_count=1)
+
+        # Check
+        with self.assertRaises(expected_exception=TransientError):
+            instance.call(function, deadline=Deadline.after(seconds=0.5))
+
+        self._sleep.assert_not_called()
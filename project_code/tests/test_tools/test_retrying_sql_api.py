@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `RetryingSQLAPI` from the `retrying_sql_api.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import unittest
+from unittest import mock as UnitMock
+
+from mysql.connector import errorcode
+from mysql.connector.errors import Error as MySQLError
+
+from tests.test_helper import *
+
+from tools import retry_policy
+from tools.retry_policy import RetryPolicy
+from tools.retrying_sql_api import RetryingSQLAPI as tested_class
+
+from abstract.api.sql_api_interface import SQLAPIInterface
+from mysql_support import mysql_database_single
+from mysql_support.mysql_database_single import MySQLDataBaseSingle
+from mysql_support.mysql_transient_errors import is_transient_mysql_error
+
+from typing import Any, List
+
+
+# ______________________________________________________________________________________________________________________
+class TestRetryingSQLAPI(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = UnitMock.patch.object(target=retry_policy.time, attribute='sleep')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._database = UnitMock.create_autospec(spec=MySQLDataBaseSingle, instance=True)
+        self._database.in_transaction = False
+        self._policy = RetryPolicy(error_classifier=is_transient_mysql_error, max_attempts=3)
+        self._instance = tested_class(database=self._database, retry_policy=self._policy)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_implements_SQLAPIInterface(self) -> None:
+        AbstractTestHelper.check_inspected_class_implements_expected_interface(
+            _cls=tested_class, expected_interface=SQLAPIInterface
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_read_is_retried_after_lost_connection(self) -> None:
+        # Build
+        self._database.execute_query_returns_all.side_effect = [MySQLError(errno=errorcode.CR_SERVER_LOST), [(1,)]]
+
+        # Operate
+        rows: Any = self._instance.execute_query_returns_all("SELECT id FROM users WHERE id = %s", 1, timeout=1.0)
+
+        # Check
+        self.assertEqual(first=rows, second=[(1,)])
+        self._database.execute_query_returns_all.assert_called_with("SELECT id FROM users WHERE id = %s", 1,
+                                                                    timeout=1.0)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_write_is_not_retried_after_lost_connection(self) -> None:
+        # Build
+        self._database.execute_query_no_returns.side_effect = MySQLError(errno=errorcode.CR_SERVER_LOST)
+
+        # Check
+        with self.assertRaises(expected_exception=MySQLError):
+            self._instance.execute_query_no_returns("UPDATE counters SET value = value + 1")
+
+        self._database.execute_query_no_returns.assert_called_once()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_whole_transaction_is_retried_after_deadlock(self) -> None:
+        # Build
+        executed_blocks: List[int] = []
+
+        def block(session: Any) -> str:
+            executed_blocks.append(len(executed_blocks))
+
+            if len(executed_blocks) == 1:
+                raise MySQLError(errno=errorcode.ER_LOCK_DEADLOCK)
+
+            session.execute_query_no_returns("UPDATE accounts SET balance = balance - 1")
+            return 'committed'
+
+        # Operate
+        result: str = self._instance.run_transaction(block)
+
+        # Check
+        self.assertEqual(first=result, second='committed')
+        self.assertEqual(first=self._database.transaction.call_count, second=2)
+        self.assertEqual(first=self._policy.metrics.retries_by_error, second={str(errorcode.ER_LOCK_DEADLOCK): 1})
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_statement_within_transaction_is_not_retried_after_deadlock(self) -> None:
+        # Build
+        cursor: UnitMock.MagicMock = self._connection_cursor()
+        cursor.execute.side_effect = [MySQLError(errno=errorcode.ER_LOCK_DEADLOCK), None]
+
+        single = MySQLDataBaseSingle(user='4proxy')
+        instance = tested_class(database=single, retry_policy=self._policy)
+
+        # Operate
+        with self.assertRaises(expected_exception=MySQLError), single.transaction():
+            instance.execute_query_no_returns("UPDATE accounts SET balance = balance - 1", is_idempotent=True)
+
+        # Check
+        cursor.execute.assert_called_once()
+        self.assertEqual(first=self._policy.metrics.retries_by_error, second={})
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _connection_cursor(self) -> UnitMock.MagicMock:
+        patcher = UnitMock.patch.object(target=mysql_database_single, attribute='MySQLConnection', autospec=True)
+        MockMySQLConnection: UnitMock.MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        connection: UnitMock.MagicMock = MockMySQLConnection.return_value
+        connection.in_transaction = False
+        connection.unread_result = False
+
+        return connection.cursor.return_value.__enter__.return_value
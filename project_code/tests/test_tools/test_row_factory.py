@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for functions from the `row_factory.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import unittest
+
+from dataclasses import dataclass, field
+
+from tools import row_factory as tested_module
+from tools.row_factory import RowFormat
+
+from typing import List, Optional
+
+
+# ______________________________________________________________________________________________________________________
+@dataclass
+class Event:
+    id: int
+    kind: str
+    tags: List[str] = field(default_factory=list)
+    note: Optional[str] = None
+
+
+# ______________________________________________________________________________________________________________________
+class TestRowFactory(unittest.TestCase):
+    def test_tuple_format_has_no_factory(self) -> None:
+        self.assertIsNone(obj=tested_module.get_row_factory(row_format=RowFormat.TUPLE, column_names=('id',)))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_dict_format_builds_dict_per_row(self) -> None:
+        # Build
+        row_factory = tested_module.get_row_factory(row_format=RowFormat.DICT, column_names=('id', 'kind'))
+
+        # Check
+        self.assertEqual(first=row_factory((1, "click")), second={'id': 1, 'kind': "click"})
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_named_row_class_is_generated_once_per_shape(self) -> None:
+        # Operate
+        first_class = tested_module.get_named_row_class(column_names=('id', 'kind'))
+        second_class = tested_module.get_named_row_class(column_names=('id', 'kind'))
+
+        # Check
+        self.assertIs(expr1=first_class, expr2=second_class)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_named_row_has_slots_and_access_by_name_and_index(self) -> None:
+        # Build
+        row_factory = tested_module.get_row_factory(row_format=RowFormat.NAMED, column_names=('id', 'COUNT(*)'))
+
+        # Operate
+        row = row_factory((1, 10))
+
+        # Check
+        self.assertFalse(expr=hasattr(row, '__dict__'), msg="Failure! The named row has *__dict__*!")
+        self.assertEqual(first=(row.id, row.column_1, row[1], tuple(row)), second=(1, 10, 10, (1, 10)))
+        self.assertEqual(first=row._asdict(), second={'id': 1, 'column_1': 10})
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_generated_attribute_name_does_not_take_real_column_name(self) -> None:
+        # Build
+        row_factory = tested_module.get_row_factory(row_format=RowFormat.NAMED, column_names=('column_1', 'COUNT(*)'))
+
+        # Operate
+        row = row_factory((1, 2))
+
+        # Check
+        self.assertEqual(first=(row.column_1, row.column_1_1), second=(1, 2))
+        self.assertEqual(first=repr(row), second="Row(column_1=1, column_1_1=2)")
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_row_mapper_fills_dataclass_by_column_names(self) -> None:
+        # Build
+        row_factory = tested_module.get_row_factory(row_format=Event, column_names=('kind', 'extra', 'id'))
+
+        # Operate
+        row = row_factory(("click", "ignored", 7))
+
+        # Check
+        self.assertEqual(first=row, second=Event(id=7, kind="click"))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_row_mapper_is_cached_per_class_and_shape(self) -> None:
+        self.assertIs(expr1=tested_module.get_row_mapper(row_class=Event, column_names=('id', 'kind')),
+                      expr2=tested_module.get_row_mapper(row_class=Event, column_names=('id', 'kind')))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_row_mapper_raise_ValueError_for_missing_required_field(self) -> None:
+        with self.assertRaises(expected_exception=ValueError):
+            tested_module.get_row_mapper(row_class=Event, column_names=('id',))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_row_mapper_raise_ValueError_for_unsafe_column_name_of_plain_class(self) -> None:
+        with self.assertRaises(expected_exception=ValueError):
+            tested_module.get_row_mapper(row_class=dict, column_names=('id', 'a=1) or (b'))
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `SchemaMetadataCache` from the `schema_metadata_cache.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import unittest
+from unittest import mock as UnitMock
+
+from tools import schema_metadata_cache as tested_module
+from tools.schema_metadata_cache import SchemaMetadataCache as tested_class
+from tools.table_metadata_dto import ColumnMetadataDTO, TableMetadataDTO
+
+from abstract.api.sql_api_interface import SQLAPIInterface
+
+from typing import Any, List
+
+
+# ______________________________________________________________________________________________________________________
+class TestSchemaMetadataCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._database = UnitMock.create_autospec(spec=SQLAPIInterface, instance=True)
+        self._database.execute_query_returns_all.side_effect = self._read_information_schema
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _read_information_schema(sql_query: str, *query_data: Any) -> List[Any]:
+        if sql_query == tested_module.COLUMNS_QUERY:
+            if query_data[1] == "missing":
+                return []
+
+            return [
+                {'COLUMN_NAME': 'id', 'DATA_TYPE': 'BIGINT', 'IS_NULLABLE': 'NO', 'CHARACTER_MAXIMUM_LENGTH': None},
+                {'COLUMN_NAME': 'email', 'DATA_TYPE': 'varchar', 'IS_NULLABLE': 'YES', 'CHARACTER_MAXIMUM_LENGTH': 255},
+            ]
+
+        return [('PRIMARY', 'PRIMARY KEY', 'id'), ('uq_email', 'UNIQUE', 'email')]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_metadata_is_read_once_and_cached(self) -> None:
+        # Build
+        instance = tested_class(database=self._database, default_schema_name="banana_db")
+
+        # Operate
+        metadata: TableMetadataDTO = instance.get_table_metadata(table_name="users")
+        cached_metadata: TableMetadataDTO = instance.get_table_metadata(table_name="banana_db.users")
+
+        # Check
+        self.assertIs(expr1=cached_metadata, expr2=metadata)
+        self.assertEqual(first=self._database.execute_query_returns_all.call_count, second=2)
+        self._database.execute_query_returns_all.assert_any_call(tested_module.COLUMNS_QUERY, "banana_db", "users")
+
+        self.assertEqual(first=metadata.columns, second=(
+            ColumnMetadataDTO(name='id', data_type='bigint', is_nullable=False),
+            ColumnMetadataDTO(name='email', data_type='varchar', is_nullable=True, max_length=255),
+        ))
+        self.assertEqual(first=metadata.primary_key, second=('id',))
+        self.assertEqual(first=metadata.unique_keys, second=(('email',),))
+        self.assertEqual(first=metadata.find_key_within(column_names=('email', 'name')), second=('email',))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_metadata_is_read_again_after_ttl(self) -> None:
+        # Build
+        instance = tested_class(database=self._database, ttl_seconds=10.0, default_schema_name="banana_db")
+
+        # Operate
+        with UnitMock.patch.object(target=tested_module.time, attribute='monotonic',
+                                   side_effect=[0.0, 5.0, 20.0, 20.0]):
+            instance.get_table_metadata(table_name="users")
+            instance.get_table_metadata(table_name="users")
+            instance.get_table_metadata(table_name="users")
+
+        # Check
+        self.assertEqual(first=self._database.execute_query_returns_all.call_count, second=4)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_raw_values_are_decoded(self) -> None:
+        # Build
+        self._database.execute_query_returns_all.side_effect = [
+            [(bytearray(b'id'), bytearray(b'BIGINT'), bytearray(b'NO'), None)],
+            [(bytearray(b'PRIMARY'), bytearray(b'PRIMARY KEY'), bytearray(b'id'))],
+        ]
+        instance = tested_class(database=self._database, default_schema_name="banana_db")
+
+        # Operate
+        metadata: TableMetadataDTO = instance.get_table_metadata(table_name="users")
+
+        # Check
+        self.assertEqual(first=metadata.columns, second=(ColumnMetadataDTO(name='id', data_type='bigint',
+                                                                           is_nullable=False),))
+        self.assertEqual(first=metadata.primary_key, second=('id',))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_metadata_is_read_by_backend_reader_if_it_exists(self) -> None:
+        # Build
+        self._database._read_metadata_rows = UnitMock.Mock(side_effect=[
+            [('id', 'int', 'NO', None)],
+            [('PRIMARY', 'PRIMARY KEY', 'id')],
+        ])
+        instance = tested_class(database=self._database, default_schema_name="banana_db")
+
+        # Operate
+        metadata: TableMetadataDTO = instance.get_table_metadata(table_name="users")
+
+        # Check
+        self._database._read_metadata_rows.assert_any_call(tested_module.COLUMNS_QUERY, "banana_db", "users")
+        self._database.execute_query_returns_all.assert_not_called()
+        self.assertEqual(first=metadata.primary_key, second=('id',))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_invalidate_removes_table_metadata(self) -> None:
+        # Build
+        instance = tested_class(database=self._database, default_schema_name="banana_db")
+        instance.get_table_metadata(table_name="users")
+
+        # Operate
+        instance.invalidate(table_name="users")
+        instance.get_table_metadata(table_name="users")
+
+        # Check
+        self.assertEqual(first=self._database.execute_query_returns_all.call_count, second=4)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_get_table_metadata_raises_for_unknown_schema_or_table(self) -> None:
+        # Build
+        instance = tested_class(database=self._database)
+
+        # Check
+        with self.assertRaises(expected_exception=ValueError):
+            instance.get_table_metadata(table_name="users")
+
+        with self.assertRaises(expected_exception=ValueError):
+            instance.get_table_metadata(table_name="banana_db.missing")
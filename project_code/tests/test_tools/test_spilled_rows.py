@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `SpillableRowBuffer` and `SpilledRowSequence` from the `spilled_rows.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import datetime
+import unittest
+
+from decimal import Decimal
+
+from tools.memory_budget_dto import MemoryBudgetDTO
+from tools.spilled_rows import SpillableRowBuffer as tested_class, SpilledRowSequence
+
+from typing import Any, List, Tuple
+
+
+# ______________________________________________________________________________________________________________________
+class TestSpillableRowBuffer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+
+        cls._rows: List[Tuple[Any, ...]] = [
+            (i, f"name-{i}", Decimal(i) / 4, datetime.date(2024, 1, 1 + i % 28), None) for i in range(2500)
+        ]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _build_rows(self, memory_budget: MemoryBudgetDTO, **params: Any) -> Any:
+        buffer = tested_class(memory_budget=memory_budget, **params)
+
+        for start in range(0, len(self._rows), 1000):
+            buffer.append_rows(rows=self._rows[start:start + 1000])
+
+        rows = buffer.build()
+
+        if isinstance(rows, SpilledRowSequence):
+            self.addCleanup(rows.close)
+
+        return rows
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_rows_within_budget_are_kept_in_list(self) -> None:
+        # Operate
+        rows = self._build_rows(memory_budget=MemoryBudgetDTO(max_rows=len(self._rows)))
+
+        # Check
+        self.assertIsInstance(obj=rows, cls=list)
+        self.assertEqual(first=rows, second=self._rows)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_rows_over_budget_are_read_back_by_random_access(self) -> None:
+        for memory_budget in (MemoryBudgetDTO(max_rows=1500), MemoryBudgetDTO(max_bytes=1024)):
+            with self.subTest(memory_budget=memory_budget):
+                # Operate
+                rows = self._build_rows(memory_budget=memory_budget)
+
+                # Check
+                self.assertIsInstance(obj=rows, cls=SpilledRowSequence)
+                self.assertEqual(first=len(rows), second=len(self._rows))
+                self.assertEqual(first=rows[1234], second=self._rows[1234])
+                self.assertEqual(first=rows[-1], second=self._rows[-1])
+                self.assertEqual(first=rows[10:13], second=self._rows[10:13])
+                self.assertEqual(first=list(rows), second=self._rows)
+
+                with self.assertRaises(expected_exception=IndexError):
+                    rows[len(self._rows)]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_rows_of_many_batches_are_read_back_in_any_order(self) -> None:
+        # Build
+        buffer = tested_class(memory_budget=MemoryBudgetDTO(max_rows=10, chunk_size=7))
+
+        # Operate
+        buffer.append_rows(rows=self._rows[:25])
+        buffer.append_rows(rows=self._rows[25:40])
+
+        rows = buffer.build()
+        self.addCleanup(rows.close)
+
+        # Check
+        self.assertIsInstance(obj=rows, cls=SpilledRowSequence)
+        self.assertEqual(first=[rows[index] for index in reversed(range(len(rows)))],
+                         second=self._rows[39::-1])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_row_factory_is_applied_to_spilled_rows(self) -> None:
+        # Operate
+        rows = self._build_rows(memory_budget=MemoryBudgetDTO(max_rows=0), row_factory=lambda row: row[0])
+
+        # Check
+        self.assertEqual(first=rows[7], second=7)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_closed_sequence_raises_on_read(self) -> None:
+        # Build
+        rows = self._build_rows(memory_budget=MemoryBudgetDTO(max_rows=0))
+
+        # Operate
+        with rows:
+            pass
+
+        # Check
+        self.assertTrue(expr=rows.is_closed)
+
+        with self.assertRaises(expected_exception=ValueError):
+            rows[0]
+
+
+# ______________________________________________________________________________________________________________________
+class TestMemoryBudgetDTO(unittest.TestCase):
+    def test_invalid_fields_raise_ValueError(self) -> None:
+        for params in ({'max_rows': -1}, {'max_bytes': 1.5}, {'chunk_size': 0}):
+            with self.subTest(params=params):
+                with self.assertRaises(expected_exception=ValueError):
+                    MemoryBudgetDTO(**params)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for functions from the `sql_statement_builder.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import unittest
+
+from tools import sql_statement_builder as tested_module
+
+from typing import Tuple
+
+
+# ______________________________________________________________________________________________________________________
+class TestSQLStatementBuilder(unittest.TestCase):
+    def test_validate_identifier_accepts_name_and_schema_name(self) -> None:
+        # Build
+        valid_identifiers: Tuple[str, ...] = "events", "telemetry.events", "_col$1"
+
+        # Check
+        for identifier in valid_identifiers:
+            with self.subTest(pattern=identifier):
+                self.assertEqual(first=tested_module.validate_identifier(identifier=identifier),
+                                 second=identifier)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_validate_identifier_raise_ValueError_for_unsafe_identifier(self) -> None:
+        # Build
+        invalid_identifiers: Tuple[str, ...] = "", "1col", "a b", "t; DROP TABLE t", "`t`", "a.b.c"
+
+        # Check
+        for identifier in invalid_identifiers:
+            with self.subTest(pattern=identifier):
+                with self.assertRaises(expected_exception=ValueError):
+                    tested_module.validate_identifier(identifier=identifier)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_quote_identifier_quotes_every_part(self) -> None:
+        self.assertEqual(first=tested_module.quote_identifier(identifier="db.events"),
+                         second="`db`.`events`")
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_build_multi_row_insert_returns_expected_statement(self) -> None:
+        # Operate
+        sql_query: str = tested_module.build_multi_row_insert(table_name="events",
+                                                              column_names=("a", "b"),
+                                                              rows_count=2)
+
+        # Check
+        self.assertEqual(first=sql_query,
+                         second="INSERT INTO `events` (`a`, `b`) VALUES (%s, %s), (%s, %s)")
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_build_multi_row_insert_raise_ValueError_for_empty_statement(self) -> None:
+        with self.assertRaises(expected_exception=ValueError):
+            tested_module.build_multi_row_insert(table_name="events", column_names=(), rows_count=1)
+
+        with self.assertRaises(expected_exception=ValueError):
+            tested_module.build_multi_row_insert(table_name="events", column_names=("a",), rows_count=0)
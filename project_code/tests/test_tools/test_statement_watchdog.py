@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for `StatementWatchdog` from the `statement_watchdog.py` file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import gc
+import threading
+import unittest
+import weakref
+
+from tools import fork_guard
+from tools.statement_watchdog import StatementWatchdog as tested_class, WatchedStatement
+
+from typing import List
+
+
+# ______________________________________________________________________________________________________________________
+class TestStatementWatchdog(unittest.TestCase):
+    def test_statement_over_timeout_is_cancelled(self) -> None:
+        # Build
+        instance = tested_class()
+        cancelled = threading.Event()
+
+        # Operate
+        watched = instance.watch(timeout=0.01, on_timeout=cancelled.set)
+
+        # Check
+        self.assertTrue(expr=cancelled.wait(timeout=5.0))
+        self.assertTrue(expr=watched.finish())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_finished_statement_is_not_cancelled(self) -> None:
+        # Build
+        instance = tested_class()
+        cancelled = threading.Event()
+        later_cancelled = threading.Event()
+
+        # Operate
+        watched = instance.watch(timeout=0.05, on_timeout=cancelled.set)
+        is_timed_out: bool = watched.finish()
+
+        # The later statement proves the deadline of the finished one has passed
+        instance.watch(timeout=0.1, on_timeout=later_cancelled.set)
+        later_cancelled.wait(timeout=5.0)
+
+        # Check
+        self.assertFalse(expr=is_timed_out)
+        self.assertFalse(expr=cancelled.is_set())
+        self.assertTrue(expr=later_cancelled.is_set())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_finished_statements_with_long_timeouts_are_released(self) -> None:
+        # Build
+        instance = tested_class()
+        long_watched: WatchedStatement = instance.watch(timeout=60.0, on_timeout=lambda: None)
+        self.addCleanup(long_watched.finish)
+
+        watched_statements: List[WatchedStatement] = [instance.watch(timeout=60.0, on_timeout=lambda: None)
+                                                      for _ in range(10)]
+        watched_refs: List[weakref.ref] = [weakref.ref(watched) for watched in watched_statements]
+
+        # Operate
+        for watched in watched_statements:
+            watched.finish()
+
+        del watched, watched_statements
+        gc.collect()
+
+        # Check
+        self.assertEqual(first=[ref for ref in watched_refs if ref() is not None], second=[])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_forked_child_forgets_statements_of_parent(self) -> None:
+        # Build
+        instance = tested_class()
+        parent_cancelled = threading.Event()
+        child_cancelled = threading.Event()
+
+        parent_watched: WatchedStatement = instance.watch(timeout=0.2, on_timeout=parent_cancelled.set)
+        self.addCleanup(parent_watched.finish)
+
+        # Operate
+        fork_guard._run_after_fork_in_child()
+        instance.watch(timeout=0.3, on_timeout=child_cancelled.set)
+
+        # Check
+        self.assertTrue(expr=child_cancelled.wait(timeout=5.0))
+        self.assertFalse(expr=parent_cancelled.is_set())
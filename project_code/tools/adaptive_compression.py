@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `AdaptiveCompressionPolicy` class, which decides whether a connection
+should use the compression of the protocol from the observed bytes per query, and the `TransferMeter` class,
+which observes the queries of a single connection.
+
+The compression pays off for the large transfers over a slow link (e.g. the exports from a remote replica),
+for the small queries it only spends the CPU of both the client and the server. The meter keeps
+a moving average of the bytes received per query:
+    - the average reaching `enable_bytes_per_query` recommends the compression;
+    - the average falling under `disable_bytes_per_query` recommends no compression;
+    - otherwise the recommendation is kept (a hysteresis), so a connection doesn't flip between the modes.
+
+*The compression is negotiated when a connection is opened, so the owner of the connection applies
+the recommendation by reconnecting at a safe point.
+
+*Relationship with other modules:
+    `mysql_compression`: The `adaptive` compression of the MySQL connections.
+    `mysql_database_single`: Meters its connection and reconnects, when the recommendation changes.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'AdaptiveCompressionPolicy',
+    'TransferMeter',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+
+# ______________________________________________________________________________________________________________________
+class AdaptiveCompressionPolicy:
+    """AdaptiveCompressionPolicy thresholds of the adaptive compression, it is shared by the meters of connections.
+
+    Example:
+        >>> policy = AdaptiveCompressionPolicy(enable_bytes_per_query=256 * 1024)
+        >>> database = MySQLDataBaseSingle(compression=policy, host='replica-eu', user='exporter')
+    """
+
+    def __init__(self, enable_bytes_per_query: int = 64 * 1024, disable_bytes_per_query: int = 8 * 1024,
+                 smoothing: float = 0.2, min_queries_count: int = 8) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            enable_bytes_per_query (int, optional): The mean bytes per query, from which the compression
+                                                    is recommended. Defaults to 64 KiB.
+            disable_bytes_per_query (int, optional): The mean bytes per query, under which the compression
+                                                     is not recommended. Defaults to 8 KiB.
+            smoothing (float, optional): The weight of the last query in the moving average. Defaults to 0.2.
+            min_queries_count (int, optional): The number of the observed queries before the first
+                                               recommendation. Defaults to 8.
+
+        Raises:
+            ValueError: If the thresholds or the parameters of the average are invalid.
+        """
+        if not 0 <= disable_bytes_per_query <= enable_bytes_per_query:
+            raise ValueError("The thresholds must be 0 <= *disable_bytes_per_query* <= *enable_bytes_per_query*!")
+
+        if not 0 < smoothing <= 1:
+            raise ValueError("The *smoothing* must be within (0, 1]!")
+
+        if not isinstance(min_queries_count, int) or min_queries_count <= 0:
+            raise ValueError("The *min_queries_count* must be an int > 0!")
+
+        self.__enable_bytes_per_query: int = enable_bytes_per_query
+        self.__disable_bytes_per_query: int = disable_bytes_per_query
+        self.__smoothing: float = smoothing
+        self.__min_queries_count: int = min_queries_count
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def enable_bytes_per_query(self) -> int:
+        return self.__enable_bytes_per_query
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def disable_bytes_per_query(self) -> int:
+        return self.__disable_bytes_per_query
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def smoothing(self) -> float:
+        return self.__smoothing
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def min_queries_count(self) -> int:
+        return self.__min_queries_count
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def create_meter(self) -> 'TransferMeter':
+        """create_meter creates the meter of a connection, which starts without the compression."""
+        return TransferMeter(policy=self)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}(enable_bytes_per_query={self.__enable_bytes_per_query}, "
+                f"disable_bytes_per_query={self.__disable_bytes_per_query}, smoothing={self.__smoothing}, "
+                f"min_queries_count={self.__min_queries_count})")
+
+
+# ______________________________________________________________________________________________________________________
+class TransferMeter:
+    """TransferMeter moving average of the bytes per query of a connection and its recommendation.
+
+    *The meter belongs to the owner of a single connection, it is not thread-safe.
+
+    Example:
+        >>> meter = AdaptiveCompressionPolicy().create_meter()
+        >>> meter.observe_query(received_bytes=2_000_000)  # a large export
+        False                                                # not enough queries yet
+    """
+
+    __slots__ = ('__policy', '__queries_count', '__mean_bytes_per_query', '__is_compression_recommended')
+
+    def __init__(self, policy: AdaptiveCompressionPolicy) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            policy (AdaptiveCompressionPolicy): The thresholds of the recommendation.
+        """
+        self.__policy: AdaptiveCompressionPolicy = policy
+        self.__queries_count: int = 0
+        self.__mean_bytes_per_query: float = 0.0
+        self.__is_compression_recommended: bool = False
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def policy(self) -> AdaptiveCompressionPolicy:
+        return self.__policy
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def queries_count(self) -> int:
+        return self.__queries_count
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def mean_bytes_per_query(self) -> float:
+        return self.__mean_bytes_per_query
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def is_compression_recommended(self) -> bool:
+        return self.__is_compression_recommended
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def observe_query(self, received_bytes: int) -> bool:
+        """observe_query records the bytes received by a query and updates the recommendation.
+
+        Args:
+            received_bytes (int): The (uncompressed) bytes of the result of the query.
+
+        Returns:
+            bool: Whether the compression is recommended.
+        """
+        policy: AdaptiveCompressionPolicy = self.__policy
+        self.__queries_count += 1
+
+        # The first queries are averaged evenly, so the first recommendation doesn't depend on a single query
+        weight: float = max(policy.smoothing, 1 / self.__queries_count)
+        self.__mean_bytes_per_query += weight * (received_bytes - self.__mean_bytes_per_query)
+
+        if self.__queries_count < policy.min_queries_count:
+            return self.__is_compression_recommended
+
+        if self.__mean_bytes_per_query >= policy.enable_bytes_per_query:
+            self.__is_compression_recommended = True
+
+        elif self.__mean_bytes_per_query < policy.disable_bytes_per_query:
+            self.__is_compression_recommended = False
+
+        return self.__is_compression_recommended
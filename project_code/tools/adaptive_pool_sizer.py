@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `AdaptivePoolSizer` class, which recommends the size of a connection pool
+from the observed leases (the waiting for a connection, the holding time and the peak of the used connections).
+
+The policy is AIMD bounded by Little's law, it is evaluated once per interval:
+    - the waiting over the target grows the size additively, at least to the size needed by Little's law
+      (arrival rate * holding time * headroom);
+    - a low peak utilization shrinks the size multiplicatively, but never below the peak
+      of the used connections and the size needed by Little's law;
+    - otherwise the size is kept.
+
+*Relationship with other modules:
+    `mysql_database_pool`: Reports its leases and applies the recommended size.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'AdaptivePoolSizer'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import math
+import threading
+import time
+
+
+# ______________________________________________________________________________________________________________________
+class AdaptivePoolSizer:
+    """AdaptivePoolSizer recommends the size of a pool between its bounds from the observed leases.
+
+    Example:
+        >>> sizer = AdaptivePoolSizer(min_size=2, max_size=32, target_acquire_wait=0.005)
+        >>> database = MySQLDataBasePool(pool_config=..., pool_sizer=sizer, **dbconfig)
+    """
+
+    def __init__(self, min_size: int, max_size: int, target_acquire_wait: float = 0.005,
+                 evaluation_interval: float = 1.0, low_utilization: float = 0.5,
+                 increase_step: int = 2, decrease_factor: float = 0.75, headroom: float = 1.25) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            min_size (int): The min size of the pool.
+            max_size (int): The max size of the pool.
+            target_acquire_wait (float, optional): The mean seconds of waiting for a connection,
+                                                   over which the pool grows. Defaults to 0.005.
+            evaluation_interval (float, optional): The min seconds between the evaluations. Defaults to 1.0.
+            low_utilization (float, optional): The share of the size used at peak,
+                                               under which the pool shrinks. Defaults to 0.5.
+            increase_step (int, optional): The additive increase of the size. Defaults to 2.
+            decrease_factor (float, optional): The multiplicative decrease of the size. Defaults to 0.75.
+            headroom (float, optional): The multiplier of the size needed by Little's law. Defaults to 1.25.
+
+        Raises:
+            ValueError: If the bounds or the parameters of the policy are invalid.
+        """
+        if not isinstance(min_size, int) or min_size <= 0:
+            raise ValueError("The *min_size* must be an int > 0!")
+
+        if not isinstance(max_size, int) or max_size < min_size:
+            raise ValueError("The *max_size* must be an int >= *min_size*!")
+
+        if target_acquire_wait < 0 or evaluation_interval <= 0:
+            raise ValueError("The *target_acquire_wait* must be >= 0 and *evaluation_interval* > 0!")
+
+        if not 0 < low_utilization < 1 or not 0 < decrease_factor < 1:
+            raise ValueError("The *low_utilization* and *decrease_factor* must be within (0, 1)!")
+
+        if not isinstance(increase_step, int) or increase_step <= 0 or headroom < 1:
+            raise ValueError("The *increase_step* must be an int > 0 and *headroom* >= 1!")
+
+        self.__min_size: int = min_size
+        self.__max_size: int = max_size
+        self.__target_acquire_wait: float = target_acquire_wait
+        self.__evaluation_interval: float = evaluation_interval
+        self.__low_utilization: float = low_utilization
+        self.__increase_step: int = increase_step
+        self.__decrease_factor: float = decrease_factor
+        self.__headroom: float = headroom
+
+        self.__lock = threading.Lock()
+        self.__reset_window(started_at=time.monotonic())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def min_size(self) -> int:
+        return self.__min_size
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def clamp(self, size: int) -> int:
+        """clamp returns the size limited by the bounds."""
+        return min(max(size, self.__min_size), self.__max_size)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def observe_lease(self, wait_seconds: float, hold_seconds: float, in_use_count: int, size: int) -> int:
+        """observe_lease records a finished lease and evaluates the size, when the interval has elapsed.
+
+        Args:
+            wait_seconds (float): The seconds of waiting for the connection.
+            hold_seconds (float): The seconds the connection was used.
+            in_use_count (int): The number of the used connections, when the lease started.
+            size (int): The current size of the pool.
+
+        Returns:
+            int: The recommended size of the pool, `size` if it shouldn't change.
+        """
+        with self.__lock:
+            self.__leases_count += 1
+            self.__wait_seconds += wait_seconds
+            self.__hold_seconds += hold_seconds
+            self.__peak_in_use_count = max(self.__peak_in_use_count, in_use_count)
+
+            now: float = time.monotonic()
+            elapsed: float = now - self.__window_started_at
+
+            if elapsed < self.__evaluation_interval:
+                return size
+
+            recommended_size: int = self.__recommend_size(size=size, elapsed=elapsed)
+            self.__reset_window(started_at=now)
+
+        return recommended_size
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __recommend_size(self, size: int, elapsed: float) -> int:
+        arrival_rate: float = self.__leases_count / elapsed
+        mean_hold_seconds: float = self.__hold_seconds / self.__leases_count
+        little_size: int = math.ceil(arrival_rate * mean_hold_seconds * self.__headroom)
+
+        if self.__wait_seconds / self.__leases_count > self.__target_acquire_wait:
+            recommended_size: int = max(size + self.__increase_step, little_size)
+
+        elif self.__peak_in_use_count <= size * self.__low_utilization:
+            recommended_size = min(size, max(int(size * self.__decrease_factor),
+                                             self.__peak_in_use_count, little_size))
+
+        else:
+            recommended_size = size
+
+        return self.clamp(size=recommended_size)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __reset_window(self, started_at: float) -> None:
+        self.__window_started_at: float = started_at
+        self.__leases_count: int = 0
+        self.__wait_seconds: float = 0.0
+        self.__hold_seconds: float = 0.0
+        self.__peak_in_use_count: int = 0
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `AdmissionController` class - a concurrency limiter with priority lanes,
+which admits the work to a connection pool before it takes a connection.
+
+A lane may use its reserved connections and the shared ones, which are not reserved by the other lanes
+(the unused reservations of the other lanes always stay free). The free connections are given
+to the waiting requests of the most important lane first. The new requests of a lane are shed early,
+when its queue is full or its oldest request has waited longer than the target latency,
+so an overloaded lane fails fast instead of building a queue of requests, which would time out anyway.
+
+*Relationship with other modules:
+    `priority_lane_dto`: The configuration of the lanes.
+    `deadline`: Limits the waiting of a request.
+    `mysql_database_pool`: Admits the work before leasing a pooled connection.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'AdmissionController'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import threading
+import time
+
+from collections import deque
+from contextlib import contextmanager
+
+from tools.deadline import Deadline
+from tools.priority_lane_dto import PriorityLaneDTO
+
+from typing import Deque, Dict, Iterator, List, Optional, Sequence
+
+
+# ______________________________________________________________________________________________________________________
+class _Waiter:
+    __slots__ = ('lane_name', 'enqueued_at', 'is_granted')
+
+    def __init__(self, lane_name: str) -> None:
+        self.lane_name: str = lane_name
+        self.enqueued_at: float = time.monotonic()
+        self.is_granted: bool = False
+
+
+# ______________________________________________________________________________________________________________________
+class AdmissionController:
+    """AdmissionController limits the concurrent work by the capacity shared by the priority lanes.
+
+    Example:
+        >>> controller = AdmissionController(capacity=10, lanes=(
+        ...     PriorityLaneDTO(name='interactive', reserved_connections=4, target_queue_latency=0.05),
+        ...     PriorityLaneDTO(name='batch', max_queue_length=100),
+        ... ))
+        >>> with controller.admit(lane_name='batch', deadline=Deadline.after(seconds=30.0)):
+        ...     ...
+    """
+
+    def __init__(self, capacity: int, lanes: Sequence[PriorityLaneDTO]) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            capacity (int): The max number of the admitted requests (the size of the pool).
+            lanes (Sequence[PriorityLaneDTO]): The lanes from the most important one.
+
+        Raises:
+            ValueError: If there are no lanes, their names repeat or their reservations exceed the capacity.
+        """
+        if not lanes:
+            raise ValueError("At least one priority lane is required!")
+
+        if len({lane.name for lane in lanes}) != len(lanes):
+            raise ValueError("The names of the priority lanes must be unique!")
+
+        if sum(lane.reserved_connections for lane in lanes) > capacity:
+            raise ValueError(f"The reserved connections of the priority lanes cannot be > capacity ({capacity})!")
+
+        self.__capacity: int = capacity
+        self.__lanes: Dict[str, PriorityLaneDTO] = {lane.name: lane for lane in lanes}
+
+        self.__condition = threading.Condition()
+        self.__in_use: Dict[str, int] = {lane.name: 0 for lane in lanes}
+        self.__queues: Dict[str, Deque[_Waiter]] = {lane.name: deque() for lane in lanes}
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @capacity.setter
+    def capacity(self, capacity: int) -> None:
+        """capacity changes the max number of the admitted requests (e.g. when the pool is resized).
+
+        *The requests admitted over a smaller capacity finish normally, the new ones wait for them.
+
+        Raises:
+            ValueError: If the reserved connections of the lanes exceed the capacity.
+        """
+        if capacity < self.reserved_connections_count:
+            raise ValueError(f"The reserved connections of the priority lanes cannot be > capacity ({capacity})!")
+
+        with self.__condition:
+            self.__capacity = capacity
+            self.__dispatch()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def reserved_connections_count(self) -> int:
+        return sum(lane.reserved_connections for lane in self.__lanes.values())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def lanes(self) -> List[PriorityLaneDTO]:
+        return list(self.__lanes.values())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def get_in_use_count(self, lane_name: str) -> int:
+        return self.__in_use[self.__resolve_lane_name(lane_name=lane_name)]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def get_queue_length(self, lane_name: str) -> int:
+        return len(self.__queues[self.__resolve_lane_name(lane_name=lane_name)])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @contextmanager
+    def admit(self, lane_name: Optional[str] = None, deadline: Optional[Deadline] = None) -> Iterator[None]:
+        """admit waits for the admission of a request for the context.
+
+        Args:
+            lane_name (Optional[str], optional): The lane of the request. Defaults to None (the first lane).
+            deadline (Optional[Deadline], optional): The deadline of the waiting. Defaults to None (no limit).
+
+        Raises:
+            KeyError: If the lane is unknown.
+            RuntimeError: If the queue of the lane is full.
+            TimeoutError: If the queue of the lane is over its target latency or the deadline passes.
+        """
+        lane_name = self.__resolve_lane_name(lane_name=lane_name)
+        self.__acquire(lane_name=lane_name, deadline=deadline)
+
+        try:
+            yield
+
+        finally:
+            self.__release(lane_name=lane_name)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __acquire(self, lane_name: str, deadline: Optional[Deadline]) -> None:
+        lane: PriorityLaneDTO = self.__lanes[lane_name]
+        queue: Deque[_Waiter] = self.__queues[lane_name]
+
+        with self.__condition:
+            if deadline is not None:
+                deadline.check(operation=f"Admission to the {lane_name!r} lane")
+
+            # The limits of the queue are applied only to the requests, which have to wait
+            if not queue and self.__is_admissible(lane_name=lane_name):
+                self.__in_use[lane_name] += 1
+                return
+
+            if lane.max_queue_length is not None and len(queue) >= lane.max_queue_length:
+                raise RuntimeError(f"The request is shed, the queue of the {lane_name!r} lane is full!")
+
+            if lane.target_queue_latency is not None and queue \
+                    and time.monotonic() - queue[0].enqueued_at > lane.target_queue_latency:
+                raise TimeoutError(f"The request is shed, the queue of the {lane_name!r} lane is over "
+                                   f"its target latency ({lane.target_queue_latency}s)!")
+
+            waiter = _Waiter(lane_name=lane_name)
+            queue.append(waiter)
+            self.__dispatch()
+
+            try:
+                while not waiter.is_granted:
+                    if deadline is None:
+                        self.__condition.wait()
+
+                    else:
+                        self.__condition.wait(timeout=deadline.check(operation=f"Admission to the {lane_name!r} lane"))
+
+            except BaseException:
+                if waiter.is_granted:
+                    self.__release_locked(lane_name=lane_name)
+
+                else:
+                    queue.remove(waiter)
+
+                    # The waiter behind it may be admissible now
+                    self.__dispatch()
+
+                raise
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __release(self, lane_name: str) -> None:
+        with self.__condition:
+            self.__release_locked(lane_name=lane_name)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __release_locked(self, lane_name: str) -> None:
+        self.__in_use[lane_name] -= 1
+        self.__dispatch()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __dispatch(self) -> None:
+        """__dispatch admits the first waiters of the lanes from the most important one, the lock must be held."""
+        is_granted: bool = False
+
+        for lane_name, queue in self.__queues.items():
+            while queue and self.__is_admissible(lane_name=lane_name):
+                queue.popleft().is_granted = True
+                self.__in_use[lane_name] += 1
+                is_granted = True
+
+        if is_granted:
+            self.__condition.notify_all()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __is_admissible(self, lane_name: str) -> bool:
+        free_count: int = self.__capacity - sum(self.__in_use.values())
+
+        unused_reservations_of_others: int = sum(
+            max(lane.reserved_connections - self.__in_use[name], 0)
+            for name, lane in self.__lanes.items()
+            if name != lane_name
+        )
+
+        return free_count > unused_reservations_of_others
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __resolve_lane_name(self, lane_name: Optional[str]) -> str:
+        if lane_name is None:
+            return next(iter(self.__lanes))
+
+        if lane_name not in self.__lanes:
+            raise KeyError(f"Unknown priority lane: {lane_name!r}!")
+
+        return lane_name
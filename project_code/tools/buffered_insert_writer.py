@@ -0,0 +1,462 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `BufferedInsertWriter` class - a write-behind buffer of rows
+for a single target table.
+
+The rows accepted by the writer are grouped and written by a background thread
+as multi-row `INSERT` statements, so the caller doesn't wait for a round trip per row.
+
+*Relationship with other modules:
+    `sql_api_interface`: The rows are written through `execute_query_no_returns` of the API.
+    `sql_statement_builder`: Builds the text of multi-row `INSERT` statements.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'BufferedInsertWriter'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.3.0"
+
+import threading
+import time
+import weakref
+
+from collections import deque
+
+from abstract.api.sql_api_interface import SQLAPIInterface
+from tools.sql_statement_builder import build_multi_row_insert, validate_identifier
+
+from typing import Any, Deque, Iterable, List, Optional, Sequence, Tuple
+
+
+# ______________________________________________________________________________________________________________________
+class _InsertBuffer:
+    """_InsertBuffer buffered rows of `BufferedInsertWriter` and the background thread, which writes them.
+
+    *The thread refers to the buffer only, so the writer, which is not closed, is still released
+    by the garbage collector. Its finalizer closes the buffer.
+    """
+
+    def __init__(self,
+                 database: SQLAPIInterface,
+                 table_name: str,
+                 column_names: Tuple[str, ...],
+                 max_batch_rows: int,
+                 max_batch_bytes: int,
+                 flush_interval: float,
+                 max_buffered_rows: int,
+                 placeholder: str) -> None:
+        self.__database: SQLAPIInterface = database
+        self.__table_name: str = table_name
+        self.__column_names: Tuple[str, ...] = column_names
+        self.__placeholder: str = placeholder
+
+        self.__max_batch_rows: int = max_batch_rows
+        self.__max_batch_bytes: int = max_batch_bytes
+        self.__flush_interval: float = flush_interval
+        self.__max_buffered_rows: int = max_buffered_rows
+
+        self.__condition = threading.Condition()
+
+        # The row, its estimated size and the time it was buffered, the oldest row is the first one
+        self.__rows: Deque[Tuple[Tuple[Any, ...], int, float]] = deque()
+        self.__buffered_bytes: int = 0
+
+        # Sequence numbers of rows, used by `flush` to wait for its rows
+        self.__accepted_rows_count: int = 0
+        self.__processed_rows_count: int = 0
+        self.__written_rows_count: int = 0
+
+        self.__flush_requested: bool = False
+        self.__is_closed: bool = False
+        # The errors of the failed batches and their rows, which were not written
+        self.__flush_errors: List[BaseException] = []
+        self.__failed_rows: List[Tuple[Any, ...]] = []
+
+        self.__flush_thread = threading.Thread(target=self.__run_flush_loop,
+                                               name=f"BufferedInsertWriter-{table_name}",
+                                               daemon=True)
+        self.__flush_thread.start()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def written_rows_count(self) -> int:
+        return self.__written_rows_count
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def buffered_rows_count(self) -> int:
+        return len(self.__rows)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def is_closed(self) -> bool:
+        return self.__is_closed
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def write_many(self, rows: Iterable[Sequence[Any]], timeout: Optional[float]) -> None:
+        deadline: Optional[float] = None if timeout is None else time.monotonic() + timeout
+
+        with self.__condition:
+            for row in rows:
+                row = tuple(row)
+
+                if len(row) != len(self.__column_names):
+                    raise ValueError(
+                        f"The row has {len(row)} values, but the writer expects {len(self.__column_names)}!"
+                    )
+
+                self.__wait_for_free_space(deadline=deadline)
+
+                if not self.__rows:
+                    # The background thread starts counting `flush_interval` from this row
+                    self.__condition.notify_all()
+
+                row_size: int = self.__estimate_row_size(row=row)
+
+                self.__rows.append((row, row_size, time.monotonic()))
+                self.__buffered_bytes += row_size
+                self.__accepted_rows_count += 1
+
+                if len(self.__rows) >= self.__max_batch_rows or self.__buffered_bytes >= self.__max_batch_bytes:
+                    self.__condition.notify_all()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def flush(self, timeout: Optional[float]) -> None:
+        with self.__condition:
+            self.__raise_flush_error()
+
+            target_rows_count: int = self.__accepted_rows_count
+
+            self.__flush_requested = True
+            self.__condition.notify_all()
+
+            is_flushed: bool = self.__condition.wait_for(
+                predicate=lambda: self.__processed_rows_count >= target_rows_count,
+                timeout=timeout
+            )
+
+            if not is_flushed:
+                raise TimeoutError("The buffered rows were not written in the allotted time!")
+
+            self.__raise_flush_error()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def close(self) -> None:
+        with self.__condition:
+            if self.__is_closed:
+                return
+
+            self.__is_closed = True
+            self.__condition.notify_all()
+
+        self.__flush_thread.join()
+
+        with self.__condition:
+            self.__raise_flush_error()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def take_failed_rows(self) -> List[Tuple[Any, ...]]:
+        with self.__condition:
+            failed_rows: List[Tuple[Any, ...]] = self.__failed_rows
+            self.__failed_rows = []
+
+        return failed_rows
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __wait_for_free_space(self, deadline: Optional[float]) -> None:
+        while True:
+            self.__raise_flush_error()
+
+            if self.__is_closed:
+                raise RuntimeError("The buffered writer is closed!")
+
+            if len(self.__rows) < self.__max_buffered_rows:
+                return
+
+            # The buffer is full, so the background thread must start flushing right now
+            self.__condition.notify_all()
+
+            remaining: Optional[float] = None if deadline is None else deadline - time.monotonic()
+
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError("There is no free space in the buffer of the writer!")
+
+            self.__condition.wait(timeout=remaining)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __raise_flush_error(self) -> None:
+        if not self.__flush_errors:
+            return
+
+        error, *later_errors = self.__flush_errors
+        self.__flush_errors = []
+
+        # The first error is raised, the later ones are not lost
+        for later_error in later_errors:
+            error.add_note(f"A later batch of the buffered writer has failed too: {later_error!r}")
+
+        error.add_note(f"{len(self.__failed_rows)} rows were not written, they are returned by *take_failed_rows*.")
+
+        raise error
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __is_flush_due(self) -> bool:
+        if not self.__rows:
+            return False
+
+        if self.__is_closed or self.__flush_requested:
+            return True
+
+        if len(self.__rows) >= self.__max_batch_rows or self.__buffered_bytes >= self.__max_batch_bytes:
+            return True
+
+        return time.monotonic() - self.__rows[0][2] >= self.__flush_interval
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __take_batch(self) -> List[Tuple[Any, ...]]:
+        batch: List[Tuple[Any, ...]] = []
+        batch_bytes: int = 0
+
+        while self.__rows and len(batch) < self.__max_batch_rows:
+            row, row_size, _ = self.__rows[0]
+
+            # At least one row is taken, even if it is larger than the limit
+            if batch and batch_bytes + row_size > self.__max_batch_bytes:
+                break
+
+            self.__rows.popleft()
+            self.__buffered_bytes -= row_size
+
+            batch.append(row)
+            batch_bytes += row_size
+
+        return batch
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __run_flush_loop(self) -> None:
+        while True:
+            with self.__condition:
+                while not self.__is_flush_due():
+                    if self.__is_closed and not self.__rows:
+                        return
+
+                    if not self.__rows:
+                        self.__flush_requested = False
+                        wait_timeout: Optional[float] = None
+
+                    else:
+                        # The rows left by a partial flush keep their time, so none of them waits longer
+                        wait_timeout = self.__flush_interval - (time.monotonic() - self.__rows[0][2])
+
+                    self.__condition.wait(timeout=wait_timeout)
+
+                batch: List[Tuple[Any, ...]] = self.__take_batch()
+
+                # Writers blocked by backpressure can continue
+                self.__condition.notify_all()
+
+            error: Optional[BaseException] = self.__write_batch(batch=batch)
+
+            with self.__condition:
+                self.__processed_rows_count += len(batch)
+
+                if error is None:
+                    self.__written_rows_count += len(batch)
+
+                else:
+                    self.__flush_errors.append(error)
+                    self.__failed_rows.extend(batch)
+
+                self.__condition.notify_all()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __write_batch(self, batch: List[Tuple[Any, ...]]) -> Optional[BaseException]:
+        sql_query: str = build_multi_row_insert(table_name=self.__table_name,
+                                                column_names=self.__column_names,
+                                                rows_count=len(batch),
+                                                placeholder=self.__placeholder)
+
+        query_data: List[Any] = [value for row in batch for value in row]
+
+        try:
+            self.__database.execute_query_no_returns(sql_query, *query_data)
+
+        except Exception as error:
+            return error
+
+        return None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __estimate_row_size(row: Tuple[Any, ...]) -> int:
+        # Placeholders, separators and numbers are counted as 8 bytes per value
+        size: int = 0
+
+        for value in row:
+            if isinstance(value, (str, bytes, bytearray, memoryview)):
+                size += len(value) + 8
+
+            else:
+                size += 8
+
+        return size
+
+
+# ______________________________________________________________________________________________________________________
+class BufferedInsertWriter:
+    """BufferedInsertWriter write-behind buffer of rows for a single target table.
+
+    The buffered rows are flushed by a background thread as multi-row `INSERT` statements
+    when one of the thresholds is hit:
+        - `max_batch_rows` rows are buffered;
+        - `max_batch_bytes` (estimated size of values) are buffered;
+        - `flush_interval` seconds have passed since the oldest unwritten row was buffered.
+
+    When `max_buffered_rows` rows are waiting to be written, `write` blocks the caller
+    (backpressure) until the background thread frees up space.
+
+    *The writer uses the database from its own thread, so it should be given
+    a separate instance of the database API, not shared with other threads.
+    *`close` (or leaving the `with` block) always flushes all buffered rows.
+    If the caller forgets to close the writer, it is closed when it is collected or at the interpreter exit.
+    *An error of a background flush is raised by the next call of `write`, `flush` or `close`.
+    The errors of the later batches are added to its notes, the rows of all failed batches
+    are kept until they are taken by `take_failed_rows`.
+    """
+
+    def __init__(self,
+                 database: SQLAPIInterface,
+                 table_name: str,
+                 column_names: Sequence[str],
+                 max_batch_rows: int = 1000,
+                 max_batch_bytes: int = 1_048_576,
+                 flush_interval: float = 1.0,
+                 max_buffered_rows: int = 10_000,
+                 placeholder: str = '%s') -> None:
+        """__init__ initializes an instance of this class and starts the background thread.
+
+        Args:
+            database (SQLAPIInterface): The API used to execute `INSERT` statements.
+            table_name (str): The name of the target table.
+            column_names (Sequence[str]): The names of the columns, every row must have the same length.
+            max_batch_rows (int, optional): Max number of rows in one statement. Defaults to 1000.
+            max_batch_bytes (int, optional): Max estimated size of values in one statement. Defaults to 1 MiB.
+            flush_interval (float, optional): Max seconds a row waits in the buffer. Defaults to 1.0.
+            max_buffered_rows (int, optional): Number of buffered rows, which blocks the callers. Defaults to 10000.
+            placeholder (str, optional): The parameter placeholder of the driver. Defaults to '%s'.
+
+        Raises:
+            ValueError: If any of the thresholds is <= 0 or `max_buffered_rows` < `max_batch_rows`.
+        """
+        validate_identifier(identifier=table_name)
+
+        for column_name in column_names:
+            validate_identifier(identifier=column_name)
+
+        if min(max_batch_rows, max_batch_bytes, max_buffered_rows) <= 0 or flush_interval <= 0:
+            raise ValueError("The thresholds of the buffered writer cannot be <= 0!")
+
+        if max_buffered_rows < max_batch_rows:
+            raise ValueError("The *max_buffered_rows* value cannot be < *max_batch_rows*!")
+
+        self.__buffer = _InsertBuffer(database=database,
+                                      table_name=table_name,
+                                      column_names=tuple(column_names),
+                                      max_batch_rows=max_batch_rows,
+                                      max_batch_bytes=max_batch_bytes,
+                                      flush_interval=flush_interval,
+                                      max_buffered_rows=max_buffered_rows,
+                                      placeholder=placeholder)
+
+        # The finalizer refers to the buffer only, it closes the buffer when the writer is collected or at the exit
+        self.__finalizer = weakref.finalize(self, self.__buffer.close)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def written_rows_count(self) -> int:
+        return self.__buffer.written_rows_count
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def buffered_rows_count(self) -> int:
+        return self.__buffer.buffered_rows_count
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def is_closed(self) -> bool:
+        return self.__buffer.is_closed
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __enter__(self) -> 'BufferedInsertWriter':
+        return self
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def write(self, row: Sequence[Any], timeout: Optional[float] = None) -> None:
+        """write puts the row into the buffer.
+
+        *The call blocks only when the buffer is full (backpressure).
+
+        Args:
+            row (Sequence[Any]): The values of the row in the order of `column_names`.
+            timeout (Optional[float], optional): Max seconds to wait for free space. Defaults to None (forever).
+
+        Raises:
+            ValueError: If the length of the row doesn't match the number of columns.
+            RuntimeError: If the writer is closed.
+            TimeoutError: If there is no free space in the buffer during `timeout`.
+        """
+        self.write_many(rows=(row,), timeout=timeout)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def write_many(self, rows: Iterable[Sequence[Any]], timeout: Optional[float] = None) -> None:
+        """write_many puts the rows into the buffer.
+
+        *The `timeout` is applied to the whole call, not to each row.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): The rows in the order of `column_names`.
+            timeout (Optional[float], optional): Max seconds to wait for free space. Defaults to None (forever).
+        """
+        self.__buffer.write_many(rows=rows, timeout=timeout)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """flush writes all rows buffered before the call and waits for it.
+
+        Args:
+            timeout (Optional[float], optional): Max seconds to wait. Defaults to None (forever).
+
+        Raises:
+            TimeoutError: If the rows are not written during `timeout`.
+        """
+        self.__buffer.flush(timeout=timeout)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def close(self) -> None:
+        """close flushes all buffered rows and stops the background thread.
+
+        *Repeated calls do nothing.
+        """
+        # The finalizer is called once, the repeated calls do nothing
+        self.__finalizer()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def take_failed_rows(self) -> List[Tuple[Any, ...]]:
+        """take_failed_rows returns the rows of the failed batches and forgets them.
+
+        *The rows can be written again, e.g. after the error is resolved.
+
+        Returns:
+            List[Tuple[Any, ...]]: The rows, which were not written, in the order they were buffered.
+        """
+        return self.__buffer.take_failed_rows()
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the chunked transfer of large values (e.g. the BLOB and TEXT columns) between
+the database and a file object or a buffer of the caller, so a value is never held in memory as a whole.
+
+    `ChunkedStreamReader`: Reads a binary file object in chunks into a single reused buffer
+                           and lends the chunks as `memoryview` slices of it.
+    `ChunkSink`: Writes the received chunks to a writable buffer (`bytearray`, `mmap`, `numpy` array, ...)
+                 through `memoryview` slices or to a binary file object.
+
+*Relationship with other modules:
+    `mysql_database_single`: Sends a parameter from a file object and reads a column into a buffer or a file.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'ChunkSink',
+    'ChunkedStreamReader',
+    'DEFAULT_STREAM_CHUNK_SIZE',
+    'is_readable_stream',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import io
+
+from typing import Any, BinaryIO, Optional, Union
+
+
+# Large enough to keep the number of the round trips low, small enough for the default `max_allowed_packet` (64 MiB)
+DEFAULT_STREAM_CHUNK_SIZE: int = 1024 * 1024
+
+
+# ______________________________________________________________________________________________________________________
+def is_readable_stream(value: Any) -> bool:
+    """is_readable_stream checks whether the value is a file object to be sent in chunks (not a bytes-like value)."""
+    return callable(getattr(value, 'read', None)) and not isinstance(value, (bytes, bytearray, memoryview, str))
+
+
+# ______________________________________________________________________________________________________________________
+class ChunkedStreamReader(io.RawIOBase):
+    """ChunkedStreamReader reader of a binary file object, which returns the chunks as views of a reused buffer.
+
+    *A returned chunk is valid only until the next `read`, its consumer must copy or send it before.
+
+    Example:
+        >>> with open('model.bin', 'rb') as stream:
+        ...     reader = ChunkedStreamReader(stream=stream, chunk_size=1024 * 1024)
+        ...     while chunk := reader.read():
+        ...         send(chunk)
+    """
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            stream (BinaryIO): The binary file object, it is read from its current position.
+            chunk_size (int, optional): The max bytes of a chunk. Defaults to 1 MiB.
+
+        Raises:
+            ValueError: If the size of the chunk is <= 0.
+        """
+        super().__init__()
+
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("The *chunk_size* must be an int > 0!")
+
+        self.__stream: BinaryIO = stream
+        self.__buffer = bytearray(chunk_size)
+        self.__view = memoryview(self.__buffer)
+        self.__read_bytes: int = 0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def read_bytes(self) -> int:
+        """read_bytes the number of the bytes read from the stream."""
+        return self.__read_bytes
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def readable(self) -> bool:
+        return True
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def read(self, size: Optional[int] = -1) -> Union[memoryview, bytes]:
+        """read reads the next chunk of the stream.
+
+        Args:
+            size (Optional[int], optional): The max bytes of the chunk. Defaults to -1 (`chunk_size`).
+
+        Raises:
+            TypeError: If the stream is not binary.
+
+        Returns:
+            Union[memoryview, bytes]: The view of the chunk in the reused buffer, or the chunk returned
+                                      by a stream without `readinto`. Empty at the end of the stream.
+        """
+        if size is None or size < 0 or size > len(self.__buffer):
+            size = len(self.__buffer)
+
+        readinto = getattr(self.__stream, 'readinto', None)
+
+        if readinto is None:
+            chunk: Any = self.__stream.read(size)
+
+            if isinstance(chunk, str):
+                raise TypeError("The stream must be opened in the binary mode!")
+
+        else:
+            chunk = self.__view[:readinto(self.__view[:size]) or 0]
+
+        self.__read_bytes += len(chunk)
+
+        return chunk
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def readinto(self, buffer: Any) -> int:
+        target = memoryview(buffer).cast('B')
+        chunk: Union[memoryview, bytes] = self.read(len(target))
+        target[:len(chunk)] = chunk
+
+        return len(chunk)
+
+
+# ______________________________________________________________________________________________________________________
+class ChunkSink:
+    """ChunkSink writer of the received chunks to a writable buffer or a binary file object.
+
+    Example:
+        >>> sink = ChunkSink(target=bytearray(size))
+        >>> sink.reserve(size=size)
+        >>> for chunk in chunks:
+        ...     sink.write(chunk=chunk)
+    """
+
+    def __init__(self, target: Any) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            target (Any): A binary file object (has `write`) or an object supporting the writable buffer protocol.
+
+        Raises:
+            TypeError: If the target is neither a file object nor a writable buffer.
+        """
+        self.__file: Optional[Any] = None
+        self.__view: Optional[memoryview] = None
+        self.__written_bytes: int = 0
+
+        if callable(getattr(target, 'write', None)):
+            self.__file = target
+            return
+
+        try:
+            view = memoryview(target)
+
+        except TypeError:
+            raise TypeError("The target must be a binary file object or a writable buffer!") from None
+
+        if view.readonly:
+            raise TypeError("The target buffer must be writable!")
+
+        self.__view = view.cast('B')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def written_bytes(self) -> int:
+        return self.__written_bytes
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def reserve(self, size: int) -> None:
+        """reserve checks the buffer has room for the bytes of the value (a file object has no limit).
+
+        Raises:
+            ValueError: If the rest of the buffer is smaller than the size.
+        """
+        if self.__view is not None and self.__written_bytes + size > len(self.__view):
+            raise ValueError(f"The target buffer is too small: *{len(self.__view) - self.__written_bytes}* bytes "
+                             f"left for a value of *{size}* bytes!")
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def write(self, chunk: Union[bytes, bytearray, memoryview]) -> None:
+        """write writes the chunk after the previous ones.
+
+        Raises:
+            ValueError: If the chunk doesn't fit into the rest of the buffer.
+        """
+        size: int = len(chunk)
+
+        if self.__view is not None:
+            self.reserve(size=size)
+            self.__view[self.__written_bytes:self.__written_bytes + size] = chunk
+
+        else:
+            view = memoryview(chunk)
+
+            # A raw file object may write a part of the chunk
+            while view:
+                written: Optional[int] = self.__file.write(view)
+
+                if written is None or written >= len(view):
+                    break
+
+                view = view[written:]
+
+        self.__written_bytes += size
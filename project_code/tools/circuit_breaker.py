@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `CircuitBreaker` class, which stops sending the work to a failing endpoint
+(e.g. a replica, which is down), so the threads fail fast instead of waiting for its timeouts.
+
+    CLOSED: The calls pass, their outcomes are recorded in a sliding window. When the rate of the failed
+            or the slow calls in the window reaches its threshold, the circuit opens.
+    OPEN: The calls fail fast with `ConnectionError` for `open_seconds`, then the circuit is half-open.
+    HALF_OPEN: A limited number of the trial calls pass (each after the health probe, if it is set),
+               the others fail fast. The successful trials close the circuit, a failed one opens it again.
+
+*Relationship with other modules:
+    `circuit_breaking_sql_api`: Guards the queries and the transactions of a database endpoint.
+    `mysql_transient_errors`: Classifies the MySQL errors, which mean the endpoint is failing.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'CircuitBreaker',
+    'CircuitState',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import threading
+import time
+
+from collections import deque
+from contextlib import contextmanager
+from enum import Enum
+
+from typing import Callable, Deque, Iterator, Optional, Tuple, TypeVar
+
+
+T = TypeVar('T')
+
+
+# ______________________________________________________________________________________________________________________
+class CircuitState(Enum):
+    """CircuitState states of the circuit.
+
+    Attributes:
+        CLOSED: The calls pass.
+        OPEN: The calls fail fast.
+        HALF_OPEN: The limited trial calls pass.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+# ______________________________________________________________________________________________________________________
+class CircuitBreaker:
+    """CircuitBreaker fails the calls fast, while the endpoint is failing.
+
+    Example:
+        >>> breaker = CircuitBreaker(name='replica-1', failure_classifier=is_mysql_endpoint_failure,
+        ...                          slow_call_seconds=1.0, health_probe=replica.check_health)
+        >>> rows = breaker.call(lambda: replica.execute_query_returns_all("SELECT ..."))
+    """
+
+    def __init__(self,
+                 name: str,
+                 failure_classifier: Optional[Callable[[BaseException], bool]] = None,
+                 failure_rate_threshold: float = 0.5,
+                 slow_call_seconds: Optional[float] = None,
+                 slow_call_rate_threshold: float = 1.0,
+                 window_size: int = 20,
+                 min_calls_count: int = 10,
+                 open_seconds: float = 5.0,
+                 half_open_calls_count: int = 1,
+                 health_probe: Optional[Callable[[], None]] = None) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            name (str): The name of the endpoint for the messages.
+            failure_classifier (Optional[Callable[[BaseException], bool]], optional): Decides whether the error
+                                    means the endpoint is failing. Defaults to None (every error).
+            failure_rate_threshold (float, optional): The share of the failed calls, which opens the circuit.
+                                                      Defaults to 0.5.
+            slow_call_seconds (Optional[float], optional): The duration of a slow call. Defaults to None
+                                                           (the latency is not checked).
+            slow_call_rate_threshold (float, optional): The share of the slow calls, which opens the circuit.
+                                                        Defaults to 1.0.
+            window_size (int, optional): The number of the last calls in the sliding window. Defaults to 20.
+            min_calls_count (int, optional): The min number of the calls in the window to evaluate the rates.
+                                             Defaults to 10.
+            open_seconds (float, optional): The seconds the circuit stays open. Defaults to 5.0.
+            half_open_calls_count (int, optional): The number of the concurrent trial calls,
+                                                   which must succeed to close the circuit. Defaults to 1.
+            health_probe (Optional[Callable[[], None]], optional): The cheap check of the endpoint (e.g. a ping)
+                                                                   run before each trial call. Defaults to None.
+
+        Raises:
+            ValueError: If the parameters of the breaker are invalid.
+        """
+        if not 0 < failure_rate_threshold <= 1 or not 0 < slow_call_rate_threshold <= 1:
+            raise ValueError("The thresholds of the rates must be within (0, 1]!")
+
+        if window_size <= 0 or not 0 < min_calls_count <= window_size:
+            raise ValueError("The *window_size* must be > 0 and *min_calls_count* within (0, window_size]!")
+
+        if open_seconds < 0 or half_open_calls_count <= 0:
+            raise ValueError("The *open_seconds* must be >= 0 and *half_open_calls_count* > 0!")
+
+        self.__name: str = name
+        self.__failure_classifier: Callable[[BaseException], bool] = failure_classifier or (lambda error: True)
+        self.__failure_rate_threshold: float = failure_rate_threshold
+        self.__slow_call_seconds: Optional[float] = slow_call_seconds
+        self.__slow_call_rate_threshold: float = slow_call_rate_threshold
+        self.__min_calls_count: int = min_calls_count
+        self.__open_seconds: float = open_seconds
+        self.__half_open_calls_count: int = half_open_calls_count
+        self.__health_probe: Optional[Callable[[], None]] = health_probe
+
+        self.__lock = threading.Lock()
+        self.__state: CircuitState = CircuitState.CLOSED
+        self.__opened_at: float = 0.0
+
+        # The outcomes of the last calls: (is_failed, is_slow)
+        self.__window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+
+        self.__trial_calls_count: int = 0
+        self.__succeeded_trials_count: int = 0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def state(self) -> CircuitState:
+        with self.__lock:
+            self.__update_state()
+            return self.__state
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def call(self, function: Callable[[], T]) -> T:
+        """call calls the function through the circuit.
+
+        Raises:
+            ConnectionError: If the circuit is open.
+
+        Returns:
+            T: The result of the function.
+        """
+        with self.guard():
+            return function()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """guard runs the work of the context through the circuit (e.g. a transaction).
+
+        Raises:
+            ConnectionError: If the circuit is open or the health probe of a trial call fails.
+        """
+        is_trial: bool = self.__acquire_call()
+
+        if is_trial and self.__health_probe is not None:
+            try:
+                self.__health_probe()
+
+            except Exception as error:
+                self.__record_outcome(is_trial=True, is_failed=True, is_slow=False)
+                raise ConnectionError(f"The health probe of the endpoint {self.__name!r} has failed!") from error
+
+        started_at: float = time.monotonic()
+
+        try:
+            yield
+
+        except Exception as error:
+            self.__record_outcome(is_trial=is_trial, is_failed=self.__failure_classifier(error),
+                                  is_slow=self.__is_slow(started_at=started_at))
+            raise
+
+        except BaseException:
+            # The interrupted call (e.g. `KeyboardInterrupt`) says nothing about the endpoint
+            self.__release_trial(is_trial=is_trial)
+            raise
+
+        self.__record_outcome(is_trial=is_trial, is_failed=False, is_slow=self.__is_slow(started_at=started_at))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __acquire_call(self) -> bool:
+        with self.__lock:
+            self.__update_state()
+
+            if self.__state is CircuitState.CLOSED:
+                return False
+
+            if self.__state is CircuitState.HALF_OPEN and self.__trial_calls_count < self.__half_open_calls_count:
+                self.__trial_calls_count += 1
+                return True
+
+        raise ConnectionError(f"The circuit of the endpoint {self.__name!r} is open, the call is rejected!")
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __record_outcome(self, is_trial: bool, is_failed: bool, is_slow: bool) -> None:
+        with self.__lock:
+            if is_trial:
+                # The circuit may have been opened by another trial meanwhile
+                if self.__state is not CircuitState.HALF_OPEN:
+                    return
+
+                self.__trial_calls_count -= 1
+
+                if is_failed or is_slow:
+                    self.__open()
+
+                else:
+                    self.__succeeded_trials_count += 1
+
+                    if self.__succeeded_trials_count >= self.__half_open_calls_count:
+                        self.__close()
+
+                return
+
+            # A call started before the circuit opened doesn't change its state
+            if self.__state is not CircuitState.CLOSED:
+                return
+
+            self.__window.append((is_failed, is_slow))
+
+            if len(self.__window) < self.__min_calls_count:
+                return
+
+            failed_count: int = sum(is_failed for is_failed, _ in self.__window)
+            slow_count: int = sum(is_slow for _, is_slow in self.__window)
+
+            if failed_count >= self.__failure_rate_threshold * len(self.__window) \
+                    or slow_count >= self.__slow_call_rate_threshold * len(self.__window):
+                self.__open()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __release_trial(self, is_trial: bool) -> None:
+        if is_trial:
+            with self.__lock:
+                if self.__state is CircuitState.HALF_OPEN:
+                    self.__trial_calls_count -= 1
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __update_state(self) -> None:
+        if self.__state is CircuitState.OPEN and time.monotonic() - self.__opened_at >= self.__open_seconds:
+            self.__state = CircuitState.HALF_OPEN
+            self.__trial_calls_count = 0
+            self.__succeeded_trials_count = 0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __open(self) -> None:
+        self.__state = CircuitState.OPEN
+        self.__opened_at = time.monotonic()
+        self.__window.clear()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __close(self) -> None:
+        self.__state = CircuitState.CLOSED
+        self.__window.clear()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __is_slow(self, started_at: float) -> bool:
+        return self.__slow_call_seconds is not None and time.monotonic() - started_at >= self.__slow_call_seconds
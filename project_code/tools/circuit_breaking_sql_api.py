@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `CircuitBreakingSQLAPI` class - a layer over a database endpoint,
+which passes its queries and transactions through a `CircuitBreaker`.
+
+*Relationship with other modules:
+    `circuit_breaker`: Fails the calls fast, while the endpoint is failing.
+    `sql_api_interface`: The API of the wrapped database.
+    `transaction_interface`: The transactions of the wrapped database.
+    `retrying_sql_api`: Can wrap this layer, the rejected calls (`ConnectionError`) are not retried.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'CircuitBreakingSQLAPI'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+from contextlib import contextmanager
+
+from abstract.api.sql_api_interface import SQLAPIInterface
+from abstract.api.transaction_interface import TransactionInterface
+
+from tools.circuit_breaker import CircuitBreaker
+
+from typing import Any, Dict, Iterable, Iterator
+
+
+# ______________________________________________________________________________________________________________________
+class CircuitBreakingSQLAPI(SQLAPIInterface, TransactionInterface):
+    """CircuitBreakingSQLAPI guards the queries and the transactions of the wrapped endpoint.
+
+    Example:
+        >>> replica = MySQLDataBasePool(pool_config=..., host='replica-1', connection_timeout=2)
+        >>> database = CircuitBreakingSQLAPI(database=replica, circuit_breaker=CircuitBreaker(
+        ...     name='replica-1', failure_classifier=is_mysql_endpoint_failure, health_probe=replica.check_health))
+        >>> rows = database.execute_query_returns_all("SELECT ...")  # `ConnectionError` at once, while it is down
+    """
+
+    def __init__(self, database: SQLAPIInterface, circuit_breaker: CircuitBreaker) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            database (SQLAPIInterface): The wrapped endpoint, `TransactionInterface` is required by the transactions.
+            circuit_breaker (CircuitBreaker): The breaker of the endpoint.
+        """
+        self.__database: SQLAPIInterface = database
+        self.__circuit_breaker: CircuitBreaker = circuit_breaker
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def database(self) -> SQLAPIInterface:
+        return self.__database
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        return self.__circuit_breaker
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_query_no_returns(self, sql_query: str, *query_data, **options: Any) -> None:
+        self.__circuit_breaker.call(lambda: self.__database.execute_query_no_returns(sql_query, *query_data,
+                                                                                     **options))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_query_returns_one(self, sql_query: str, *query_data, **options: Any) -> Any:
+        return self.__circuit_breaker.call(lambda: self.__database.execute_query_returns_one(sql_query, *query_data,
+                                                                                             **options))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_query_returns_all(self, sql_query: str, *query_data, **options: Any) -> Iterable[Any]:
+        return self.__circuit_breaker.call(lambda: self.__database.execute_query_returns_all(sql_query, *query_data,
+                                                                                             **options))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_query_returns_columns(self, sql_query: str, *query_data, **options: Any) -> Dict[str, Any]:
+        return self.__circuit_breaker.call(
+            lambda: self.__database.execute_query_returns_columns(sql_query, *query_data, **options)
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @contextmanager
+    def transaction(self, **options: Any) -> Iterator[Any]:
+        with self.__circuit_breaker.guard(), self.__get_transactional_database().transaction(**options) as session:
+            yield session
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @contextmanager
+    def group_commit(self, max_statements: int = 100, max_delay_ms: int = 50, **options: Any) -> Iterator[Any]:
+        with self.__circuit_breaker.guard(), \
+                self.__get_transactional_database().group_commit(max_statements=max_statements,
+                                                                 max_delay_ms=max_delay_ms,
+                                                                 **options) as session:
+            yield session
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __get_transactional_database(self) -> TransactionInterface:
+        if not isinstance(self.__database, TransactionInterface):
+            raise TypeError("The database must implement *TransactionInterface* to run transactions!")
+
+        return self.__database
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `ColumnarResultBuilder` class, which collects the rows
+of a result set into columns instead of rows.
+
+Numeric columns are stored in typed buffers: preallocated and growable `numpy` arrays,
+if `numpy` is installed, or `array.array` otherwise. Other columns are stored
+in `numpy` object arrays (or lists). The rows are decoded by chunks (e.g. per `fetchmany`),
+so no intermediate list of all rows is built.
+
+*`numpy` is an optional dependency.
+
+*Relationship with other modules:
+    `sql_api_interface`: The implementations of the API use the builder for the columnar fetch mode.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'ColumnarResultBuilder',
+    'INT_TYPECODE',
+    'UINT_TYPECODE',
+    'FLOAT_TYPECODE',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.3.0"
+
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from typing import Any, Dict, List, Optional, Sequence
+
+
+# Typecodes of `array.array` for the numeric columns, `None` is used for object columns
+INT_TYPECODE: str = 'q'
+UINT_TYPECODE: str = 'Q'
+FLOAT_TYPECODE: str = 'd'
+
+NUMPY_DTYPES: Dict[str, str] = {
+    INT_TYPECODE: 'int64',
+    UINT_TYPECODE: 'uint64',
+    FLOAT_TYPECODE: 'float64',
+}
+
+INITIAL_CAPACITY: int = 1024
+
+
+# ______________________________________________________________________________________________________________________
+class _ColumnBuffer:
+    """_ColumnBuffer growable buffer of the values of a single column.
+
+    *A numeric column with `NULL` values is switched to the object storage,
+    so `NULL` is kept as `None` instead of an arbitrary number.
+    """
+
+    def __init__(self, typecode: Optional[str], use_numpy: bool) -> None:
+        self.typecode: Optional[str] = typecode
+        self.use_numpy: bool = use_numpy
+        self.size: int = 0
+
+        if use_numpy:
+            dtype: str = NUMPY_DTYPES[typecode] if typecode is not None else 'object'
+            self.values: Any = numpy.empty(INITIAL_CAPACITY, dtype=dtype)
+
+        elif typecode is not None:
+            self.values = array(typecode)
+
+        else:
+            self.values = []
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def extend(self, values: Sequence[Any]) -> None:
+        if self.typecode is not None and None in values:
+            self.__switch_to_objects()
+
+        if not self.use_numpy:
+            self.values.extend(values)
+            self.size += len(values)
+            return
+
+        new_size: int = self.size + len(values)
+
+        if new_size > len(self.values):
+            self.__grow(min_capacity=new_size)
+
+        self.values[self.size:new_size] = values
+        self.size = new_size
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def build(self) -> Any:
+        if self.use_numpy:
+            # A copy of the used part, so the spare capacity is released
+            return self.values[:self.size].copy()
+
+        return self.values
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __grow(self, min_capacity: int) -> None:
+        capacity: int = len(self.values)
+
+        while capacity < min_capacity:
+            capacity *= 2
+
+        grown = numpy.empty(capacity, dtype=self.values.dtype)
+        grown[:self.size] = self.values[:self.size]
+
+        self.values = grown
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __switch_to_objects(self) -> None:
+        if self.use_numpy:
+            objects = numpy.empty(len(self.values), dtype='object')
+            objects[:self.size] = self.values[:self.size].tolist()
+
+            self.values = objects
+
+        else:
+            self.values = self.values.tolist()
+
+        self.typecode = None
+
+
+# ______________________________________________________________________________________________________________________
+def _make_column_keys(column_names: Sequence[str]) -> List[str]:
+    column_keys: List[str] = []
+
+    for index, column_name in enumerate(column_names):
+        key: str = column_name
+
+        # Duplicates (e.g. `id` of two joined tables) would overwrite each other in the result
+        if key in column_keys:
+            key = f"column_{index}"
+            suffix: int = 0
+
+            # The generated key must not overwrite a real column (e.g. `column_2`) or an earlier key either
+            while key in column_keys or key in column_names:
+                suffix += 1
+                key = f"column_{index}_{suffix}"
+
+        column_keys.append(key)
+
+    return column_keys
+
+
+# ______________________________________________________________________________________________________________________
+class ColumnarResultBuilder:
+    """ColumnarResultBuilder collects the rows of a result set into columns.
+
+    *Duplicate column names (e.g. `SELECT a.id, b.id ...`) are returned as `column_<index>`,
+    as the attributes of the named rows, so no column is lost.
+
+    Example:
+        >>> builder = ColumnarResultBuilder(column_names=('id', 'name'), typecodes=(INT_TYPECODE, None))
+        >>> while rows := cursor.fetchmany(10_000):
+        ...     builder.append_rows(rows)
+        >>> columns = builder.build()  # {'id': array([...]), 'name': array([...], dtype=object)}
+    """
+
+    def __init__(self,
+                 column_names: Sequence[str],
+                 typecodes: Sequence[Optional[str]],
+                 use_numpy: Optional[bool] = None) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            column_names (Sequence[str]): The column names of the result.
+            typecodes (Sequence[Optional[str]]): The typecodes of the numeric columns
+                                                 (`INT_TYPECODE`, `UINT_TYPECODE`, `FLOAT_TYPECODE`),
+                                                 `None` for other columns.
+            use_numpy (Optional[bool], optional): Whether to build `numpy` arrays. Defaults to None
+                                                  (if `numpy` is installed).
+
+        Raises:
+            ValueError: If the number of typecodes doesn't match the number of columns.
+            ImportError: If `use_numpy` is True, but `numpy` is not installed.
+        """
+        if len(column_names) != len(typecodes):
+            raise ValueError("The number of typecodes must match the number of columns!")
+
+        if use_numpy is None:
+            use_numpy = numpy is not None
+
+        elif use_numpy and numpy is None:
+            raise ImportError("The *numpy* package is required for the columns of numpy arrays!")
+
+        self.__column_names: List[str] = _make_column_keys(column_names=column_names)
+        self.__buffers: List[_ColumnBuffer] = [
+            _ColumnBuffer(typecode=typecode, use_numpy=use_numpy) for typecode in typecodes
+        ]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def append_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        """append_rows decodes a chunk of rows into the columns.
+
+        Args:
+            rows (Sequence[Sequence[Any]]): The chunk of rows, e.g. the result of `fetchmany`.
+        """
+        if not rows:
+            return
+
+        for buffer, column_values in zip(self.__buffers, zip(*rows)):
+            buffer.extend(values=column_values)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def build(self) -> Dict[str, Any]:
+        """build returns the collected columns.
+
+        Returns:
+            Dict[str, Any]: The arrays of the columns by the column names.
+        """
+        return {name: buffer.build() for name, buffer in zip(self.__column_names, self.__buffers)}
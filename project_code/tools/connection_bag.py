@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `ConnectionBag` class - the store of the idle connections of a pool,
+which lends and takes back the connections without a shared lock.
+
+Every item has its own claim (a non-blocking lock), so taking an item is a single try of its claim.
+A returned item is pushed to the shared queue and to the cache of the returning thread, which takes
+its own recently used (warm) items first. The threads don't wait on a common lock on the fast path,
+the other threads still see all free items in the shared queue, so no item is hidden in a cache.
+
+*The waiting for an item, when the bag is empty, is left to the pool, which also limits the number of the items.
+
+*Relationship with other modules:
+    `mysql_database_pool`: Keeps its idle connections in the bag.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'ConnectionBag'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import itertools
+import threading
+
+from collections import deque
+
+from typing import Callable, Deque, Dict, Generic, Iterator, List, Optional, TypeVar
+
+
+T = TypeVar('T')
+
+
+# ______________________________________________________________________________________________________________________
+class _BagEntry(Generic[T]):
+    __slots__ = ('item', 'claim', 'is_queued', 'is_removed', 'released_order')
+
+    def __init__(self, item: T) -> None:
+        self.item: T = item
+
+        # The entry is created for a leased item, so its claim is taken
+        self.claim = threading.Lock()
+        self.claim.acquire()
+
+        self.is_queued: bool = False
+        self.is_removed: bool = False
+        self.released_order: int = 0
+
+
+# ______________________________________________________________________________________________________________________
+class ConnectionBag(Generic[T]):
+    """ConnectionBag the idle items of a pool with the per-thread caches and a shared queue.
+
+    Example:
+        >>> bag = ConnectionBag(local_cache_size=2)
+        >>> bag.put(session)          # a new or a returned item
+        >>> bag.poll() is session     # the most recently returned item of the thread first
+        True
+        >>> bag.poll() is None        # no free item, the pool creates a new one or waits
+        True
+    """
+
+    def __init__(self, local_cache_size: int = 2) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            local_cache_size (int, optional): The max number of the items cached by a thread. Defaults to 2.
+
+        Raises:
+            ValueError: If the size of the cache is < 0.
+        """
+        if not isinstance(local_cache_size, int) or local_cache_size < 0:
+            raise ValueError("The *local_cache_size* must be an int >= 0!")
+
+        self.__local_cache_size: int = local_cache_size
+
+        # The operations of `deque`, `dict` and `itertools.count` are atomic, the entries are guarded by their claims
+        self.__entries: Dict[int, _BagEntry[T]] = {}
+        self.__shared_queue: Deque[_BagEntry[T]] = deque()
+        self.__released_orders: Iterator[int] = itertools.count()
+        self.__local = threading.local()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def idle_count(self) -> int:
+        """idle_count the number of the free items (a snapshot)."""
+        return self.count_idle()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def count_idle(self, predicate: Optional[Callable[[T], bool]] = None) -> int:
+        """count_idle counts the free items (a snapshot).
+
+        Args:
+            predicate (Optional[Callable[[T], bool]], optional): Selects the items. Defaults to None (every item).
+
+        Returns:
+            int: The number of the selected free items.
+        """
+        return sum(not entry.claim.locked() and (predicate is None or predicate(entry.item))
+                   for entry in list(self.__entries.values()))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def poll(self) -> Optional[T]:
+        """poll takes a free item without waiting.
+
+        Returns:
+            Optional[T]: The most recently returned free item (of this thread first), None if there is no free item.
+        """
+        local_entries: List[_BagEntry[T]] = self.__get_local_entries()
+
+        while local_entries:
+            entry: _BagEntry[T] = local_entries.pop()
+
+            if self.__try_claim(entry=entry):
+                return entry.item
+
+        while True:
+            try:
+                entry = self.__shared_queue.pop()
+
+            except IndexError:
+                return None
+
+            entry.is_queued = False
+
+            if self.__try_claim(entry=entry):
+                return entry.item
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def put(self, item: T) -> None:
+        """put returns the taken item (or adds a new one) to the bag as a free item.
+
+        Args:
+            item (T): The item taken by `poll` or a new item.
+        """
+        entry: Optional[_BagEntry[T]] = self.__entries.get(id(item))
+
+        if entry is None:
+            entry = self.__entries.setdefault(id(item), _BagEntry(item=item))
+
+        entry.released_order = next(self.__released_orders)
+        entry.claim.release()
+
+        local_entries: List[_BagEntry[T]] = self.__get_local_entries()
+
+        if self.__local_cache_size:
+            if len(local_entries) >= self.__local_cache_size:
+                del local_entries[0]
+
+            local_entries.append(entry)
+
+        # A free entry stays in the shared queue, so the other threads can take it from the cache of this thread
+        if not entry.is_queued:
+            entry.is_queued = True
+            self.__shared_queue.append(entry)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def remove(self, item: T) -> None:
+        """remove forgets the taken item (e.g. its connection is closed).
+
+        Args:
+            item (T): The item taken by `poll`.
+        """
+        entry: Optional[_BagEntry[T]] = self.__entries.pop(id(item), None)
+
+        if entry is not None:
+            entry.is_removed = True
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def drain(self, predicate: Optional[Callable[[T], bool]] = None, limit: Optional[int] = None) -> List[T]:
+        """drain takes the free items out of the bag, the least recently returned ones first.
+
+        Args:
+            predicate (Optional[Callable[[T], bool]], optional): Selects the items. Defaults to None (every item).
+            limit (Optional[int], optional): The max number of the items. Defaults to None (no limit).
+
+        Returns:
+            List[T]: The items, which are removed from the bag.
+        """
+        entries: List[_BagEntry[T]] = sorted((entry for entry in list(self.__entries.values())
+                                              if not entry.claim.locked()),
+                                             key=lambda entry: entry.released_order)
+        items: List[T] = []
+
+        for entry in entries:
+            if limit is not None and len(items) >= limit:
+                break
+
+            if (predicate is None or predicate(entry.item)) and self.__try_claim(entry=entry):
+                self.remove(item=entry.item)
+                items.append(entry.item)
+
+        return items
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __get_local_entries(self) -> List[_BagEntry[T]]:
+        try:
+            return self.__local.entries
+
+        except AttributeError:
+            self.__local.entries = []
+            return self.__local.entries
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __try_claim(entry: _BagEntry[T]) -> bool:
+        if not entry.claim.acquire(blocking=False):
+            return False
+
+        # The removed entry may still be referenced by a cache or the queue, its claim is kept
+        return not entry.is_removed
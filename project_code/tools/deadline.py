@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `Deadline` class - the end-to-end time budget of a request,
+which is shared by all its steps (waiting for a pooled connection, executing the query).
+
+*Relationship with other modules:
+    `mysql_database_pool`: Limits the waiting for a connection by the deadline.
+    `mysql_database_single`: Limits the execution of the statements by the remaining time.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'Deadline'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import time
+
+from dataclasses import dataclass
+
+from typing import Optional
+
+
+# ______________________________________________________________________________________________________________________
+@dataclass(frozen=True)
+class Deadline:
+    """Deadline the moment (`time.monotonic()`), after which the work of a request is useless.
+
+    Example:
+        >>> deadline = Deadline.after(seconds=0.3)  # the timeout of the upstream gateway
+        >>> database.execute_query_returns_all("SELECT ...", deadline=deadline)
+
+    Attributes:
+        expires_at (float): The moment of the deadline on the `time.monotonic()` clock.
+    """
+    expires_at: float
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @classmethod
+    def after(cls, seconds: float) -> 'Deadline':
+        """after creates the deadline in `seconds` from now."""
+        return cls(expires_at=time.monotonic() + seconds)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def remaining(self) -> float:
+        """remaining the seconds left until the deadline, 0.0 if it has passed."""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def is_expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def check(self, operation: str = "The operation") -> float:
+        """check makes sure the deadline hasn't passed before starting the operation.
+
+        Args:
+            operation (str, optional): The name of the operation for the message. Defaults to "The operation".
+
+        Raises:
+            TimeoutError: If the deadline has passed.
+
+        Returns:
+            float: The remaining seconds.
+        """
+        remaining: float = self.expires_at - time.monotonic()
+
+        if remaining <= 0:
+            raise TimeoutError(f"{operation} is skipped, its deadline has passed!")
+
+        return remaining
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def limit_timeout(self, timeout: Optional[float]) -> float:
+        """limit_timeout returns the timeout shrunk to the remaining time.
+
+        Args:
+            timeout (Optional[float]): The timeout of the operation, `None` - no own timeout.
+
+        Raises:
+            TimeoutError: If the deadline has passed.
+
+        Returns:
+            float: The smaller of `timeout` and the remaining seconds.
+        """
+        remaining: float = self.check()
+
+        return remaining if timeout is None else min(timeout, remaining)
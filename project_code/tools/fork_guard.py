@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the registry of the objects, which must forget their inherited
+connections in a child process after `os.fork()` (e.g. gunicorn with `--preload`).
+
+A connection opened before a fork is shared by the parent and the child processes.
+If both use it, the protocol streams are mixed up; if the child closes it properly
+(`COM_QUIT`, `shutdown()`), the connection of the parent is broken too.
+So the child must only drop its copy of the socket and connect again when it is needed.
+
+*The callbacks are run by `os.register_at_fork(after_in_child=...)`, the registry
+keeps weak references, so a registered object is still collected as usual.
+
+*Relationship with other modules:
+    `mysql_database_single`: Drops the inherited connection in the child process.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'register_after_fork_in_child',
+    'unregister_after_fork_in_child',
+    'drop_inherited_socket',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import os
+import socket
+import weakref
+
+from typing import Any, Callable, Optional
+
+
+_after_fork_callbacks: 'weakref.WeakKeyDictionary[Any, Callable[[Any], None]]' = weakref.WeakKeyDictionary()
+
+
+# ______________________________________________________________________________________________________________________
+def register_after_fork_in_child(owner: Any, callback: Callable[[Any], None]) -> None:
+    """register_after_fork_in_child registers the callback, which is called with `owner` in a forked child.
+
+    *The callback must not keep a strong reference to `owner` (e.g. it should be an unbound method),
+    otherwise the owner is never collected.
+
+    Args:
+        owner (Any): The object, which holds the connections.
+        callback (Callable[[Any], None]): The function, which drops the inherited connections of `owner`.
+    """
+    _after_fork_callbacks[owner] = callback
+
+
+# ______________________________________________________________________________________________________________________
+def unregister_after_fork_in_child(owner: Any) -> None:
+    _after_fork_callbacks.pop(owner, None)
+
+
+# ______________________________________________________________________________________________________________________
+def drop_inherited_socket(sock: Optional[socket.socket]) -> None:
+    """drop_inherited_socket closes the descriptor of the socket in this process only.
+
+    `close()` without `shutdown()` releases only the copy of the descriptor,
+    so the connection of the parent process stays usable.
+
+    Args:
+        sock (Optional[socket.socket]): The inherited socket.
+    """
+    if sock is None:
+        return
+
+    try:
+        sock.close()
+    except OSError:
+        pass
+
+
+# ______________________________________________________________________________________________________________________
+def _run_after_fork_in_child() -> None:
+    for owner, callback in list(_after_fork_callbacks.items()):
+        callback(owner)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_run_after_fork_in_child)
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `KeysetPaginator` class - a lazy iterator over all rows of a table
+in the order of its key, built on keyset pagination.
+
+Every page is read by `WHERE key > last_key ORDER BY key LIMIT n`, so the cost of a page
+doesn't depend on how far the scan went, unlike `LIMIT n OFFSET m`.
+
+*Relationship with other modules:
+    `sql_api_interface`: The pages are read through `execute_query_returns_all` of the API.
+    `sql_statement_builder`: Checks and quotes the identifiers of the statements.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'KeysetPaginator'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.1"
+
+import time
+
+from abstract.api.sql_api_interface import SQLAPIInterface
+from tools.sql_statement_builder import quote_identifier
+
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+
+# ______________________________________________________________________________________________________________________
+class KeysetPaginator:
+    """KeysetPaginator lazy iterator over the rows of a table in the order of its key.
+
+    The size of the page is adapted to `target_page_seconds`: it grows while the pages are read
+    faster than the target and shrinks when they are slower, within `min_page_size` and `max_page_size`.
+
+    The position of the scan is available as `checkpoint` (the key of the last yielded row).
+    A scan can be resumed by passing the saved checkpoint as `start_after` to a new paginator.
+
+    Example:
+        >>> paginator = KeysetPaginator(database, table_name='events', key_column_names=('id',))
+        >>> for row in paginator:
+        ...     process(row)
+        ...     save_checkpoint(paginator.checkpoint)
+
+    *The key must be unique (e.g. the primary key), otherwise rows with the same key
+    on the border of the pages are skipped.
+    *The rows must contain the key columns. The key is read from the rows by name (`dict` rows, attributes)
+    or by position of the key columns in `column_names` (tuple rows), unless `key_getter` is given.
+    """
+
+    def __init__(self,
+                 database: SQLAPIInterface,
+                 table_name: str,
+                 key_column_names: Sequence[str],
+                 column_names: Optional[Sequence[str]] = None,
+                 where_clause: Optional[str] = None,
+                 where_data: Sequence[Any] = (),
+                 start_after: Optional[Sequence[Any]] = None,
+                 page_size: int = 1000,
+                 min_page_size: int = 100,
+                 max_page_size: int = 50_000,
+                 target_page_seconds: float = 0.5,
+                 key_getter: Optional[Callable[[Any], Tuple[Any, ...]]] = None,
+                 quote_char: str = '`') -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            database (SQLAPIInterface): The API used to read the pages.
+            table_name (str): The name of the scanned table.
+            key_column_names (Sequence[str]): The names of the columns of the unique key (the order of the scan).
+            column_names (Optional[Sequence[str]], optional): The names of the read columns. Defaults to None (all).
+            where_clause (Optional[str], optional): The extra condition of the rows, e.g. `kind = %s`.
+                                                    Defaults to None.
+            where_data (Sequence[Any], optional): The parameters of `where_clause`. Defaults to ().
+            start_after (Optional[Sequence[Any]], optional): The checkpoint to resume from. Defaults to None.
+            page_size (int, optional): The initial size of the page. Defaults to 1000.
+            min_page_size (int, optional): The min size of the page. Defaults to 100.
+            max_page_size (int, optional): The max size of the page. Defaults to 50000.
+            target_page_seconds (float, optional): The desired time of reading a page. Defaults to 0.5.
+            key_getter (Optional[Callable[[Any], Tuple[Any, ...]]], optional): The function,
+                                                                             which returns the key of a row.
+                                                                             Defaults to None.
+            quote_char (str, optional): The quote character of the SQL dialect. Defaults to '`'.
+
+        Raises:
+            ValueError: If there are no key columns, the page sizes are inconsistent,
+                        or `start_after` doesn't match the key columns.
+        """
+        if not key_column_names:
+            raise ValueError("The key of the scan must have at least one column!")
+
+        if not 0 < min_page_size <= page_size <= max_page_size:
+            raise ValueError("The page sizes must satisfy: 0 < *min_page_size* <= *page_size* <= *max_page_size*!")
+
+        if start_after is not None and len(start_after) != len(key_column_names):
+            raise ValueError("The checkpoint must have a value for every key column!")
+
+        self.__database: SQLAPIInterface = database
+        self.__key_column_names: Tuple[str, ...] = tuple(key_column_names)
+        self.__column_names: Optional[Tuple[str, ...]] = None if column_names is None else tuple(column_names)
+        self.__where_data: Tuple[Any, ...] = tuple(where_data)
+
+        self.__page_size: int = page_size
+        self.__min_page_size: int = min_page_size
+        self.__max_page_size: int = max_page_size
+        self.__target_page_seconds: float = target_page_seconds
+
+        self.__checkpoint: Optional[Tuple[Any, ...]] = None if start_after is None else tuple(start_after)
+
+        # The key of the last read row, the next page is read after it
+        self.__read_position: Optional[Tuple[Any, ...]] = self.__checkpoint
+        self.__key_getter: Callable[[Any], Tuple[Any, ...]] = key_getter or self.__get_key_of_row
+
+        self.__first_page_query, self.__next_page_query = self.__build_page_queries(table_name=table_name,
+                                                                                    where_clause=where_clause,
+                                                                                    quote_char=quote_char)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def checkpoint(self) -> Optional[Tuple[Any, ...]]:
+        return self.__checkpoint
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def page_size(self) -> int:
+        return self.__page_size
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __iter__(self) -> Iterator[Any]:
+        for page in self.__iterate_read_pages():
+            for row in page:
+                # The checkpoint follows the yielded rows, so a scan stopped within a page resumes after its last row
+                self.__checkpoint = tuple(self.__key_getter(row))
+
+                yield row
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def iterate_pages(self) -> Iterator[List[Any]]:
+        """iterate_pages yields the rows page by page.
+
+        *`checkpoint` is moved to the end of a page when the page is yielded.
+
+        Yields:
+            Iterator[List[Any]]: The rows of the next page.
+        """
+        for page in self.__iterate_read_pages():
+            self.__checkpoint = self.__read_position
+
+            yield page
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __iterate_read_pages(self) -> Iterator[List[Any]]:
+        while True:
+            page_size: int = self.__page_size
+            started_at: float = time.monotonic()
+
+            rows: List[Any] = self.__read_page(page_size=page_size)
+
+            self.__adapt_page_size(page_seconds=time.monotonic() - started_at, rows_count=len(rows))
+
+            if not rows:
+                return
+
+            self.__read_position = tuple(self.__key_getter(rows[-1]))
+
+            yield rows
+
+            if len(rows) < page_size:
+                return
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __read_page(self, page_size: int) -> List[Any]:
+        if self.__read_position is None:
+            rows = self.__database.execute_query_returns_all(self.__first_page_query, *self.__where_data, page_size)
+
+        else:
+            rows = self.__database.execute_query_returns_all(self.__next_page_query,
+                                                             *self.__read_position, *self.__where_data, page_size)
+
+        return list(rows or ())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __adapt_page_size(self, page_seconds: float, rows_count: int) -> None:
+        # A short page (the end of the table) says nothing about the speed
+        if rows_count < self.__page_size:
+            return
+
+        if page_seconds < self.__target_page_seconds / 2:
+            self.__page_size = min(self.__page_size * 2, self.__max_page_size)
+
+        elif page_seconds > self.__target_page_seconds:
+            self.__page_size = max(self.__page_size // 2, self.__min_page_size)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __get_key_of_row(self, row: Any) -> Tuple[Any, ...]:
+        if isinstance(row, dict):
+            return tuple(row[name] for name in self.__key_column_names)
+
+        if isinstance(row, (tuple, list)):
+            if self.__column_names is None:
+                raise ValueError("The key of a tuple row can be found only with explicit *column_names*!")
+
+            return tuple(row[self.__column_names.index(name)] for name in self.__key_column_names)
+
+        return tuple(getattr(row, name) for name in self.__key_column_names)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __build_page_queries(self,
+                             table_name: str,
+                             where_clause: Optional[str],
+                             quote_char: str) -> Tuple[str, str]:
+        def quote(identifier: str) -> str:
+            return quote_identifier(identifier=identifier, quote_char=quote_char)
+
+        quoted_keys: List[str] = [quote(name) for name in self.__key_column_names]
+
+        if self.__column_names is None:
+            selected_columns: str = '*'
+        else:
+            selected_columns = ', '.join(quote(name) for name in self.__column_names)
+
+        # Row constructor comparison `(a, b) > (%s, %s)` keeps the order of a composite key
+        if len(quoted_keys) == 1:
+            key_condition: str = f"{quoted_keys[0]} > %s"
+        else:
+            key_condition = f"({', '.join(quoted_keys)}) > ({', '.join(['%s'] * len(quoted_keys))})"
+
+        extra_condition: str = f"({where_clause})" if where_clause else ''
+
+        first_page_conditions: List[str] = [extra_condition] if extra_condition else []
+        next_page_conditions: List[str] = [key_condition] + first_page_conditions
+
+        base_query: str = f"SELECT {selected_columns} FROM {quote(table_name)}"
+        order_clause: str = f" ORDER BY {', '.join(quoted_keys)} LIMIT %s"
+
+        first_page_query: str = base_query + (
+            f" WHERE {' AND '.join(first_page_conditions)}" if first_page_conditions else ''
+        ) + order_clause
+
+        next_page_query: str = base_query + f" WHERE {' AND '.join(next_page_conditions)}" + order_clause
+
+        return first_page_query, next_page_query
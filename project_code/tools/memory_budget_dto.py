@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module defines a `MemoryBudgetDTO` class representing a data transfer object (DTO)
+for limiting the memory used by the rows of a fetched result.
+
+*Relationship with other modules:
+    `spilled_rows`: Spills the rows over the budget to a temporary file.
+    `sql_api_interface`: The implementations of the API use the budget for fetching the results.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'MemoryBudgetDTO'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+from dataclasses import dataclass
+
+from typing import Optional
+
+
+# ______________________________________________________________________________________________________________________
+@dataclass(frozen=True)
+class MemoryBudgetDTO:
+    """MemoryBudgetDTO represents a frozen data transfer object (DTO) for the memory budget of a result.
+
+    The rows are kept in memory while both limits are respected, then all rows are spilled
+    to a temporary file and read back through a memory-mapped sequence.
+
+    *The size of the rows is estimated by `sys.getsizeof` of the rows and their values.
+    *The limits are checked per row, but a fetched chunk of `chunk_size` rows is held in memory while it is added,
+    so the memory may exceed the budget by up to one chunk. Keep `chunk_size` well below the limits.
+
+    Attributes:
+        max_rows (Optional[int]): The max number of rows kept in memory, `None` - no limit.
+        max_bytes (Optional[int]): The max estimated size of the rows kept in memory, `None` - no limit.
+        chunk_size (int): The number of rows fetched from the server at once.
+    """
+    max_rows: Optional[int] = None
+    max_bytes: Optional[int] = None
+    chunk_size: int = 10_000
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __post_init__(self) -> None:
+        """__post_init__ post-initialization to validate this class."""
+        for field_name in ('max_rows', 'max_bytes'):
+            value: Optional[int] = getattr(self, field_name)
+
+            if value is not None and (not isinstance(value, int) or value < 0):
+                raise ValueError(f"The *{field_name}* field of memory budget must be an int >= 0 or None!")
+
+        if not isinstance(self.chunk_size, int) or self.chunk_size <= 0:
+            raise ValueError("The *chunk_size* field of memory budget must be an int > 0!")
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `ParallelTableExporter` class, which exports a table into files
+by ranges of its integer primary key, read in parallel by worker processes.
+
+Every worker process builds its own database instance by `database_factory` (by default from the class
+and `dbconfig` of the parent instance), so decoding of the rows is not limited by the GIL of a single process.
+Each range is read by keyset pages and streamed into its own file (CSV or JSON Lines).
+
+*Relationship with other modules:
+    `sql_database`: By default, the workers build their database instances from the class and `dbconfig`
+                    of the parent.
+    `row_factory`: The workers read the rows in a fixed format, whatever the default format of the database is.
+    `sql_api_interface`: The bounds of the key and the rows are read through the API.
+    `keyset_paginator`: Reads the rows of a range page by page.
+    `table_export_result_dto`: The result of the export.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'ExportFormat',
+    'ParallelTableExporter',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import csv
+import json
+import multiprocessing
+import os
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial
+
+from abstract.api.sql_api_interface import SQLAPIInterface
+from abstract.database.connection_interface import PoolConnectionInterface, SingleConnectionInterface
+from abstract.database.sql_database import SQLDataBase
+from tools.keyset_paginator import KeysetPaginator
+from tools.row_factory import RowFormat
+from tools.sql_statement_builder import quote_identifier, validate_identifier
+from tools.table_export_result_dto import TableExportResultDTO
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# ______________________________________________________________________________________________________________________
+class ExportFormat(Enum):
+    """ExportFormat formats of the exported files.
+
+    Attributes:
+        CSV: Comma-separated values with a header row.
+        JSONL: A JSON object per line (JSON Lines).
+    """
+    CSV = 'csv'
+    JSONL = 'jsonl'
+
+
+# ______________________________________________________________________________________________________________________
+@dataclass(frozen=True)
+class _RangeExportTask:
+    """_RangeExportTask picklable description of the range exported by a worker process.
+
+    *The range is half-open: `lower_key <= key < upper_key`.
+    """
+    database_factory: Callable[[], Any]
+    table_name: str
+    key_column_name: str
+    column_names: Optional[Tuple[str, ...]]
+    lower_key: int
+    upper_key: int
+    file_path: str
+    export_format: ExportFormat
+    page_size: int
+    quote_char: str
+
+
+# ______________________________________________________________________________________________________________________
+def _row_to_mapping(row: Any, column_names: Optional[Sequence[str]]) -> Dict[str, Any]:
+    if isinstance(row, dict):
+        return row
+
+    if hasattr(row, '_asdict'):
+        return row._asdict()
+
+    if column_names is None:
+        raise ValueError("The names of the exported tuple rows can be found only with explicit *column_names*!")
+
+    return dict(zip(column_names, row))
+
+
+# ______________________________________________________________________________________________________________________
+def _export_range(task: _RangeExportTask) -> TableExportResultDTO:
+    """_export_range exports a range of the table into its file, it is executed by a worker process."""
+    started_at: float = time.monotonic()
+
+    database: Any = task.database_factory()
+
+    # The writers need the names of the columns, the tuple rows are named by the explicit `column_names`
+    if hasattr(database, 'default_row_format'):
+        database.default_row_format = RowFormat.DICT if task.column_names is None else RowFormat.TUPLE
+
+    quoted_key: str = quote_identifier(identifier=task.key_column_name, quote_char=task.quote_char)
+
+    paginator = KeysetPaginator(database=database,
+                                table_name=task.table_name,
+                                key_column_names=(task.key_column_name,),
+                                column_names=task.column_names,
+                                where_clause=f"{quoted_key} >= %s AND {quoted_key} < %s",
+                                where_data=(task.lower_key, task.upper_key),
+                                page_size=task.page_size,
+                                min_page_size=task.page_size,
+                                max_page_size=task.page_size,
+                                quote_char=task.quote_char)
+
+    rows_count: int = 0
+
+    try:
+        with open(task.file_path, 'w', encoding='utf-8', newline='') as file:
+            if task.export_format is ExportFormat.CSV:
+                rows_count = _write_csv(file=file, pages=paginator.iterate_pages(), column_names=task.column_names)
+
+            else:
+                rows_count = _write_jsonl(file=file, pages=paginator.iterate_pages(), column_names=task.column_names)
+
+    finally:
+        if isinstance(database, SingleConnectionInterface):
+            database.close_active_connection_with_database()
+
+    return TableExportResultDTO(rows_count=rows_count,
+                                bytes_count=os.path.getsize(task.file_path),
+                                seconds=time.monotonic() - started_at,
+                                file_paths=(task.file_path,))
+
+
+# ______________________________________________________________________________________________________________________
+def _write_csv(file: Any, pages: Any, column_names: Optional[Sequence[str]]) -> int:
+    writer = csv.writer(file)
+    rows_count: int = 0
+
+    for page in pages:
+        if not rows_count:
+            header: Sequence[str] = column_names or list(_row_to_mapping(row=page[0], column_names=None))
+            writer.writerow(header)
+
+        writer.writerows(row.values() if isinstance(row, dict) else row for row in page)
+        rows_count += len(page)
+
+    return rows_count
+
+
+# ______________________________________________________________________________________________________________________
+def _write_jsonl(file: Any, pages: Any, column_names: Optional[Sequence[str]]) -> int:
+    rows_count: int = 0
+
+    for page in pages:
+        file.writelines(
+            json.dumps(_row_to_mapping(row=row, column_names=column_names), default=str) + '\n' for row in page
+        )
+        rows_count += len(page)
+
+    return rows_count
+
+
+# ______________________________________________________________________________________________________________________
+class ParallelTableExporter:
+    """ParallelTableExporter exports a table into files by ranges of its primary key in worker processes.
+
+    The range `[MIN(key), MAX(key)]` is split into `ranges_count` equal ranges, which are exported
+    into the files `<table_name>.<index>.<format>` of `output_directory`. There are more ranges
+    than workers by default, so a worker with a sparse range takes the next one.
+
+    Example:
+        >>> exporter = ParallelTableExporter(database, table_name='events', key_column_name='id',
+        ...                                  output_directory='/tmp/events', workers_count=8)
+        >>> result = exporter.export()
+        >>> result.rows_per_second
+
+    *The key must be a unique integer column (e.g. `AUTO_INCREMENT` primary key).
+    *The workers build their own instances by `database_factory`, it must be picklable (e.g. a module-level
+    function or `functools.partial` of an importable class). By default, it is `type(database)(**database.dbconfig)`,
+    so the settings of `database`, which are not a part of `dbconfig`, are not applied in the workers.
+    A pool can't be built from `dbconfig` alone, so it requires the factory.
+    *The workers are started with the `spawn` method by default, so they don't inherit
+    the connections of the parent process.
+    """
+
+    def __init__(self,
+                 database: SQLDataBase,
+                 table_name: str,
+                 key_column_name: str,
+                 output_directory: str,
+                 column_names: Optional[Sequence[str]] = None,
+                 export_format: ExportFormat = ExportFormat.CSV,
+                 workers_count: Optional[int] = None,
+                 ranges_count: Optional[int] = None,
+                 page_size: int = 10_000,
+                 start_method: str = 'spawn',
+                 quote_char: str = '`',
+                 database_factory: Optional[Callable[[], SQLAPIInterface]] = None) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            database (SQLDataBase): The database, which implements `SQLAPIInterface`.
+            table_name (str): The name of the exported table.
+            key_column_name (str): The name of the unique integer key column.
+            output_directory (str): The directory of the files, it is created if needed.
+            column_names (Optional[Sequence[str]], optional): The names of the exported columns.
+                                                              Defaults to None (all).
+            export_format (ExportFormat, optional): The format of the files. Defaults to ExportFormat.CSV.
+            workers_count (Optional[int], optional): The number of worker processes. Defaults to None (CPU count).
+            ranges_count (Optional[int], optional): The number of key ranges. Defaults to None (4 per worker).
+            page_size (int, optional): The number of rows read by a query of a worker. Defaults to 10000.
+            start_method (str, optional): The start method of the worker processes. Defaults to 'spawn'.
+            quote_char (str, optional): The quote character of the SQL dialect. Defaults to '`'.
+            database_factory (Optional[Callable[[], SQLAPIInterface]], optional): The picklable function,
+                                                                                  which builds the database
+                                                                                  of a worker. Defaults to None
+                                                                                  (the class and `dbconfig`
+                                                                                  of `database`).
+
+        Raises:
+            TypeError: If `database` doesn't implement `SQLAPIInterface`
+                       or it is a pool and `database_factory` isn't given.
+            ValueError: If the numbers of workers, ranges or the page size are not positive.
+        """
+        if not isinstance(database, SQLAPIInterface):
+            raise TypeError("The exported database must implement *SQLAPIInterface*!")
+
+        if database_factory is None:
+            if isinstance(database, PoolConnectionInterface):
+                raise TypeError("A pool can't be built from its *dbconfig* alone, pass *database_factory*!")
+
+            database_factory = partial(type(database), **database.dbconfig)
+
+        workers_count = workers_count or os.cpu_count() or 1
+        ranges_count = ranges_count or workers_count * 4
+
+        if workers_count <= 0 or ranges_count <= 0 or page_size <= 0:
+            raise ValueError("The *workers_count*, *ranges_count* and *page_size* values must be > 0!")
+
+        self.__database: SQLDataBase = database
+        self.__table_name: str = validate_identifier(identifier=table_name)
+        self.__key_column_name: str = validate_identifier(identifier=key_column_name)
+        self.__column_names: Optional[Tuple[str, ...]] = None if column_names is None else tuple(column_names)
+        self.__output_directory: str = output_directory
+        self.__export_format: ExportFormat = export_format
+        self.__workers_count: int = workers_count
+        self.__ranges_count: int = ranges_count
+        self.__page_size: int = page_size
+        self.__start_method: str = start_method
+        self.__quote_char: str = quote_char
+        self.__database_factory: Callable[[], SQLAPIInterface] = database_factory
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def export(self,
+               progress_callback: Optional[Callable[[TableExportResultDTO], None]] = None) -> TableExportResultDTO:
+        """export exports the table and waits for all ranges.
+
+        Args:
+            progress_callback (Optional[Callable[[TableExportResultDTO], None]], optional):
+                The function called in the parent process with the result of every finished range.
+                Defaults to None.
+
+        Returns:
+            TableExportResultDTO: The aggregated result, its time is the wall time of the export,
+                                  so `rows_per_second` is the throughput of all workers.
+        """
+        started_at: float = time.monotonic()
+
+        os.makedirs(self.__output_directory, exist_ok=True)
+
+        tasks: List[_RangeExportTask] = self.__build_range_tasks()
+        result = TableExportResultDTO()
+
+        if tasks:
+            with ProcessPoolExecutor(max_workers=min(self.__workers_count, len(tasks)),
+                                     mp_context=multiprocessing.get_context(self.__start_method)) as executor:
+                # `map` keeps the order of the ranges, so the files are listed in the order of the key
+                for range_result in executor.map(_export_range, tasks):
+                    result += range_result
+
+                    if progress_callback is not None:
+                        progress_callback(range_result)
+
+        return TableExportResultDTO(rows_count=result.rows_count,
+                                    bytes_count=result.bytes_count,
+                                    seconds=time.monotonic() - started_at,
+                                    file_paths=result.file_paths)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __build_range_tasks(self) -> List[_RangeExportTask]:
+        min_key, max_key = self.__get_key_bounds()
+
+        if min_key is None:
+            return []
+
+        ranges_count: int = min(self.__ranges_count, max_key - min_key + 1)
+        range_size: int = -(-(max_key - min_key + 1) // ranges_count)
+
+        tasks: List[_RangeExportTask] = []
+
+        for index, lower_key in enumerate(range(min_key, max_key + 1, range_size)):
+            file_name: str = f"{self.__table_name}.{index:05d}.{self.__export_format.value}"
+
+            tasks.append(_RangeExportTask(database_factory=self.__database_factory,
+                                          table_name=self.__table_name,
+                                          key_column_name=self.__key_column_name,
+                                          column_names=self.__column_names,
+                                          lower_key=lower_key,
+                                          upper_key=min(lower_key + range_size, max_key + 1),
+                                          file_path=os.path.join(self.__output_directory, file_name),
+                                          export_format=self.__export_format,
+                                          page_size=self.__page_size,
+                                          quote_char=self.__quote_char))
+
+        return tasks
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __get_key_bounds(self) -> Tuple[Optional[int], Optional[int]]:
+        quoted_key: str = quote_identifier(identifier=self.__key_column_name, quote_char=self.__quote_char)
+        quoted_table: str = quote_identifier(identifier=self.__table_name, quote_char=self.__quote_char)
+
+        row: Any = self.__database.execute_query_returns_one(  # type: ignore[attr-defined]
+            f"SELECT MIN({quoted_key}) AS min_key, MAX({quoted_key}) AS max_key FROM {quoted_table}"
+        )
+
+        if row is None:
+            return None, None
+
+        min_key, max_key = tuple(row.values()) if isinstance(row, dict) else tuple(row)
+
+        if min_key is None:
+            return None, None
+
+        return int(min_key), int(max_key)
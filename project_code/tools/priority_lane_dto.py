@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module defines a `PriorityLaneDTO` class representing a data transfer object (DTO)
+for a priority class of the work admitted to a connection pool.
+
+*Relationship with other modules:
+    `admission_controller`: Admits the work of the lanes by their priority, reservations and queue limits.
+    `mysql_database_pool`: The lanes of the pool are passed to its admission controller.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'PriorityLaneDTO'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+from dataclasses import dataclass
+
+from typing import Optional
+
+
+# ______________________________________________________________________________________________________________________
+@dataclass(frozen=True)
+class PriorityLaneDTO:
+    """PriorityLaneDTO represents a frozen data transfer object (DTO) for a priority lane (e.g. interactive, batch).
+
+    *The priority of a lane is its position in the sequence of lanes, the first lane is the most important.
+
+    Attributes:
+        name (str): The name of the lane.
+        reserved_connections (int): The number of connections, which can't be taken by the other lanes.
+        max_queue_length (Optional[int]): The max number of waiting requests, `None` - no limit.
+        target_queue_latency (Optional[float]): The seconds the oldest request may wait before
+                                                the new requests are shed, `None` - no shedding.
+    """
+    name: str
+    reserved_connections: int = 0
+    max_queue_length: Optional[int] = None
+    target_queue_latency: Optional[float] = None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __post_init__(self) -> None:
+        """__post_init__ post-initialization to validate this class."""
+        if not isinstance(self.name, str) or not self.name.strip():
+            raise ValueError("The *name* field of priority lane must be a non-empty string!")
+
+        if not isinstance(self.reserved_connections, int) or self.reserved_connections < 0:
+            raise ValueError("The *reserved_connections* field of priority lane must be an int >= 0!")
+
+        if self.max_queue_length is not None and (not isinstance(self.max_queue_length, int)
+                                                  or self.max_queue_length < 0):
+            raise ValueError("The *max_queue_length* field of priority lane must be an int >= 0 or None!")
+
+        if self.target_queue_latency is not None and self.target_queue_latency <= 0:
+            raise ValueError("The *target_queue_latency* field of priority lane must be > 0 or None!")
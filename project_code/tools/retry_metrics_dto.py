@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module defines a `RetryMetricsDTO` class representing a data transfer object (DTO)
+for the counters of the calls retried by a retry policy.
+
+*Relationship with other modules:
+    `retry_policy`: Collects the counters and returns their snapshot.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'RetryMetricsDTO'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+from dataclasses import dataclass, field
+
+from typing import Mapping
+
+
+# ______________________________________________________________________________________________________________________
+@dataclass(frozen=True)
+class RetryMetricsDTO:
+    """RetryMetricsDTO represents a frozen data transfer object (DTO) for the counters of a retry policy.
+
+    Attributes:
+        calls_count (int): The number of the calls.
+        retries_count (int): The number of the retries of all calls.
+        recovered_count (int): The number of the calls succeeded after a retry.
+        exhausted_count (int): The number of the calls failed after the last allowed attempt.
+        budget_rejections_count (int): The number of the retries not made because of the retry budget.
+        retries_by_error (Mapping[str, int]): The number of the retries by the error (e.g. `'1213'`).
+    """
+    calls_count: int = 0
+    retries_count: int = 0
+    recovered_count: int = 0
+    exhausted_count: int = 0
+    budget_rejections_count: int = 0
+    retries_by_error: Mapping[str, int] = field(default_factory=dict)
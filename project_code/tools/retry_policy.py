@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `RetryPolicy` class, which retries the calls failed by transient errors
+(e.g. deadlocks) with the jittered exponential backoff.
+
+The retries are limited by a retry budget (a token bucket filled by a share of the calls),
+so under a persistent failure the retries don't multiply the load of the struggling server.
+
+*Relationship with other modules:
+    `retry_metrics_dto`: The snapshot of the counters of the policy.
+    `mysql_transient_errors`: Classifies the MySQL errors for the policy.
+    `retrying_sql_api`: Applies the policy to the queries and the transactions of a database.
+    `deadline`: The backoff never sleeps past the deadline of the call.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'RetryPolicy'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import random
+import threading
+import time
+
+from collections import Counter
+
+from tools.deadline import Deadline
+from tools.retry_metrics_dto import RetryMetricsDTO
+
+from typing import Callable, Optional, TypeVar
+
+
+T = TypeVar('T')
+
+# The classifier gets the error and whether the call is idempotent, it returns whether the call may be retried
+ErrorClassifier = Callable[[BaseException, bool], bool]
+
+
+# ______________________________________________________________________________________________________________________
+class RetryPolicy:
+    """RetryPolicy retries the calls failed by the errors accepted by the classifier.
+
+    Example:
+        >>> policy = RetryPolicy(error_classifier=is_transient_mysql_error, max_attempts=5)
+        >>> rows = policy.call(lambda: database.execute_query_returns_all("SELECT ..."))
+        >>> policy.metrics.retries_count
+        2
+    """
+
+    def __init__(self,
+                 error_classifier: ErrorClassifier,
+                 max_attempts: int = 3,
+                 base_delay: float = 0.02,
+                 max_delay: float = 1.0,
+                 budget_ratio: float = 0.1,
+                 max_budget: float = 10.0,
+                 rng: Optional[random.Random] = None) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            error_classifier (ErrorClassifier): Decides whether the error of a call may be retried.
+            max_attempts (int, optional): The max number of the attempts of a call. Defaults to 3.
+            base_delay (float, optional): The seconds of the first backoff, it doubles with each retry.
+                                          Defaults to 0.02.
+            max_delay (float, optional): The max seconds of a backoff. Defaults to 1.0.
+            budget_ratio (float, optional): The retries allowed per call on average. Defaults to 0.1.
+            max_budget (float, optional): The initial and the max number of the retries in reserve. Defaults to 10.0.
+            rng (Optional[random.Random], optional): The generator of the jitter. Defaults to None (a new one).
+
+        Raises:
+            ValueError: If the parameters of the policy are invalid.
+        """
+        if not isinstance(max_attempts, int) or max_attempts <= 0:
+            raise ValueError("The *max_attempts* must be an int > 0!")
+
+        if base_delay < 0 or max_delay < base_delay:
+            raise ValueError("The *base_delay* must be >= 0 and *max_delay* >= *base_delay*!")
+
+        if budget_ratio < 0 or max_budget < 0:
+            raise ValueError("The *budget_ratio* and *max_budget* must be >= 0!")
+
+        self.__error_classifier: ErrorClassifier = error_classifier
+        self.__max_attempts: int = max_attempts
+        self.__base_delay: float = base_delay
+        self.__max_delay: float = max_delay
+        self.__budget_ratio: float = budget_ratio
+        self.__max_budget: float = max_budget
+        self.__rng: random.Random = rng if rng is not None else random.Random()
+
+        self.__lock = threading.Lock()
+        self.__budget: float = max_budget
+
+        self.__calls_count: int = 0
+        self.__retries_count: int = 0
+        self.__recovered_count: int = 0
+        self.__exhausted_count: int = 0
+        self.__budget_rejections_count: int = 0
+        self.__retries_by_error: Counter = Counter()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def metrics(self) -> RetryMetricsDTO:
+        """metrics the snapshot of the counters of the policy."""
+        with self.__lock:
+            return RetryMetricsDTO(calls_count=self.__calls_count,
+                                   retries_count=self.__retries_count,
+                                   recovered_count=self.__recovered_count,
+                                   exhausted_count=self.__exhausted_count,
+                                   budget_rejections_count=self.__budget_rejections_count,
+                                   retries_by_error=dict(self.__retries_by_error))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def call(self, function: Callable[[], T], is_idempotent: bool = True, deadline: Optional[Deadline] = None) -> T:
+        """call calls the function and retries it after a transient error.
+
+        Args:
+            function (Callable[[], T]): The call, which must be safe to repeat after the classified error.
+            is_idempotent (bool, optional): Whether the call may be repeated after an error, which leaves
+                                            its effect unknown (e.g. a lost connection). Defaults to True.
+            deadline (Optional[Deadline], optional): The deadline of the call, no retry is made after it.
+                                                     Defaults to None.
+
+        Raises:
+            BaseException: The error of the last attempt.
+
+        Returns:
+            T: The result of the function.
+        """
+        with self.__lock:
+            self.__calls_count += 1
+            self.__budget = min(self.__budget + self.__budget_ratio, self.__max_budget)
+
+        attempt: int = 1
+
+        while True:
+            try:
+                result: T = function()
+
+            except Exception as error:
+                if not self.__error_classifier(error, is_idempotent):
+                    raise
+
+                delay: float = self.__get_backoff_delay(attempt=attempt)
+
+                if not self.__take_retry(error=error, attempt=attempt, delay=delay, deadline=deadline):
+                    raise
+
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if attempt > 1:
+                with self.__lock:
+                    self.__recovered_count += 1
+
+            return result
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __get_backoff_delay(self, attempt: int) -> float:
+        # The full jitter spreads the retries of the calls failed together (e.g. by the same deadlock)
+        return self.__rng.uniform(0, min(self.__max_delay, self.__base_delay * 2 ** (attempt - 1)))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __take_retry(self, error: BaseException, attempt: int, delay: float, deadline: Optional[Deadline]) -> bool:
+        with self.__lock:
+            if attempt >= self.__max_attempts or (deadline is not None and delay >= deadline.remaining):
+                self.__exhausted_count += 1
+                return False
+
+            if self.__budget < 1:
+                self.__budget_rejections_count += 1
+                return False
+
+            self.__budget -= 1
+            self.__retries_count += 1
+            self.__retries_by_error[str(getattr(error, 'errno', None) or type(error).__name__)] += 1
+
+            return True
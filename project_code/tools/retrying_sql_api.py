@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `RetryingSQLAPI` class - a layer over a database,
+which retries its queries and whole transactions by a `RetryPolicy`.
+
+*A statement is retried alone only outside of a transaction: after a deadlock the server
+rolls back the whole transaction, so the transaction must be retried by `run_transaction`.
+A database, which is within a transaction (its `in_transaction` is true), has its statements called once.
+
+*Relationship with other modules:
+    `retry_policy`: Decides about the retries and counts them.
+    `sql_api_interface`: The API of the wrapped database.
+    `transaction_interface`: The transactions of the wrapped database.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'RetryingSQLAPI'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+from abstract.api.sql_api_interface import SQLAPIInterface
+from abstract.api.transaction_interface import TransactionInterface
+
+from tools.retry_policy import RetryPolicy
+
+from typing import Any, Callable, Dict, Iterable, TypeVar
+
+
+T = TypeVar('T')
+
+
+# ______________________________________________________________________________________________________________________
+class RetryingSQLAPI(SQLAPIInterface):
+    """RetryingSQLAPI retries the queries and the transactions of the wrapped database.
+
+    The queries returning rows are treated as idempotent reads, `execute_query_no_returns`
+    is treated as a write, unless it is marked `is_idempotent`.
+
+    Example:
+        >>> database = RetryingSQLAPI(database=MySQLDataBasePool(...),
+        ...                           retry_policy=RetryPolicy(error_classifier=is_transient_mysql_error))
+        >>> database.run_transaction(lambda session: session.execute_query_no_returns("UPDATE ..."))
+    """
+
+    def __init__(self, database: SQLAPIInterface, retry_policy: RetryPolicy) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            database (SQLAPIInterface): The wrapped database, `TransactionInterface` is required by `run_transaction`.
+            retry_policy (RetryPolicy): The policy of the retries.
+        """
+        self.__database: SQLAPIInterface = database
+        self.__retry_policy: RetryPolicy = retry_policy
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def database(self) -> SQLAPIInterface:
+        return self.__database
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self.__retry_policy
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_query_no_returns(self, sql_query: str, *query_data,
+                                 is_idempotent: bool = False, **options: Any) -> None:
+        self.__call_statement(lambda: self.__database.execute_query_no_returns(sql_query, *query_data, **options),
+                              is_idempotent=is_idempotent, options=options)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_query_returns_one(self, sql_query: str, *query_data, **options: Any) -> Any:
+        return self.__call_statement(
+            lambda: self.__database.execute_query_returns_one(sql_query, *query_data, **options), options=options
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_query_returns_all(self, sql_query: str, *query_data, **options: Any) -> Iterable[Any]:
+        return self.__call_statement(
+            lambda: self.__database.execute_query_returns_all(sql_query, *query_data, **options), options=options
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute_query_returns_columns(self, sql_query: str, *query_data, **options: Any) -> Dict[str, Any]:
+        return self.__call_statement(
+            lambda: self.__database.execute_query_returns_columns(sql_query, *query_data, **options), options=options
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def run_transaction(self, block: Callable[[Any], T], is_idempotent: bool = False, **options: Any) -> T:
+        """run_transaction runs the block in a transaction and retries the whole transaction after a transient error.
+
+        *The block may run several times, so it must not have effects outside the database
+        (or they must be safe to repeat).
+
+        Args:
+            block (Callable[[Any], T]): The statements of the transaction, it gets the object
+                                        yielded by `transaction` of the database.
+            is_idempotent (bool, optional): Whether the transaction may be repeated, when its commit
+                                            is unknown (a lost connection). Defaults to False.
+            options: The parameters of `transaction` of the database (e.g. `deadline`).
+
+        Raises:
+            TypeError: If the database doesn't implement `TransactionInterface`.
+
+        Returns:
+            T: The result of the block.
+        """
+        if not isinstance(self.__database, TransactionInterface):
+            raise TypeError("The database must implement *TransactionInterface* to run transactions!")
+
+        def run_once() -> T:
+            with self.__database.transaction(**options) as session:
+                return block(session)
+
+        return self.__retry_policy.call(run_once, is_idempotent=is_idempotent, deadline=options.get('deadline'))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __call_statement(self, function: Callable[[], T], options: Dict[str, Any], is_idempotent: bool = True) -> T:
+        # The transaction rolled back by the server is retried as a whole by `run_transaction`
+        if getattr(self.__database, 'in_transaction', False):
+            return function()
+
+        return self.__retry_policy.call(function, is_idempotent=is_idempotent, deadline=options.get('deadline'))
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the formats of result rows and the factories converting
+the plain rows of the driver (tuples) into these formats.
+
+The factories are built once per shape of the result (column names) and cached,
+so the conversion of a row is a single call without any per-row lookups.
+
+*Relationship with other modules:
+    `sql_api_interface`: The implementations of the API use the factories to build the result rows.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'RowFormat',
+    'RowFormatType',
+    'get_named_row_class',
+    'get_row_mapper',
+    'get_row_factory',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import keyword
+
+from dataclasses import MISSING, fields, is_dataclass
+from enum import Enum
+from functools import lru_cache
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+
+# ______________________________________________________________________________________________________________________
+class RowFormat(Enum):
+    """RowFormat formats of the result rows.
+
+    Attributes:
+        DICT: A `dict` per row, the keys are the column names.
+        TUPLE: A plain `tuple` per row, as it is returned by the driver (no conversion).
+        NAMED: An instance of a `__slots__` class per row, the class is generated once per result shape.
+    """
+    DICT = 'dict'
+    TUPLE = 'tuple'
+    NAMED = 'named'
+
+
+# Either a predefined format or a user class (e.g. dataclass) filled by the compiled row mapper
+RowFormatType = Union[RowFormat, Type[Any]]
+
+RowFactory = Callable[[Sequence[Any]], Any]
+
+
+# ______________________________________________________________________________________________________________________
+class _NamedRow:
+    """_NamedRow base class of the generated named rows.
+
+    *The generated subclasses define `__slots__`, so a row doesn't have a `__dict__`.
+    """
+
+    __slots__ = ()
+
+    _fields: Tuple[str, ...] = ()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        return tuple(self)[index]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __iter__(self):
+        for name in self.__slots__:
+            yield getattr(self, name)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _NamedRow):
+            return self._fields == other._fields and tuple(self) == tuple(other)
+
+        return NotImplemented
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        values: str = ', '.join(f"{name}={value!r}" for name, value in zip(self._fields, self))
+
+        return f"Row({values})"
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _asdict(self) -> Dict[str, Any]:
+        return dict(zip(self._fields, self))
+
+
+# ______________________________________________________________________________________________________________________
+def _make_attribute_names(column_names: Tuple[str, ...]) -> List[str]:
+    attribute_names: List[str] = []
+
+    for index, column_name in enumerate(column_names):
+        name: str = column_name
+
+        # Expressions (e.g. `COUNT(*)`), keywords and duplicates can't be attribute names
+        if not name.isidentifier() or keyword.iskeyword(name) or name.startswith('_') or name in attribute_names:
+            name = f"column_{index}"
+            suffix: int = 0
+
+            # The generated name must not take the slot of a real column (e.g. `column_1`) or an earlier name
+            while name in attribute_names or name in column_names:
+                suffix += 1
+                name = f"column_{index}_{suffix}"
+
+        attribute_names.append(name)
+
+    return attribute_names
+
+
+# ______________________________________________________________________________________________________________________
+@lru_cache(maxsize=1024)
+def get_named_row_class(column_names: Tuple[str, ...]) -> Type[Any]:
+    """get_named_row_class returns the `__slots__` class of rows for the result shape.
+
+    The class is generated once per `column_names` and cached.
+    The values are available as attributes, by index and by iteration.
+
+    *Column names, which are not valid attribute names (e.g. `COUNT(*)`), are available
+    as `column_<index>` attributes (with a `_<number>` suffix, if a real column has this name).
+
+    Args:
+        column_names (Tuple[str, ...]): The column names of the result.
+
+    Returns:
+        Type[Any]: The class, which constructor takes the values of a row positionally.
+    """
+    attribute_names: List[str] = _make_attribute_names(column_names=column_names)
+
+    arguments: str = ', '.join(f"v{index}" for index in range(len(attribute_names)))
+    assignments: str = ''.join(
+        f"\n    self.{name} = v{index}" for index, name in enumerate(attribute_names)
+    ) or "\n    pass"
+
+    namespace: Dict[str, Any] = {}
+    exec(f"def __init__(self, {arguments}):{assignments}", namespace)
+
+    return type('Row', (_NamedRow,), {
+        '__slots__': tuple(attribute_names),
+        '_fields': tuple(attribute_names),
+        '__init__': namespace['__init__'],
+    })
+
+
+# ______________________________________________________________________________________________________________________
+@lru_cache(maxsize=1024)
+def get_row_mapper(row_class: Type[Any], column_names: Tuple[str, ...]) -> RowFactory:
+    """get_row_mapper returns the compiled function, which fills an instance of `row_class` from a row.
+
+    The columns are matched with the fields of the dataclass by name, other columns are ignored.
+    The function is compiled once per class and result shape and cached,
+    so mapping a row doesn't look up the names.
+
+    *For a class, which is not a dataclass, the keyword arguments of the constructor
+    are taken from all column names, so they must be valid identifiers.
+
+    Args:
+        row_class (Type[Any]): The class of the rows, usually a dataclass.
+        column_names (Tuple[str, ...]): The column names of the result.
+
+    Raises:
+        ValueError: If a required field of the dataclass has no column in the result
+                    or a column name can't be a keyword argument.
+
+    Returns:
+        RowFactory: The function, which takes a row (tuple) and returns an instance of `row_class`.
+    """
+    if is_dataclass(row_class):
+        init_fields: Dict[str, Any] = {field.name: field for field in fields(row_class) if field.init}
+
+        for name, field in init_fields.items():
+            is_required: bool = field.default is MISSING and field.default_factory is MISSING
+
+            if is_required and name not in column_names:
+                raise ValueError(f"The field: *{name}* of *{row_class.__name__}* - has no column in the result!")
+
+        field_names: List[str] = [name for name in dict.fromkeys(column_names) if name in init_fields]
+
+    else:
+        field_names = list(dict.fromkeys(column_names))
+
+        for name in field_names:
+            if not name.isidentifier() or keyword.iskeyword(name):
+                raise ValueError(f"The column: *{name}* - can't be a keyword argument of *{row_class.__name__}*!")
+
+    arguments: str = ', '.join(f"{name}=row[{column_names.index(name)}]" for name in field_names)
+
+    namespace: Dict[str, Any] = {'row_class': row_class}
+    exec(f"def map_row(row):\n    return row_class({arguments})", namespace)
+
+    return namespace['map_row']
+
+
+# ______________________________________________________________________________________________________________________
+def get_row_factory(row_format: RowFormatType, column_names: Sequence[str]) -> Optional[RowFactory]:
+    """get_row_factory returns the factory converting the rows of the driver (tuples) into `row_format`.
+
+    Args:
+        row_format (RowFormatType): The predefined format or the class of the rows.
+        column_names (Sequence[str]): The column names of the result.
+
+    Returns:
+        Optional[RowFactory]: The factory or `None`, when the rows don't need conversion (`RowFormat.TUPLE`).
+    """
+    column_names = tuple(column_names)
+
+    if row_format is RowFormat.TUPLE:
+        return None
+
+    if row_format is RowFormat.DICT:
+        return lambda row: dict(zip(column_names, row))
+
+    if row_format is RowFormat.NAMED:
+        named_row_class: Type[Any] = get_named_row_class(column_names=column_names)
+
+        return lambda row: named_row_class(*row)
+
+    if isinstance(row_format, type):
+        return get_row_mapper(row_class=row_format, column_names=column_names)
+
+    raise TypeError(f"The row format: *{row_format!r}* - is not supported!")
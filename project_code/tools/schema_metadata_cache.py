@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `SchemaMetadataCache` class - a lazily filled cache of the metadata
+of tables (column types, nullability, primary and unique keys) read from `INFORMATION_SCHEMA`.
+
+Queries of `INFORMATION_SCHEMA` are slow on servers with many tables, so the metadata
+is read once per table and kept for `ttl_seconds` or until it is invalidated (e.g. after `ALTER TABLE`).
+
+*Relationship with other modules:
+    `sql_database`: The default schema is the `database` of `dbconfig`.
+    `sql_api_interface`: The metadata is read through `execute_query_returns_all` of the API,
+                         the MySQL backend reads it by `_read_metadata_rows` with the fixed options.
+    `table_metadata_dto`: The cached metadata of a table.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'SchemaMetadataCache'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import threading
+import time
+
+from abstract.api.sql_api_interface import SQLAPIInterface
+from abstract.database.sql_database import SQLDataBase
+from tools.sql_statement_builder import validate_identifier
+from tools.table_metadata_dto import ColumnMetadataDTO, TableMetadataDTO
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+COLUMNS_QUERY: str = (
+    "SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, CHARACTER_MAXIMUM_LENGTH "
+    "FROM INFORMATION_SCHEMA.COLUMNS "
+    "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s "
+    "ORDER BY ORDINAL_POSITION"
+)
+
+KEYS_QUERY: str = (
+    "SELECT tc.CONSTRAINT_NAME, tc.CONSTRAINT_TYPE, kcu.COLUMN_NAME "
+    "FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS AS tc "
+    "JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE AS kcu "
+    "ON kcu.CONSTRAINT_SCHEMA = tc.CONSTRAINT_SCHEMA "
+    "AND kcu.CONSTRAINT_NAME = tc.CONSTRAINT_NAME "
+    "AND kcu.TABLE_NAME = tc.TABLE_NAME "
+    "WHERE tc.TABLE_SCHEMA = %s AND tc.TABLE_NAME = %s "
+    "AND tc.CONSTRAINT_TYPE IN ('PRIMARY KEY', 'UNIQUE') "
+    "ORDER BY tc.CONSTRAINT_NAME, kcu.ORDINAL_POSITION"
+)
+
+
+# ______________________________________________________________________________________________________________________
+def _get_row_values(row: Any) -> Tuple[Any, ...]:
+    # The rows may be returned in any format of the API, the values are in the order of the query
+    return tuple(row.values()) if isinstance(row, dict) else tuple(row)
+
+
+# ______________________________________________________________________________________________________________________
+def _decode_text(value: Any) -> Any:
+    # The raw cursors return the text values as `bytearray`
+    return value.decode('utf-8') if isinstance(value, (bytes, bytearray)) else value
+
+
+# ______________________________________________________________________________________________________________________
+class SchemaMetadataCache:
+    """SchemaMetadataCache lazily filled cache of the metadata of tables with a TTL.
+
+    Example:
+        >>> metadata_cache = SchemaMetadataCache(database, ttl_seconds=300)
+        >>> metadata_cache.get_table_metadata('users').primary_key
+        ('id',)
+        >>> metadata_cache.invalidate('users')  # after `ALTER TABLE users ...`
+
+    *The cache is thread-safe, concurrent first reads of a table may query it more than once.
+    """
+
+    def __init__(self,
+                 database: SQLAPIInterface,
+                 ttl_seconds: Optional[float] = 300.0,
+                 default_schema_name: Optional[str] = None) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            database (SQLAPIInterface): The API used to read `INFORMATION_SCHEMA`.
+            ttl_seconds (Optional[float], optional): The time of keeping the metadata. Defaults to 300.0
+                                                     (None - until invalidation).
+            default_schema_name (Optional[str], optional): The schema of the tables without a schema prefix.
+                                                           Defaults to None (the `database` of `dbconfig`).
+
+        Raises:
+            ValueError: If `ttl_seconds` is negative.
+        """
+        if ttl_seconds is not None and ttl_seconds < 0:
+            raise ValueError("The *ttl_seconds* value cannot be < 0!")
+
+        self.__database: SQLAPIInterface = database
+        self.__ttl_seconds: Optional[float] = ttl_seconds
+        self.__default_schema_name: Optional[str] = default_schema_name
+
+        self.__entries: Dict[Tuple[str, str], Tuple[TableMetadataDTO, float]] = {}
+        self.__lock = threading.Lock()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        return self.__ttl_seconds
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def get_table_metadata(self, table_name: str) -> TableMetadataDTO:
+        """get_table_metadata returns the metadata of the table, it is read on the first call or after TTL.
+
+        Args:
+            table_name (str): The name of the table, optionally with a schema prefix (`schema.table`).
+
+        Raises:
+            ValueError: If the schema isn't known or the table doesn't exist.
+
+        Returns:
+            TableMetadataDTO: The metadata of the table.
+        """
+        key: Tuple[str, str] = self.__split_table_name(table_name=table_name)
+
+        with self.__lock:
+            entry: Optional[Tuple[TableMetadataDTO, float]] = self.__entries.get(key)
+
+        if entry is not None and not self.__is_expired(loaded_at=entry[1]):
+            return entry[0]
+
+        metadata: TableMetadataDTO = self.__read_table_metadata(schema_name=key[0], table_name=key[1])
+
+        with self.__lock:
+            self.__entries[key] = (metadata, time.monotonic())
+
+        return metadata
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def invalidate(self, table_name: Optional[str] = None) -> None:
+        """invalidate removes the metadata of the table or of all tables from the cache.
+
+        Args:
+            table_name (Optional[str], optional): The name of the table, optionally with a schema prefix.
+                                                  Defaults to None (all tables).
+        """
+        with self.__lock:
+            if table_name is None:
+                self.__entries.clear()
+
+            else:
+                self.__entries.pop(self.__split_table_name(table_name=table_name), None)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __is_expired(self, loaded_at: float) -> bool:
+        return self.__ttl_seconds is not None and time.monotonic() - loaded_at >= self.__ttl_seconds
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __split_table_name(self, table_name: str) -> Tuple[str, str]:
+        schema_name, _, name = validate_identifier(identifier=table_name).rpartition('.')
+
+        if not schema_name:
+            schema_name = self.__get_default_schema_name()
+
+        return schema_name, name
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __get_default_schema_name(self) -> str:
+        schema_name: Optional[str] = self.__default_schema_name
+
+        if schema_name is None and isinstance(self.__database, SQLDataBase):
+            schema_name = self.__database.dbconfig.get('database')
+
+        if not schema_name:
+            raise ValueError("The schema of the table isn't known, use `schema.table` or *default_schema_name*!")
+
+        return schema_name
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __read_rows(self, sql_query: str, *query_data: Any) -> List[Tuple[Any, ...]]:
+        # The MySQL backend reads the metadata regardless of the default row format, conversion and memory budget
+        read_metadata_rows: Optional[Callable[..., Iterable[Any]]] = getattr(self.__database,
+                                                                             '_read_metadata_rows', None)
+
+        if read_metadata_rows is not None:
+            rows: Iterable[Any] = read_metadata_rows(sql_query, *query_data)
+
+        else:
+            rows = self.__database.execute_query_returns_all(sql_query, *query_data) or ()
+
+        return [tuple(map(_decode_text, _get_row_values(row=row))) for row in rows]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __read_table_metadata(self, schema_name: str, table_name: str) -> TableMetadataDTO:
+        columns: List[ColumnMetadataDTO] = []
+
+        for name, data_type, is_nullable, max_length in self.__read_rows(COLUMNS_QUERY, schema_name, table_name):
+            columns.append(ColumnMetadataDTO(name=name,
+                                             data_type=data_type.lower(),
+                                             is_nullable=is_nullable == 'YES',
+                                             max_length=None if max_length is None else int(max_length)))
+
+        if not columns:
+            raise ValueError(f"The table: *{schema_name}.{table_name}* - doesn't exist!")
+
+        primary_key: Tuple[str, ...] = ()
+        unique_keys: Dict[str, List[str]] = {}
+
+        for constraint_name, constraint_type, column_name in self.__read_rows(KEYS_QUERY, schema_name, table_name):
+            if constraint_type == 'PRIMARY KEY':
+                primary_key += (column_name,)
+
+            else:
+                unique_keys.setdefault(constraint_name, []).append(column_name)
+
+        return TableMetadataDTO(schema_name=schema_name,
+                                table_name=table_name,
+                                columns=tuple(columns),
+                                primary_key=primary_key,
+                                unique_keys=tuple(tuple(key) for key in unique_keys.values()))
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `SpillableRowBuffer` class, which collects the rows of a result
+within a memory budget, and the `SpilledRowSequence` class - a random-access sequence
+of the rows spilled to a temporary file.
+
+The rows over the budget are encoded by `pickle` in batches (a chunk of rows per record) into an anonymous
+temporary file, only the offsets of the batches are kept in memory. A batch shares the header and the memo
+of `pickle` among its rows, so the file is smaller and faster to write than with a record per row.
+The file is read back through `mmap`, so the pages of the file are loaded and released by the OS as needed.
+
+*Relationship with other modules:
+    `memory_budget_dto`: The limits of the rows kept in memory.
+    `row_factory`: The spilled rows are converted into the row format when they are read.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'SpillableRowBuffer',
+    'SpilledRowSequence',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import bisect
+import mmap
+import pickle
+import sys
+import tempfile
+import weakref
+
+from array import array
+from collections.abc import Sequence as SequenceABC
+
+from tools.memory_budget_dto import MemoryBudgetDTO
+from tools.row_factory import RowFactory
+
+from typing import Any, BinaryIO, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+# ______________________________________________________________________________________________________________________
+def _estimate_row_size(row: Sequence[Any]) -> int:
+    return sys.getsizeof(row) + sum(map(sys.getsizeof, row))
+
+
+# ______________________________________________________________________________________________________________________
+def _release_spilled_file(memory_map: Optional[mmap.mmap], file: BinaryIO) -> None:
+    if memory_map is not None:
+        memory_map.close()
+
+    file.close()
+
+
+# ______________________________________________________________________________________________________________________
+class SpilledRowSequence(SequenceABC):
+    """SpilledRowSequence read-only random-access sequence of the rows spilled to a temporary file.
+
+    *The file is deleted when the sequence is closed or collected, it can be used as a context manager.
+    *A row is read with its whole batch, the last read batch is kept, so the sequential reads decode each batch once.
+    """
+
+    def __init__(self,
+                 file: BinaryIO,
+                 offsets: array,
+                 row_ends: array,
+                 row_factory: Optional[RowFactory] = None) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            file (BinaryIO): The temporary file with the encoded batches of rows.
+            offsets (array): The offsets of the batches in the file and the end of the last batch.
+            row_ends (array): The number of rows up to the end of each batch.
+            row_factory (Optional[RowFactory], optional): The factory of the row format. Defaults to None.
+        """
+        file.flush()
+
+        # `mmap` can't map an empty file
+        memory_map: Optional[mmap.mmap] = None
+
+        if offsets[-1]:
+            memory_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.__memory_map: Optional[mmap.mmap] = memory_map
+        self.__offsets: array = offsets
+        self.__row_ends: array = row_ends
+        self.__row_factory: Optional[RowFactory] = row_factory
+
+        # The index and the rows of the last read batch, they are replaced together
+        self.__read_batch: Tuple[int, List[Tuple[Any, ...]]] = (-1, [])
+
+        self.__finalizer = weakref.finalize(self, _release_spilled_file, memory_map, file)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def is_closed(self) -> bool:
+        return not self.__finalizer.alive
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def close(self) -> None:
+        """close deletes the temporary file, the rows are not available after it."""
+        self.__finalizer()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __enter__(self) -> 'SpilledRowSequence':
+        return self
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self.__row_ends[-1] if self.__row_ends else 0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self.__read_row(position=position) for position in range(*index.indices(len(self)))]
+
+        rows_count: int = len(self)
+
+        if index < 0:
+            index += rows_count
+
+        if not 0 <= index < rows_count:
+            raise IndexError("The index of the row is out of range!")
+
+        return self.__read_row(position=index)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __iter__(self) -> Iterator[Any]:
+        for position in range(len(self)):
+            yield self.__read_row(position=position)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __read_row(self, position: int) -> Any:
+        if self.is_closed:
+            raise ValueError("The spilled rows are closed!")
+
+        batch_index: int = bisect.bisect_right(self.__row_ends, position)
+        read_batch_index, batch_rows = self.__read_batch
+
+        if read_batch_index != batch_index:
+            batch_rows = pickle.loads(self.__memory_map[self.__offsets[batch_index]:self.__offsets[batch_index + 1]])
+            self.__read_batch = (batch_index, batch_rows)
+
+        row: Any = batch_rows[position - (self.__row_ends[batch_index - 1] if batch_index else 0)]
+
+        if self.__row_factory is None:
+            return row
+
+        return self.__row_factory(row)
+
+
+# ______________________________________________________________________________________________________________________
+class SpillableRowBuffer:
+    """SpillableRowBuffer collects the rows of a result in memory until the budget is exceeded, then on disk.
+
+    Example:
+        >>> buffer = SpillableRowBuffer(memory_budget=MemoryBudgetDTO(max_bytes=64 * 1024 * 1024))
+        >>> while rows := cursor.fetchmany(10_000):
+        ...     buffer.append_rows(rows)
+        >>> rows = buffer.build()  # `list` or `SpilledRowSequence`
+    """
+
+    def __init__(self,
+                 memory_budget: MemoryBudgetDTO,
+                 row_factory: Optional[RowFactory] = None,
+                 directory: Optional[str] = None) -> None:
+        """__init__ initializes an instance of this class.
+
+        Args:
+            memory_budget (MemoryBudgetDTO): The limits of the rows kept in memory.
+            row_factory (Optional[RowFactory], optional): The factory of the row format. Defaults to None.
+            directory (Optional[str], optional): The directory of the temporary file. Defaults to None (system).
+        """
+        self.__memory_budget: MemoryBudgetDTO = memory_budget
+        self.__row_factory: Optional[RowFactory] = row_factory
+        self.__directory: Optional[str] = directory
+
+        self.__rows: List[Sequence[Any]] = []
+        self.__rows_size: int = 0
+
+        self.__file: Optional[BinaryIO] = None
+        self.__offsets: array = array('Q', [0])
+        self.__row_ends: array = array('Q')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def is_spilled(self) -> bool:
+        return self.__file is not None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def append_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        """append_rows adds a chunk of rows, e.g. the result of `fetchmany`.
+
+        *The budget is checked per row, so the rows kept in memory exceed it by one row at most.
+
+        Args:
+            rows (Sequence[Sequence[Any]]): The rows of the driver (tuples).
+        """
+        if self.__file is not None:
+            self.__write_rows(rows=rows)
+            return
+
+        is_size_counted: bool = self.__memory_budget.max_bytes is not None
+
+        for index, row in enumerate(rows):
+            self.__rows.append(row)
+
+            if is_size_counted:
+                self.__rows_size += _estimate_row_size(row=row)
+
+            if self.__is_budget_exceeded():
+                self.__spill()
+                self.__write_rows(rows=rows[index + 1:])
+                return
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def build(self) -> Union[List[Any], SpilledRowSequence]:
+        """build returns the collected rows in the row format.
+
+        Returns:
+            Union[List[Any], SpilledRowSequence]: The list of rows within the budget,
+                                                  otherwise the sequence of the spilled rows.
+        """
+        if self.__file is None:
+            if self.__row_factory is None:
+                return self.__rows
+
+            return list(map(self.__row_factory, self.__rows))
+
+        return SpilledRowSequence(file=self.__file, offsets=self.__offsets, row_ends=self.__row_ends,
+                                  row_factory=self.__row_factory)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __is_budget_exceeded(self) -> bool:
+        max_rows: Optional[int] = self.__memory_budget.max_rows
+        max_bytes: Optional[int] = self.__memory_budget.max_bytes
+
+        return (
+            (max_rows is not None and len(self.__rows) > max_rows)
+            or (max_bytes is not None and self.__rows_size > max_bytes)
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __spill(self) -> None:
+        self.__file = tempfile.TemporaryFile(dir=self.__directory)
+
+        rows: List[Sequence[Any]] = self.__rows
+        self.__rows = []
+        self.__rows_size = 0
+
+        chunk_size: int = self.__memory_budget.chunk_size
+
+        for start in range(0, len(rows), chunk_size):
+            self.__write_rows(rows=rows[start:start + chunk_size])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __write_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        if not rows:
+            return
+
+        # A batch is a single record of `pickle`, so the rows share its header and the memo of repeated values
+        data: bytes = pickle.dumps([tuple(row) for row in rows], protocol=pickle.HIGHEST_PROTOCOL)
+        self.__file.write(data)
+
+        self.__offsets.append(self.__offsets[-1] + len(data))
+        self.__row_ends.append((self.__row_ends[-1] if self.__row_ends else 0) + len(rows))
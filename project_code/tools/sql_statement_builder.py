@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides helper functions for building parameterized SQL statements.
+
+The functions of this module only build the text of statements with placeholders,
+the values themselves are always passed to the driver separately.
+
+*Relationship with other modules:
+    `sql_api_interface`: The built statements are intended to be executed
+                         through the methods of the API interface.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'validate_identifier',
+    'quote_identifier',
+    'build_multi_row_insert',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+import re
+
+from typing import Iterable, List, Pattern
+
+
+IDENTIFIER_PATTERN: Pattern[str] = re.compile(r'^[A-Za-z_][A-Za-z0-9_$]*(\.[A-Za-z_][A-Za-z0-9_$]*)?$')
+
+
+# ______________________________________________________________________________________________________________________
+def validate_identifier(identifier: str) -> str:
+    """validate_identifier checks that the identifier is safe to be inserted into the SQL statement.
+
+    Identifiers (table and column names) can't be passed as query parameters,
+    so they are restricted to a plain `name` or `schema.name` form.
+
+    Args:
+        identifier (str): The name of the table or column.
+
+    Raises:
+        TypeError: If `identifier` is not a string.
+        ValueError: If `identifier` doesn't match the allowed form.
+
+    Returns:
+        str: The checked identifier.
+    """
+    if not isinstance(identifier, str):
+        raise TypeError("The identifier must be a string!")
+
+    if not IDENTIFIER_PATTERN.match(identifier):
+        raise ValueError(f"The identifier: *{identifier}* - is not allowed in SQL statement!")
+
+    return identifier
+
+
+# ______________________________________________________________________________________________________________________
+def quote_identifier(identifier: str, quote_char: str = '`') -> str:
+    """quote_identifier validates and quotes the identifier.
+
+    *The `schema.name` form is quoted part by part.
+
+    Args:
+        identifier (str): The name of the table or column.
+        quote_char (str, optional): The quote character of the SQL dialect. Defaults to '`'.
+
+    Returns:
+        str: The quoted identifier.
+    """
+    validate_identifier(identifier=identifier)
+
+    return '.'.join(f"{quote_char}{part}{quote_char}" for part in identifier.split('.'))
+
+
+# ______________________________________________________________________________________________________________________
+def build_multi_row_insert(table_name: str,
+                           column_names: Iterable[str],
+                           rows_count: int,
+                           placeholder: str = '%s',
+                           quote_char: str = '`') -> str:
+    """build_multi_row_insert builds an `INSERT` statement for several rows at once.
+
+    Example of the result for 2 columns and 2 rows:
+        INSERT INTO `table` (`a`, `b`) VALUES (%s, %s), (%s, %s)
+
+    Args:
+        table_name (str): The name of the target table.
+        column_names (Iterable[str]): The names of the inserted columns.
+        rows_count (int): The number of rows in the statement.
+        placeholder (str, optional): The parameter placeholder of the driver. Defaults to '%s'.
+        quote_char (str, optional): The quote character of the SQL dialect. Defaults to '`'.
+
+    Raises:
+        ValueError: If there are no columns or `rows_count` <= 0.
+
+    Returns:
+        str: The text of the statement.
+    """
+    quoted_columns: List[str] = [quote_identifier(identifier=name, quote_char=quote_char) for name in column_names]
+
+    if not quoted_columns:
+        raise ValueError("The statement must contain at least one column!")
+
+    if rows_count <= 0:
+        raise ValueError("The *rows_count* value cannot be <= 0!")
+
+    row_placeholders: str = '(' + ', '.join([placeholder] * len(quoted_columns)) + ')'
+
+    return (
+        f"INSERT INTO {quote_identifier(identifier=table_name, quote_char=quote_char)} "
+        f"({', '.join(quoted_columns)}) VALUES " + ', '.join([row_placeholders] * rows_count)
+    )
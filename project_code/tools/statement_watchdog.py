@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module provides the `StatementWatchdog` class, which calls the cancellation
+of the statements running longer than their timeout (e.g. `KILL QUERY` from a side connection).
+
+A single daemon thread waits for the nearest deadline of all watched statements,
+so watching a statement doesn't start a thread. The cancellation itself runs in a short-lived thread,
+so a slow cancellation doesn't delay the others.
+
+*Relationship with other modules:
+    `mysql_database_single`: Cancels the statements, which can't be limited by the server hint.
+    `fork_guard`: A forked child forgets the statements and the thread of the parent.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'StatementWatchdog',
+    'WatchedStatement',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.2.0"
+
+import heapq
+import itertools
+import threading
+import time
+
+from tools.fork_guard import register_after_fork_in_child
+
+from typing import Callable, List, Optional, Tuple
+
+
+# ______________________________________________________________________________________________________________________
+class WatchedStatement:
+    """WatchedStatement handle of a statement watched by `StatementWatchdog`.
+
+    *The cancellation and `finish` are serialized by a lock, so the cancellation
+    never reaches a statement started after the watched one has finished.
+    """
+
+    def __init__(self, on_timeout: Callable[[], None], on_finish: Optional[Callable[[], None]] = None) -> None:
+        self.__on_timeout: Optional[Callable[[], None]] = on_timeout
+        self.__on_finish: Optional[Callable[[], None]] = on_finish
+        self.__lock = threading.Lock()
+
+        self.__is_finished: bool = False
+        self.__is_timed_out: bool = False
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def is_timed_out(self) -> bool:
+        return self.__is_timed_out
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def finish(self) -> bool:
+        """finish stops watching the statement, it waits for a running cancellation.
+
+        Returns:
+            bool: Whether the statement was cancelled by the timeout.
+        """
+        with self.__lock:
+            is_first_finish: bool = not self.__is_finished
+            self.__is_finished = True
+
+            # The cancellation refers to the database and its connection, it is never called after the finish
+            self.__on_timeout = None
+
+        if is_first_finish and self.__on_finish is not None:
+            self.__on_finish()
+
+        return self.__is_timed_out
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _cancel(self) -> None:
+        with self.__lock:
+            if self.__is_finished:
+                return
+
+            self.__is_timed_out = True
+
+            try:
+                self.__on_timeout()
+            except Exception:
+                # The statement is reported as timed out anyway, a failed cancellation can't be raised here
+                pass
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _is_finished(self) -> bool:
+        return self.__is_finished
+
+
+# ______________________________________________________________________________________________________________________
+class StatementWatchdog:
+    """StatementWatchdog calls the cancellation of the statements, which are not finished before their deadline.
+
+    Example:
+        >>> watched = watchdog.watch(timeout=5.0, on_timeout=kill_query)
+        >>> try:
+        ...     cursor.execute(sql_query)
+        ... finally:
+        ...     timed_out = watched.finish()
+    """
+
+    def __init__(self) -> None:
+        self.__deadlines: List[Tuple[float, int, WatchedStatement]] = []
+        self.__counter = itertools.count()
+
+        # The statements finished since the last compaction of the heap
+        self.__finished_count: int = 0
+
+        self.__condition = threading.Condition()
+        self.__thread: Optional[threading.Thread] = None
+
+        # A forked child inherits the lock in any state, but not the thread, which may hold it
+        register_after_fork_in_child(owner=self, callback=StatementWatchdog.__forget_parent_statements)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def watch(self, timeout: float, on_timeout: Callable[[], None]) -> WatchedStatement:
+        """watch starts watching a statement.
+
+        Args:
+            timeout (float): The seconds until the cancellation.
+            on_timeout (Callable[[], None]): The cancellation of the statement.
+
+        Returns:
+            WatchedStatement: The handle, which must be finished when the statement returns.
+        """
+        watched = WatchedStatement(on_timeout=on_timeout, on_finish=self.__count_finished_statement)
+
+        with self.__condition:
+            heapq.heappush(self.__deadlines, (time.monotonic() + timeout, next(self.__counter), watched))
+
+            # The thread doesn't survive `os.fork()`, so it is checked on every use
+            if self.__thread is None or not self.__thread.is_alive():
+                self.__thread = threading.Thread(target=self.__watch_deadlines, name='StatementWatchdog', daemon=True)
+                self.__thread.start()
+
+            self.__condition.notify()
+
+        return watched
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __count_finished_statement(self) -> None:
+        with self.__condition:
+            self.__finished_count += 1
+
+            # The statements with long timeouts would keep the finished ones in the heap, so it is compacted
+            # when they are the most of its entries
+            if self.__finished_count * 2 >= len(self.__deadlines):
+                self.__deadlines = [entry for entry in self.__deadlines if not entry[2]._is_finished()]
+                heapq.heapify(self.__deadlines)
+
+                self.__finished_count = 0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __forget_parent_statements(self) -> None:
+        # The statements of the parent are not executed in the child
+        self.__deadlines = []
+        self.__finished_count = 0
+
+        self.__condition = threading.Condition()
+        self.__thread = None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __watch_deadlines(self) -> None:
+        condition: threading.Condition = self.__condition
+
+        while True:
+            with condition:
+                # The condition is replaced after `os.fork()`, the new statements are watched by a new thread
+                if condition is not self.__condition:
+                    return
+
+                # The finished statements on the top are dropped here, the others by the compaction
+                while self.__deadlines and self.__deadlines[0][2]._is_finished():
+                    heapq.heappop(self.__deadlines)
+
+                if not self.__deadlines:
+                    condition.wait()
+                    continue
+
+                deadline, _, watched = self.__deadlines[0]
+                remaining: float = deadline - time.monotonic()
+
+                if remaining > 0:
+                    condition.wait(timeout=remaining)
+                    continue
+
+                heapq.heappop(self.__deadlines)
+
+            threading.Thread(target=watched._cancel, name='StatementWatchdogCancel', daemon=True).start()
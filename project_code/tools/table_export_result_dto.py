@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module defines a `TableExportResultDTO` class representing a data transfer object (DTO)
+for the result of exporting a table or a range of its rows into files.
+
+*Relationship with other modules:
+    `parallel_table_exporter`: Returns the result per range and the aggregated result of the export.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TableExportResultDTO'
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+from dataclasses import dataclass
+
+from typing import Tuple
+
+
+# ______________________________________________________________________________________________________________________
+@dataclass(frozen=True)
+class TableExportResultDTO:
+    """TableExportResultDTO represents a frozen data transfer object (DTO) for the result of an export.
+
+    *The results of the ranges are summed by `+`, the time of the aggregated result
+    is the wall time of the whole export, so it is set by the exporter.
+
+    Attributes:
+        rows_count (int): The number of exported rows.
+        bytes_count (int): The number of written bytes.
+        seconds (float): The time of the export.
+        file_paths (Tuple[str, ...]): The paths of the written files.
+    """
+    rows_count: int = 0
+    bytes_count: int = 0
+    seconds: float = 0.0
+    file_paths: Tuple[str, ...] = ()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_count / self.seconds if self.seconds > 0 else 0.0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_count / self.seconds if self.seconds > 0 else 0.0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __add__(self, other: 'TableExportResultDTO') -> 'TableExportResultDTO':
+        if not isinstance(other, TableExportResultDTO):
+            return NotImplemented
+
+        return TableExportResultDTO(rows_count=self.rows_count + other.rows_count,
+                                    bytes_count=self.bytes_count + other.bytes_count,
+                                    seconds=self.seconds + other.seconds,
+                                    file_paths=self.file_paths + other.file_paths)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module defines the `ColumnMetadataDTO` and `TableMetadataDTO` classes representing
+data transfer objects (DTO) for the metadata of a table read from `INFORMATION_SCHEMA`.
+
+*Relationship with other modules:
+    `schema_metadata_cache`: Reads and caches the metadata of the tables.
+
+Copyright 2024 4-proxy
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'ColumnMetadataDTO',
+    'TableMetadataDTO',
+]
+
+__author__ = "4-proxy"
+__version__ = "0.1.0"
+
+from dataclasses import dataclass
+
+from typing import Optional, Sequence, Tuple
+
+
+# ______________________________________________________________________________________________________________________
+@dataclass(frozen=True)
+class ColumnMetadataDTO:
+    """ColumnMetadataDTO represents a frozen data transfer object (DTO) for the metadata of a column.
+
+    Attributes:
+        name (str): The name of the column.
+        data_type (str): The type of the column in lower case, e.g. 'bigint', 'varchar'.
+        is_nullable (bool): Whether the column accepts `NULL`.
+        max_length (Optional[int]): The max length of a string column, `None` for other columns.
+    """
+    name: str
+    data_type: str
+    is_nullable: bool
+    max_length: Optional[int] = None
+
+
+# ______________________________________________________________________________________________________________________
+@dataclass(frozen=True)
+class TableMetadataDTO:
+    """TableMetadataDTO represents a frozen data transfer object (DTO) for the metadata of a table.
+
+    Attributes:
+        schema_name (str): The name of the schema (database) of the table.
+        table_name (str): The name of the table.
+        columns (Tuple[ColumnMetadataDTO, ...]): The columns in the order of the table.
+        primary_key (Tuple[str, ...]): The names of the columns of the primary key, empty if there is none.
+        unique_keys (Tuple[Tuple[str, ...], ...]): The names of the columns of every unique key.
+    """
+    schema_name: str
+    table_name: str
+    columns: Tuple[ColumnMetadataDTO, ...]
+    primary_key: Tuple[str, ...] = ()
+    unique_keys: Tuple[Tuple[str, ...], ...] = ()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def column_names(self) -> Tuple[str, ...]:
+        return tuple(column.name for column in self.columns)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def get_column(self, column_name: str) -> ColumnMetadataDTO:
+        """get_column returns the metadata of the column by its name.
+
+        Raises:
+            KeyError: If the table has no such column.
+        """
+        for column in self.columns:
+            if column.name == column_name:
+                return column
+
+        raise KeyError(f"The table: *{self.table_name}* - has no column: *{column_name}*!")
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def find_key_within(self, column_names: Sequence[str]) -> Optional[Tuple[str, ...]]:
+        """find_key_within returns the primary or the first unique key, which consists of `column_names` only.
+
+        Args:
+            column_names (Sequence[str]): The available columns, e.g. the columns of inserted rows.
+
+        Returns:
+            Optional[Tuple[str, ...]]: The names of the columns of the key or `None`, if there is no such key.
+        """
+        available_names = set(column_names)
+
+        for key in (self.primary_key, *self.unique_keys):
+            if key and set(key) <= available_names:
+                return key
+
+        return None